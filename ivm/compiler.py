@@ -1,8 +1,26 @@
 from transisi import absolute_sntx_morph as ast
-from transisi.morph_t import TipeToken
+from transisi.morph_t import TipeToken, Token
 from ivm.core.opcodes import Op
 from ivm.core.structs import CodeObject
 
+def baris_node(node):
+    """Baris token pertama di dalam node (parser tidak mengisi lokasi), None jika tidak ada."""
+    for nilai in node.__dict__.values():
+        if type(nilai) is list:
+            if not nilai: continue
+            nilai = nilai[0]
+        if type(nilai) is Token:
+            return nilai.baris
+        anak = getattr(nilai, "__dict__", None)
+        if anak is not None and "lokasi" in anak:
+            baris = baris_node(nilai)
+            if baris is not None:
+                return baris
+    return None
+
+# Kelas node -> apakah pernyataan (St); isinstance ke kelas AST (ABC) mahal per visit
+_ADALAH_PERNYATAAN = {}
+
 class ScopeAnalyzer:
     """Pre-pass visitor to populate free_vars and cell_vars in Compiler instances."""
     def __init__(self, compiler):
@@ -49,6 +67,12 @@ class ScopeAnalyzer:
         self.visit(node.blok_coba)
         if node.blok_akhirnya: self.visit(node.blok_akhirnya)
 
+    def visit_SelamaDari(self, node):
+        # Variabel penampung loop 'selama ... dari' adalah variabel lokal.
+        self.compiler.locals.add(node.nama.nilai)
+        self.visit(node.sumber)
+        self.visit(node.badan)
+
     def visit_Jodohkan(self, node):
         # Visitor ini memastikan variabel dari pola 'jodohkan' didaftarkan sebagai variabel lokal.
         self.visit(node.ekspresi)
@@ -68,11 +92,17 @@ class Compiler:
         self.loop_contexts = []
         self.parent = parent
         self.locals = set()
+        self.local_slots = {} # Nama lokal -> indeks slot Frame.fast (urutan alokasi)
         self.free_vars = [] # Captured from outer
         self.cell_vars = [] # Captured by inner
+        self.exception_table = [] # (awal, akhir, handler_pc, kedalaman_stack) per blok coba, terdalam dulu
+        self.iter_depth = 0 # Jumlah iterator loop 'selama ... dari' yang sedang ada di stack operand
+        self.line_table = [] # (pc_awal, baris) setiap kali pernyataan berpindah baris
 
     def compile(self, node: ast.MRPH, filename: str = "<module>", is_main_script: bool = False) -> CodeObject:
         self.instructions = []
+        self.exception_table = []
+        self.line_table = []
         self.visit(node)
 
         if is_main_script:
@@ -82,21 +112,60 @@ class Compiler:
 
         self.emit(Op.PUSH_CONST, None)
         self.emit(Op.RET)
-        return CodeObject(name="<module>", instructions=self.instructions, filename=filename)
+        return CodeObject(name="<module>", instructions=self.instructions, filename=filename,
+                          exception_table=tuple(self.exception_table), line_table=tuple(self.line_table))
 
     def emit(self, opcode, *args):
         self.instructions.append((opcode, *args))
         return len(self.instructions) - 1
 
+    def local_slot(self, name: str) -> int:
+        slot = self.local_slots.get(name)
+        if slot is None:
+            slot = self.local_slots[name] = len(self.local_slots)
+        return slot
+
+    def emit_load_local(self, name: str):
+        # Level modul tidak punya slot; tetap pakai lookup berbasis nama
+        if self.parent is None: return self.emit(Op.LOAD_LOCAL, name)
+        return self.emit(Op.LOAD_FAST, self.local_slot(name))
+
+    def emit_store_local(self, name: str):
+        if self.parent is None: return self.emit(Op.STORE_LOCAL, name)
+        return self.emit(Op.STORE_FAST, self.local_slot(name))
+
     def patch_jump(self, index, target):
         opcode = self.instructions[index][0]
         self.instructions[index] = (opcode, target)
 
+    def add_handler(self, start: int, end: int, handler: int):
+        # Blok dalam selesai lebih dulu, jadi urutan tabel otomatis terdalam -> terluar.
+        # Pernyataan dimulai dengan stack operand yang hanya berisi iterator loop
+        # 'selama ... dari' yang membungkusnya.
+        self.exception_table.append((start, end, handler, self.iter_depth))
+
     def visit(self, node):
+        kelas = node.__class__
+        pernyataan = _ADALAH_PERNYATAAN.get(kelas)
+        if pernyataan is None:
+            pernyataan = _ADALAH_PERNYATAAN[kelas] = issubclass(kelas, ast.St)
+        if pernyataan:
+            self.mark_line(baris_node(node))
         method_name = f'visit_{node.__class__.__name__}'
         visitor = getattr(self, method_name, self.generic_visit)
         return visitor(node)
 
+    def mark_line(self, baris):
+        if baris is None: return
+        table = self.line_table
+        pc = len(self.instructions)
+        if table:
+            if table[-1][1] == baris: return
+            if table[-1][0] == pc:
+                table.pop() # Pernyataan sebelumnya tidak menghasilkan instruksi
+                if table and table[-1][1] == baris: return
+        table.append((pc, baris))
+
     def generic_visit(self, node):
         raise NotImplementedError(f"Compiler belum mendukung node: {node.__class__.__name__}")
 
@@ -120,10 +189,10 @@ class Compiler:
         self.emit(Op.STORE_VAR, node.nama.nilai)
 
     def visit_Ini(self, node: ast.Ini):
-        self.emit(Op.LOAD_LOCAL, "ini")
+        self.emit_load_local("ini")
 
     def visit_Induk(self, node: ast.Induk):
-        self.emit(Op.LOAD_LOCAL, "ini")
+        self.emit_load_local("ini")
         self.emit(Op.LOAD_SUPER_METHOD, node.metode.nilai)
 
     def visit_AmbilProperti(self, node: ast.AmbilProperti):
@@ -147,6 +216,8 @@ class Compiler:
         func_compiler = analyzed_compiler
         arg_names = [param.nilai for param in node.parameter]
         if is_method: arg_names.insert(0, "ini")
+        # Argumen menempati slot awal sesuai urutan (dipakai call_function_internal)
+        for name in arg_names: func_compiler.local_slot(name)
 
         func_compiler.visit(node.badan)
 
@@ -163,7 +234,10 @@ class Compiler:
             arg_names=arg_names,
             is_generator=is_gen,
             free_vars=tuple(func_compiler.free_vars),
-            cell_vars=tuple(func_compiler.cell_vars)
+            cell_vars=tuple(func_compiler.cell_vars),
+            local_names=tuple(func_compiler.local_slots),
+            exception_table=tuple(func_compiler.exception_table),
+            line_table=tuple(func_compiler.line_table)
         )
 
         if closure_cells:
@@ -293,6 +367,15 @@ class Compiler:
                 self.emit(Op.IO_MKDIR)
                 return
 
+        if isinstance(node.callee, ast.AmbilProperti):
+            # obj.metode(...): LOAD_METHOD + CALL_METHOD, tanpa BoundMethod perantara
+            self.visit(node.callee.objek)
+            self.emit(Op.LOAD_METHOD, node.callee.nama.nilai)
+            for arg in node.argumen:
+                self.visit(arg)
+            self.emit(Op.CALL_METHOD, len(node.argumen))
+            return
+
         self.visit(node.callee)
         for arg in node.argumen:
             self.visit(arg)
@@ -326,7 +409,7 @@ class Compiler:
                     if name in self.cell_vars:
                         self.emit(Op.STORE_DEREF, name)
                     else:
-                        self.emit(Op.STORE_LOCAL, name)
+                        self.emit_store_local(name)
                 else:
                     self.emit(Op.STORE_VAR, name)
         else:
@@ -336,7 +419,7 @@ class Compiler:
                 if name in self.cell_vars:
                     self.emit(Op.STORE_DEREF, name)
                 else:
-                    self.emit(Op.STORE_LOCAL, name)
+                    self.emit_store_local(name)
             else:
                 self.emit(Op.STORE_VAR, name)
 
@@ -348,7 +431,7 @@ class Compiler:
                 if name in self.cell_vars:
                     self.emit(Op.STORE_DEREF, name)
                 else:
-                    self.emit(Op.STORE_LOCAL, name)
+                    self.emit_store_local(name)
             elif name in self.free_vars:
                 self.emit(Op.STORE_DEREF, name)
             else:
@@ -373,14 +456,14 @@ class Compiler:
     def visit_Warnai(self, node: ast.Warnai):
         self.visit(node.warna)
         self.emit(Op.PRINT_RAW)
-        push_try_idx = self.emit(Op.PUSH_TRY, 0)
+        try_start = len(self.instructions)
         self.visit(node.badan)
-        self.emit(Op.POP_TRY)
+        try_end = len(self.instructions)
         self.emit(Op.PUSH_CONST, "\u001b[0m")
         self.emit(Op.PRINT_RAW)
         jump_end = self.emit(Op.JMP, 0)
         handler_start = len(self.instructions)
-        self.patch_jump(push_try_idx, handler_start)
+        self.add_handler(try_start, try_end, handler_start)
         self.emit(Op.PUSH_CONST, "\u001b[0m")
         self.emit(Op.PRINT_RAW)
         self.emit(Op.THROW)
@@ -421,18 +504,19 @@ class Compiler:
             self.patch_jump(jmp, end_pos)
 
     def visit_CobaTangkap(self, node: ast.CobaTangkap):
-        push_try_idx = self.emit(Op.PUSH_TRY, 0)
+        # Tanpa PUSH_TRY/POP_TRY: rentang blok coba dicatat di exception_table CodeObject
+        try_start = len(self.instructions)
         self.visit(node.blok_coba)
-        self.emit(Op.POP_TRY)
+        try_end = len(self.instructions)
         jump_to_finally = self.emit(Op.JMP, 0)
         handler_start = len(self.instructions)
-        self.patch_jump(push_try_idx, handler_start)
+        self.add_handler(try_start, try_end, handler_start)
         end_catch_jumps = []
         for tangkap in node.daftar_tangkap:
             if tangkap.nama_error:
                 self.emit(Op.DUP)
                 name = tangkap.nama_error.nilai
-                if self.parent: self.locals.add(name); self.emit(Op.STORE_LOCAL, name)
+                if self.parent: self.locals.add(name); self.emit_store_local(name)
                 else: self.emit(Op.STORE_VAR, name)
             if tangkap.kondisi_jaga:
                 self.visit(tangkap.kondisi_jaga)
@@ -481,6 +565,33 @@ class Compiler:
             self.patch_jump(break_idx, loop_end)
         self.loop_contexts.pop()
 
+    def visit_SelamaDari(self, node: ast.SelamaDari):
+        # [sumber] GET_ITER; FOR_ITER akhir; simpan nama; badan; JMP awal. 'berhenti' harus
+        # membuang iterator sendiri, FOR_ITER sudah mem-pop-nya saat sumber habis.
+        self.visit(node.sumber)
+        self.emit(Op.GET_ITER)
+        loop_start = len(self.instructions)
+        current_loop_ctx = {'breaks': [], 'start': loop_start}
+        self.loop_contexts.append(current_loop_ctx)
+        self.iter_depth += 1
+        for_iter = self.emit(Op.FOR_ITER, 0)
+        name = node.nama.nilai
+        if self.parent is not None:
+            self.locals.add(name)
+            if name in self.cell_vars: self.emit(Op.STORE_DEREF, name)
+            else: self.emit_store_local(name)
+        else:
+            self.emit(Op.STORE_VAR, name)
+        self.visit(node.badan)
+        self.emit(Op.JMP, loop_start)
+        self.iter_depth -= 1
+        if current_loop_ctx['breaks']:
+            break_target = self.emit(Op.POP)
+            for break_idx in current_loop_ctx['breaks']:
+                self.patch_jump(break_idx, break_target)
+        self.patch_jump(for_iter, len(self.instructions))
+        self.loop_contexts.pop()
+
     def visit_Berhenti(self, node: ast.Berhenti):
         if not self.loop_contexts: raise SyntaxError("'berhenti' di luar loop")
         jmp = self.emit(Op.JMP, 0)
@@ -491,6 +602,38 @@ class Compiler:
         loop_start = self.loop_contexts[-1]['start']
         self.emit(Op.JMP, loop_start)
 
+    def emit_build_string(self, bagian: list):
+        """
+        Rantai teks -> satu BUILD_STRING. Literal teks yang bersebelahan digabung saat
+        kompilasi; ekspresi interpolasi dikonversi oleh BUILD_STRING sendiri (tanpa STR);
+        bagian lain dicatat sebagai mentah agar semantik '+' (termasuk error-nya) tetap.
+        """
+        konversi = []
+        mentah = []
+        n = 0
+        literal = None
+        for b in bagian:
+            nilai = self._nilai_konstanta(b)
+            if isinstance(nilai, str):
+                literal = nilai if literal is None else literal + nilai
+                continue
+            if literal is not None:
+                self.emit(Op.PUSH_CONST, literal); n += 1
+                literal = None
+            if isinstance(b, ast.KonversiTeks):
+                konversi.append(n)
+                self.visit(b.ekspresi)
+            else:
+                mentah.append(n)
+                self.visit(b)
+            n += 1
+        if literal is not None:
+            self.emit(Op.PUSH_CONST, literal); n += 1
+        if n == 1 and not mentah:
+            # Seluruh rantai literal: sudah dilipat jadi satu konstanta
+            return
+        self.emit(Op.BUILD_STRING, n, tuple(konversi), tuple(mentah))
+
     def visit_KonversiTeks(self, node: ast.KonversiTeks):
         self.visit(node.ekspresi)
         self.emit(Op.STR)
@@ -515,11 +658,35 @@ class Compiler:
         scope = self.resolve_variable(name)
         if scope == 'local':
             if name in self.cell_vars: self.emit(Op.LOAD_DEREF, name)
-            else: self.emit(Op.LOAD_LOCAL, name)
+            else: self.emit_load_local(name)
         elif scope == 'free': self.emit(Op.LOAD_DEREF, name)
         else: self.emit(Op.LOAD_VAR, name)
 
+    def _bagian_rantai_teks(self, node: ast.Xprs):
+        """
+        Meratakan rantai '+' bersarang kiri ((a + b) + c) jadi daftar bagian jika rantainya
+        membangun teks (ada literal teks atau interpolasi), selain itu None.
+        """
+        bagian = []
+        while isinstance(node, ast.FoxBinary) and node.op.tipe == TipeToken.TAMBAH:
+            bagian.append(node.kanan)
+            node = node.kiri
+        bagian.append(node)
+        bagian.reverse()
+        if len(bagian) < 2: return None
+        if not any(isinstance(b, ast.KonversiTeks) or isinstance(self._nilai_konstanta(b), str) for b in bagian): return None
+        return bagian
+
+    def _nilai_konstanta(self, node: ast.Xprs):
+        if not isinstance(node, ast.Konstanta): return None
+        return node.token.nilai if hasattr(node, 'token') else node.nilai
+
     def visit_FoxBinary(self, node: ast.FoxBinary):
+        if node.op.tipe == TipeToken.TAMBAH:
+            bagian = self._bagian_rantai_teks(node)
+            # Dua bagian tanpa interpolasi ("a" + x) tetap satu ADD biasa
+            if bagian and (len(bagian) > 2 or any(isinstance(b, ast.KonversiTeks) for b in bagian)):
+                return self.emit_build_string(bagian)
         self.visit(node.kiri); self.visit(node.kanan)
         op = node.op.tipe
         if op == TipeToken.TAMBAH: self.emit(Op.ADD)
@@ -589,7 +756,7 @@ class Compiler:
             alias = base[:-4] if base.endswith('.fox') else base.split('.')[-1]
         if self.parent is not None:
             self.locals.add(alias)
-            self.emit(Op.STORE_LOCAL, alias)
+            self.emit_store_local(alias)
         else:
             self.emit(Op.STORE_VAR, alias)
 
@@ -602,13 +769,16 @@ class Compiler:
                      arg_names.append(token_param.nilai)
             for arg in arg_names:
                 func_compiler.locals.add(arg)
-                func_compiler.emit(Op.LOAD_LOCAL, arg)
+                func_compiler.local_slot(arg)
+            for arg in arg_names:
+                func_compiler.emit_load_local(arg)
             func_compiler.emit(Op.BUILD_VARIANT, varian.nama.nilai, len(arg_names))
             func_compiler.emit(Op.RET)
             code_obj = CodeObject(
                 name=varian.nama.nilai,
                 instructions=func_compiler.instructions,
-                arg_names=arg_names
+                arg_names=arg_names,
+                local_names=tuple(func_compiler.local_slots)
             )
             self.emit(Op.PUSH_CONST, code_obj)
             self.emit(Op.STORE_VAR, varian.nama.nilai)
@@ -622,7 +792,7 @@ class Compiler:
             self.emit(Op.LOAD_ATTR, simbol)
             if self.parent is not None:
                 self.locals.add(simbol)
-                self.emit(Op.STORE_LOCAL, simbol)
+                self.emit_store_local(simbol)
             else:
                 self.emit(Op.STORE_VAR, simbol)
         self.emit(Op.POP)
@@ -633,7 +803,7 @@ class Compiler:
         alias = node.alias.nilai if node.alias else module_path.split('.')[-1]
         if self.parent is not None:
             self.locals.add(alias)
-            self.emit(Op.STORE_LOCAL, alias)
+            self.emit_store_local(alias)
         else:
             self.emit(Op.STORE_VAR, alias)
 
@@ -671,12 +841,14 @@ class Compiler:
             if isinstance(pola, ast.PolaVarian):
                 self.emit(Op.IS_VARIANT, pola.nama.nilai)
                 jump_next = self.emit(Op.JMP_IF_FALSE, 0)
-                self.emit(Op.UNPACK_VARIANT)
                 if pola.daftar_ikatan:
+                    self.emit(Op.UNPACK_VARIANT)
                     for token_var in pola.daftar_ikatan:
                         var_name = token_var.nilai
-                        if self.parent: self.locals.add(var_name); self.emit(Op.STORE_LOCAL, var_name)
+                        if self.parent: self.locals.add(var_name); self.emit_store_local(var_name)
                         else: self.emit(Op.STORE_VAR, var_name)
+                else:
+                    self.emit(Op.POP)
             elif isinstance(pola, ast.PolaLiteral):
                 val = pola.nilai.nilai
                 self.emit(Op.PUSH_CONST, val)
@@ -685,17 +857,21 @@ class Compiler:
                 self.emit(Op.POP)
             elif isinstance(pola, ast.PolaWildcard):
                 self.emit(Op.POP)
+                self.emit(Op.POP)
             elif isinstance(pola, ast.PolaIkatanVariabel):
                 var_name = pola.token.nilai
-                if self.parent: self.locals.add(var_name); self.emit(Op.STORE_LOCAL, var_name)
+                if self.parent: self.locals.add(var_name); self.emit_store_local(var_name)
                 else: self.emit(Op.STORE_VAR, var_name)
+                self.emit(Op.POP)
             else:
                 raise NotImplementedError(f"Pola {pola.__class__.__name__} belum didukung")
+            # Subjek sudah di-pop di setiap jalur yang cocok: badan kasus berjalan pada
+            # kedalaman stack dasar, sama seperti yang diasumsikan FOR_ITER dan iter_depth.
             self.visit(kasus.badan)
             jump_end = self.emit(Op.JMP, 0)
             end_jumps.append(jump_end)
             if jump_next != -1: self.patch_jump(jump_next, len(self.instructions))
-        self.emit(Op.POP)
+        self.emit(Op.POP)  # Tidak ada kasus yang cocok
         end_pos = len(self.instructions)
         for jmp in end_jumps: self.patch_jump(jmp, end_pos)
 
@@ -0,0 +1,168 @@
+# ivm/core/bytecode_cache.py
+"""
+Cache bytecode persisten untuk modul .fox (setara __pycache__ di CPython).
+
+Hasil kompilasi `<dir>/nama.fox` disimpan di `<dir>/__foxcache__/nama.fox.mvm`, atau
+`nama.fox.opt-N.mvm` untuk level optimasi N > 0 (ivm/optimizer.py, opsi -O), sehingga
+setiap level punya entri sendiri dan bisa dipakai bergantian tanpa saling menimpa:
+
+    Header cache : b"FOXCACHE" + mtime_ns(8) + ukuran(8) + sha256 sumber(32) + tag compiler(32)
+    Isi          : image .mvm v2 (ivm/core/serializer.py)
+
+Validasi saat baca:
+  1. Tag compiler harus sama (hash sumber lexer/parser/compiler/format, plus optimizer
+     dan levelnya untuk N > 0, lihat tag_compiler()).
+  2. Jalur cepat: mtime_ns dan ukuran sumber sama -> pakai tanpa membaca sumber.
+  3. Selain itu sumber dibaca dan di-hash; hash sama -> pakai (header disegarkan),
+     beda -> kompilasi ulang dan tulis ulang entri.
+
+Sumber yang baru saja diubah (mtime terlalu dekat dengan waktu tulis cache) dicatat
+tanpa mtime, jadi pemakaian berikutnya selalu lewat hash: perubahan dalam resolusi
+mtime yang sama dengan ukuran sama tetap terdeteksi.
+
+Penulisan atomik: file sementara di direktori cache lalu os.replace, jadi penulis
+paralel tidak pernah menghasilkan entri setengah jadi; pembaca melihat entri lama
+atau baru utuh. Semua kegagalan I/O atau entri rusak diperlakukan sebagai cache miss.
+"""
+import hashlib
+import os
+import struct
+import tempfile
+import time
+from typing import Callable, Dict, Optional
+
+from ivm.core.structs import CodeObject
+
+CACHE_DIR = "__foxcache__"
+CACHE_SUFFIX = ".mvm"
+
+_MAGIC = b"FOXCACHE"
+_HEADER = struct.Struct("<8sqq32s32s")
+# Selisih minimal (detik) antara mtime sumber dan waktu tulis agar mtime boleh dipercaya
+_MTIME_AMAN = 2.0
+
+_tag_compiler: Dict[int, bytes] = {}
+
+def tag_compiler(optimasi: int = 0) -> bytes:
+    """
+    Sidik jari versi compiler: sha256 atas sumber modul yang menentukan hasil kompilasi
+    dan format serialisasinya. Mengubah salah satunya membatalkan semua entri cache.
+    Untuk level optimasi > 0 sumber ivm/optimizer.py dan levelnya ikut di-hash.
+    """
+    tag = _tag_compiler.get(optimasi)
+    if tag is not None:
+        return tag
+    if optimasi:
+        import ivm.optimizer
+        h = hashlib.sha256(tag_compiler())
+        with open(ivm.optimizer.__file__, "rb") as f:
+            h.update(f.read())
+        h.update(bytes((optimasi,)))
+    else:
+        import transisi.lx
+        import transisi.crusher
+        import transisi.absolute_sntx_morph
+        import ivm.compiler
+        import ivm.core.opcodes
+        import ivm.core.serializer
+        import ivm.core.deserializer
+        h = hashlib.sha256()
+        for modul in (transisi.lx, transisi.crusher, transisi.absolute_sntx_morph, ivm.compiler,
+                      ivm.core.opcodes, ivm.core.serializer, ivm.core.deserializer):
+            with open(modul.__file__, "rb") as f:
+                h.update(f.read())
+    tag = _tag_compiler[optimasi] = h.digest()
+    return tag
+
+def path_cache(source_path: str, optimasi: int = 0) -> str:
+    """Lokasi entri cache untuk file sumber `source_path` pada level optimasi `optimasi`."""
+    direktori, nama = os.path.split(os.path.abspath(source_path))
+    if optimasi:
+        nama += f".opt-{optimasi}"
+    return os.path.join(direktori, CACHE_DIR, nama + CACHE_SUFFIX)
+
+def _baca(path: str) -> Optional[bytes]:
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+def _tulis(path: str, data: bytes, mode: int):
+    """Tulis atomik; gagal (read-only, izin, disk penuh) diabaikan diam-diam."""
+    try:
+        direktori = os.path.dirname(path)
+        os.makedirs(direktori, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=direktori, prefix=".tmp-", suffix=CACHE_SUFFIX)
+        try:
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, mode) # mkstemp selalu 0600; ikuti izin baca file sumber
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+    except OSError:
+        pass
+
+def _muat_image(data: bytes, source_path: str) -> Optional[CodeObject]:
+    from ivm.core.deserializer import deserialize_mvm
+    try:
+        return deserialize_mvm(data, filename=source_path, offset=_HEADER.size)
+    except Exception:
+        return None # Entri rusak/terpotong -> miss
+
+def kompilasi_dengan_cache(source_path: str, kompilasi: Callable[[str], CodeObject], optimasi: int = 0) -> CodeObject:
+    """
+    Kembalikan CodeObject untuk `source_path`, dari cache jika masih valid.
+    `kompilasi(source)` dipanggil hanya saat miss; error kompilasi diteruskan apa adanya
+    dan tidak menulis entri. `optimasi` hanya memilih entri: hasil `kompilasi` harus
+    sudah dioptimasi pada level tersebut.
+    """
+    st = os.stat(source_path)
+    cache_path = path_cache(source_path, optimasi)
+    tag = tag_compiler(optimasi)
+
+    entri = _baca(cache_path)
+    header = None
+    if entri is not None and len(entri) >= _HEADER.size:
+        header = _HEADER.unpack_from(entri)
+        if header[0] != _MAGIC or header[4] != tag:
+            header = None
+        elif header[1] == st.st_mtime_ns and header[2] == st.st_size:
+            code = _muat_image(entri, source_path)
+            if code is not None:
+                return code
+            header = None
+
+    with open(source_path, "rb") as f:
+        source_bytes = f.read()
+    digest = hashlib.sha256(source_bytes).digest()
+
+    if header is not None and header[3] == digest:
+        code = _muat_image(entri, source_path)
+        if code is not None:
+            # Isi sama tapi mtime/ukuran berubah (mis. touch, checkout): segarkan header
+            _tulis(cache_path, _buat_header(st, digest, tag) + entri[_HEADER.size:], st.st_mode & 0o666)
+            return code
+
+    from ivm.core.serializer import serialize_mvm
+    # Sama dengan open(..., "r") mode teks: newline universal
+    source = source_bytes.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    code = kompilasi(source)
+    try:
+        image = serialize_mvm(code)
+    except (TypeError, ValueError, struct.error):
+        return code # Konstanta di luar format: jalan tanpa cache
+    _tulis(cache_path, _buat_header(st, digest, tag) + image, st.st_mode & 0o666)
+    return code
+
+def _buat_header(st: os.stat_result, digest: bytes, tag: bytes) -> bytes:
+    mtime_ns = st.st_mtime_ns
+    if time.time() - st.st_mtime < _MTIME_AMAN:
+        mtime_ns = 0 # Sumber masih "panas": paksa verifikasi hash di pemakaian berikutnya
+    return _HEADER.pack(_MAGIC, mtime_ns, st.st_size, digest, tag)
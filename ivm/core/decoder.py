@@ -0,0 +1,137 @@
+# ivm/core/decoder.py
+"""
+Decode instruksi CodeObject (list tuple heterogen) menjadi dua array paralel:
+  - ops  : array('B') berisi nilai int opcode
+  - args : list operand, satu per instruksi (None / nilai tunggal / tuple untuk multi-operand)
+
+Indeks keduanya sama dengan pc di CodeObject.instructions, jadi target lompatan
+tidak berubah. Varian hybrid (bootstrap vs self-hosted) diselesaikan di sini.
+
+fuse_superinstructions menurunkan salinan array dengan urutan opcode panas
+digabung jadi satu superinstruksi (lihat DecodedOp).
+"""
+import operator
+from array import array
+from typing import Any, Iterable, List, Set, Tuple
+from ivm.core.opcodes import Op, DecodedOp
+
+_IS_INSTANCE = Op.IS_INSTANCE.value
+_IS_VARIANT = Op.IS_VARIANT.value
+_BUILD_VARIANT = Op.BUILD_VARIANT.value
+_UNKNOWN = DecodedOp.UNKNOWN.value
+# Nilai opcode yang boleh muncul di bytecode; DecodedOp internal (superinstruksi, varian
+# bertipe) hanya dibuat decoder/VM, jadi nilai mentahnya dianggap tidak dikenal
+_OPCODE_VALID = frozenset(op.value for op in Op)
+
+def decode_instruction(instr: Tuple) -> Tuple[int, Any]:
+    """Decode satu tuple instruksi menjadi (opcode_int, operand)."""
+    op = instr[0]
+    n = len(instr)
+    if not isinstance(op, int) or op not in _OPCODE_VALID:
+        return _UNKNOWN, None
+
+    if op == _IS_INSTANCE or op == _IS_VARIANT:
+        # Bootstrap: nama di operand. Self-hosted: operand None, nama di stack.
+        if n > 1 and instr[1] is not None:
+            named = DecodedOp.IS_INSTANCE_NAMED if op == _IS_INSTANCE else DecodedOp.IS_VARIANT_NAMED
+            return named.value, instr[1]
+        return int(op), None
+
+    if op == _BUILD_VARIANT and n == 3:
+        # Bootstrap format: (OP, Name, Count)
+        return DecodedOp.BUILD_VARIANT_NAMED.value, (instr[1], instr[2])
+
+    if n < 2: return int(op), None
+    if n == 2: return int(op), instr[1]
+    return int(op), tuple(instr[1:])
+
+def decode_instructions(instructions: List[Tuple]) -> Tuple[array, List[Any]]:
+    ops = array('B')
+    args = []
+    for instr in instructions:
+        op, arg = decode_instruction(instr)
+        ops.append(op)
+        args.append(arg)
+    return ops, args
+
+_LOAD_FAST = Op.LOAD_FAST.value
+_STORE_FAST = Op.STORE_FAST.value
+_PUSH_CONST = Op.PUSH_CONST.value
+_ADD = Op.ADD.value
+_LOAD_ATTR = Op.LOAD_ATTR.value
+_LOAD_METHOD = Op.LOAD_METHOD.value
+_JMP_IF_FALSE = Op.JMP_IF_FALSE.value
+
+# Opcode yang operandnya target lompatan (pc); PUSH_TRY untuk bytecode self-hosted
+_TARGET_LOMPATAN = frozenset(op.value for op in (Op.JMP, Op.JMP_IF_FALSE, Op.JMP_IF_TRUE, Op.FOR_ITER, Op.PUSH_TRY))
+
+_COMPARE_FUNCS = {
+    Op.EQ.value: operator.eq, Op.NEQ.value: operator.ne,
+    Op.LT.value: operator.lt, Op.GT.value: operator.gt,
+    Op.LTE.value: operator.le, Op.GTE.value: operator.ge,
+}
+
+# Nama atribut yang ditangani khusus oleh LOAD_ATTR/LOAD_METHOD, tidak digabung
+_ATTR_KHUSUS = ("__class__", "punya")
+
+def _attr_biasa(a):
+    return (a[0], a[1]) if a[1] not in _ATTR_KHUSUS else None
+
+# (urutan opcode, superinstruksi, pembentuk operand dari args urutan itu -> None jika batal).
+# Per opcode awal, pola yang lebih panjang dicoba lebih dulu.
+SUPERINSTRUCTIONS = [
+    ((_LOAD_FAST, _PUSH_CONST, _ADD, _STORE_FAST), DecodedOp.INC_FAST,
+        lambda a: (a[0], a[1]) if a[0] == a[3] else None),
+    ((_LOAD_FAST, _LOAD_ATTR), DecodedOp.LOAD_FAST_ATTR, _attr_biasa),
+    ((_LOAD_FAST, _LOAD_METHOD), DecodedOp.LOAD_FAST_METHOD, _attr_biasa),
+    ((_LOAD_FAST, _LOAD_FAST), DecodedOp.LOAD_FAST_FAST, lambda a: (a[0], a[1])),
+    ((_LOAD_FAST, _PUSH_CONST), DecodedOp.LOAD_FAST_CONST, lambda a: (a[0], a[1])),
+    ((_STORE_FAST, _LOAD_FAST), DecodedOp.STORE_FAST_LOAD_FAST, lambda a: (a[0], a[1])),
+] + [
+    ((cmp_op, _JMP_IF_FALSE), DecodedOp.COMPARE_JMP_IF_FALSE, lambda a, f=func: (f, a[1]))
+    for cmp_op, func in _COMPARE_FUNCS.items()
+]
+
+_POLA_PER_OP = {}
+for _pola in SUPERINSTRUCTIONS:
+    _POLA_PER_OP.setdefault(_pola[0][0], []).append(_pola)
+
+# Jumlah instruksi asli yang dicakup tiap opcode hasil decode: 1, atau panjang urutan superinstruksi
+PANJANG_URUTAN = array('B', [1]) * 256
+for _pola in SUPERINSTRUCTIONS:
+    PANJANG_URUTAN[_pola[1].value] = len(_pola[0])
+
+def block_leaders(ops: array, args: List[Any], batas: Iterable[int] = ()) -> Set[int]:
+    """pc yang menjadi awal basic block: target lompatan ditambah `batas` (misal pc exception_table)."""
+    leaders = set(batas)
+    for pc, op in enumerate(ops):
+        if op in _TARGET_LOMPATAN and type(args[pc]) is int:
+            leaders.add(args[pc])
+    return leaders
+
+def fuse_superinstructions(ops: array, args: List[Any], batas: Iterable[int] = ()) -> Tuple[array, List[Any]]:
+    """
+    Salinan (ops, args) dengan urutan di SUPERINSTRUCTIONS digabung. Superinstruksi
+    ditaruh di pc instruksi pertama dan mengeksekusi seluruh urutan; instruksi asli
+    sesudahnya tidak diubah. Urutan tidak digabung melewati awal basic block (target
+    lompatan atau pc di `batas`), jadi satu superinstruksi selalu berada di satu blok
+    dan satu rentang exception_table.
+    """
+    fops = array('B', ops)
+    fargs = list(args)
+    n = len(ops)
+    leaders = block_leaders(ops, args, batas)
+    i = 0
+    while i < n:
+        for urutan, fused, pembentuk in _POLA_PER_OP.get(ops[i], ()):
+            k = len(urutan)
+            if (i + k <= n and all(ops[i + j] == urutan[j] for j in range(1, k))
+                    and not any(i + j in leaders for j in range(1, k))):
+                operand = pembentuk(args[i:i + k])
+                if operand is not None:
+                    fops[i] = fused.value
+                    fargs[i] = operand
+                    i += k - 1
+                    break
+        i += 1
+    return fops, fargs
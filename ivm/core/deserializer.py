@@ -1,12 +1,29 @@
 # ivm/core/deserializer.py
+import mmap
 import struct
+from copy import deepcopy
+from functools import cached_property
 from ivm.core.structs import CodeObject
 from ivm.core.opcodes import Op
 
+MAGIC = b"VZOEL FOXS"
+HEADER_SIZE = 16
+
+# Byte opcode -> Op; lookup dict jauh lebih murah daripada Op(byte) per instruksi
+_OP_DARI_BYTE = {op.value: op for op in Op}
+
 class BinaryReader:
-    def __init__(self, data: bytes):
+    """
+    Pembaca image .mvm. `data` boleh bytes, memoryview atau memoryview atas mmap:
+    string di-decode langsung dari potongan buffer tanpa menyalin image.
+    """
+    def __init__(self, data: bytes, version: int = 1, pos: int = 0):
         self.data = data
-        self.pos = 0
+        self.pos = pos
+        self.version = version
+        self.strings = [] # Pool string bersama (v2)
+        self.lazy = False # v2: CodeObject bersarang di-decode saat pertama dipakai (LazyCodeObject)
+        self.pemilik = None # _ImageMmap yang ditahan setiap LazyCodeObject dari buffer ini (muat_mvm)
 
     def read_byte(self):
         val = self.data[self.pos]
@@ -25,7 +42,7 @@ class BinaryReader:
 
     def read_string(self):
         length = self.read_int()
-        val = self.data[self.pos : self.pos + length].decode("utf-8")
+        val = str(self.data[self.pos : self.pos + length], "utf-8")
         self.pos += length
         return val
 
@@ -57,6 +74,9 @@ class BinaryReader:
 
     def read_code_object(self, filename="<binary>"):
         # Tag already consumed by read_constant if called recursively
+        if self.version >= 2:
+            return self.read_code_object_v2(filename)
+
         # Structure matches greenfield/cotc/bytecode/struktur.fox
 
         # Name
@@ -95,11 +115,263 @@ class BinaryReader:
 
         return CodeObject(name=name, instructions=instructions, arg_names=arg_names, filename=filename)
 
-def deserialize_code_object(data: bytes, filename="<binary>") -> CodeObject:
-    reader = BinaryReader(data)
+    # --- Format v2 (ivm/core/serializer.py) ---
+
+    def read_uvarint(self):
+        data = self.data
+        pos = self.pos
+        b = data[pos]
+        pos += 1
+        val = b & 0x7F
+        shift = 7
+        while b & 0x80:
+            b = data[pos]
+            pos += 1
+            val |= (b & 0x7F) << shift
+            shift += 7
+        self.pos = pos
+        return val
+
+    def read_svarint(self):
+        val = self.read_uvarint()
+        return -((val + 1) >> 1) if val & 1 else val >> 1
+
+    def read_pool(self):
+        strings = []
+        data = self.data
+        for _ in range(self.read_uvarint()):
+            length = self.read_uvarint()
+            strings.append(str(data[self.pos : self.pos + length], "utf-8"))
+            self.pos += length
+        self.strings = strings
+
+    def read_names(self):
+        strings = self.strings
+        read_uvarint = self.read_uvarint
+        return tuple([strings[read_uvarint()] for _ in range(read_uvarint())])
+
+    def read_constant_v2(self):
+        tag = self.read_byte()
+        if tag == 5: return self.strings[self.read_uvarint()]
+        elif tag == 3: return self.read_svarint()
+        elif tag == 1: return None
+        elif tag == 2: return bool(self.read_byte())
+        elif tag == 7: return self.read_code_object_v2() # nested: filename tersimpan
+        elif tag == 4: return self.read_float()
+        elif tag == 9: # Tuple
+            return tuple([self.read_constant_v2() for _ in range(self.read_uvarint())])
+        elif tag == 6: # List
+            return [self.read_constant_v2() for _ in range(self.read_uvarint())]
+        elif tag == 8: # Dict
+            res = {}
+            for _ in range(self.read_uvarint()):
+                k = self.read_constant_v2()
+                res[k] = self.read_constant_v2()
+            return res
+        elif tag == 10: # Bytes
+            length = self.read_uvarint()
+            val = bytes(self.data[self.pos : self.pos + length])
+            self.pos += length
+            return val
+        else:
+            raise ValueError(f"Unknown type tag: {tag}")
+
+    def read_code_object_v2(self, filename=None):
+        # Layout: lihat ivm/core/serializer.py. filename=None -> pakai yang tersimpan
+        read_uvarint = self.read_uvarint
+        read_byte = self.read_byte
+        read_names = self.read_names
+        strings = self.strings
+
+        body_len = read_uvarint()
+        body_end = self.pos + body_len
+        name = strings[read_uvarint()]
+        stored_filename = strings[read_uvarint()]
+        flags = read_byte()
+        arg_names = list(read_names())
+        local_names = read_names()
+        free_vars = read_names()
+        cell_vars = read_names()
+
+        exception_table = tuple([
+            (read_uvarint(), read_uvarint(), read_uvarint(), read_uvarint())
+            for _ in range(read_uvarint())
+        ])
+
+        line_table = []
+        pc = baris = 0
+        for _ in range(read_uvarint()):
+            pc += read_uvarint()
+            baris += self.read_svarint()
+            line_table.append((pc, baris))
+
+        fields = dict(
+            name=name,
+            arg_names=arg_names,
+            filename=stored_filename if filename is None else filename,
+            is_generator=bool(flags & 1),
+            free_vars=free_vars,
+            cell_vars=cell_vars,
+            local_names=local_names,
+            exception_table=exception_table,
+            line_table=tuple(line_table),
+        )
+        if self.lazy:
+            # Instruksi (dan CodeObject di dalamnya) dilewati; di-decode saat pertama diakses.
+            # Image terpotong harus gagal di sini, bukan nanti saat fungsinya dipanggil.
+            if body_end > len(self.data):
+                raise ValueError("Image .mvm terpotong")
+            if self.pemilik is not None: self.pemilik.tertunda += 1
+            code = LazyCodeObject((self.data, strings, self.pos, self.pemilik), **fields)
+            self.pos = body_end
+            return code
+        return CodeObject(instructions=self.read_instructions_v2(), **fields)
+
+    def read_instructions_v2(self):
+        # Operand paling umum (indeks pool string, int kecil, nil) di-decode inline;
+        # sisanya lewat read_constant_v2
+        data = self.data
+        strings = self.strings
+        read_constant = self.read_constant_v2
+        op_dari_byte = _OP_DARI_BYTE
+        instructions = []
+        append = instructions.append
+        count = self.read_uvarint()
+        pos = self.pos
+        for _ in range(count):
+            op = op_dari_byte[data[pos]]
+            n = data[pos + 1]
+            pos += 2
+            if n == 0:
+                append((op,))
+                continue
+            instr = [op]
+            for _ in range(n):
+                tag = data[pos]
+                if tag == 5 or tag == 3:
+                    b = data[pos + 1]
+                    if b < 0x80:
+                        pos += 2
+                        if tag == 5:
+                            instr.append(strings[b])
+                        else:
+                            instr.append(-((b + 1) >> 1) if b & 1 else b >> 1)
+                        continue
+                elif tag == 1:
+                    pos += 1
+                    instr.append(None)
+                    continue
+                self.pos = pos
+                instr.append(read_constant())
+                pos = self.pos
+            append(tuple(instr))
+        self.pos = pos
+        return instructions
+
+class LazyCodeObject(CodeObject):
+    """
+    CodeObject dari image .mvm v2 yang instruksinya belum di-decode. Metadata (nama,
+    argumen, slot, tabel) sudah terisi; `instructions` di-decode dari buffer image saat
+    pertama diakses (biasanya saat fungsi pertama kali dipanggil), lalu tersimpan sebagai
+    atribut biasa sehingga akses berikutnya tidak lewat property lagi. Fungsi yang tidak
+    pernah dipanggil tidak pernah membayar biaya decode.
+    """
+    def __init__(self, sumber, **fields):
+        super().__init__(instructions=None, **fields)
+        del self.instructions # Buka jalan untuk cached_property di bawah
+        self._sumber = sumber # (buffer, pool string, posisi instruksi)
+
+    @cached_property
+    def instructions(self):
+        data, strings, pos, pemilik = self._sumber
+        self._sumber = None # Lepas referensi ke buffer image
+        reader = BinaryReader(data, 2, pos)
+        reader.strings = strings
+        reader.lazy = True
+        reader.pemilik = pemilik
+        instructions = reader.read_instructions_v2()
+        if pemilik is not None:
+            del reader, data # memoryview harus sudah lepas sebelum mmap bisa ditutup
+            pemilik.lepas()
+        return instructions
+
+    def __deepcopy__(self, memo):
+        # Salinan selalu CodeObject biasa yang sudah di-decode; buffer image tidak ikut disalin
+        salinan = CodeObject.__new__(CodeObject)
+        memo[id(self)] = salinan
+        self.instructions
+        for key, val in self.__dict__.items():
+            if key != "_sumber":
+                salinan.__dict__[key] = deepcopy(val, memo)
+        return salinan
+
+class _ImageMmap:
+    """
+    Pemilik mmap image yang dibuka muat_mvm. Setiap LazyCodeObject yang belum di-decode
+    menahan satu referensi, ditambah satu milik muat_mvm selama deserialisasi; mmap
+    (dan salinan file descriptor-nya) ditutup begitu referensi terakhir dilepas, yaitu
+    saat semua fungsi image sudah di-decode. Fungsi yang tidak pernah dipanggil
+    menahan mmap sampai LazyCodeObject-nya dibuang.
+    """
+    __slots__ = ("peta", "tertunda")
+
+    def __init__(self, peta: mmap.mmap):
+        self.peta = peta
+        self.tertunda = 1
+
+    def lepas(self):
+        self.tertunda -= 1
+        if self.tertunda == 0:
+            try:
+                self.peta.close()
+            except BufferError:
+                pass # Masih ada memoryview hidup di luar loader; mmap ditutup saat di-GC
+
+def deserialize_code_object(data: bytes, filename="<binary>", version: int = 1, offset: int = 0,
+                            lazy: bool = False, pemilik: "_ImageMmap" = None) -> CodeObject:
+    reader = BinaryReader(data, version, offset)
+    if version >= 2:
+        reader.read_pool()
+        reader.lazy = lazy
+        reader.pemilik = pemilik
     # Check top level tag
     tag = reader.read_byte()
     if tag != 7:
         raise ValueError("Root object must be CodeObject (Tag 7)")
 
     return reader.read_code_object(filename)
+
+def deserialize_mvm(data: bytes, filename="<binary>", offset: int = 0, lazy: bool = True,
+                    pemilik: "_ImageMmap" = None) -> CodeObject:
+    """
+    Deserialisasi image .mvm lengkap (header 16 byte + payload) mulai `offset` di `data`.
+    Versi format dibaca dari header: v1 (greenfield) atau v2 (ivm/core/serializer.py).
+    Payload dibaca lewat memoryview tanpa disalin; v2 dengan lazy=True mengembalikan
+    LazyCodeObject yang menahan referensi ke `data` sampai instruksinya di-decode.
+    """
+    data = memoryview(data)
+    if len(data) < offset + HEADER_SIZE or data[offset : offset + 10] != MAGIC:
+        raise ValueError("Format .mvm tidak valid (Magic Header mismatch)")
+    version = data[offset + 10]
+    if version not in (1, 2):
+        raise ValueError(f"Versi .mvm tidak didukung: {version}")
+    return deserialize_code_object(data, filename=filename, version=version, offset=offset + HEADER_SIZE,
+                                   lazy=lazy, pemilik=pemilik)
+
+def muat_mvm(path: str, filename=None, lazy: bool = True) -> CodeObject:
+    """
+    Muat file .mvm lewat mmap (read-only): halaman file dibaca OS sesuai kebutuhan,
+    tanpa salinan image di memori Python. File kosong/tidak bisa di-mmap dibaca biasa.
+    mmap ditutup setelah semua fungsi di-decode (langsung jika lazy=False), lihat _ImageMmap.
+    """
+    filename = path if filename is None else filename
+    with open(path, "rb") as f:
+        try:
+            peta = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            return deserialize_mvm(f.read(), filename=filename, lazy=lazy)
+    pemilik = _ImageMmap(peta)
+    try:
+        return deserialize_mvm(peta, filename=filename, lazy=lazy, pemilik=pemilik)
+    finally:
+        pemilik.lepas()
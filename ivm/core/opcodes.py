@@ -130,6 +130,17 @@ class Op(IntEnum):
     IO_LIST = 93 # Helper
     IO_MKDIR = 94 # Helper
 
+    # === Slot-indexed Locals ===
+    # Arg: indeks slot di Frame.fast (nama ada di CodeObject.local_names)
+    LOAD_FAST = 95
+    STORE_FAST = 96
+
+    # === Method Calls ===
+    # LOAD_METHOD nama: [obj] -> [metode, kelas_pemilik, obj] tanpa membuat BoundMethod,
+    # atau [nilai_atribut, nil, UNBOUND] jika atribut bukan metode instance.
+    LOAD_METHOD = 97
+    CALL_METHOD = 98 # Arg: jumlah argumen (tanpa 'ini')
+
     # === System / IO (Legacy/Console) ===
     PRINT = 53
     PRINT_RAW = 54
@@ -138,6 +149,50 @@ class Op(IntEnum):
     # === Flow Control (Coroutines/Infinity) ===
     YIELD = 56
     RESUME = 57
+    # FOR_ITER target: [iter] -> [iter, nilai]. Iterator Python (hasil GET_ITER): nilai
+    # berikutnya di-push. Generator: dilanjutkan di tempat, nilai yield di-push apa adanya
+    # (tanpa Momen). Iterator/generator habis -> di-pop dan lompat ke target.
+    FOR_ITER = 99
+    # GET_ITER: [sumber] -> [iter]. daftar/kamus (kunci)/teks/bytes/rentang jadi iterator
+    # Python; generator diteruskan apa adanya.
+    GET_ITER = 100
+    # BUILD_STRING n, konversi, mentah: gabung n bagian teratas jadi satu teks dalam satu langkah
+    # (interpolasi dan rantai '+'). Indeks di `konversi` dikonversi seperti STR; indeks di
+    # `mentah` adalah operand '+' biasa yang harus sudah teks (bukan teks -> rantai '+' diulang).
+    BUILD_STRING = 101
 
     def __repr__(self):
         return self.name
+
+class DecodedOp(IntEnum):
+    """
+    Opcode internal hasil decode (ivm/core/decoder.py). Varian hybrid bootstrap
+    vs self-hosted dipecah jadi opcode tersendiri saat decode, sehingga handler
+    tidak perlu mengecek bentuk instruksi lagi. Tidak pernah ditulis ke bytecode/.mvm.
+    """
+    UNKNOWN = 0               # Opcode tidak dikenal (no-op, sama seperti dispatch lama)
+    IS_INSTANCE_NAMED = 200   # (IS_INSTANCE, nama_tipe) - nama di operand, bukan di stack
+    IS_VARIANT_NAMED = 201    # (IS_VARIANT, nama_varian)
+    BUILD_VARIANT_NAMED = 202 # (BUILD_VARIANT, nama, jumlah) - format bootstrap
+
+    # --- Superinstruksi (decoder.fuse_superinstructions) ---
+    # Menempati pc instruksi pertama urutannya; instruksi asli sesudahnya tetap
+    # di array sebagai target lompatan. Dipilih dari profil ivm/core/profiler.py.
+    LOAD_FAST_ATTR = 203       # LOAD_FAST s; LOAD_ATTR n        -> (s, n)
+    LOAD_FAST_METHOD = 204     # LOAD_FAST s; LOAD_METHOD n      -> (s, n)
+    LOAD_FAST_FAST = 205       # LOAD_FAST a; LOAD_FAST b        -> (a, b)
+    LOAD_FAST_CONST = 206      # LOAD_FAST s; PUSH_CONST c       -> (s, c)
+    STORE_FAST_LOAD_FAST = 207 # STORE_FAST a; LOAD_FAST b       -> (a, b)
+    INC_FAST = 208             # LOAD_FAST s; PUSH_CONST c; ADD; STORE_FAST s -> (s, c)
+    COMPARE_JMP_IF_FALSE = 209 # EQ/NEQ/LT/GT/LTE/GTE; JMP_IF_FALSE t -> (fungsi_operator, t)
+
+    # --- Spesialisasi tipe (ivm/core/specializer.py) ---
+    # Ditulis VM saat runtime ke CodeObject.specialized() menggantikan ADD/SUB/MUL
+    # generik; tipe operand tidak cocok -> situs dikembalikan ke opcode generik.
+    ADD_INT = 210
+    ADD_FLOAT = 211
+    ADD_STR = 212
+    SUB_INT = 213
+    SUB_FLOAT = 214
+    MUL_INT = 215
+    MUL_FLOAT = 216
@@ -0,0 +1,57 @@
+# ivm/core/profiler.py
+"""
+Profiler frekuensi opcode untuk StandardVM (StandardVM(profiler=OpcodeProfiler())).
+
+Mencatat opcode tunggal, pasangan, dan triple yang dieksekusi berurutan secara
+statis (pc berurutan di frame yang sama, bukan lewat lompatan atau pergantian
+frame). Hanya urutan seperti itu yang bisa digabung jadi superinstruksi oleh
+ivm/core/decoder.py, jadi angka di sini langsung menunjukkan kandidatnya.
+"""
+from collections import Counter
+from typing import List, Tuple
+from ivm.core.opcodes import Op, DecodedOp
+
+def nama_opcode(op: int) -> str:
+    for enum in (Op, DecodedOp):
+        try:
+            return enum(op).name
+        except ValueError:
+            pass
+    return f"OP_{op}"
+
+class OpcodeProfiler:
+    def __init__(self):
+        self.tunggal: Counter = Counter()
+        self.pasangan: Counter = Counter()
+        self.triple: Counter = Counter()
+        self._frame = None
+        self._pc = -1
+        self._prev1 = None
+        self._prev2 = None
+
+    def catat(self, frame, pc: int, op: int):
+        """Dipanggil VM sebelum instruksi di (frame, pc) dieksekusi."""
+        self.tunggal[op] += 1
+        if frame is self._frame and pc == self._pc + 1:
+            self.pasangan[(self._prev1, op)] += 1
+            if self._prev2 is not None:
+                self.triple[(self._prev2, self._prev1, op)] += 1
+            self._prev2 = self._prev1
+        else:
+            self._frame = frame
+            self._prev2 = None
+        self._prev1 = op
+        self._pc = pc
+
+    def teratas(self, n: int = 20) -> Tuple[List, List, List]:
+        return self.tunggal.most_common(n), self.pasangan.most_common(n), self.triple.most_common(n)
+
+    def laporan(self, n: int = 20) -> str:
+        total = sum(self.tunggal.values()) or 1
+        baris = []
+        for judul, data in zip(("Opcode", "Pasangan", "Triple"), self.teratas(n)):
+            baris.append(f"== {judul} teratas ==")
+            for kunci, jumlah in data:
+                nama = nama_opcode(kunci) if isinstance(kunci, int) else " ; ".join(nama_opcode(k) for k in kunci)
+                baris.append(f"{jumlah:>10} {jumlah / total * 100:>6.2f}%  {nama}")
+        return "\n".join(baris)
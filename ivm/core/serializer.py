@@ -0,0 +1,178 @@
+# ivm/core/serializer.py
+"""
+Penulis .mvm sisi Python (pasangan ivm/core/deserializer.py).
+
+Format v1 (ditulis compiler self-hosted greenfield) hanya menyimpan satu operand per
+instruksi dan membuang metadata CodeObject (free_vars, cell_vars, local_names,
+exception_table, is_generator, filename), jadi tidak cukup untuk hasil ivm/compiler.py.
+Penulis ini selalu menghasilkan format v2:
+
+    Header (16 byte) : b"VZOEL FOXS" + versi(1) + flags(1) + timestamp(4)
+    Payload          : pool string, lalu tag 7 + CodeObject root
+    Pool string      : uvarint jumlah, lalu per string uvarint panjang + UTF-8.
+                       Dipakai bersama oleh semua CodeObject (nama, nama variabel,
+                       konstanta string), setiap string unik hanya disimpan sekali.
+
+    CodeObject v2    : uvarint panjang badan (agar bisa dilewati tanpa decode), lalu
+                       name, filename (ref pool), flags(1; bit0 = is_generator),
+                       arg_names, local_names, free_vars, cell_vars (uvarint jumlah + ref pool),
+                       exception_table (uvarint jumlah, 4 x uvarint per entri),
+                       line_table (uvarint jumlah, per entri uvarint selisih pc + svarint selisih baris),
+                       instruksi (uvarint jumlah, per instruksi op(1) + jumlah_operand(1) + konstanta...)
+
+    Konstanta v2     : tag 1 None, 2 bool(1), 3 int (svarint, ukuran bebas), 4 float (<d),
+                       5 str (ref pool), 6 list, 7 CodeObject, 8 dict, 9 tuple, 10 bytes
+
+uvarint: LEB128 tanpa tanda; svarint: zigzag lalu LEB128. Nilai kecil (indeks pool,
+nomor slot, target lompatan) hanya butuh satu byte.
+"""
+import struct
+import time
+from ivm.core.structs import CodeObject
+
+MAGIC = b"VZOEL FOXS"
+FORMAT_VERSION = 2
+HEADER_SIZE = 16
+
+# Tag konstanta (1-8 sama dengan v1)
+TAG_NONE = 1
+TAG_BOOL = 2
+TAG_INT = 3
+TAG_FLOAT = 4
+TAG_STRING = 5
+TAG_LIST = 6
+TAG_CODE = 7
+TAG_DICT = 8
+# Tambahan v2
+TAG_TUPLE = 9
+TAG_BYTES = 10
+
+FLAG_GENERATOR = 1
+
+_pack_float = struct.Struct("<d").pack
+
+class BinaryWriter:
+    def __init__(self, strings=None):
+        self.buf = bytearray()
+        # Pool string bersama: str -> indeks (urutan sisipan = urutan di pool)
+        self.strings = {} if strings is None else strings
+
+    def write_byte(self, val: int):
+        self.buf.append(val)
+
+    def write_uvarint(self, val: int):
+        buf = self.buf
+        while val >= 0x80:
+            buf.append((val & 0x7F) | 0x80)
+            val >>= 7
+        buf.append(val)
+
+    def write_svarint(self, val: int):
+        self.write_uvarint(val << 1 if val >= 0 else ((-val) << 1) - 1)
+
+    def write_float(self, val: float):
+        self.buf += _pack_float(val)
+
+    def write_ref(self, val: str):
+        strings = self.strings
+        idx = strings.get(val)
+        if idx is None:
+            idx = strings[val] = len(strings)
+        self.write_uvarint(idx)
+
+    def write_names(self, vals):
+        self.write_uvarint(len(vals))
+        for val in vals:
+            self.write_ref(val)
+
+    def write_constant(self, val):
+        # bool dicek sebelum int (bool adalah subclass int)
+        if val is None:
+            self.write_byte(TAG_NONE)
+        elif val is True or val is False:
+            self.write_byte(TAG_BOOL)
+            self.write_byte(1 if val else 0)
+        elif type(val) is int:
+            self.write_byte(TAG_INT)
+            self.write_svarint(val)
+        elif type(val) is float:
+            self.write_byte(TAG_FLOAT)
+            self.write_float(val)
+        elif type(val) is str:
+            self.write_byte(TAG_STRING)
+            self.write_ref(val)
+        elif type(val) is list or type(val) is tuple:
+            self.write_byte(TAG_LIST if type(val) is list else TAG_TUPLE)
+            self.write_uvarint(len(val))
+            for item in val:
+                self.write_constant(item)
+        elif type(val) is dict:
+            self.write_byte(TAG_DICT)
+            self.write_uvarint(len(val))
+            for k, v in val.items():
+                self.write_constant(k)
+                self.write_constant(v)
+        elif type(val) is bytes:
+            self.write_byte(TAG_BYTES)
+            self.write_uvarint(len(val))
+            self.buf += val
+        elif isinstance(val, CodeObject):
+            self.write_byte(TAG_CODE)
+            self.write_code_object(val)
+        else:
+            raise TypeError(f"Konstanta tidak bisa diserialisasi: {type(val).__name__}")
+
+    def write_code_object(self, code: CodeObject):
+        # Tag sudah ditulis oleh write_constant / serialize_code_object.
+        # Badan ditulis terpisah dulu agar panjangnya bisa diletakkan di depan.
+        body = BinaryWriter(self.strings)
+        body.write_code_body(code)
+        self.write_uvarint(len(body.buf))
+        self.buf += body.buf
+
+    def write_code_body(self, code: CodeObject):
+        self.write_ref(code.name)
+        self.write_ref(code.filename)
+        self.write_byte(FLAG_GENERATOR if code.is_generator else 0)
+        self.write_names(code.arg_names)
+        self.write_names(code.local_names)
+        self.write_names(code.free_vars)
+        self.write_names(code.cell_vars)
+
+        self.write_uvarint(len(code.exception_table))
+        for entri in code.exception_table:
+            for nilai in entri:
+                self.write_uvarint(nilai)
+
+        self.write_uvarint(len(code.line_table))
+        pc_lalu = baris_lalu = 0
+        for pc, baris in code.line_table:
+            self.write_uvarint(pc - pc_lalu)
+            self.write_svarint(baris - baris_lalu)
+            pc_lalu, baris_lalu = pc, baris
+
+        self.write_uvarint(len(code.instructions))
+        for instr in code.instructions:
+            self.write_byte(int(instr[0]))
+            self.write_byte(len(instr) - 1)
+            for operand in instr[1:]:
+                self.write_constant(operand)
+
+def serialize_code_object(code: CodeObject) -> bytes:
+    """Payload .mvm v2 (pool string + CodeObject root, tanpa header) untuk `code`."""
+    body = BinaryWriter()
+    body.write_byte(TAG_CODE)
+    body.write_code_object(code)
+
+    pool = BinaryWriter()
+    pool.write_uvarint(len(body.strings))
+    for val in body.strings:
+        data = val.encode("utf-8")
+        pool.write_uvarint(len(data))
+        pool.buf += data
+    return bytes(pool.buf + body.buf)
+
+def serialize_mvm(code: CodeObject, flags: int = 0) -> bytes:
+    """Image .mvm v2 lengkap (header + payload), siap ditulis ke disk."""
+    header = MAGIC + bytes((FORMAT_VERSION, flags)) + struct.pack("<I", int(time.time()) & 0xFFFFFFFF)
+    return header + serialize_code_object(code)
@@ -0,0 +1,53 @@
+# ivm/core/specializer.py
+"""
+Spesialisasi tipe (quickening) opcode aritmatika untuk StandardVM._run_fast.
+
+Situs ADD/SUB/MUL generik yang melihat operand int-int, float-float atau str-str
+(khusus ADD) ditulis ulang di tempat menjadi opcode spesialis (DecodedOp.ADD_INT, ...)
+di array milik CodeObject.specialized(). Opcode spesialis hanya mengecek tipe lalu
+langsung menghitung; jika tipe operand berubah situs di-deoptimasi kembali ke opcode
+generik. Situs yang sudah SPESIALISASI_MAX_DEOPT kali deopt dibiarkan generik.
+
+Perbandingan (LT/GT/...) tidak dispesialisasi: yang panas sudah digabung dengan
+JMP_IF_FALSE menjadi COMPARE_JMP_IF_FALSE (lihat decoder.py).
+"""
+import operator
+from ivm.core.opcodes import Op, DecodedOp
+from ivm.core.profiler import nama_opcode
+
+SPESIALISASI_MAX_DEOPT = 4
+
+# (opcode generik, tipe a, tipe b) -> opcode spesialis
+SPESIALIS = {
+    (Op.ADD.value, int, int): DecodedOp.ADD_INT.value,
+    (Op.ADD.value, float, float): DecodedOp.ADD_FLOAT.value,
+    (Op.ADD.value, str, str): DecodedOp.ADD_STR.value,
+    (Op.SUB.value, int, int): DecodedOp.SUB_INT.value,
+    (Op.SUB.value, float, float): DecodedOp.SUB_FLOAT.value,
+    (Op.MUL.value, int, int): DecodedOp.MUL_INT.value,
+    (Op.MUL.value, float, float): DecodedOp.MUL_FLOAT.value,
+}
+
+# Opcode spesialis -> opcode generik asalnya (tujuan deoptimasi)
+GENERIK = {spes: kunci[0] for kunci, spes in SPESIALIS.items()}
+
+# Opcode generik -> fungsi operator Python
+OPERATOR = {Op.ADD.value: operator.add, Op.SUB.value: operator.sub, Op.MUL.value: operator.mul}
+
+class StatistikSpesialisasi:
+    """
+    Penghitung per opcode spesialis (indeks = nilai opcode): berapa kali situs
+    dispesialisasi dan berapa kali cek tipenya gagal lalu deopt. Eksekusi opcode
+    spesialis yang berhasil tidak dihitung, agar jalur panas _run_fast tetap bebas
+    penghitung; jumlah eksekusi ADD/SUB/MUL per situs tersedia lewat OpcodeProfiler.
+    """
+    def __init__(self):
+        self.spesialisasi = [0] * 256
+        self.deopt = [0] * 256
+
+    def laporan(self) -> str:
+        baris = [f"{'Opcode':<10} {'situs':>7} {'deopt':>8}"]
+        for spes in sorted(GENERIK):
+            if not self.spesialisasi[spes] and not self.deopt[spes]: continue
+            baris.append(f"{nama_opcode(spes):<10} {self.spesialisasi[spes]:>7} {self.deopt[spes]:>8}")
+        return "\n".join(baris)
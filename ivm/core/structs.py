@@ -1,7 +1,35 @@
+import sys
+from array import array
+from bisect import bisect_right
+from copy import deepcopy
 from dataclasses import dataclass, field
 from typing import List, Any, Dict, Tuple, Optional
+from ivm.core.decoder import decode_instructions, fuse_superinstructions
 
-@dataclass
+class _Unbound:
+    """Penanda slot lokal yang belum pernah diisi (beda dengan nil/None)."""
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __repr__(self):
+        return "<unbound>"
+
+    def __reduce__(self):
+        return (_Unbound, ())
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+UNBOUND = _Unbound()
+
+@dataclass(slots=True)
 class Cell:
     """Container for closure variables."""
     value: Any = None
@@ -18,6 +46,85 @@ class CodeObject:
     is_generator: bool = False
     free_vars: Tuple[str, ...] = field(default_factory=tuple) # Names of variables captured from outer scopes
     cell_vars: Tuple[str, ...] = field(default_factory=tuple) # Names of local variables captured by inner scopes
+    local_names: Tuple[str, ...] = field(default_factory=tuple) # Slot -> nama lokal (LOAD_FAST/STORE_FAST); arg_names selalu di slot awal
+    # (awal, akhir, handler_pc, kedalaman_stack): instruksi di [awal, akhir) dilindungi handler_pc; terdalam dulu
+    exception_table: Tuple[Tuple[int, int, int, int], ...] = field(default_factory=tuple)
+    # (pc_awal, baris) urut per pc: instruksi mulai pc_awal berasal dari baris sumber itu (lihat baris())
+    line_table: Tuple[Tuple[int, int], ...] = field(default_factory=tuple)
+    # Cache hasil decode (ops, args, sumber instructions); diisi lazily oleh decoded()
+    _decoded: Optional[Tuple[Any, List[Any], List[Tuple]]] = field(default=None, init=False, repr=False, compare=False)
+    # Inline cache per situs instruksi (pc -> entri milik VM), dikosongkan saat decode ulang
+    inline_cache: Dict[int, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Template pemanggilan (lihat call_info), dihitung sekali per CodeObject
+    _call_info: Optional[Tuple[int, List[Any], Tuple[Tuple[int, str], ...]]] = field(default=None, init=False, repr=False, compare=False)
+    # Hasil fuse_superinstructions atas decoded() (ops_sumber, ops, args), diisi lazily oleh fused()
+    _fused: Optional[Tuple[Any, Any, List[Any]]] = field(default=None, init=False, repr=False, compare=False)
+    # (sumber instructions, fused, ops, args): salinan ops yang boleh ditulis ulang VM, lihat specialized()
+    _specialized: Optional[Tuple[Any, bool, Any, List[Any]]] = field(default=None, init=False, repr=False, compare=False)
+    # Jumlah deoptimasi per situs (pc -> n); situs yang terlalu sering deopt tidak dispesialisasi lagi
+    deopt_count: Dict[int, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Free-list Frame yang sudah selesai dan siap dipakai ulang (dikelola StandardVM)
+    frame_pool: List[Any] = field(default_factory=list, init=False, repr=False, compare=False)
+
+    def baris(self, pc: int) -> Optional[int]:
+        """Baris sumber untuk instruksi di `pc` menurut line_table, None jika tidak tercatat."""
+        i = bisect_right(self.line_table, (pc, sys.maxsize)) - 1
+        return self.line_table[i][1] if i >= 0 else None
+
+    def decoded(self) -> Tuple[Any, List[Any]]:
+        """
+        Mengembalikan (ops, args) hasil decode instructions, di-cache di objek ini.
+        Decode ulang otomatis jika list instructions diganti atau panjangnya berubah.
+        """
+        cache = self._decoded
+        instructions = self.instructions
+        if cache is None or cache[2] is not instructions or len(cache[0]) != len(instructions):
+            ops, args = decode_instructions(instructions)
+            cache = self._decoded = (ops, args, instructions)
+            self.inline_cache.clear()
+        return cache[0], cache[1]
+
+    def fused(self) -> Tuple[Any, List[Any]]:
+        """
+        Seperti decoded(), tapi dengan superinstruksi (lihat decoder.fuse_superinstructions).
+        Awal, akhir dan handler tiap rentang exception_table menjadi batas fusi.
+        """
+        ops, args = self.decoded()
+        cache = self._fused
+        if cache is None or cache[0] is not ops:
+            batas = [pc for entri in self.exception_table for pc in entri[:3]]
+            cache = self._fused = (ops,) + fuse_superinstructions(ops, args, batas)
+        return cache[1], cache[2]
+
+    def specialized(self, fused: bool = True) -> Tuple[Any, List[Any]]:
+        """
+        Seperti fused() (atau decoded() jika fused=False), tapi array ops-nya salinan
+        pribadi yang ditulis ulang di tempat oleh spesialisasi tipe StandardVM
+        (ivm/core/specializer.py). decoded()/fused() sendiri tidak pernah diubah.
+        Dipanggil setiap pergantian frame, jadi cache dicek langsung tanpa lewat fused().
+        """
+        cache = self._specialized
+        instructions = self.instructions
+        if cache is None or cache[0] is not instructions or cache[1] != fused or len(cache[2]) != len(instructions):
+            ops, args = self.fused() if fused else self.decoded()
+            cache = self._specialized = (instructions, fused, array('B', ops), args)
+            self.deopt_count.clear()
+        return cache[2], cache[3]
+
+    def call_info(self) -> Tuple[int, List[Any], Tuple[Tuple[int, str], ...]]:
+        """
+        (jumlah_arg, ekor_slot, arg_cell) untuk membangun frame pemanggilan:
+        ekor_slot adalah isi awal slot non-argumen (UNBOUND), arg_cell berisi
+        (indeks, nama) argumen yang disimpan di Cell, bukan di slot/locals.
+        """
+        info = self._call_info
+        if info is None:
+            argc = len(self.arg_names)
+            tail = [UNBOUND] * max(len(self.local_names) - argc, 0)
+            captured = set(self.cell_vars) | set(self.free_vars)
+            cell_args = tuple((i, name) for i, name in enumerate(self.arg_names) if name in captured)
+            info = self._call_info = (argc, tail, cell_args)
+        return info
 
     def __repr__(self):
         return f"<CodeObject {self.name}>"
@@ -32,18 +139,116 @@ class MorphFunction:
     def __repr__(self):
         return f"<Fungsi {self.code.name}>"
 
-@dataclass
+@dataclass(slots=True)
 class Frame:
+    """
+    Frame eksekusi. Container yang jarang terpakai (locals untuk kode ber-slot,
+    exception_handlers, snapshots, cells) bernilai None sampai pertama kali
+    dibutuhkan, jadi pemanggilan fungsi biasa hanya mengalokasikan stack dan fast.
+    """
     code: CodeObject
     globals: Dict[str, Any] # Globals context for this frame
     pc: int = 0
-    locals: Dict[str, Any] = field(default_factory=dict)
+    locals: Optional[Dict[str, Any]] = None # Locals berbasis nama; None jika kode memakai slot (fast)
     stack: List[Any] = field(default_factory=list) # Operand stack for this frame
     is_init_call: bool = False # Flag if this frame is a constructor call
-    exception_handlers: List[int] = field(default_factory=list) # Stack of PC targets for try-catch blocks
-    snapshots: List[int] = field(default_factory=list) # Stack snapshots (SP locations)
+    exception_handlers: Optional[List[int]] = None # Stack of PC targets for try-catch blocks (lazy)
+    snapshots: Optional[List[int]] = None # Stack snapshots (SP locations) (lazy)
     defining_class: Optional['MorphClass'] = None # Class that defined the method running in this frame
-    cells: Dict[str, Cell] = field(default_factory=dict) # Mapping of cell_var/free_var names to Cell objects
+    cells: Optional[Dict[str, Cell]] = None # Mapping of cell_var/free_var names to Cell objects (lazy)
+    fast: List[Any] = None # Slot lokal (indeks = slot di code.local_names), diisi UNBOUND saat frame dibuat
+    generator: Optional['MorphGenerator'] = None # Generator pemilik frame ini (frame generator saja)
+
+    def __post_init__(self):
+        if self.fast is None:
+            self.fast = [UNBOUND] * len(self.code.local_names)
+        if self.locals is None and not self.code.local_names:
+            self.locals = {}
+
+    def get_local(self, name: str, default: Any = None) -> Any:
+        """Baca variabel lokal berdasarkan nama, dari slot (jika ada) atau dict locals."""
+        if name in self.code.local_names:
+            val = self.fast[self.code.local_names.index(name)]
+            return default if val is UNBOUND else val
+        if self.locals is None: return default
+        return self.locals.get(name, default)
+
+    def set_local(self, name: str, val: Any):
+        if name in self.code.local_names:
+            self.fast[self.code.local_names.index(name)] = val
+        else:
+            if self.locals is None: self.locals = {}
+            self.locals[name] = val
+
+class ModuleGlobals(dict):
+    """
+    Globals satu modul: dict kecil milik modul di atas lapisan builtins bersama
+    (read-only, lihat ivm/stdlib/namespace.py). Penulisan selalu masuk ke dict
+    modul, jadi builtin bisa di-shadow tanpa menyentuh lapisan bersama.
+    Pembacaan ([], get(), `in`) melihat dict modul lalu builtins; builtin tidak
+    pernah disalin ke dict modul, jadi hasilnya tidak bergantung pada pembacaan
+    sebelumnya. Iterasi (keys/items/len) hanya mencakup nama milik modul.
+    Jalur panas (get(), LOAD_VAR di StandardVM) memakai dict.get lalu lapisan
+    builtins langsung; __missing__ hanya untuk [] dari kode lain.
+    """
+    __slots__ = ("builtins",)
+
+    def __init__(self, builtins, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.builtins = builtins
+
+    def __missing__(self, key):
+        return self.builtins[key]
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in self.builtins
+
+    def get(self, key, default=None):
+        val = dict.get(self, key, UNBOUND)
+        if val is UNBOUND: val = self.builtins.get(key, default)
+        return val
+
+    def __deepcopy__(self, memo):
+        # Lapisan builtins dibagi, bukan disalin
+        salinan = ModuleGlobals(self.builtins)
+        memo[id(self)] = salinan
+        for k, v in self.items():
+            salinan[k] = deepcopy(v, memo)
+        return salinan
+
+class MethodDict(dict):
+    """Dict metode kelas. Setiap mutasi menaikkan MorphClass.epoch (lihat di bawah)."""
+    def __setitem__(self, key, value):
+        MorphClass.epoch += 1
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        MorphClass.epoch += 1
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        MorphClass.epoch += 1
+        return super().__ior__(other)
+
+    def pop(self, *args):
+        MorphClass.epoch += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        MorphClass.epoch += 1
+        return super().popitem()
+
+    def clear(self):
+        MorphClass.epoch += 1
+        super().clear()
+
+    def update(self, *args, **kwargs):
+        MorphClass.epoch += 1
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        MorphClass.epoch += 1
+        return super().setdefault(key, default)
 
 @dataclass
 class MorphClass:
@@ -51,11 +256,44 @@ class MorphClass:
     methods: Dict[str, CodeObject]
     superclass: Optional['MorphClass'] = None
     globals: Dict[str, Any] = field(default_factory=dict) # Capture module scope
+    # Tabel metode datar: nama -> (metode, kelas_pemilik), beserta epoch saat dibangun
+    _table: Optional[Dict[str, Tuple[Any, 'MorphClass']]] = field(default=None, init=False, repr=False, compare=False)
+    _table_epoch: int = field(default=-1, init=False, repr=False, compare=False)
+    # False selama __init__/__post_init__: kelas baru belum ada di cache mana pun
+    _siap: bool = field(default=False, init=False, repr=False, compare=False)
+
+    # Versi global struktur semua kelas. Naik setiap methods/superclass kelas mana pun
+    # berubah setelah kelas itu selesai dibuat, sehingga inline cache lookup metode di VM
+    # cukup membandingkan satu angka. Membuat kelas baru tidak menaikkannya.
+    epoch = 0
+
+    def __post_init__(self):
+        if not isinstance(self.methods, MethodDict):
+            self.methods = MethodDict(self.methods)
+        self._siap = True
+
+    def __setattr__(self, name, value):
+        if name in ("methods", "superclass") and getattr(self, "_siap", False):
+            MorphClass.epoch += 1
+        object.__setattr__(self, name, value)
+
+    def method_table(self) -> Dict[str, Tuple[Any, 'MorphClass']]:
+        """
+        Metode milik sendiri digabung di atas metode warisan (hasil sama dengan
+        menelusuri rantai superclass). Dibangun ulang otomatis jika epoch berubah.
+        """
+        if self._table is None or self._table_epoch != MorphClass.epoch:
+            table = dict(self.superclass.method_table()) if self.superclass else {}
+            for name, method in self.methods.items():
+                table[name] = (method, self)
+            self._table = table
+            self._table_epoch = MorphClass.epoch
+        return self._table
 
     def __repr__(self):
         return f"<Kelas {self.name}>"
 
-@dataclass
+@dataclass(slots=True)
 class MorphInstance:
     klass: MorphClass
     properties: Dict[str, Any] = field(default_factory=dict)
@@ -69,7 +307,7 @@ class MorphInstance:
     def __eq__(self, other):
         return self is other
 
-@dataclass
+@dataclass(slots=True)
 class BoundMethod:
     instance: MorphInstance
     method: CodeObject
@@ -82,12 +320,12 @@ class BoundMethod:
              name = self.method.code.name
         return f"<BoundMethod {name} of {self.instance}>"
 
-@dataclass
+@dataclass(slots=True)
 class SuperBoundMethod(BoundMethod):
     """Subclass to signal that this is a super() call."""
     pass
 
-@dataclass
+@dataclass(slots=True)
 class MorphVariant:
     name: str
     args: List[Any] = field(default_factory=list)
@@ -100,9 +338,117 @@ class MorphVariant:
 
 @dataclass
 class MorphGenerator:
+    """
+    Satu objek per generator selama hidupnya; frame-nya ditangguhkan (YIELD) dan
+    dilanjutkan (RESUME/FOR_ITER) di tempat, tanpa objek baru per nilai.
+    """
     frame: Frame
     status: str = "suspended" # suspended, running, closed
     daftar_checkpoint: List[Tuple[Frame, Dict[str, Any]]] = field(default_factory=list)
+    # Target lompatan FOR_ITER yang sedang mengonsumsi generator ini; None = protokol Momen (RESUME)
+    iter_exit: Optional[int] = None
 
     def __repr__(self):
         return f"<Generator {self.frame.code.name}>"
+
+def format_jejak(frames, pcs) -> List[str]:
+    return [f"{f.code.name} at PC {pc}" for f, pc in zip(frames, pcs)]
+
+class MorphError(dict):
+    """
+    Dict error yang dibuat VM (ErrorSistem, ErrorManual, ErrorModul). Kunci 'jejak'
+    disimpan dulu sebagai snapshot (frame, pc) dan baru diformat jadi list teks saat
+    dict dibaca (atribut/indeks/iterasi/repr), jadi error yang ditangkap lalu
+    diabaikan tidak pernah membayar biaya format stack trace.
+    Frame.code tidak berubah walau frame didaur ulang, jadi snapshot tetap valid.
+    """
+    __slots__ = ("_jejak_tertunda",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._jejak_tertunda = None
+
+    def tunda_jejak(self, frames, pcs):
+        self.pop("jejak", None)
+        self._jejak_tertunda = (frames, pcs)
+
+    def _isi_jejak(self):
+        tertunda = self._jejak_tertunda
+        if tertunda is not None:
+            self._jejak_tertunda = None
+            dict.__setitem__(self, "jejak", format_jejak(*tertunda))
+
+    def __missing__(self, key):
+        self._isi_jejak()
+        if dict.__contains__(self, key): return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        self._isi_jejak(); return dict.__contains__(self, key)
+
+    def __iter__(self):
+        self._isi_jejak(); return dict.__iter__(self)
+
+    def __len__(self):
+        self._isi_jejak(); return dict.__len__(self)
+
+    def __repr__(self):
+        self._isi_jejak(); return dict.__repr__(self)
+
+    def __eq__(self, other):
+        self._isi_jejak()
+        if isinstance(other, MorphError): other._isi_jejak()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        return eq if eq is NotImplemented else not eq
+
+    __hash__ = None
+
+    def get(self, key, default=None):
+        self._isi_jejak(); return dict.get(self, key, default)
+
+    def keys(self):
+        self._isi_jejak(); return dict.keys(self)
+
+    def values(self):
+        self._isi_jejak(); return dict.values(self)
+
+    def items(self):
+        self._isi_jejak(); return dict.items(self)
+
+    def copy(self):
+        self._isi_jejak(); return MorphError(self)
+
+    def __reduce__(self):
+        self._isi_jejak(); return (MorphError, (dict(self),))
+
+# Nama tipe internal VM -> nama yang terlihat pengguna Morph di pesan error
+_NAMA_TIPE_TAMPIL = {"MorphError": "dict"}
+
+def pesan_error(e: Exception) -> str:
+    """
+    str(e) untuk kunci 'pesan' error Morph. Pesan TypeError Python memuat nama tipe
+    ("can only concatenate str (not ...)", "'...' object is not callable"); nama tipe
+    internal diganti nama tampilannya, jadi error VM tetap disebut 'dict'.
+    """
+    pesan = str(e)
+    if isinstance(e, TypeError):
+        for nama, tampil in _NAMA_TIPE_TAMPIL.items():
+            pesan = pesan.replace(f"'{nama}'", f"'{tampil}'").replace(f'"{nama}"', f'"{tampil}"')
+    return pesan
+
+class LemparanMorph(Exception):
+    """
+    Error Morph (nilai `lemparkan` atau error VM) yang tidak punya handler di frame
+    eksekusi bersarang (load_module, call_function_sync, jalan_biner). Dibawa keluar
+    sebagai exception Python agar unwinding tidak melewati frame pemanggil; `nilai`
+    diserahkan ke handler pemanggil apa adanya.
+    """
+    def __init__(self, nilai: Any):
+        super().__init__(nilai)
+        self.nilai = nilai
+
+    def __str__(self):
+        return str(self.nilai)
@@ -1,14 +1,28 @@
 # ivm/main.py
+import os
+import re
 import sys
 import argparse
+import contextlib
+import difflib
+import io
 from transisi.lx import Leksikal
 from transisi.crusher import Pengurai
 from ivm.compiler import Compiler
+from ivm.core.bytecode_cache import kompilasi_dengan_cache
+from ivm.optimizer import Optimizer, LEVEL_MAKS
 from ivm.vms.standard_vm import StandardVM
 
 def main():
     parser = argparse.ArgumentParser(description="IVM Runner for .fox files")
     parser.add_argument("file", help="The .fox file to execute.")
+    parser.add_argument("--no-cache", action="store_true", help="Selalu kompilasi ulang, tanpa membaca/menulis __foxcache__.")
+    parser.add_argument("-O", dest="optimasi", type=int, choices=range(LEVEL_MAKS + 1), default=0, metavar="N",
+                        help="Level optimasi bytecode modul .fox (script utama dan semua modul yang diimpor): "
+                             "0 mati (default), 1 peephole & kontrol alir, 2 ditambah propagasi konstanta & store mati.")
+    parser.add_argument("--verifikasi-optimasi", action="store_true",
+                        help="Jalankan program tanpa optimasi dan dengan level -O (default 2), lalu bandingkan "
+                             "keluaran, error dan kode keluar; beda -> exit 1. Program dijalankan dua kali.")
     parser.add_argument('vm_args', nargs=argparse.REMAINDER, help="Arguments for the script.")
     args = parser.parse_args()
 
@@ -23,24 +37,21 @@ def main():
     # Cek apakah file binary .mvm
     if args.file.endswith('.mvm'):
         try:
-            vm = StandardVM(script_args=script_args)
+            # Image .mvm sudah jadi dan tidak dioptimasi ulang; -O berlaku untuk modul .fox yang diimpornya
+            vm = StandardVM(script_args=script_args, bytecode_cache=not args.no_cache, optimize=args.optimasi)
             # VM load_module sudah punya logika read binary .mvm
             # Tapi kita perlu load sebagai *main script*.
             # load_module mengembalikan globals dict.
             # Kita perlu cara agar VM mengeksekusinya sebagai main.
 
-            # Cara alternatif: Baca manual, deserialisasi, lalu vm.load(code_obj)
-            with open(args.file, 'rb') as f:
-                binary_data = f.read()
-
-            if binary_data[:10] != b"VZOEL FOXS":
-                print(f"Error: File '{args.file}' bukan format Morph yang valid (Magic Header mismatch).", file=sys.stderr)
+            # Cara alternatif: muat image (mmap), deserialisasi, lalu vm.load(code_obj)
+            from ivm.core.deserializer import muat_mvm
+            try:
+                code_obj = muat_mvm(args.file)
+            except ValueError as e:
+                print(f"Error: {e}: '{args.file}'", file=sys.stderr)
                 sys.exit(1)
 
-            payload = binary_data[16:]
-            from ivm.core.deserializer import deserialize_code_object
-            code_obj = deserialize_code_object(payload, filename=args.file)
-
             # Load dan jalankan level modul
             vm.load(code_obj)
             vm.run()
@@ -60,17 +71,18 @@ def main():
         return
 
     # Text Source Path (.fox)
-    try:
-        with open(args.file, "r", encoding="utf-8") as f:
-            source = f.read()
-    except FileNotFoundError:
+    if not os.path.exists(args.file):
         print(f"Error: File '{args.file}' not found.", file=sys.stderr)
         sys.exit(1)
-    except Exception as e:
-        print(f"Error reading file: {e}", file=sys.stderr)
-        sys.exit(1)
 
-    try:
+    if args.verifikasi_optimasi:
+        verifikasi_optimasi(args, script_args, args.optimasi or LEVEL_MAKS)
+    else:
+        jalankan_sumber(args, script_args, args.optimasi)
+
+def jalankan_sumber(args, script_args, optimasi: int):
+    """Kompilasi (lewat __foxcache__ kecuali --no-cache) lalu jalankan script .fox `args.file`."""
+    def kompilasi(source: str):
         lexer = Leksikal(source, nama_file=args.file)
         tokens, errors = lexer.buat_token()
         if errors:
@@ -91,10 +103,27 @@ def main():
 
         compiler = Compiler()
         # Perubahan Penting: is_main_script=False agar compiler tidak hardcode call utama()
-        code_obj = compiler.compile(ast, filename=args.file, is_main_script=False)
+        code = compiler.compile(ast, filename=args.file, is_main_script=False)
+        return Optimizer(optimasi).optimize(code)
 
+    try:
+        if args.no_cache:
+            with open(args.file, "r", encoding="utf-8") as f:
+                source = f.read()
+            code_obj = kompilasi(source)
+        else:
+            code_obj = kompilasi_dengan_cache(args.file, kompilasi, optimasi)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Error reading file: {e}", file=sys.stderr)
+        sys.exit(1)
+    except Exception:
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+    try:
         # Inisialisasi VM dengan argumen
-        vm = StandardVM(script_args=script_args)
+        vm = StandardVM(script_args=script_args, bytecode_cache=not args.no_cache, optimize=optimasi)
         vm.load(code_obj)
         vm.run()
 
@@ -109,5 +138,48 @@ def main():
         traceback.print_exc()
         sys.exit(1)
 
+# Tidak ikut dibandingkan: nomor pc di jejak error ('f at PC 12', optimasi memang menggeser pc)
+# dan alamat objek Python di repr ('<... object at 0x7f...>', beda di setiap putaran)
+_TIDAK_DETERMINISTIK = re.compile(r"\bat (?:PC \d+|0x[0-9a-fA-F]+)")
+
+def _jalankan_tertangkap(args, script_args, optimasi: int):
+    """(stdout, stderr, kode keluar) dari jalankan_sumber pada level `optimasi`."""
+    keluaran, error = io.StringIO(), io.StringIO()
+    kode = 0
+    with contextlib.redirect_stdout(keluaran), contextlib.redirect_stderr(error):
+        try:
+            jalankan_sumber(args, script_args, optimasi)
+        except SystemExit as e:
+            kode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    return keluaran.getvalue(), error.getvalue(), kode
+
+def verifikasi_optimasi(args, script_args, optimasi: int):
+    """
+    Jalankan script tanpa optimasi lalu dengan level `optimasi` (VM baru per putaran), dan
+    bandingkan stdout, stderr (nomor pc jejak & alamat objek diabaikan) serta kode keluar. Sama: keluaran
+    versi teroptimasi diteruskan apa adanya. Beda: laporan diff di stderr dan exit 1.
+    """
+    dasar = _jalankan_tertangkap(args, script_args, 0)
+    hasil = _jalankan_tertangkap(args, script_args, optimasi)
+
+    beda = []
+    for nama, a, b in (("stdout", dasar[0], hasil[0]), ("stderr", dasar[1], hasil[1])):
+        a, b = _TIDAK_DETERMINISTIK.sub("at _", a), _TIDAK_DETERMINISTIK.sub("at _", b)
+        if a != b:
+            beda.extend(difflib.unified_diff(a.splitlines(keepends=True), b.splitlines(keepends=True),
+                                             fromfile=f"{nama} -O0", tofile=f"{nama} -O{optimasi}"))
+    if dasar[2] != hasil[2]:
+        beda.append(f"kode keluar: -O0 = {dasar[2]}, -O{optimasi} = {hasil[2]}\n")
+
+    if beda:
+        print(f"[verifikasi-optimasi] GAGAL: hasil -O0 dan -O{optimasi} berbeda untuk '{args.file}'", file=sys.stderr)
+        sys.stderr.writelines(line if line.endswith("\n") else line + "\n" for line in beda)
+        sys.exit(1)
+
+    sys.stdout.write(hasil[0])
+    sys.stderr.write(hasil[1])
+    print(f"[verifikasi-optimasi] OK: hasil -O0 dan -O{optimasi} identik", file=sys.stderr)
+    sys.exit(hasil[2])
+
 if __name__ == "__main__":
     main()
@@ -1,83 +1,542 @@
 from ivm.core.opcodes import Op
 from ivm.core.structs import CodeObject
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
+import operator
+
+# Instruksi yang operand pertamanya target lompatan (pc)
+_JUMPS = frozenset((Op.JMP, Op.JMP_IF_FALSE, Op.JMP_IF_TRUE, Op.FOR_ITER))
+_CONDITIONAL = frozenset((Op.JMP_IF_FALSE, Op.JMP_IF_TRUE))
+# Instruksi yang tidak pernah jatuh ke instruksi berikutnya
+_TERMINATORS = frozenset((Op.JMP, Op.RET, Op.THROW, Op.HALT))
+# Handler berbasis stack (bytecode self-hosted) tidak dimodelkan: kode berisi ini tidak disentuh
+_UNSUPPORTED = frozenset((Op.PUSH_TRY, Op.POP_TRY))
+
+# Semantik sama persis dengan handler StandardVM (operasi Python biasa pada operand)
+_BINARY = {
+    Op.ADD: operator.add, Op.SUB: operator.sub, Op.MUL: operator.mul,
+    Op.DIV: operator.truediv, Op.MOD: operator.mod,
+    Op.EQ: operator.eq, Op.NEQ: operator.ne, Op.GT: operator.gt, Op.LT: operator.lt,
+    Op.GTE: operator.ge, Op.LTE: operator.le,
+    Op.AND: lambda a, b: a and b, Op.OR: lambda a, b: a or b,
+    Op.BIT_AND: operator.and_, Op.BIT_OR: operator.or_, Op.BIT_XOR: operator.xor,
+    Op.LSHIFT: operator.lshift, Op.RSHIFT: operator.rshift,
+}
+_UNARY = {Op.NOT: operator.not_, Op.BIT_NOT: operator.invert}
+
+# Tipe konstanta yang boleh dilipat/dipropagasi (immutable, bisa diserialisasi)
+_SCALAR = (type(None), bool, int, float, str)
+# Batas ukuran hasil lipatan: jangan menggembungkan bytecode ("x" * 10**9, 1 << 10**6)
+_MAX_STR = 4096
+_MAX_INT_BITS = 4096
+
+# Jumlah maksimal putaran pipeline per CodeObject (biasanya stabil dalam 2-3 putaran)
+_MAX_ROUNDS = 10
+
+# Level optimasi (opsi -O runner/loader): 0 mati, 1 lokal/kontrol alir, 2 + dataflow slot lokal
+LEVEL_MAKS = 2
+
+def _is_const(val) -> bool:
+    if type(val) not in _SCALAR: return False
+    if type(val) is str: return len(val) <= _MAX_STR
+    if type(val) is int: return val.bit_length() <= _MAX_INT_BITS
+    return True
+
+def _same_const(a, b) -> bool:
+    # 1 == 1.0 == True di Python, tapi bukan konstanta yang sama untuk VM
+    return type(a) is type(b) and a == b
+
+class _Block:
+    """Basic block: instruksi berurutan tanpa target lompatan di tengah."""
+    __slots__ = ("instrs", "lines", "dead")
+
+    def __init__(self):
+        self.instrs: List[Tuple] = [] # Target lompatan berupa indeks blok, bukan pc
+        self.lines: List[Optional[int]] = [] # Baris sumber per instruksi
+        self.dead = False
+
+    def last_op(self):
+        return self.instrs[-1][0] if self.instrs else None
+
+class _Function:
+    """
+    CFG satu CodeObject. Urutan blok (layout) tidak pernah diubah, jadi rentang
+    exception_table tetap berupa rentang indeks blok yang bersambung.
+    """
+    def __init__(self, code: CodeObject):
+        self.code = code
+        instructions = code.instructions
+        n = len(instructions)
+
+        leaders = {0}
+        for pc, instr in enumerate(instructions):
+            op = instr[0]
+            if op in _JUMPS:
+                leaders.add(instr[1])
+            if op in _JUMPS or op in _TERMINATORS:
+                leaders.add(pc + 1)
+        for start, end, handler, _ in code.exception_table:
+            leaders.update((start, end, handler))
+        starts = sorted(pc for pc in leaders if 0 <= pc <= n)
+        if starts[-1] != n: starts.append(n)
+
+        # pc -> indeks blok; pc == n memetakan ke blok sentinel kosong (akhir kode)
+        block_of = {}
+        for i, pc in enumerate(starts):
+            block_of[pc] = i
+        self.blocks = [_Block() for _ in starts]
+
+        lines = self._expand_lines(code, n)
+        for i, start in enumerate(starts[:-1]):
+            block = self.blocks[i]
+            for pc in range(start, starts[i + 1]):
+                instr = instructions[pc]
+                if instr[0] in _JUMPS:
+                    instr = (instr[0], block_of[instr[1]]) + tuple(instr[2:])
+                block.instrs.append(instr)
+                block.lines.append(lines[pc])
+
+        # (blok_awal, blok_akhir, blok_handler, kedalaman_stack), rentang [awal, akhir)
+        self.handlers = [(block_of[s], block_of[e], block_of[h], d) for s, e, h, d in code.exception_table]
+
+    @staticmethod
+    def _expand_lines(code: CodeObject, n: int) -> List[Optional[int]]:
+        lines = [None] * n
+        table = code.line_table
+        for i, (pc, baris) in enumerate(table):
+            end = table[i + 1][0] if i + 1 < len(table) else n
+            for p in range(pc, min(end, n)):
+                lines[p] = baris
+        return lines
+
+    # --- Navigasi ---
+
+    def next_live(self, i: int) -> int:
+        """Blok hidup pertama sesudah i (indeks sentinel jika tidak ada)."""
+        blocks = self.blocks
+        i += 1
+        while i < len(blocks) - 1 and blocks[i].dead:
+            i += 1
+        return i
+
+    def resolve(self, i: int) -> int:
+        """Blok hidup & tidak kosong yang benar-benar dieksekusi saat melompat ke blok i."""
+        blocks = self.blocks
+        while i < len(blocks) - 1 and (blocks[i].dead or not blocks[i].instrs):
+            i += 1
+        return i
+
+    def falls_through(self, block: _Block) -> bool:
+        return block.last_op() not in _TERMINATORS
+
+    def successors(self, i: int) -> List[int]:
+        block = self.blocks[i]
+        succ = []
+        if block.instrs and block.instrs[-1][0] in _JUMPS:
+            succ.append(self.resolve(block.instrs[-1][1]))
+        if self.falls_through(block):
+            succ.append(self.resolve(self.next_live(i)))
+        return succ
+
+    def covering_handlers(self, i: int) -> List[int]:
+        return [h for s, e, h, _ in self.handlers if s <= i < e]
+
+    # --- Linearisasi ---
+
+    def assemble(self) -> Tuple[List[Tuple], Tuple, Tuple]:
+        blocks = self.blocks
+        start_pc = []
+        pc = 0
+        for block in blocks:
+            start_pc.append(pc)
+            if not block.dead:
+                pc += len(block.instrs)
+
+        instructions = []
+        lines = []
+        for block in blocks:
+            if block.dead: continue
+            for instr, baris in zip(block.instrs, block.lines):
+                if instr[0] in _JUMPS:
+                    instr = (instr[0], start_pc[self.resolve(instr[1])]) + tuple(instr[2:])
+                instructions.append(instr)
+                lines.append(baris)
+
+        exception_table = []
+        for s, e, h, depth in self.handlers:
+            start, end = start_pc[s], start_pc[e]
+            if start < end:
+                exception_table.append((start, end, start_pc[self.resolve(h)], depth))
+
+        line_table = []
+        for pc, baris in enumerate(lines):
+            if baris is not None and (not line_table or line_table[-1][1] != baris):
+                line_table.append((pc, baris))
+        return instructions, tuple(exception_table), tuple(line_table)
 
 class Optimizer:
+    """
+    Optimizer bytecode IVM berbasis CFG (tanpa SSA), dijalankan berulang sampai stabil:
+
+      1. Lipat konstanta & peephole per blok: PUSH_CONST a; PUSH_CONST b; BINOP,
+         PUSH_CONST a; NOT, lompatan bersyarat atas konstanta, NOT; JMP_IF_*,
+         DUP/PUSH_CONST; POP, STORE_LOCAL x; LOAD_LOCAL x -> DUP; STORE_LOCAL x.
+      2. Propagasi konstanta slot lokal (STORE_FAST/LOAD_FAST) lintas blok (dataflow maju).
+      3. Threading lompatan: rantai JMP, lompatan ke blok berikutnya, inversi
+         JMP_IF_*; JMP, dan JMP ke blok `return` kecil disalin di tempat.
+      4. Hapus blok tak terjangkau (termasuk handler yang rentangnya sudah kosong).
+      5. Eliminasi store mati berdasarkan liveness slot (dataflow mundur).
+
+    Level 1 menjalankan pass 1, 3 dan 4; level 2 (default) semuanya. Level 0 tidak
+    mengubah apa pun: optimize() mengembalikan masukan apa adanya.
+
+    CodeObject bersarang (fungsi, metode, varian) dioptimasi rekursif. Hasilnya
+    CodeObject baru dengan metadata utuh (nama, filename, slot, cell/free vars,
+    is_generator); exception_table dan line_table dipetakan ulang ke pc baru.
+    Masukan tidak pernah diubah.
+    """
+    def __init__(self, level: int = LEVEL_MAKS):
+        if not 0 <= level <= LEVEL_MAKS:
+            raise ValueError(f"Level optimasi tidak valid: {level} (0-{LEVEL_MAKS})")
+        self.level = level
+        # id(masukan) -> (masukan, hasil); masukan ikut disimpan agar id-nya tidak dipakai ulang
+        self._memo: Dict[int, Tuple[CodeObject, CodeObject]] = {}
+
     def optimize(self, code_obj: CodeObject) -> CodeObject:
+        """Mengembalikan CodeObject baru hasil optimasi `code_obj` (beserta CodeObject bersarang)."""
+        if self.level == 0: return code_obj
+        memo = self._memo.get(id(code_obj))
+        if memo is not None: return memo[1]
+
+        instructions = [self._optimize_operands(instr) for instr in code_obj.instructions]
+        if any(type(instr[0]) is not Op or instr[0] in _UNSUPPORTED for instr in instructions):
+            instructions, exception_table, line_table = instructions, code_obj.exception_table, code_obj.line_table
+        else:
+            source = CodeObject(name=code_obj.name, instructions=instructions, local_names=code_obj.local_names,
+                                arg_names=code_obj.arg_names, exception_table=code_obj.exception_table,
+                                line_table=code_obj.line_table)
+            instructions, exception_table, line_table = self._run_pipeline(source)
+
+        hasil = CodeObject(
+            name=code_obj.name,
+            instructions=instructions,
+            arg_names=list(code_obj.arg_names),
+            filename=code_obj.filename,
+            is_generator=code_obj.is_generator,
+            free_vars=code_obj.free_vars,
+            cell_vars=code_obj.cell_vars,
+            local_names=code_obj.local_names,
+            exception_table=exception_table,
+            line_table=line_table,
+        )
+        self._memo[id(code_obj)] = (code_obj, hasil)
+        return hasil
+
+    def _optimize_operands(self, instr: Tuple) -> Tuple:
+        if any(isinstance(operand, CodeObject) for operand in instr[1:]):
+            return (instr[0],) + tuple(self.optimize(x) if isinstance(x, CodeObject) else x for x in instr[1:])
+        return instr
+
+    def _run_pipeline(self, code: CodeObject):
+        fn = _Function(code)
+        # Slot 'ini' dibaca VM lewat nama saat konstruktor selesai (Frame.get_local)
+        pinned = {i for i, name in enumerate(code.local_names) if name == "ini"}
+        for _ in range(_MAX_ROUNDS):
+            changed = self.peephole(fn)
+            if self.level >= 2:
+                changed |= self.propagate_constants(fn)
+            changed |= self.thread_jumps(fn)
+            changed |= self.remove_unreachable(fn)
+            if self.level >= 2:
+                changed |= self.eliminate_dead_stores(fn, pinned)
+            if not changed: break
+        return fn.assemble()
+
+    # === 1. Lipat konstanta & peephole ===
+
+    def peephole(self, fn: _Function) -> bool:
+        changed = False
+        for block in fn.blocks:
+            if block.dead or not block.instrs: continue
+            out, lines = [], []
+            for instr, baris in zip(block.instrs, block.lines):
+                out.append(instr)
+                lines.append(baris)
+                while self._reduce_tail(out, lines):
+                    changed = True
+            block.instrs, block.lines = out, lines
+        return changed
+
+    def _reduce_tail(self, out: List[Tuple], lines: List) -> bool:
+        """Sederhanakan pola di ujung `out`; True jika ada yang diubah."""
+        if len(out) < 2: return False
+        last, prev = out[-1], out[-2]
+        op = last[0]
+        prev_const = prev[0] == Op.PUSH_CONST and _is_const(prev[1])
+
+        if op == Op.POP and (prev[0] == Op.DUP or prev[0] == Op.PUSH_CONST):
+            del out[-2:], lines[-2:]
+            return True
+        if op in _UNARY and prev_const:
+            try: val = _UNARY[op](prev[1])
+            except Exception: return False
+            if not _is_const(val): return False
+            out[-2:] = [(Op.PUSH_CONST, val)]
+            del lines[-1]
+            return True
+        if op in _CONDITIONAL:
+            if prev_const:
+                jump = bool(prev[1]) == (op == Op.JMP_IF_TRUE)
+                baris = lines[-2]
+                del out[-2:], lines[-2:]
+                if jump:
+                    out.append((Op.JMP, last[1]))
+                    lines.append(baris)
+                return True
+            if prev[0] == Op.NOT:
+                out[-2:] = [(Op.JMP_IF_TRUE if op == Op.JMP_IF_FALSE else Op.JMP_IF_FALSE, last[1])]
+                del lines[-1]
+                return True
+            return False
+        if op == Op.LOAD_LOCAL and prev[0] == Op.STORE_LOCAL and prev[1] == last[1]:
+            out[-2:] = [(Op.DUP,), prev]
+            return True
+        if op in _BINARY and prev_const and len(out) >= 3:
+            first = out[-3]
+            if first[0] != Op.PUSH_CONST or not _is_const(first[1]): return False
+            try: val = _BINARY[op](first[1], prev[1])
+            except Exception: return False # Error runtime (bagi nol, tipe) tetap terjadi saat runtime
+            if not _is_const(val): return False
+            out[-3:] = [(Op.PUSH_CONST, val)]
+            del lines[-2:]
+            return True
+        return False
+
+    # === 2. Propagasi konstanta slot lokal ===
+
+    def propagate_constants(self, fn: _Function) -> bool:
         """
-        Optimizes the given CodeObject by performing constant folding
-        and dead code elimination. Returns a new CodeObject.
+        Dataflow maju atas slot FAST: state blok = {slot: konstanta} yang pasti berlaku
+        di awal blok. Awal fungsi dan handler exception: semua slot tidak diketahui.
         """
-        instructions = code_obj.instructions[:]
+        blocks = fn.blocks
+        handler_blocks = {fn.resolve(h) for _, _, h, _ in fn.handlers}
+        states: Dict[int, Optional[Dict[int, Any]]] = {i: None for i in range(len(blocks))}
+        work = [0] + sorted(handler_blocks)
+        for i in work:
+            states[i] = {}
+        while work:
+            i = work.pop()
+            if i >= len(blocks) - 1 or blocks[i].dead: continue
+            state = self._transfer(blocks[i], dict(states[i]))
+            for s in fn.successors(i):
+                if s >= len(blocks) - 1: continue
+                incoming = {} if s in handler_blocks else state
+                lama = states[s]
+                if lama is None:
+                    baru = dict(incoming)
+                else:
+                    baru = {k: v for k, v in lama.items() if k in incoming and _same_const(incoming[k], v)}
+                if lama is None or baru != lama or len(baru) != len(lama):
+                    states[s] = baru
+                    work.append(s)
 
-        # Pass 1: Constant Folding
-        instructions = self.fold_constants(instructions)
+        changed = False
+        for i, block in enumerate(blocks[:-1]):
+            if block.dead or states[i] is None: continue
+            changed |= self._rewrite(block, dict(states[i]))
+        return changed
 
-        # Pass 2: Dead Code Elimination
-        # instructions = self.eliminate_dead_code(instructions) # Skip for now, tricky with jumps
+    @staticmethod
+    def _store(instrs: List[Tuple], idx: int, state: Dict[int, Any]):
+        prev = instrs[idx - 1] if idx else None
+        if prev is not None and prev[0] == Op.PUSH_CONST and _is_const(prev[1]):
+            state[instrs[idx][1]] = prev[1]
+        else:
+            state.pop(instrs[idx][1], None)
 
-        return CodeObject(
-            name=f"{code_obj.name}_opt",
-            instructions=instructions,
-            arg_names=code_obj.arg_names
-        )
+    def _transfer(self, block: _Block, state: Dict[int, Any]) -> Dict[int, Any]:
+        instrs = block.instrs
+        for idx, instr in enumerate(instrs):
+            if instr[0] == Op.STORE_FAST:
+                self._store(instrs, idx, state)
+        return state
+
+    def _rewrite(self, block: _Block, state: Dict[int, Any]) -> bool:
+        changed = False
+        instrs = block.instrs
+        for idx, instr in enumerate(instrs):
+            op = instr[0]
+            if op == Op.STORE_FAST:
+                self._store(instrs, idx, state)
+            elif op == Op.LOAD_FAST and instr[1] in state:
+                instrs[idx] = (Op.PUSH_CONST, state[instr[1]])
+                changed = True
+        return changed
+
+    # === 3. Threading lompatan ===
 
-    def fold_constants(self, instructions: List[Tuple]) -> List[Tuple]:
+    def thread_jumps(self, fn: _Function) -> bool:
+        blocks = fn.blocks
+        changed = False
+        preds = self._predecessor_counts(fn)
+        for i, block in enumerate(blocks[:-1]):
+            if block.dead or not block.instrs: continue
+            last = block.instrs[-1]
+            op = last[0]
+            if op not in _JUMPS: continue
+
+            target = self._final_target(fn, last[1])
+            if target != last[1]:
+                block.instrs[-1] = last = (op, target) + tuple(last[2:])
+                changed = True
+
+            fallthrough = fn.resolve(fn.next_live(i))
+            if op == Op.JMP:
+                if target == fallthrough:
+                    block.instrs.pop(); block.lines.pop()
+                    changed = True
+                    continue
+                # Blok tujuan `return` kecil: salin di tempat, hemat satu lompatan
+                tujuan = blocks[target] if target < len(blocks) - 1 else None
+                if tujuan is not None and self._is_small_return(tujuan):
+                    block.instrs[-1:] = list(tujuan.instrs)
+                    block.lines[-1:] = list(tujuan.lines)
+                    changed = True
+            elif op in _CONDITIONAL:
+                if target == fallthrough:
+                    block.instrs[-1] = (Op.POP,)
+                    changed = True
+                    continue
+                # JMP_IF_X L1; (blok F: JMP L2); L1: ...  ->  JMP_IF_notX L2; L1: ...
+                f = fallthrough
+                if f >= len(blocks) - 1 or preds.get(f, 0) != 1: continue
+                lompat = blocks[f].instrs
+                if len(lompat) == 1 and lompat[0][0] == Op.JMP and target == fn.resolve(fn.next_live(f)) \
+                        and not self._in_handler_range(fn, f):
+                    inverse = Op.JMP_IF_TRUE if op == Op.JMP_IF_FALSE else Op.JMP_IF_FALSE
+                    block.instrs[-1] = (inverse, lompat[0][1])
+                    blocks[f].dead = True
+                    changed = True
+        return changed
+
+    @staticmethod
+    def _final_target(fn: _Function, target: int) -> int:
+        seen = set()
+        target = fn.resolve(target)
+        while target < len(fn.blocks) - 1 and target not in seen:
+            seen.add(target)
+            instrs = fn.blocks[target].instrs
+            if len(instrs) != 1 or instrs[0][0] != Op.JMP: break
+            target = fn.resolve(instrs[0][1])
+        return target
+
+    @staticmethod
+    def _is_small_return(block: _Block) -> bool:
+        instrs = block.instrs
+        if not instrs or instrs[-1][0] != Op.RET or len(instrs) > 2: return False
+        return len(instrs) == 1 or instrs[0][0] == Op.PUSH_CONST
+
+    @staticmethod
+    def _in_handler_range(fn: _Function, i: int) -> bool:
+        return any(s <= i < e or h == i for s, e, h, _ in fn.handlers)
+
+    @staticmethod
+    def _predecessor_counts(fn: _Function) -> Dict[int, int]:
+        counts: Dict[int, int] = {}
+        for i, block in enumerate(fn.blocks[:-1]):
+            if block.dead: continue
+            for s in fn.successors(i):
+                s = fn.resolve(s)
+                counts[s] = counts.get(s, 0) + 1
+        return counts
+
+    # === 4. Blok tak terjangkau ===
+
+    def remove_unreachable(self, fn: _Function) -> bool:
+        blocks = fn.blocks
+        reachable: Set[int] = set()
+        work = [0]
+        while True:
+            while work:
+                i = work.pop()
+                if i in reachable or i >= len(blocks) - 1 or blocks[i].dead: continue
+                reachable.add(i)
+                work.extend(fn.successors(i))
+            # Handler hidup jika rentangnya memuat instruksi yang terjangkau
+            for s, e, h, _ in fn.handlers:
+                if h not in reachable and not blocks[h].dead and any(j in reachable and blocks[j].instrs for j in range(s, e)):
+                    work.append(h)
+            if not work: break
+
+        changed = False
+        for i, block in enumerate(blocks[:-1]):
+            if not block.dead and i not in reachable:
+                block.dead = True
+                changed = True
+        return changed
+
+    # === 5. Store mati ===
+
+    def eliminate_dead_stores(self, fn: _Function, pinned: Set[int]) -> bool:
         """
-        Simple peephole optimization for constant arithmetic.
-        Pattern: PUSH_CONST a, PUSH_CONST b, BINARY_OP -> PUSH_CONST (a op b)
+        Liveness slot FAST (dataflow mundur). Di blok yang dilindungi handler, live-in
+        handler berlaku di setiap titik (exception bisa terjadi di instruksi mana pun).
+        Yang dihapus hanya pasangan yang hilang seluruhnya:
+          PUSH_CONST c / DUP; STORE_FAST x (x mati)  -> (tidak ada)
+          STORE_FAST x; LOAD_FAST x (x mati sesudahnya) -> (nilai tetap di stack)
         """
-        if len(instructions) < 3:
-            return instructions
-
-        new_instr = []
-        i = 0
-        while i < len(instructions):
-            # Check for 3-op sequence
-            if i + 2 < len(instructions):
-                op1 = instructions[i]
-                op2 = instructions[i+1]
-                op3 = instructions[i+2]
-
-                if (op1[0] == Op.PUSH_CONST and
-                    op2[0] == Op.PUSH_CONST and
-                    self.is_binary_math_op(op3[0])):
-
-                    val1 = op1[1]
-                    val2 = op2[1]
-
-                    try:
-                        res = self.evaluate_op(op3[0], val1, val2)
-                        # Replace 3 ops with 1 result
-                        new_instr.append((Op.PUSH_CONST, res))
-                        i += 3
-                        continue
-                    except Exception:
-                        # If eval fails (e.g. div by zero), keep original
-                        pass
+        blocks = fn.blocks
+        live_in: Dict[int, Set[int]] = {i: set() for i in range(len(blocks))}
+        live_handler = lambda i: set().union(*(live_in[h] for h in fn.covering_handlers(i)))
 
-            new_instr.append(instructions[i])
-            i += 1
+        changed_flow = True
+        while changed_flow:
+            changed_flow = False
+            for i in range(len(blocks) - 2, -1, -1):
+                block = blocks[i]
+                if block.dead: continue
+                extra = live_handler(i)
+                live = set(extra).union(*(live_in[s] for s in fn.successors(i)))
+                for instr in reversed(block.instrs):
+                    self._step_live(instr, live)
+                    live |= extra
+                if live != live_in[i]:
+                    live_in[i] = live
+                    changed_flow = True
+
+        changed = False
+        for i, block in enumerate(blocks[:-1]):
+            if block.dead or not block.instrs: continue
+            extra = live_handler(i)
+            live = set(extra).union(*(live_in[s] for s in fn.successors(i)))
+            instrs, lines = block.instrs, block.lines
+            j = len(instrs) - 1
+            while j >= 0:
+                instr = instrs[j]
+                op = instr[0]
+                if j >= 1:
+                    prev = instrs[j - 1]
+                    if op == Op.LOAD_FAST and prev[0] == Op.STORE_FAST and prev[1] == instr[1] \
+                            and instr[1] not in live and instr[1] not in pinned:
+                        del instrs[j - 1:j + 1], lines[j - 1:j + 1]
+                        changed = True
+                        j -= 2
+                        continue
+                    if op == Op.STORE_FAST and instr[1] not in live and instr[1] not in pinned \
+                            and (prev[0] == Op.DUP or prev[0] == Op.PUSH_CONST):
+                        del instrs[j - 1:j + 1], lines[j - 1:j + 1]
+                        changed = True
+                        j -= 2
+                        continue
+                self._step_live(instr, live)
+                live |= extra
+                j -= 1
+        return changed
 
-        # Recursive pass if changes were made?
-        # For now single pass is enough for prototype.
-        return new_instr
-
-    def is_binary_math_op(self, opcode: Op) -> bool:
-        return opcode in [Op.ADD, Op.SUB, Op.MUL, Op.DIV, Op.MOD, Op.EQ, Op.NEQ, Op.GT, Op.LT]
-
-    def evaluate_op(self, opcode: Op, a, b):
-        # Note: Stack order for subtraction/division:
-        # PUSH a, PUSH b, SUB -> a - b ?
-        # StandardVM Logic: b = pop(), a = pop(), push(a-b).
-        # So PUSH a (bottom), PUSH b (top). a is first operand.
-        if opcode == Op.ADD: return a + b
-        if opcode == Op.SUB: return a - b
-        if opcode == Op.MUL: return a * b
-        if opcode == Op.DIV: return a / b
-        if opcode == Op.MOD: return a % b
-        if opcode == Op.EQ: return a == b
-        if opcode == Op.NEQ: return a != b
-        if opcode == Op.GT: return a > b
-        if opcode == Op.LT: return a < b
-        raise ValueError(f"Unknown op {opcode}")
+    @staticmethod
+    def _step_live(instr: Tuple, live: Set[int]):
+        op = instr[0]
+        if op == Op.STORE_FAST:
+            live.discard(instr[1])
+        elif op == Op.LOAD_FAST:
+            live.add(instr[1])
@@ -0,0 +1,119 @@
+# ivm/stdlib/backend.py
+"""
+Backend Python untuk `pinjam "_backend"` (Ascension Architecture): primitif
+I/O, sistem, jaringan, dan bytes yang dipakai stdlib COTC. Satu instance
+per VM, di-cache oleh StandardVM._resolve_native.
+"""
+
+class PythonBackend:
+    # File I/O
+    def fs_buka(self, path, mode): return open(path, mode)
+    def fs_baca(self, handle, size):
+        return handle.read() if (size is None or size < 0) else handle.read(size)
+    def fs_tulis(self, handle, content):
+        if isinstance(content, list): handle.write(bytes(content))
+        else: handle.write(content)
+    def fs_tutup(self, handle): handle.close()
+    def fs_ada(self, path):
+        import os; return os.path.exists(path)
+    def fs_hapus(self, path):
+        import os; os.remove(path)
+    def fs_mkdir(self, path):
+        import os; os.makedirs(path, exist_ok=True)
+    def fs_listdir(self, path):
+        import os; return os.listdir(path)
+    def fs_cwd(self):
+        import os; return os.getcwd()
+
+    # System
+    def sys_waktu(self): import time; return time.time()
+    def sys_tidur(self, d): import time; time.sleep(d)
+    def sys_keluar(self, c): import sys; sys.exit(c)
+    def sys_platform(self): import sys; return sys.platform
+
+    # Network
+    def net_konek(self, host, port):
+        import socket
+        try:
+            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            s.connect((host, port))
+            return s
+        except Exception as e:
+            # print(f"Net Error: {e}")
+            return None
+
+    def net_kirim(self, sock, data):
+        try:
+            if isinstance(data, str): data = data.encode('utf-8')
+            sock.sendall(data)
+            return True # Sukses
+        except Exception:
+            return False # Gagal
+
+    def net_terima(self, sock, size):
+        try:
+            sz = size if (size is not None and size > 0) else 4096
+            data = sock.recv(sz)
+            return data # Bytes
+        except Exception:
+            return None
+
+    def net_tutup(self, sock):
+        try:
+            sock.close()
+        except: pass
+
+    # Converters (Helper)
+    def conv_len(self, o): return len(o)
+    def conv_str(self, o):
+        from ivm.stdlib.core import builtins_str
+        return builtins_str(o)
+
+    # Bytes Manipulation
+    def sys_bytes_dari_list(self, lst):
+        """Convert list of integers to bytes object"""
+        if not isinstance(lst, list):
+             raise TypeError(f"sys_bytes_dari_list expects list, got {type(lst)}")
+        try:
+            return bytes(lst)
+        except Exception as e:
+            # Re-raise to debug
+            raise ValueError(f"sys_bytes_dari_list failed: {e}. Data sample: {lst[:10] if lst else 'empty'}")
+
+    def sys_bytes_ke_list(self, data):
+        """Convert bytes object to list of integers"""
+        if not isinstance(data, (bytes, bytearray)): return []
+        return list(data)
+
+    def sys_bytes_decode(self, data, encoding):
+        """Decode bytes to string"""
+        if not isinstance(data, (bytes, bytearray)): return None
+        try:
+            # Convert encoding arg from Morph string to python string if needed
+            enc = encoding if isinstance(encoding, str) else "utf-8"
+            return data.decode(enc)
+        except Exception:
+            return None
+
+    def sys_list_append(self, lst, item):
+        """Append item to list"""
+        if isinstance(lst, list):
+            lst.append(item)
+        return None
+
+    def sys_list_pop(self, lst, index):
+        """Pop item from list"""
+        if not isinstance(lst, list): return None
+        try:
+            idx = index if index is not None else -1
+            return lst.pop(idx)
+        except (IndexError, TypeError):
+            return None
+
+    def sys_to_float(self, x): return float(x)
+    def sys_to_int(self, x): return int(x)
+    def sys_chr(self, x): return chr(x)
+    def sys_ord(self, x): return ord(x)
+    def sys_str_join(self, lst, sep):
+        if not isinstance(lst, list): return ""
+        return str(sep).join([str(x) for x in lst])
@@ -11,7 +11,8 @@ def _builtin_ingat(*args):
     if not hasattr(gen_obj, 'frame') or not hasattr(gen_obj, 'daftar_checkpoint'):
         raise TypeError("Argumen untuk ingat() harus sebuah generator.")
 
-    frame_copy = copy.deepcopy(gen_obj.frame)
+    # Frame memegang referensi balik ke generatornya; jangan ikut disalin
+    frame_copy = copy.deepcopy(gen_obj.frame, {id(gen_obj): gen_obj})
     globals_copy = copy.deepcopy(vm.globals)
 
     gen_obj.daftar_checkpoint.append((frame_copy, globals_copy))
@@ -41,6 +42,7 @@ def builtins_tipe(*args):
     if isinstance(obj, list): return "daftar"
     if isinstance(obj, dict): return "kamus"
     if isinstance(obj, (bytes, bytearray)): return "bytes"
+    if isinstance(obj, range): return "rentang"
     if obj is None: return "nil"
     # Helper for debugging AST
     if hasattr(obj, "__class__") and hasattr(obj.__class__, "name"):
@@ -102,6 +104,20 @@ def builtins_chr(*args):
 def builtins_ord(*args):
     return ord(args[0])
 
+def builtins_rentang(*args):
+    """
+    rentang(akhir) / rentang(awal, akhir[, langkah]): deret angka bulat lazy untuk loop
+    terhitung 'selama i dari rentang(...)'. Diiterasi langsung oleh GET_ITER/FOR_ITER.
+    """
+    if not 1 <= len(args) <= 3:
+        raise TypeError("rentang() butuh 1 sampai 3 argumen")
+    try:
+        return range(*args)
+    except ValueError:
+        raise ValueError("Langkah rentang() tidak boleh 0") from None
+    except TypeError:
+        raise TypeError("Argumen rentang() harus angka bulat") from None
+
 def builtins_keys(*args):
     if not args: return []
     obj = args[0]
@@ -160,6 +176,7 @@ CORE_BUILTINS = {
     "ingat": _builtin_ingat,
     "chr": builtins_chr,
     "ord": builtins_ord,
+    "rentang": builtins_rentang,
 
     # Hidden builtins for bootstrap shim
     "_panjang_builtin": builtins_panjang,
@@ -13,7 +13,7 @@ except ImportError:
     FOX_ENGINE_AVAILABLE = False
     fox_api = None # Pastikan variabel ada
 
-from ivm.vms import standard_vm  # Untuk mengakses get_current_vm
+from ivm.vm_context import get_current_vm
 
 # Helper to run async functions from sync VM
 def _run_sync(coro):
@@ -31,7 +31,7 @@ def _execute_morph_function(code_obj, args):
     """
     Executes a Morph CodeObject using the current running VM instance.
     """
-    vm = standard_vm.get_current_vm()
+    vm = get_current_vm()
     if vm is None:
         raise RuntimeError("Fox API dipanggil di luar konteks StandardVM yang sedang berjalan.")
     return vm.call_function_sync(code_obj, args)
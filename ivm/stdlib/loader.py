@@ -1,8 +1,8 @@
 # ivm/stdlib/loader.py
 import sys
 from ivm.vm_context import get_current_vm
-from ivm.core.deserializer import deserialize_code_object
-from ivm.core.structs import Frame, CodeObject, MorphFunction
+from ivm.core.deserializer import deserialize_mvm
+from ivm.core.structs import Frame, CodeObject, MorphFunction, LemparanMorph, pesan_error
 
 def jalan_biner(data: bytes, args: list = None):
     """
@@ -19,21 +19,11 @@ def jalan_biner(data: bytes, args: list = None):
          # Or treat as error
          raise ValueError("Invalid Morph Binary Format.")
 
-    payload = data[16:]
-    code_obj = deserialize_code_object(payload, filename="<binary_run>")
+    code_obj = deserialize_mvm(data, filename="<binary_run>")
 
     # Prepare execution
-    module_globals = {}
-
-    from ivm.stdlib.core import CORE_BUILTINS
-    from ivm.stdlib.file_io import FILE_IO_BUILTINS
-    from ivm.stdlib.sistem import SYSTEM_BUILTINS
-    from ivm.stdlib.fox import FOX_BUILTINS
-
-    module_globals.update(CORE_BUILTINS)
-    module_globals.update(FILE_IO_BUILTINS)
-    module_globals.update(SYSTEM_BUILTINS)
-    module_globals.update(FOX_BUILTINS)
+    from ivm.stdlib.namespace import buat_globals_modul
+    module_globals = buat_globals_modul()
 
     # Inject argumen_sistem
     if args is not None:
@@ -41,9 +31,10 @@ def jalan_biner(data: bytes, args: list = None):
     elif "argumen_sistem" in vm.globals:
         module_globals["argumen_sistem"] = vm.globals["argumen_sistem"]
 
-    # Save current state
+    # Save current state; frame biner nanti berada di call_stack[depth], pemanggilnya di depth - 1
     saved_globals = vm.globals
-    saved_handlers = list(vm.current_frame.exception_handlers) if vm.call_stack else []
+    depth = len(vm.call_stack)
+    saved_handlers = list(vm.current_frame.exception_handlers or ()) if vm.call_stack else []
 
     # Save running state
     previous_running = vm.running
@@ -52,60 +43,30 @@ def jalan_biner(data: bytes, args: list = None):
     vm.running = True
 
     final_result = None
-    module_success = False
+
+    def error_biner(sumber):
+        # Policy _execute_until: error ditangani `coba` di dalam kode biner jika ada handler
+        # di frame biner (call_stack[depth:]); selain itu diteruskan ke pemanggil jalan_biner
+        # tanpa unwinding frame pemanggil (frame biner dibuang di blok except di bawah).
+        # `lemparkan` tanpa handler di kode biner sudah berupa LemparanMorph
+        def policy(e: Exception):
+            if isinstance(e, LemparanMorph) or not vm._has_handler(depth):
+                raise e
+            vm._handle_exception({
+                "pesan": pesan_error(e),
+                "jenis": "ErrorRuntime",
+                "sumber": sumber
+            })
+        return policy
 
     try:
-        # Push Frame
+        # Push Frame, lalu eksekusi synchronous lewat inti eksekusi VM
         frame = Frame(code=code_obj, globals=module_globals)
         vm.call_stack.append(frame)
+        vm._execute_until(depth, error_biner("<binary>"))
 
-        # Execute Synchronously (Sub-loop)
-        start_depth = len(vm.call_stack)
-        while len(vm.call_stack) >= start_depth and vm.running:
-            if vm.instruction_count >= vm.max_instructions:
-                raise RuntimeError("Instruction limit exceeded")
-
-            curr = vm.current_frame
-            # Check EOF
-            if curr.pc >= len(curr.code.instructions):
-                vm._return_from_frame(None)
-                module_success = True # Marked as success
-                continue
-
-            instr = curr.code.instructions[curr.pc]
-            curr.pc += 1
-
-            try:
-                vm.execute(instr)
-            except Exception as e:
-                # Handle VM exceptions (including Panic)
-                # Ensure the exception is propagated properly if it wasn't caught inside
-                err = {
-                    "pesan": str(e),
-                    "jenis": "ErrorRuntime",
-                    "sumber": "<binary>"
-                }
-                vm._handle_exception(err)
-
-                # If _handle_exception raises (Panic), this try-except will catch it again?
-                # No, _handle_exception raises RuntimeError.
-                # We want to let that RuntimeError propagate to the caller of jalan_biner.
-                # But here we are inside try...except Exception.
-                # So we must re-raise.
-                raise
-
-            vm.instruction_count += 1
-
-        # Module body executed.
-
-        # Check success status (handle RET opcode case)
-        if not module_success:
-             curr_len = len(vm.call_stack)
-             # If stack matches start_depth - 1 (returned to caller)
-             if curr_len == start_depth - 1:
-                 module_success = True
-
-        if not module_success:
+        # Sukses jika frame modul sudah kembali (EOF atau RET), bukan berhenti karena HALT
+        if len(vm.call_stack) != depth:
             raise RuntimeError("Binary Execution Failed (Module Body Crashed)")
 
         # Clean up module return value (only if successful)
@@ -123,60 +84,27 @@ def jalan_biner(data: bytes, args: list = None):
 
             # Ensure running is True
             vm.running = True
+            vm._execute_until(depth, error_biner("<binary:utama>"))
 
-            # Run sub-loop for utama
-            start_depth = len(vm.call_stack)
-
-            # Flag for utama
-            utama_success = False
-
-            while len(vm.call_stack) >= start_depth and vm.running:
-                if vm.instruction_count >= vm.max_instructions:
-                    raise RuntimeError("Instruction limit exceeded")
-
-                curr = vm.current_frame
-
-                if curr.pc >= len(curr.code.instructions):
-                    vm._return_from_frame(None)
-                    utama_success = True
-                    continue
-
-                instr = curr.code.instructions[curr.pc]
-                curr.pc += 1
-                try:
-                    vm.execute(instr)
-                except Exception as e:
-                     err = {
-                        "pesan": str(e),
-                        "jenis": "ErrorRuntime",
-                        "sumber": "<binary:utama>"
-                    }
-                     vm._handle_exception(err)
-                     raise
-
-                vm.instruction_count += 1
-
-            # Check success status for utama (handle RET opcode case)
-            if not utama_success:
-                 curr_len = len(vm.call_stack)
-                 if curr_len == start_depth - 1:
-                     utama_success = True
-
-            if utama_success:
-                # Execution of utama finished successfully.
-                # Capture result.
-                if vm.call_stack:
-                     caller_frame = vm.call_stack[-1]
-                     if caller_frame.stack:
-                         final_result = caller_frame.stack.pop()
-            else:
+            if len(vm.call_stack) != depth:
                 # Utama crashed.
                 raise RuntimeError("Binary Execution Failed (Utama Crashed)")
 
+            # Execution of utama finished successfully.
+            # Capture result.
+            if vm.call_stack:
+                 caller_frame = vm.call_stack[-1]
+                 if caller_frame.stack:
+                     final_result = caller_frame.stack.pop()
+
+    except Exception:
+        # Buang frame biner yang tersisa agar pemanggil melihat call_stack seperti semula
+        del vm.call_stack[depth:]
+        raise
     finally:
         vm.globals = saved_globals
         vm.running = previous_running
-        if vm.call_stack:
-            vm.current_frame.exception_handlers = saved_handlers
+        if depth > 0 and len(vm.call_stack) >= depth:
+            vm.call_stack[depth - 1].exception_handlers = saved_handlers
 
     return final_result
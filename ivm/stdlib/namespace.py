@@ -0,0 +1,17 @@
+# ivm/stdlib/namespace.py
+"""
+Namespace globals dua tingkat: satu lapisan builtins bersama (BUILTINS, beku)
+untuk VM dan semua modul yang dimuat, ditambah ModuleGlobals kecil per modul.
+Modul baru tidak lagi menyalin seluruh builtins ke dict-nya sendiri.
+"""
+from types import MappingProxyType
+from ivm.core.structs import ModuleGlobals
+from ivm.stdlib.core import CORE_BUILTINS
+from ivm.stdlib.file_io import FILE_IO_BUILTINS
+from ivm.stdlib.sistem import SYSTEM_BUILTINS
+from ivm.stdlib.fox import FOX_BUILTINS
+
+BUILTINS = MappingProxyType({**CORE_BUILTINS, **FILE_IO_BUILTINS, **SYSTEM_BUILTINS, **FOX_BUILTINS})
+
+def buat_globals_modul() -> ModuleGlobals:
+    return ModuleGlobals(BUILTINS)
@@ -1,36 +1,113 @@
 # ... (Previous imports)
-from typing import List, Any, Dict, Tuple, Union, Optional
-from ivm.core.opcodes import Op
-from ivm.core.structs import Frame, CodeObject, MorphClass, MorphInstance, BoundMethod, SuperBoundMethod, MorphFunction, MorphVariant, MorphGenerator
+import sys
+import importlib
+from operator import attrgetter
+from typing import List, Any, Dict, Tuple, Union, Optional, Callable
+from ivm.core.opcodes import Op, DecodedOp
+from ivm.core.decoder import decode_instruction, PANJANG_URUTAN
+from ivm.core.profiler import OpcodeProfiler
+from ivm.core.specializer import SPESIALIS, GENERIK, OPERATOR, SPESIALISASI_MAX_DEOPT, StatistikSpesialisasi
+from ivm.core.structs import UNBOUND, Cell, Frame, CodeObject, MorphError, LemparanMorph, format_jejak, pesan_error, MorphClass, MorphInstance, BoundMethod, SuperBoundMethod, MorphFunction, MorphVariant, MorphGenerator
 from transisi.common.result import Result
-from ivm.stdlib.core import CORE_BUILTINS
-from ivm.stdlib.file_io import FILE_IO_BUILTINS
-from ivm.stdlib.sistem import SYSTEM_BUILTINS
-from ivm.stdlib.fox import FOX_BUILTINS
-from ivm.stdlib.loader import jalan_biner
+from ivm.stdlib.namespace import buat_globals_modul
+from ivm.stdlib.core import builtins_str
+from ivm.stdlib.backend import PythonBackend
 from ivm.vm_context import set_current_vm
 
+_frame_pc = attrgetter("pc")
+
+# Modul Python internal stdlib wajib; di-reload setiap IMPORT hanya jika hot_reload=True
+INTERNAL_PY_MODULES = ("transisi.stdlib.wajib._teks_internal", "transisi.stdlib.wajib._koleksi_internal")
+
+# Opcode disimpan sebagai satu byte di format biner, jadi 256 slot cukup
+DISPATCH_TABLE_SIZE = 256
+
+# Jumlah kelas berbeda yang diingat per situs LOAD_ATTR sebelum dianggap megamorfik
+INLINE_CACHE_MAX_CLASSES = 4
+
+# Batas Frame bekas yang disimpan per CodeObject (rekursi dalam tidak menimbun frame)
+FRAME_POOL_MAX = 16
+
+# Lapisan builtins untuk globals yang bukan ModuleGlobals (dict biasa tanpa builtins)
+_TANPA_BUILTINS = {}
+
+def _builtins_dari(globals_: Dict[str, Any]):
+    return getattr(globals_, "builtins", _TANPA_BUILTINS)
+
+# Nilai int opcode panas yang di-inline di _run_fast (hindari akses atribut Op.X per instruksi)
+_LOAD_FAST = Op.LOAD_FAST.value
+_STORE_FAST = Op.STORE_FAST.value
+_LOAD_LOCAL = Op.LOAD_LOCAL.value
+_PUSH_CONST = Op.PUSH_CONST.value
+_JMP_IF_FALSE = Op.JMP_IF_FALSE.value
+_LOAD_VAR = Op.LOAD_VAR.value
+_STORE_LOCAL = Op.STORE_LOCAL.value
+_EQ = Op.EQ.value
+_LOAD_INDEX = Op.LOAD_INDEX.value
+_JMP = Op.JMP.value
+_POP = Op.POP.value
+_ADD = Op.ADD.value
+_MUL = Op.MUL.value
+_FOR_ITER = Op.FOR_ITER.value
+_LOAD_FAST_ATTR = DecodedOp.LOAD_FAST_ATTR.value
+_LOAD_FAST_METHOD = DecodedOp.LOAD_FAST_METHOD.value
+_LOAD_FAST_FAST = DecodedOp.LOAD_FAST_FAST.value
+_LOAD_FAST_CONST = DecodedOp.LOAD_FAST_CONST.value
+_STORE_FAST_LOAD_FAST = DecodedOp.STORE_FAST_LOAD_FAST.value
+_INC_FAST = DecodedOp.INC_FAST.value
+_COMPARE_JMP_IF_FALSE = DecodedOp.COMPARE_JMP_IF_FALSE.value
+_ADD_INT = DecodedOp.ADD_INT.value
+_ADD_FLOAT = DecodedOp.ADD_FLOAT.value
+_ADD_STR = DecodedOp.ADD_STR.value
+_SUB_INT = DecodedOp.SUB_INT.value
+_SUB_FLOAT = DecodedOp.SUB_FLOAT.value
+_MUL_INT = DecodedOp.MUL_INT.value
+_MUL_FLOAT = DecodedOp.MUL_FLOAT.value
+
+def _teruskan_error(e: Exception):
+    """Policy _execute_until: exception diteruskan ke pemanggil Python tanpa dicari handler Morph-nya."""
+    raise e
+
 class StandardVM:
     # ... (__init__ and properties same)
-    def __init__(self, max_instructions: int = 50_000_000, script_args: List[str] = None):
+    def __init__(self, max_instructions: int = 50_000_000, script_args: List[str] = None, fast_loop: bool = True, pool_frames: bool = True,
+                 superinstructions: bool = True, profiler: Optional[OpcodeProfiler] = None, hot_reload: bool = False,
+                 specialize: bool = True, bytecode_cache: bool = True, optimize: int = 0):
         self.call_stack: List[Frame] = []
         self.registers: List[Any] = [None] * 32
-        self.globals: Dict[str, Any] = {}
+        self.globals: Dict[str, Any] = buat_globals_modul()
         self.running: bool = False
+        # Batas instruksi per run(). _run_fast mengeceknya hanya di lompatan mundur, opcode
+        # lewat tabel dispatch (termasuk CALL) dan pergantian frame, bukan per N instruksi
         self.max_instructions = max_instructions
         self.instruction_count = 0
+        # Kedalaman call_stack eksekusi bersarang yang sedang berjalan (lihat _execute_until);
+        # _handle_exception tidak unwinding frame di bawahnya
+        self._batas_unwind = 0
         # Hapus global exception_handlers, pindahkan ke Frame
         self.loaded_modules: Dict[str, Dict[str, Any]] = {}
-        self._init_builtins()
+        # Modul native (pinjam/IMPORT modul Python, "_backend") yang sudah diresolusi, lihat _resolve_native
+        self.native_modules: Dict[str, Any] = {}
+        # hot_reload=True: modul Python internal dimuat ulang setiap IMPORT (mode pengembangan)
+        self.hot_reload = hot_reload
+        # fast_loop=False memakai loop lama (satu instruksi per iterasi lewat execute_next), untuk perbandingan
+        self.fast_loop = fast_loop
+        # pool_frames=True: Frame fungsi yang selesai dikembalikan ke CodeObject.frame_pool dan dipakai ulang
+        self.pool_frames = pool_frames
+        # superinstructions=True: eksekusi array hasil CodeObject.fused() (urutan opcode panas digabung)
+        self.superinstructions = superinstructions
+        # profiler diisi: run() memakai _run_profiled (bytecode asli, tanpa superinstruksi)
+        self.profiler = profiler
+        # specialize=True: _run_fast menulis ulang situs ADD/SUB/MUL jadi opcode bertipe (ivm/core/specializer.py)
+        self.specialize = specialize
+        self.specialization_stats = StatistikSpesialisasi()
+        # bytecode_cache=True: modul .fox dimuat lewat __foxcache__ (ivm/core/bytecode_cache.py)
+        self.bytecode_cache = bytecode_cache
+        # optimize=N: modul .fox hasil kompilasi dioptimasi dengan ivm/optimizer.py level N (0 = mati)
+        self.optimize = optimize
+        self._dispatch = self._build_dispatch_table()
         self.globals["argumen_sistem"] = script_args if script_args is not None else []
 
-    def _init_builtins(self):
-        self.globals.update(CORE_BUILTINS)
-        self.globals.update(FILE_IO_BUILTINS)
-        self.globals.update(SYSTEM_BUILTINS)
-        self.globals.update(FOX_BUILTINS)
-        self.globals["_jalan_biner_internal"] = jalan_biner
-
     @property
     def current_frame(self) -> Frame:
         return self.call_stack[-1]
@@ -58,38 +135,303 @@ class StandardVM:
         set_current_vm(self)
         self.running = True
         try:
-            while self.running and self.call_stack:
-                if self.instruction_count >= self.max_instructions:
-                    raise RuntimeError(f"Instruction limit exceeded ({self.max_instructions}). Possible infinite loop.")
-
-                frame = self.current_frame
-                if frame.pc >= len(frame.code.instructions):
-                    self._return_from_frame(None)
-                    continue
-
-                instruction = frame.code.instructions[frame.pc]
-                frame.pc += 1
-
-                try:
-                    self.execute(instruction)
-                except Exception as e:
-                    # Handle system crashes (RuntimeError, etc.)
-                    # Bungkus sebagai error Morph dan lemparkan via mekanisme internal
-                    error_obj = {
-                            "pesan": str(e),
-                            "baris": 0,
-                            "kolom": 0,
-                            "jenis": "ErrorSistem"
-                        }
-                    self._handle_exception(error_obj)
-
-                self.instruction_count += 1
+            self._execute_until(0)
         except Exception:
             self.running = False
             raise
         finally:
             set_current_vm(None)
 
+    def _execute_until(self, depth: int, on_error: Optional[Callable[[Exception], None]] = None):
+        """
+        Inti eksekusi reentrant yang dipakai run, load_module, call_function_sync dan
+        jalan_biner: menjalankan frame di atas kedalaman `depth` sampai call_stack
+        kembali ke `depth` (atau running False). Loop yang dipakai mengikuti mode VM
+        (profiler, fast_loop, legacy).
+
+        on_error(e) adalah policy untuk exception Python dari sebuah instruksi, dipanggil
+        setelah frame.pc dan instruction_count disinkronkan. Default (_error_ke_morph)
+        membungkusnya jadi MorphError lalu mencari handler; policy boleh melempar
+        ulang untuk menghentikan eksekusi.
+
+        Selama berjalan, _handle_exception (termasuk THROW) tidak unwinding frame di
+        bawah `depth`: error tanpa handler di call_stack[depth:] keluar sebagai
+        LemparanMorph dan ikut diserahkan ke on_error.
+        """
+        if on_error is None: on_error = self._error_ke_morph
+        batas = self._batas_unwind
+        self._batas_unwind = depth
+        try:
+            if self.profiler is not None:
+                self._run_profiled(depth, on_error)
+            elif self.fast_loop:
+                self._run_fast(depth, on_error)
+            else:
+                self._run_legacy(depth, on_error)
+        finally:
+            self._batas_unwind = batas
+
+    def _error_ke_morph(self, e: Exception):
+        if isinstance(e, LemparanMorph):
+            # Error Morph dari eksekusi bersarang: teruskan nilainya beserta jejak aslinya
+            self._unwind(e.nilai)
+            return
+        # Handle system crashes (RuntimeError, etc.)
+        # Bungkus sebagai error Morph dan lemparkan via mekanisme internal
+        self._handle_exception(self._system_error(e))
+
+    def _run_legacy(self, depth: int, on_error: Callable[[Exception], None]):
+        while self.running and len(self.call_stack) > depth:
+            if self.instruction_count >= self.max_instructions:
+                raise RuntimeError(f"Instruction limit exceeded ({self.max_instructions}). Possible infinite loop.")
+
+            frame = self.current_frame
+            if frame.pc >= len(frame.code.instructions):
+                self._return_from_frame(None)
+                continue
+
+            pc = frame.pc
+            try:
+                self.execute_next(frame)
+            except Exception as e:
+                # Loop bersarang (load_module/jalan_biner) mungkin sudah memindah pc frame ini;
+                # superinstruksi yang gagal di bagian berikutnya sudah memajukan pc ke bagian itu
+                ops = (frame.code.fused() if self.superinstructions else frame.code.decoded())[0]
+                if not pc < frame.pc <= pc + PANJANG_URUTAN[ops[pc]]: frame.pc = pc + 1
+                on_error(e)
+
+            self.instruction_count += 1
+
+    def _run_profiled(self, depth: int, on_error: Callable[[Exception], None]):
+        """Seperti _run_legacy, tapi setiap instruksi dicatat ke self.profiler sebelum dieksekusi."""
+        profiler = self.profiler
+        dispatch = self._dispatch
+        while self.running and len(self.call_stack) > depth:
+            if self.instruction_count >= self.max_instructions:
+                raise RuntimeError(f"Instruction limit exceeded ({self.max_instructions}). Possible infinite loop.")
+
+            frame = self.current_frame
+            ops, args = frame.code.decoded()
+            pc = frame.pc
+            if pc >= len(ops):
+                self._return_from_frame(None)
+                continue
+
+            profiler.catat(frame, pc, ops[pc])
+            frame.pc = pc + 1
+            try:
+                dispatch[ops[pc]](frame, args[pc])
+            except Exception as e:
+                frame.pc = pc + 1
+                on_error(e)
+
+            self.instruction_count += 1
+
+    def _run_fast(self, depth: int, on_error: Callable[[Exception], None]):
+        """
+        Loop eksekusi utama. State frame aktif (array ops/args hasil decode,
+        stack, locals, pc) disimpan di variabel lokal dan hanya dimuat ulang saat frame berganti
+        (CALL/RET/YIELD/RESUME/exception). Opcode terpanas di-inline; sisanya
+        lewat tabel dispatch dengan frame.pc dan instruction_count disinkronkan
+        dulu, sehingga handler melihat state yang sama seperti di _run_legacy. Semua
+        superinstruksi di-inline dan memajukan pc lokal sebelum tiap bagiannya, jadi
+        bagian yang gagal terlihat di pc-nya sendiri.
+
+        Batas max_instructions tidak dicek per instruksi, hanya di lompatan mundur,
+        setelah opcode lewat tabel dispatch (termasuk CALL) dan saat frame berganti.
+        Di antara titik-titik itu hanya ada kode lurus (terbatas panjang bytecode),
+        jadi loop tak berujung tetap berhenti paling lambat satu iterasi setelah batas.
+        Tidak ada opsi interval "setiap N instruksi": titik cek ditentukan bentuk kode.
+
+        Dengan specialize=True array ops diambil dari CodeObject.specialized(): ADD/SUB/MUL
+        generik ditulis ulang menurut tipe operand yang terlihat, opcode bertipe
+        (ADD_INT, ...) kembali ke generik saat cek tipenya gagal.
+        """
+        call_stack = self.call_stack
+        dispatch = self._dispatch
+        limit = self.max_instructions
+        fused = self.superinstructions
+        specialize = self.specialize
+        spesialis_untuk = SPESIALIS.get if specialize else {}.get
+        # dict.get tidak memanggil ModuleGlobals.__missing__: builtin dibaca langsung dari lapisannya
+        dict_get = dict.get
+
+        while self.running and len(call_stack) > depth:
+            if self.instruction_count >= limit:
+                raise RuntimeError(f"Instruction limit exceeded ({limit}). Possible infinite loop.")
+
+            frame = call_stack[-1]
+            if specialize: ops, args = frame.code.specialized(fused)
+            else: ops, args = frame.code.fused() if fused else frame.code.decoded()
+            n_instr = len(ops)
+            stack = frame.stack
+            fast = frame.fast
+            f_locals = frame.locals
+            # self.globals hanya berubah saat pergantian frame, aman di-cache di sini
+            f_globals = self.globals
+            f_builtins = _builtins_dari(f_globals)
+            pc = frame.pc
+            count = self.instruction_count
+
+            try:
+                while True:
+                    if pc >= n_instr:
+                        frame.pc = pc
+                        self.instruction_count = count
+                        self._return_from_frame(None)
+                        break
+
+                    op = ops[pc]
+                    arg = args[pc]
+                    pc += 1
+
+                    if op == _LOAD_FAST:
+                        val = fast[arg]
+                        if val is UNBOUND: val = self._load_unbound(frame, arg)
+                        stack.append(val)
+                    elif _ADD_INT <= op <= _MUL_FLOAT:
+                        b = stack.pop(); a = stack[-1]
+                        if op == _ADD_INT and type(a) is int and type(b) is int: stack[-1] = a + b
+                        elif op == _SUB_INT and type(a) is int and type(b) is int: stack[-1] = a - b
+                        elif op == _ADD_FLOAT and type(a) is float and type(b) is float: stack[-1] = a + b
+                        elif op == _MUL_INT and type(a) is int and type(b) is int: stack[-1] = a * b
+                        elif op == _SUB_FLOAT and type(a) is float and type(b) is float: stack[-1] = a - b
+                        elif op == _MUL_FLOAT and type(a) is float and type(b) is float: stack[-1] = a * b
+                        elif op == _ADD_STR and type(a) is str and type(b) is str: stack[-1] = a + b
+                        else: stack[-1] = self._deopt(frame.code, ops, pc - 1, op, a, b)
+                    elif op == _LOAD_FAST_ATTR:
+                        obj = fast[arg[0]]
+                        if isinstance(obj, MorphInstance) and arg[1] in obj.properties:
+                            stack.append(obj.properties[arg[1]])
+                            pc += 1
+                        else:
+                            # Bukan properti instance: LOAD_ATTR lengkap (pc sinkron untuk inline cache)
+                            if obj is UNBOUND: obj = self._load_unbound(frame, arg[0])
+                            stack.append(obj)
+                            frame.pc = pc = pc + 1
+                            self._op_load_attr(frame, arg[1])
+                    elif op == _LOAD_FAST_METHOD:
+                        # Inline (bukan lewat dispatch) agar pc lokal selalu menunjuk bagian yang gagal
+                        obj = fast[arg[0]]
+                        if obj is UNBOUND: obj = self._load_unbound(frame, arg[0])
+                        stack.append(obj)
+                        frame.pc = pc = pc + 1
+                        self._op_load_method(frame, arg[1])
+                    elif op == _STORE_FAST:
+                        fast[arg] = stack.pop()
+                    elif op == _LOAD_FAST_FAST:
+                        val = fast[arg[0]]
+                        if val is UNBOUND: val = self._load_unbound(frame, arg[0])
+                        stack.append(val)
+                        pc += 1
+                        val = fast[arg[1]]
+                        if val is UNBOUND: val = self._load_unbound(frame, arg[1])
+                        stack.append(val)
+                    elif op == _LOAD_FAST_CONST:
+                        val = fast[arg[0]]
+                        if val is UNBOUND: val = self._load_unbound(frame, arg[0])
+                        stack.append(val)
+                        stack.append(arg[1])
+                        pc += 1
+                    elif op == _PUSH_CONST:
+                        stack.append(arg)
+                    elif op == _JMP_IF_FALSE:
+                        if not stack.pop():
+                            if arg < pc and count >= limit:
+                                frame.pc = arg
+                                self.instruction_count = count + 1
+                                break
+                            pc = arg
+                    elif op == _COMPARE_JMP_IF_FALSE:
+                        b = stack.pop()
+                        if arg[0](stack.pop(), b): pc += 1
+                        else:
+                            if arg[1] < pc and count >= limit:
+                                frame.pc = arg[1]
+                                self.instruction_count = count + 1
+                                break
+                            pc = arg[1]
+                    elif op == _LOAD_VAR:
+                        # Dict modul lalu lapisan builtins bersama, keduanya lookup tingkat C
+                        val = dict_get(f_globals, arg, UNBOUND)
+                        if val is UNBOUND:
+                            try: val = f_builtins[arg]
+                            except KeyError: raise RuntimeError(f"Global '{arg}' not found.") from None
+                        stack.append(val)
+                    elif op == _STORE_FAST_LOAD_FAST:
+                        fast[arg[0]] = stack.pop()
+                        pc += 1
+                        val = fast[arg[1]]
+                        if val is UNBOUND: val = self._load_unbound(frame, arg[1])
+                        stack.append(val)
+                    elif op == _INC_FAST:
+                        val = fast[arg[0]]
+                        if val is UNBOUND: val = self._load_unbound(frame, arg[0])
+                        pc += 2 # ADD yang gagal dilaporkan di pc-nya sendiri
+                        fast[arg[0]] = val + arg[1]
+                        pc += 1
+                    elif op == _LOAD_LOCAL:
+                        val = f_locals.get(arg, UNBOUND)
+                        if val is UNBOUND: val = dict_get(f_globals, arg, UNBOUND)
+                        if val is UNBOUND:
+                            try: val = f_builtins[arg]
+                            except KeyError: raise RuntimeError(f"Variable '{arg}' not found.") from None
+                        stack.append(val)
+                    elif op == _STORE_LOCAL:
+                        f_locals[arg] = stack.pop()
+                    elif op == _EQ:
+                        b = stack.pop(); stack.append(stack.pop() == b)
+                    elif _ADD <= op <= _MUL:
+                        # Aritmatika generik: hitung, lalu spesialisasi situs ini jika tipenya dikenal
+                        b = stack.pop(); a = stack.pop()
+                        stack.append(OPERATOR[op](a, b))
+                        spes = spesialis_untuk((op, type(a), type(b)))
+                        if spes is not None: self._spesialisasi(frame.code, ops, pc - 1, spes)
+                    elif op == _LOAD_INDEX:
+                        i = stack.pop(); stack.append(stack.pop()[i])
+                    elif op == _JMP:
+                        if arg < pc and count >= limit:
+                            frame.pc = arg
+                            self.instruction_count = count + 1
+                            break
+                        pc = arg
+                    elif op == _POP:
+                        if stack: stack.pop()
+                    elif op == _FOR_ITER and type(stack[-1]) is not MorphGenerator:
+                        # Iterator Python: satu next() per iterasi; generator lewat dispatch (ganti frame)
+                        val = next(stack[-1], UNBOUND)
+                        if val is UNBOUND:
+                            stack.pop()
+                            pc = arg
+                        else:
+                            stack.append(val)
+                    else:
+                        frame.pc = pc
+                        self.instruction_count = count
+                        dispatch[op](frame, arg)
+                        count = self.instruction_count + 1
+                        if not self.running or not call_stack or call_stack[-1] is not frame or count >= limit:
+                            self.instruction_count = count
+                            break
+                        pc = frame.pc
+                        continue
+
+                    count += 1
+            except Exception as e:
+                # Opcode inline belum menulis pc ke frame; handler dispatch mungkin
+                # sudah menambah instruction_count lewat loop bersarang (load_module).
+                frame.pc = pc
+                self.instruction_count = max(self.instruction_count, count) + 1
+                on_error(e)
+
+    def _system_error(self, e: Exception) -> Dict[str, Any]:
+        return MorphError({
+                "pesan": pesan_error(e),
+                "baris": 0,
+                "kolom": 0,
+                "jenis": "ErrorSistem"
+            })
+
     def _return_from_frame(self, val):
         finished_frame = self.call_stack.pop()
         if self.call_stack:
@@ -99,872 +441,1168 @@ class StandardVM:
             # If this was a constructor call, we ignore the return value 'val'
             # and instead return the instance 'ini'.
             if finished_frame.is_init_call:
-                instance = finished_frame.locals.get('ini')
+                instance = finished_frame.get_local('ini')
                 self.current_frame.stack.append(instance)
+            elif finished_frame.generator is not None:
+                self._finish_generator(finished_frame.generator, val)
             else:
                 self.current_frame.stack.append(val)
         else:
             self.running = False
 
+        if self.pool_frames:
+            self._release_frame(finished_frame)
+
+    def _finish_generator(self, gen: MorphGenerator, val: Any):
+        """Generator selesai (RET/akhir kode): konsumen FOR_ITER keluar dari loop, RESUME menerima nilai kembali."""
+        gen.status = "closed"
+        caller = self.current_frame
+        if gen.iter_exit is not None:
+            caller.stack.pop() # generator di puncak stack konsumen
+            caller.pc = gen.iter_exit
+        else:
+            caller.stack.append(val)
+
+    def _release_frame(self, frame: Frame):
+        """
+        Reset frame yang sudah selesai lalu simpan di frame_pool milik CodeObject-nya.
+        Hanya frame fungsi ber-slot (dibuat call_function_internal) yang didaur ulang:
+        frame generator tetap dipegang MorphGenerator (termasuk frame yang YIELD tanpa
+        is_generator), frame modul/main dibuat di luar jalur panggilan. Closure hanya
+        memegang Cell, jadi cells cukup dilepas.
+        """
+        code = frame.code
+        if code.is_generator or not code.local_names or frame.generator is not None: return
+        pool = code.frame_pool
+        if len(pool) >= FRAME_POOL_MAX: return
+        frame.pc = 0
+        frame.stack.clear()
+        # Lepas referensi agar objek milik panggilan lama tidak tertahan di pool
+        frame.globals = None
+        frame.locals = None
+        frame.fast = None
+        frame.cells = None
+        frame.exception_handlers = None
+        frame.snapshots = None
+        frame.defining_class = None
+        pool.append(frame)
+
     def _lookup_method(self, klass: MorphClass, name: str) -> Tuple[Optional[CodeObject], Optional[MorphClass]]:
-        curr = klass
-        while curr:
-            if name in curr.methods:
-                return curr.methods[name], curr
-            curr = curr.superclass
-        return None, None
+        return klass.method_table().get(name, (None, None))
+
+    def _lookup_method_cached(self, frame: Frame, klass: MorphClass, name: str) -> Tuple[Optional[CodeObject], Optional[MorphClass]]:
+        """
+        _lookup_method dengan inline cache per situs instruksi (code, pc).
+        Entri: [epoch, nama, [(kelas, metode, kelas_pemilik), ...]]. Seluruh entri
+        gugur jika MorphClass.epoch berubah (ada methods/superclass yang diubah).
+        Situs dengan lebih dari INLINE_CACHE_MAX_CLASSES kelas tidak di-cache lagi.
+        """
+        sites = frame.code.inline_cache
+        pc = frame.pc - 1
+        epoch = MorphClass.epoch
+        entry = sites.get(pc)
+        if entry is not None and entry[0] == epoch and entry[1] == name:
+            for k, method, def_cls in entry[2]:
+                if k is klass: return method, def_cls
+        else:
+            entry = sites[pc] = [epoch, name, []]
+
+        method, def_cls = self._lookup_method(klass, name)
+        if len(entry[2]) < INLINE_CACHE_MAX_CLASSES:
+            entry[2].append((klass, method, def_cls))
+        return method, def_cls
+
+    def _spesialisasi(self, code: CodeObject, ops, site: int, spes: int):
+        """Tulis opcode bertipe `spes` ke situs generik di ops (array dari CodeObject.specialized())."""
+        if code.deopt_count.get(site, 0) >= SPESIALISASI_MAX_DEOPT: return
+        ops[site] = spes
+        self.specialization_stats.spesialisasi[spes] += 1
+
+    def _deopt(self, code: CodeObject, ops, site: int, spes: int, a: Any, b: Any) -> Any:
+        """Cek tipe opcode bertipe gagal: kembalikan situs ke opcode generik lalu hitung secara generik."""
+        generik = GENERIK[spes]
+        ops[site] = generik
+        code.deopt_count[site] = code.deopt_count.get(site, 0) + 1
+        self.specialization_stats.deopt[spes] += 1
+        return OPERATOR[generik](a, b)
+
+    def _build_dispatch_table(self) -> List[Any]:
+        """
+        Membangun tabel dispatch datar: indeks = nilai integer opcode, isi = handler
+        yang sudah di-bind ke VM ini. Opcode tanpa handler (misal int mentah yang
+        tidak dikenal dari deserializer) dipetakan ke _op_unknown.
+        """
+        table = [self._op_unknown] * DISPATCH_TABLE_SIZE
+        for op in list(Op) + list(DecodedOp):
+            table[op.value] = getattr(self, f"_op_{op.name.lower()}")
+        return table
 
     def execute(self, instr: Tuple):
-        opcode = instr[0]
-
-        # ... (Stack, Arith, Logic, Reg, Hybrid, Var, Data, Flow - Same as before)
-        if opcode == Op.PUSH_CONST: self.stack.append(instr[1])
-        elif opcode == Op.POP: self.stack.pop() if self.stack else None
-        elif opcode == Op.DUP: self.stack.append(self.stack[-1]) if self.stack else None
-        elif opcode == Op.ADD: b, a = self.stack.pop(), self.stack.pop(); self.stack.append(a + b)
-        elif opcode == Op.SUB: b, a = self.stack.pop(), self.stack.pop(); self.stack.append(a - b)
-        elif opcode == Op.MUL: b, a = self.stack.pop(), self.stack.pop(); self.stack.append(a * b)
-        elif opcode == Op.DIV: b, a = self.stack.pop(), self.stack.pop(); self.stack.append(a / b)
-        elif opcode == Op.MOD: b, a = self.stack.pop(), self.stack.pop(); self.stack.append(a % b)
-        elif opcode == Op.EQ: b, a = self.stack.pop(), self.stack.pop(); self.stack.append(a == b)
-        elif opcode == Op.NEQ: b, a = self.stack.pop(), self.stack.pop(); self.stack.append(a != b)
-        elif opcode == Op.GT: b, a = self.stack.pop(), self.stack.pop(); self.stack.append(a > b)
-        elif opcode == Op.LT: b, a = self.stack.pop(), self.stack.pop(); self.stack.append(a < b)
-        elif opcode == Op.GTE: b, a = self.stack.pop(), self.stack.pop(); self.stack.append(a >= b)
-        elif opcode == Op.LTE: b, a = self.stack.pop(), self.stack.pop(); self.stack.append(a <= b)
-        elif opcode == Op.NOT: val = self.stack.pop(); self.stack.append(not val)
-        elif opcode == Op.AND: b, a = self.stack.pop(), self.stack.pop(); self.stack.append(a and b)
-        elif opcode == Op.OR: b, a = self.stack.pop(), self.stack.pop(); self.stack.append(a or b)
-
-        # === Bitwise Operations ===
-        elif opcode == Op.BIT_AND: b, a = self.stack.pop(), self.stack.pop(); self.stack.append(a & b)
-        elif opcode == Op.BIT_OR: b, a = self.stack.pop(), self.stack.pop(); self.stack.append(a | b)
-        elif opcode == Op.BIT_XOR: b, a = self.stack.pop(), self.stack.pop(); self.stack.append(a ^ b)
-        elif opcode == Op.BIT_NOT: val = self.stack.pop(); self.stack.append(~val)
-        elif opcode == Op.LSHIFT: b, a = self.stack.pop(), self.stack.pop(); self.stack.append(a << b)
-        elif opcode == Op.RSHIFT: b, a = self.stack.pop(), self.stack.pop(); self.stack.append(a >> b)
-
-        elif opcode == Op.LOAD_REG: self.registers[instr[1]] = instr[2]
-        elif opcode == Op.MOVE_REG: self.registers[instr[1]] = self.registers[instr[2]]
-        elif opcode == Op.ADD_REG: self.registers[instr[1]] = self.registers[instr[2]] + self.registers[instr[3]]
-        elif opcode == Op.PUSH_FROM_REG: self.stack.append(self.registers[instr[1]])
-        elif opcode == Op.POP_TO_REG: self.registers[instr[1]] = self.stack.pop()
-        elif opcode == Op.LOAD_VAR:
-            name = instr[1]
-            if name in self.globals: self.stack.append(self.globals[name])
-            else: raise RuntimeError(f"Global '{name}' not found.")
-        elif opcode == Op.STORE_VAR: self.globals[instr[1]] = self.stack.pop()
-        elif opcode == Op.LOAD_LOCAL:
-            name = instr[1]
-            if name in self.current_frame.locals: self.stack.append(self.current_frame.locals[name])
-            elif name in self.globals: self.stack.append(self.globals[name])
-            else: raise RuntimeError(f"Variable '{name}' not found.")
-        elif opcode == Op.STORE_LOCAL: self.current_frame.locals[instr[1]] = self.stack.pop()
-        elif opcode == Op.BUILD_LIST:
-            c = instr[1]; el = [self.stack.pop() for _ in range(c)]; el.reverse(); self.stack.append(el)
-        elif opcode == Op.BUILD_DICT:
-            c = instr[1]; d = {};
-            for _ in range(c): v = self.stack.pop(); k = self.stack.pop(); d[k] = v
-            self.stack.append(d)
-        elif opcode == Op.LOAD_INDEX: i = self.stack.pop(); t = self.stack.pop(); self.stack.append(t[i])
-        elif opcode == Op.STORE_INDEX: v = self.stack.pop(); i = self.stack.pop(); t = self.stack.pop(); t[i] = v
-        elif opcode == Op.SLICE:
-            # Stack: [obj, start, end] -> Pop 3 -> Push Result
-            end = self.stack.pop()
-            start = self.stack.pop()
-            obj = self.stack.pop()
-
-            # Handle nil/None for slicing to end
-            s_idx = start if start is not None else 0
-            e_idx = end if end is not None else len(obj)
-
-            if isinstance(obj, (str, list, tuple, bytes, bytearray)):
-                self.stack.append(obj[s_idx:e_idx])
-            else:
-                raise TypeError(f"Objek tipe '{type(obj).__name__}' tidak mendukung slicing/iris.")
-
-        elif opcode == Op.UNPACK_SEQUENCE:
-            count = instr[1]
-            # Perubahan: Peek seq, jangan pop!
-            seq = self.stack[-1]
-            if len(seq) < count: raise ValueError(f"Tidak cukup nilai untuk unpack (diharapkan {count}, dapat {len(seq)})")
-            for i in range(count - 1, -1, -1):
-                self.stack.append(seq[i])
-        elif opcode == Op.CHECK_LEN:
-            count = instr[1]
-            seq = self.stack[-1] # Peek, jangan pop karena nanti mau dipakai
-            self.stack.append(len(seq) == count)
-        elif opcode == Op.CHECK_LEN_MIN:
-            count = instr[1]
-            seq = self.stack[-1]
-            self.stack.append(len(seq) >= count)
-        elif opcode == Op.SNAPSHOT:
-            self.current_frame.snapshots.append(len(self.stack))
-        elif opcode == Op.RESTORE:
-            if not self.current_frame.snapshots:
-                raise RuntimeError("Stack Underflow: Tidak ada snapshot untuk direstore")
-            target_len = self.current_frame.snapshots.pop()
-            # Potong stack sampai target_len.
-            # List slice in place: del self.stack[target_len:]
-            del self.stack[target_len:]
-        elif opcode == Op.DISCARD_SNAPSHOT:
-            if self.current_frame.snapshots:
-                self.current_frame.snapshots.pop()
-        elif opcode == Op.JMP: self.current_frame.pc = instr[1]
-        elif opcode == Op.JMP_IF_FALSE:
-            if not self.stack.pop(): self.current_frame.pc = instr[1]
-        elif opcode == Op.JMP_IF_TRUE:
-            if self.stack.pop(): self.current_frame.pc = instr[1]
-
-        # === Classes & Objects ===
-        elif opcode == Op.BUILD_CLASS:
-            methods = self.stack.pop()
-            superclass = self.stack.pop()
-            name = self.stack.pop()
-            # Capture current globals for class methods context
-            klass = MorphClass(name=name, methods=methods, superclass=superclass, globals=self.globals)
-            self.stack.append(klass)
-
-        elif opcode == Op.LOAD_ATTR:
-            name = instr[1]
-            obj = self.stack.pop()
-            if isinstance(obj, MorphInstance):
-                if name == "__class__": self.stack.append(obj.klass)
-                elif name == "punya":
-                    # Helper .punya(key) for Instances
-                    def inst_punya(key):
-                        if key in obj.properties: return True
-                        m, _ = self._lookup_method(obj.klass, key)
-                        return m is not None
-                    self.stack.append(inst_punya)
-                elif name in obj.properties: self.stack.append(obj.properties[name])
-                else:
-                    method, def_cls = self._lookup_method(obj.klass, name)
-                    if method:
-                        self.stack.append(BoundMethod(instance=obj, method=method, defining_class=def_cls))
-                    else: raise AttributeError(f"Instance '{obj}' has no attribute '{name}'")
-            elif isinstance(obj, MorphClass):
-                 # Perbaikan: Izinkan akses ke properti meta-class seperti 'name'
-                 if name == "name":
-                     self.stack.append(obj.name)
-                 elif name == "punya":
-                     # Helper .punya(key) for Classes (static check)
-                     def cls_punya(key):
-                         if key == "name": return True
-                         m, _ = self._lookup_method(obj, key)
-                         return m is not None
-                     self.stack.append(cls_punya)
-                 else:
-                     method, def_cls = self._lookup_method(obj, name)
-                     if method: self.stack.append(method)
-                     else: raise AttributeError(f"Class '{obj.name}' has no attribute '{name}'")
-            elif isinstance(obj, dict):
-                # Support akses key dictionary sebagai atribut (terutama untuk ObjekError/Result)
-                if name == "punya":
-                    # Return helper function for .punya(key)
-                    def dict_punya(key):
-                        return key in obj
-                    self.stack.append(dict_punya)
-                elif name in obj: self.stack.append(obj[name])
-                else: raise AttributeError(f"Dictionary has no key '{name}'")
-            elif isinstance(obj, Result):
-                if name == "sukses": self.stack.append(obj.is_sukses())
-                elif name == "data": self.stack.append(obj.unwrap() if obj.is_sukses() else None)
-                elif name == "error": self.stack.append(obj.unwrap_error() if obj.is_gagal() else None)
-                else: raise AttributeError(f"Result object has no attribute '{name}'")
-            elif isinstance(obj, MorphVariant):
-                 # Support access to variant content by index via attribute (e.g., .0, .1) or named if we track it?
-                 # Current MorphVariant only has args list.
-                 # If we want named fields, we need to store them. But `tipe` decl only has ordered params.
-                 # Access via index like tuple? Or allow unpacking.
-                 # User typically matches, doesn't access directly.
-                 raise AttributeError(f"Varian '{obj.name}' tidak mendukung akses atribut langsung. Gunakan jodohkan.")
-            elif isinstance(obj, str):
-                # Mapping method string Morph -> Python
-                STR_METHODS = {
-                    "kecil": "lower",
-                    "besar": "upper",
-                    "bersihkan": "strip",
-                    "ganti": "replace",
-                    "temukan": "find",
-                    "pisah": "split",
-                    "awalan": "startswith",
-                    "akhiran": "endswith"
-                }
-                target_attr = STR_METHODS.get(name, name)
-                if hasattr(obj, target_attr):
-                    self.stack.append(getattr(obj, target_attr))
-                else:
-                    raise AttributeError(f"Teks '{obj}' tidak memiliki atribut/metode '{name}'")
-            else:
-                if hasattr(obj, name): self.stack.append(getattr(obj, name))
-                else: raise AttributeError(f"Object '{obj}' has no attribute '{name}'")
-
-        elif opcode == Op.STORE_ATTR:
-            name = instr[1]
-            val = self.stack.pop()
-            obj = self.stack.pop()
-            if isinstance(obj, MorphInstance): obj.properties[name] = val
-            else: setattr(obj, name, val)
-
-        elif opcode == Op.LOAD_SUPER_METHOD:
-            method_name = instr[1]
-            instance = self.stack.pop()
-
-            start_class = self.current_frame.defining_class
-            if start_class is None:
-                start_class = instance.klass
-
-            superclass = start_class.superclass
-            if not superclass:
-                raise RuntimeError(f"Cannot call 'induk': class '{start_class.name}' has no superclass.")
-
-            method, def_cls = self._lookup_method(superclass, method_name)
-            if not method:
-                raise AttributeError(f"Superclass '{superclass.name}' has no method '{method_name}'.")
-
-            self.stack.append(SuperBoundMethod(instance=instance, method=method, defining_class=def_cls))
-
-        elif opcode == Op.IS_INSTANCE:
-            # Hybrid: Check if arg is present (Bootstrap) or on stack (Self-Hosted)
-            if instr[1] is not None:
-                type_name = instr[1]
-                obj = self.stack.pop()
-            else:
-                type_name = self.stack.pop()
-                obj = self.stack.pop()
-
-            result = False
-            if type_name == "Daftar" and isinstance(obj, list): result = True
-            elif type_name == "Kamus" and isinstance(obj, dict): result = True
-            elif type_name == "Teks" and isinstance(obj, str): result = True
-            elif type_name == "Angka" and isinstance(obj, (int, float)): result = True
-            # TODO: Support Varian dan Class
-            self.stack.append(result)
-
-        elif opcode == Op.IS_VARIANT:
-            # Hybrid
-            if instr[1] is not None:
-                variant_name = instr[1]
-                obj = self.stack.pop()
-            else:
-                variant_name = self.stack.pop()
-                obj = self.stack.pop()
-
-            result = False
-            if isinstance(obj, MorphVariant):
-                result = (obj.name == variant_name)
-            elif isinstance(obj, Result):
-                # Compat for Result object
-                if variant_name == "Sukses": result = obj.is_sukses()
-                elif variant_name == "Gagal": result = obj.is_gagal()
-            self.stack.append(result)
-
-        elif opcode == Op.UNPACK_VARIANT:
-            obj = self.stack.pop()
-            if isinstance(obj, MorphVariant):
-                # Push all args to stack
-                for arg in reversed(obj.args):
-                    self.stack.append(arg)
-            elif isinstance(obj, Result):
-                # Compat for Result
-                if obj.is_sukses(): self.stack.append(obj.unwrap())
-                else: self.stack.append(obj.unwrap_error())
-            else:
-                raise TypeError(f"Objek bukan varian: {type(obj)} {obj}")
-
-        elif opcode == Op.BUILD_VARIANT:
-            # Hybrid: Check tuple length
-            if len(instr) == 3:
-                # Bootstrap format: (OP, Name, Count)
-                variant_name = instr[1]
-                count = instr[2]
-                args = [self.stack.pop() for _ in range(count)]
-                args.reverse()
-                variant = MorphVariant(name=variant_name, args=args)
-                self.stack.append(variant)
-            else:
-                # Standard format: (OP, Count). Name on Stack.
-                count = instr[1]
-                args = [self.stack.pop() for _ in range(count)]
-                args.reverse()
-
-                variant_name = self.stack.pop()
-                type_name = self.stack.pop() # Consumed
-
-                variant = MorphVariant(name=variant_name, args=args)
-                self.stack.append(variant)
-
-        elif opcode == Op.LOAD_DEREF:
-            name = instr[1]
-            cell = self.current_frame.cells.get(name)
-            if cell:
-                self.stack.append(cell.value)
-            else:
-                raise NameError(f"Deref variable '{name}' not found in closure/cells.")
-
-        elif opcode == Op.STORE_DEREF:
-            name = instr[1]
-            val = self.stack.pop()
-            cell = self.current_frame.cells.get(name)
-            if not cell:
-                # If not found, creates a new cell (only if it's a cell_var, but logic here simplifies)
-                # In python, cell must exist. We create it on frame init.
-                # If it doesn't exist, it means frame init missed it or compiler emitted wrong opcode.
-                # For robustness, create it? Or raise?
-                # Frame init (call_function_internal) should populate cells.
-                raise NameError(f"Cell '{name}' not initialized in frame.")
-            cell.value = val
-
-        elif opcode == Op.LOAD_CLOSURE:
-            name = instr[1]
-            cell = self.current_frame.cells.get(name)
-            if not cell:
-                raise NameError(f"Closure cell '{name}' not found.")
-            self.stack.append(cell)
-
-        elif opcode == Op.BUILD_FUNCTION:
-            # Dynamic Function Creation (from Dict)
-            # Stack: [func_def_dict] (Closure not supported via BUILD_FUNCTION for now, or assume no closure)
-            # Use MAKE_FUNCTION for closure support.
-
-            func_def = self.stack.pop()
-
-            if not isinstance(func_def, dict):
-                 raise TypeError("BUILD_FUNCTION expects a dictionary definition.")
-
-            name = func_def.get("nama", "<lambda>")
-            instr_raw = func_def.get("instruksi", [])
-            arg_names = func_def.get("args", [])
-            tipe_func = func_def.get("tipe", "script")
-
-            free_vars = tuple(func_def.get("free_vars", []))
-            cell_vars = tuple(func_def.get("cell_vars", []))
-
-            instructions = []
-            for ins in instr_raw:
-                if isinstance(ins, list):
-                    instructions.append(tuple(ins))
-                else:
-                    instructions.append(ins)
-
-            code_obj = CodeObject(
-                name=name,
-                instructions=instructions,
-                arg_names=arg_names,
-                is_generator=(tipe_func == "generator"),
-                free_vars=free_vars,
-                cell_vars=cell_vars
-            )
+        """Eksekusi satu tuple instruksi mentah (di-decode di tempat)."""
+        op, arg = decode_instruction(instr)
+        self._dispatch[op](self.call_stack[-1], arg)
 
-            func_obj = MorphFunction(code=code_obj, globals=self.globals)
-            self.stack.append(func_obj)
+    def execute_next(self, frame: Frame):
+        """Eksekusi instruksi hasil decode di frame.pc, pc dimajukan sebelum handler jalan."""
+        ops, args = frame.code.fused() if self.superinstructions else frame.code.decoded()
+        pc = frame.pc
+        frame.pc = pc + 1
+        self._dispatch[ops[pc]](frame, args[pc])
 
-        elif opcode == Op.MAKE_FUNCTION:
-            # Static Function Creation (from CodeObject)
-            # Stack: [closure_tuple (optional), code_object]
-            # Arg: flags. 1 = has closure.
+    def _op_unknown(self, frame, arg):
+        pass
 
-            flags = 0
-            if len(instr) > 1 and instr[1] is not None:
-                 flags = instr[1]
+    def _op_push_const(self, frame, arg):
+        frame.stack.append(arg)
 
-            code_obj = self.stack.pop()
+    def _op_pop(self, frame, arg):
+        stack = frame.stack
+        if stack: stack.pop()
 
-            # Support MorphFunction unwrapping (Self-Hosted Compiler compatibility)
-            if isinstance(code_obj, MorphFunction):
-                code_obj = code_obj.code
+    def _op_dup(self, frame, arg):
+        stack = frame.stack
+        if stack: stack.append(stack[-1])
 
-            if not isinstance(code_obj, CodeObject):
-                raise TypeError(f"MAKE_FUNCTION expects CodeObject, got {type(code_obj).__name__}")
+    def _op_add(self, frame, arg):
+        stack = frame.stack
+        b, a = stack.pop(), stack.pop(); stack.append(a + b)
 
-            closure = None
-            if flags == 1:
-                closure = self.stack.pop()
-                if closure is not None and not isinstance(closure, (list, tuple)):
-                     # Allow list built by BUILD_LIST
-                     closure = tuple(closure)
-
-            func_obj = MorphFunction(code=code_obj, globals=self.globals, closure=closure)
-            self.stack.append(func_obj)
-
-        # === Functions (Updated for Class Init) ===
-        elif opcode == Op.CALL:
-            arg_count = instr[1]
-            args = []
-            for _ in range(arg_count): args.append(self.stack.pop())
-            args.reverse()
+    # Opcode bertipe hanya ditulis ke array CodeObject.specialized() yang dijalankan _run_fast
+    # secara inline; lewat tabel dispatch cukup berperilaku seperti opcode generiknya.
+    _op_add_int = _op_add_float = _op_add_str = _op_add
 
-            func_obj = self.stack.pop()
+    def _op_sub(self, frame, arg):
+        stack = frame.stack
+        b, a = stack.pop(), stack.pop(); stack.append(a - b)
 
-            if isinstance(func_obj, SuperBoundMethod):
-                # Untuk panggilan `induk`, `ini` (instance) harus disisipkan secara manual
-                # sama seperti BoundMethod biasa.
-                args.insert(0, func_obj.instance) # 'ini'
-                self.call_function_internal(
-                    func_obj.method,
-                    args,
-                    context_globals=func_obj.defining_class.globals if func_obj.defining_class else func_obj.instance.klass.superclass.globals,
-                    defining_class=func_obj.defining_class
-                )
-            elif isinstance(func_obj, BoundMethod):
-                args.insert(0, func_obj.instance) # 'ini'
-                # Use class globals for method execution
-                self.call_function_internal(
-                    func_obj.method, args,
-                    context_globals=func_obj.defining_class.globals if func_obj.defining_class else func_obj.instance.klass.globals,
-                    defining_class=func_obj.defining_class
-                )
+    _op_sub_int = _op_sub_float = _op_sub
 
-            elif isinstance(func_obj, MorphClass):
-                instance = MorphInstance(klass=func_obj)
-                init_method, def_cls = self._lookup_method(func_obj, 'inisiasi')
-                if init_method:
-                    args.insert(0, instance)
-                    # Use class globals for constructor execution
-                    self.call_function_internal(
-                        init_method, args, is_init=True,
-                        context_globals=def_cls.globals,
-                        defining_class=def_cls
-                    )
-                else:
-                    self.stack.append(instance)
-
-            elif isinstance(func_obj, (CodeObject, MorphFunction)):
-                code_to_run = func_obj.code if isinstance(func_obj, MorphFunction) else func_obj
-                if code_to_run.is_generator:
-                    # Create a new frame but don't execute it. Wrap it in a generator object.
-                    new_frame = Frame(code=code_to_run, globals=self.globals)
-                    for name, val in zip(code_to_run.arg_names, args):
-                        new_frame.locals[name] = val
-                    gen_obj = MorphGenerator(frame=new_frame, status="suspended")
-                    self.stack.append(gen_obj)
-                else:
-                    self.call_function_internal(func_obj, args)
+    def _op_mul(self, frame, arg):
+        stack = frame.stack
+        b, a = stack.pop(), stack.pop(); stack.append(a * b)
+
+    _op_mul_int = _op_mul_float = _op_mul
+
+    def _op_div(self, frame, arg):
+        stack = frame.stack
+        b, a = stack.pop(), stack.pop(); stack.append(a / b)
+
+    def _op_mod(self, frame, arg):
+        stack = frame.stack
+        b, a = stack.pop(), stack.pop(); stack.append(a % b)
 
-            elif callable(func_obj):
-                try:
-                    self.stack.append(func_obj(*args))
-                except TypeError as e:
-                    raise TypeError(f"Error calling builtin '{func_obj}': {e}")
+    def _op_eq(self, frame, arg):
+        stack = frame.stack
+        b, a = stack.pop(), stack.pop(); stack.append(a == b)
 
+    def _op_neq(self, frame, arg):
+        stack = frame.stack
+        b, a = stack.pop(), stack.pop(); stack.append(a != b)
+
+    def _op_gt(self, frame, arg):
+        stack = frame.stack
+        b, a = stack.pop(), stack.pop(); stack.append(a > b)
+
+    def _op_lt(self, frame, arg):
+        stack = frame.stack
+        b, a = stack.pop(), stack.pop(); stack.append(a < b)
+
+    def _op_gte(self, frame, arg):
+        stack = frame.stack
+        b, a = stack.pop(), stack.pop(); stack.append(a >= b)
+
+    def _op_lte(self, frame, arg):
+        stack = frame.stack
+        b, a = stack.pop(), stack.pop(); stack.append(a <= b)
+
+    def _op_not(self, frame, arg):
+        stack = frame.stack
+        val = stack.pop(); stack.append(not val)
+
+    def _op_and(self, frame, arg):
+        stack = frame.stack
+        b, a = stack.pop(), stack.pop(); stack.append(a and b)
+
+    def _op_or(self, frame, arg):
+        stack = frame.stack
+        b, a = stack.pop(), stack.pop(); stack.append(a or b)
+
+    # === Bitwise Operations ===
+    def _op_bit_and(self, frame, arg):
+        stack = frame.stack
+        b, a = stack.pop(), stack.pop(); stack.append(a & b)
+
+    def _op_bit_or(self, frame, arg):
+        stack = frame.stack
+        b, a = stack.pop(), stack.pop(); stack.append(a | b)
+
+    def _op_bit_xor(self, frame, arg):
+        stack = frame.stack
+        b, a = stack.pop(), stack.pop(); stack.append(a ^ b)
+
+    def _op_bit_not(self, frame, arg):
+        stack = frame.stack
+        val = stack.pop(); stack.append(~val)
+
+    def _op_lshift(self, frame, arg):
+        stack = frame.stack
+        b, a = stack.pop(), stack.pop(); stack.append(a << b)
+
+    def _op_rshift(self, frame, arg):
+        stack = frame.stack
+        b, a = stack.pop(), stack.pop(); stack.append(a >> b)
+
+    # Operand multi: arg = (reg_tujuan, sumber...)
+    def _op_load_reg(self, frame, arg):
+        self.registers[arg[0]] = arg[1]
+
+    def _op_move_reg(self, frame, arg):
+        self.registers[arg[0]] = self.registers[arg[1]]
+
+    def _op_add_reg(self, frame, arg):
+        self.registers[arg[0]] = self.registers[arg[1]] + self.registers[arg[2]]
+
+    def _op_push_from_reg(self, frame, arg):
+        frame.stack.append(self.registers[arg])
+
+    def _op_pop_to_reg(self, frame, arg):
+        self.registers[arg] = frame.stack.pop()
+
+    def _load_global(self, name: str) -> Any:
+        """Baca nama dari globals aktif lalu lapisan builtins-nya, UNBOUND jika tidak ada."""
+        val = dict.get(self.globals, name, UNBOUND)
+        if val is UNBOUND: val = _builtins_dari(self.globals).get(name, UNBOUND)
+        return val
+
+    def _op_load_var(self, frame, arg):
+        val = self._load_global(arg)
+        if val is UNBOUND: raise RuntimeError(f"Global '{arg}' not found.")
+        frame.stack.append(val)
+
+    def _op_store_var(self, frame, arg):
+        self.globals[arg] = frame.stack.pop()
+
+    def _op_load_local(self, frame, arg):
+        stack = frame.stack
+        name = arg
+        val = frame.locals.get(name, UNBOUND)
+        if val is UNBOUND: val = self._load_global(name)
+        if val is UNBOUND: raise RuntimeError(f"Variable '{name}' not found.")
+        stack.append(val)
+
+    def _op_store_local(self, frame, arg):
+        frame.locals[arg] = frame.stack.pop()
+
+    def _op_load_fast(self, frame, arg):
+        val = frame.fast[arg]
+        if val is UNBOUND: val = self._load_unbound(frame, arg)
+        frame.stack.append(val)
+
+    def _op_store_fast(self, frame, arg):
+        frame.fast[arg] = frame.stack.pop()
+
+    def _load_unbound(self, frame: Frame, slot: int) -> Any:
+        # Slot belum diisi: fallback ke globals seperti LOAD_LOCAL berbasis nama
+        name = frame.code.local_names[slot]
+        val = self._load_global(name)
+        if val is UNBOUND: raise RuntimeError(f"Variable '{name}' not found.")
+        return val
+
+    # === Superinstruksi (decoder.fuse_superinstructions) ===
+    # Saat handler jalan frame.pc menunjuk instruksi kedua urutan; pc dimajukan
+    # sebelum tiap bagian seperti eksekusi tanpa superinstruksi, jadi bagian yang
+    # gagal terlihat di pc-nya sendiri (jejak, exception_table).
+    def _op_load_fast_attr(self, frame, arg):
+        self._op_load_fast(frame, arg[0])
+        frame.pc += 1
+        self._op_load_attr(frame, arg[1])
+
+    def _op_load_fast_method(self, frame, arg):
+        self._op_load_fast(frame, arg[0])
+        frame.pc += 1
+        self._op_load_method(frame, arg[1])
+
+    def _op_load_fast_fast(self, frame, arg):
+        self._op_load_fast(frame, arg[0])
+        frame.pc += 1
+        self._op_load_fast(frame, arg[1])
+
+    def _op_load_fast_const(self, frame, arg):
+        self._op_load_fast(frame, arg[0])
+        frame.stack.append(arg[1])
+        frame.pc += 1
+
+    def _op_store_fast_load_fast(self, frame, arg):
+        self._op_store_fast(frame, arg[0])
+        frame.pc += 1
+        self._op_load_fast(frame, arg[1])
+
+    def _op_inc_fast(self, frame, arg):
+        val = frame.fast[arg[0]]
+        if val is UNBOUND: val = self._load_unbound(frame, arg[0])
+        frame.pc += 2
+        frame.fast[arg[0]] = val + arg[1]
+        frame.pc += 1
+
+    def _op_compare_jmp_if_false(self, frame, arg):
+        stack = frame.stack
+        b = stack.pop()
+        if arg[0](stack.pop(), b): frame.pc += 1
+        else: frame.pc = arg[1]
+
+    def _op_build_list(self, frame, arg):
+        stack = frame.stack
+        c = arg; el = [stack.pop() for _ in range(c)]; el.reverse(); stack.append(el)
+
+    def _op_build_dict(self, frame, arg):
+        stack = frame.stack
+        c = arg; d = {};
+        for _ in range(c): v = stack.pop(); k = stack.pop(); d[k] = v
+        stack.append(d)
+
+    def _op_load_index(self, frame, arg):
+        stack = frame.stack
+        i = stack.pop(); t = stack.pop(); stack.append(t[i])
+
+    def _op_store_index(self, frame, arg):
+        stack = frame.stack
+        v = stack.pop(); i = stack.pop(); t = stack.pop(); t[i] = v
+
+    def _op_slice(self, frame, arg):
+        # Stack: [obj, start, end] -> Pop 3 -> Push Result
+        stack = frame.stack
+        end = stack.pop()
+        start = stack.pop()
+        obj = stack.pop()
+
+        # Handle nil/None for slicing to end
+        s_idx = start if start is not None else 0
+        e_idx = end if end is not None else len(obj)
+
+        if isinstance(obj, (str, list, tuple, bytes, bytearray)):
+            stack.append(obj[s_idx:e_idx])
+        else:
+            raise TypeError(f"Objek tipe '{type(obj).__name__}' tidak mendukung slicing/iris.")
+
+    def _op_unpack_sequence(self, frame, arg):
+        stack = frame.stack
+        count = arg
+        # Perubahan: Peek seq, jangan pop!
+        seq = stack[-1]
+        if len(seq) < count: raise ValueError(f"Tidak cukup nilai untuk unpack (diharapkan {count}, dapat {len(seq)})")
+        for i in range(count - 1, -1, -1):
+            stack.append(seq[i])
+
+    def _op_check_len(self, frame, arg):
+        stack = frame.stack
+        count = arg
+        seq = stack[-1] # Peek, jangan pop karena nanti mau dipakai
+        stack.append(len(seq) == count)
+
+    def _op_check_len_min(self, frame, arg):
+        stack = frame.stack
+        count = arg
+        seq = stack[-1]
+        stack.append(len(seq) >= count)
+
+    def _op_snapshot(self, frame, arg):
+        if frame.snapshots is None: frame.snapshots = []
+        frame.snapshots.append(len(frame.stack))
+
+    def _op_restore(self, frame, arg):
+        stack = frame.stack
+        if not frame.snapshots:
+            raise RuntimeError("Stack Underflow: Tidak ada snapshot untuk direstore")
+        target_len = frame.snapshots.pop()
+        # Potong stack sampai target_len.
+        # List slice in place: del stack[target_len:]
+        del stack[target_len:]
+
+    def _op_discard_snapshot(self, frame, arg):
+        if frame.snapshots:
+            frame.snapshots.pop()
+
+    def _op_jmp(self, frame, arg):
+        frame.pc = arg
+
+    def _op_jmp_if_false(self, frame, arg):
+        if not frame.stack.pop(): frame.pc = arg
+
+    def _op_jmp_if_true(self, frame, arg):
+        if frame.stack.pop(): frame.pc = arg
+
+    # === Classes & Objects ===
+    def _op_build_class(self, frame, arg):
+        stack = frame.stack
+        methods = stack.pop()
+        superclass = stack.pop()
+        name = stack.pop()
+        # Capture current globals for class methods context
+        klass = MorphClass(name=name, methods=methods, superclass=superclass, globals=self.globals)
+        klass.method_table()
+        stack.append(klass)
+
+    def _op_load_attr(self, frame, arg):
+        stack = frame.stack
+        name = arg
+        obj = stack.pop()
+        if isinstance(obj, MorphInstance):
+            if name == "__class__": stack.append(obj.klass)
+            elif name == "punya":
+                # Helper .punya(key) for Instances
+                def inst_punya(key):
+                    if key in obj.properties: return True
+                    m, _ = self._lookup_method(obj.klass, key)
+                    return m is not None
+                stack.append(inst_punya)
+            elif name in obj.properties: stack.append(obj.properties[name])
             else:
-                raise TypeError(f"Cannot call object of type {type(func_obj)}")
-
-        elif opcode == Op.RET:
-            val = None
-            if self.stack: val = self.stack.pop()
-            self._return_from_frame(val)
-
-        # === Exception Handling ===
-        elif opcode == Op.PUSH_TRY:
-            handler_pc = instr[1]
-            self.current_frame.exception_handlers.append(handler_pc)
-
-        elif opcode == Op.POP_TRY:
-            if self.current_frame.exception_handlers:
-                self.current_frame.exception_handlers.pop()
-
-        elif opcode == Op.THROW:
-            err_val = self.stack.pop()
-            self._handle_exception(err_val)
-
-        # === Modules ===
-        elif opcode == Op.IMPORT:
-            module_path = instr[1]
-            # Jika ini modul internal Python, load langsung
-            if module_path in ["transisi.stdlib.wajib._teks_internal", "transisi.stdlib.wajib._koleksi_internal"]:
-                # Import dinamis modul python
-                import importlib
-                import sys
-
-                if module_path in sys.modules:
-                    mod = importlib.reload(sys.modules[module_path])
-                else:
-                    mod = importlib.import_module(module_path)
+                method, def_cls = self._lookup_method_cached(frame, obj.klass, name)
+                if method:
+                    stack.append(BoundMethod(instance=obj, method=method, defining_class=def_cls))
+                else: raise AttributeError(f"Instance '{obj}' has no attribute '{name}'")
+        elif isinstance(obj, MorphClass):
+            # Perbaikan: Izinkan akses ke properti meta-class seperti 'name'
+            if name == "name":
+                stack.append(obj.name)
+            elif name == "punya":
+                # Helper .punya(key) for Classes (static check)
+                def cls_punya(key):
+                    if key == "name": return True
+                    m, _ = self._lookup_method(obj, key)
+                    return m is not None
+                stack.append(cls_punya)
+            else:
+                method, def_cls = self._lookup_method_cached(frame, obj, name)
+                if method: stack.append(method)
+                else: raise AttributeError(f"Class '{obj.name}' has no attribute '{name}'")
+        elif isinstance(obj, dict):
+            # Support akses key dictionary sebagai atribut (terutama untuk ObjekError/Result)
+            if name == "punya":
+                # Return helper function for .punya(key)
+                def dict_punya(key):
+                    return key in obj
+                stack.append(dict_punya)
+            # Modul (ModuleGlobals): `in` juga melihat lapisan builtins, jadi builtin tetap bisa diakses sebagai atribut
+            elif name in obj: stack.append(obj[name])
+            else: raise AttributeError(f"Dictionary has no key '{name}'")
+        elif isinstance(obj, Result):
+            if name == "sukses": stack.append(obj.is_sukses())
+            elif name == "data": stack.append(obj.unwrap() if obj.is_sukses() else None)
+            elif name == "error": stack.append(obj.unwrap_error() if obj.is_gagal() else None)
+            else: raise AttributeError(f"Result object has no attribute '{name}'")
+        elif isinstance(obj, MorphVariant):
+            # Support access to variant content by index via attribute (e.g., .0, .1) or named if we track it?
+            # Current MorphVariant only has args list.
+            # If we want named fields, we need to store them. But `tipe` decl only has ordered params.
+            # Access via index like tuple? Or allow unpacking.
+            # User typically matches, doesn't access directly.
+            raise AttributeError(f"Varian '{obj.name}' tidak mendukung akses atribut langsung. Gunakan jodohkan.")
+        elif isinstance(obj, str):
+            # Mapping method string Morph -> Python
+            STR_METHODS = {
+                "kecil": "lower",
+                "besar": "upper",
+                "bersihkan": "strip",
+                "ganti": "replace",
+                "temukan": "find",
+                "pisah": "split",
+                "awalan": "startswith",
+                "akhiran": "endswith"
+            }
+            target_attr = STR_METHODS.get(name, name)
+            if hasattr(obj, target_attr):
+                stack.append(getattr(obj, target_attr))
+            else:
+                raise AttributeError(f"Teks '{obj}' tidak memiliki atribut/metode '{name}'")
+        else:
+            if hasattr(obj, name): stack.append(getattr(obj, name))
+            else: raise AttributeError(f"Object '{obj}' has no attribute '{name}'")
+
+    def _op_store_attr(self, frame, arg):
+        stack = frame.stack
+        name = arg
+        val = stack.pop()
+        obj = stack.pop()
+        if isinstance(obj, MorphInstance): obj.properties[name] = val
+        else: setattr(obj, name, val)
+
+    def _op_load_super_method(self, frame, arg):
+        stack = frame.stack
+        method_name = arg
+        instance = stack.pop()
+
+        start_class = frame.defining_class
+        if start_class is None:
+            start_class = instance.klass
+
+        superclass = start_class.superclass
+        if not superclass:
+            raise RuntimeError(f"Cannot call 'induk': class '{start_class.name}' has no superclass.")
+
+        method, def_cls = self._lookup_method(superclass, method_name)
+        if not method:
+            raise AttributeError(f"Superclass '{superclass.name}' has no method '{method_name}'.")
+
+        stack.append(SuperBoundMethod(instance=instance, method=method, defining_class=def_cls))
+
+    def _op_is_instance(self, frame, arg):
+        # Self-Hosted: nama tipe di stack. Bentuk bootstrap didecode jadi IS_INSTANCE_NAMED.
+        stack = frame.stack
+        type_name = stack.pop()
+        stack.append(self._is_instance(stack.pop(), type_name))
+
+    def _op_is_instance_named(self, frame, arg):
+        stack = frame.stack
+        stack.append(self._is_instance(stack.pop(), arg))
+
+    def _is_instance(self, obj, type_name) -> bool:
+        result = False
+        if type_name == "Daftar" and isinstance(obj, list): result = True
+        elif type_name == "Kamus" and isinstance(obj, dict): result = True
+        elif type_name == "Teks" and isinstance(obj, str): result = True
+        elif type_name == "Angka" and isinstance(obj, (int, float)): result = True
+        # TODO: Support Varian dan Class
+        return result
+
+    def _op_is_variant(self, frame, arg):
+        # Self-Hosted: nama varian di stack. Bentuk bootstrap didecode jadi IS_VARIANT_NAMED.
+        stack = frame.stack
+        variant_name = stack.pop()
+        stack.append(self._is_variant(stack.pop(), variant_name))
+
+    def _op_is_variant_named(self, frame, arg):
+        stack = frame.stack
+        stack.append(self._is_variant(stack.pop(), arg))
+
+    def _is_variant(self, obj, variant_name) -> bool:
+        result = False
+        if isinstance(obj, MorphVariant):
+            result = (obj.name == variant_name)
+        elif isinstance(obj, Result):
+            # Compat for Result object
+            if variant_name == "Sukses": result = obj.is_sukses()
+            elif variant_name == "Gagal": result = obj.is_gagal()
+        return result
+
+    def _op_unpack_variant(self, frame, arg):
+        stack = frame.stack
+        obj = stack.pop()
+        if isinstance(obj, MorphVariant):
+            # Push all args to stack
+            for val in reversed(obj.args):
+                stack.append(val)
+        elif isinstance(obj, Result):
+            # Compat for Result
+            if obj.is_sukses(): stack.append(obj.unwrap())
+            else: stack.append(obj.unwrap_error())
+        else:
+            raise TypeError(f"Objek bukan varian: {type(obj)} {obj}")
+
+    def _op_build_variant(self, frame, arg):
+        # Standard format: (OP, Count). Name on Stack.
+        stack = frame.stack
+        count = arg
+        args = [stack.pop() for _ in range(count)]
+        args.reverse()
+
+        variant_name = stack.pop()
+        type_name = stack.pop() # Consumed
+
+        variant = MorphVariant(name=variant_name, args=args)
+        stack.append(variant)
+
+    def _op_build_variant_named(self, frame, arg):
+        # Bootstrap format: (OP, Name, Count) -> arg = (Name, Count)
+        stack = frame.stack
+        variant_name, count = arg
+        args = [stack.pop() for _ in range(count)]
+        args.reverse()
+        variant = MorphVariant(name=variant_name, args=args)
+        stack.append(variant)
+
+    def _op_load_deref(self, frame, arg):
+        name = arg
+        cell = frame.cells.get(name) if frame.cells else None
+        if cell:
+            frame.stack.append(cell.value)
+        else:
+            raise NameError(f"Deref variable '{name}' not found in closure/cells.")
+
+    def _op_store_deref(self, frame, arg):
+        name = arg
+        val = frame.stack.pop()
+        cell = frame.cells.get(name) if frame.cells else None
+        if not cell:
+            # If not found, creates a new cell (only if it's a cell_var, but logic here simplifies)
+            # In python, cell must exist. We create it on frame init.
+            # If it doesn't exist, it means frame init missed it or compiler emitted wrong opcode.
+            # For robustness, create it? Or raise?
+            # Frame init (call_function_internal) should populate cells.
+            raise NameError(f"Cell '{name}' not initialized in frame.")
+        cell.value = val
+
+    def _op_load_closure(self, frame, arg):
+        name = arg
+        cell = frame.cells.get(name) if frame.cells else None
+        if not cell:
+            raise NameError(f"Closure cell '{name}' not found.")
+        frame.stack.append(cell)
+
+    def _op_build_function(self, frame, arg):
+        # Dynamic Function Creation (from Dict)
+        # Stack: [func_def_dict] (Closure not supported via BUILD_FUNCTION for now, or assume no closure)
+        # Use MAKE_FUNCTION for closure support.
+        stack = frame.stack
+
+        func_def = stack.pop()
+
+        if not isinstance(func_def, dict):
+             raise TypeError("BUILD_FUNCTION expects a dictionary definition.")
+
+        name = func_def.get("nama", "<lambda>")
+        instr_raw = func_def.get("instruksi", [])
+        arg_names = func_def.get("args", [])
+        tipe_func = func_def.get("tipe", "script")
+
+        free_vars = tuple(func_def.get("free_vars", []))
+        cell_vars = tuple(func_def.get("cell_vars", []))
+
+        instructions = []
+        for ins in instr_raw:
+            if isinstance(ins, list):
+                instructions.append(tuple(ins))
+            else:
+                instructions.append(ins)
+
+        code_obj = CodeObject(
+            name=name,
+            instructions=instructions,
+            arg_names=arg_names,
+            is_generator=(tipe_func == "generator"),
+            free_vars=free_vars,
+            cell_vars=cell_vars
+        )
+
+        func_obj = MorphFunction(code=code_obj, globals=self.globals)
+        stack.append(func_obj)
+
+    def _op_make_function(self, frame, arg):
+        # Static Function Creation (from CodeObject)
+        # Stack: [closure_tuple (optional), code_object]
+        # Arg: flags. 1 = has closure.
+        stack = frame.stack
+
+        flags = arg if arg is not None else 0
+
+        code_obj = stack.pop()
+
+        # Support MorphFunction unwrapping (Self-Hosted Compiler compatibility)
+        if isinstance(code_obj, MorphFunction):
+            code_obj = code_obj.code
+
+        if not isinstance(code_obj, CodeObject):
+            raise TypeError(f"MAKE_FUNCTION expects CodeObject, got {type(code_obj).__name__}")
+
+        closure = None
+        if flags == 1:
+            closure = stack.pop()
+            if closure is not None and not isinstance(closure, (list, tuple)):
+                 # Allow list built by BUILD_LIST
+                 closure = tuple(closure)
+
+        func_obj = MorphFunction(code=code_obj, globals=self.globals, closure=closure)
+        stack.append(func_obj)
+
+    # === Functions (Updated for Class Init) ===
+    def _op_call(self, frame, arg):
+        stack = frame.stack
+        # Ambil argumen langsung sebagai irisan stack (urutan sudah benar)
+        if arg:
+            args = stack[-arg:]
+            del stack[-arg:]
+        else:
+            args = []
+        func_obj = stack.pop()
+        self._call_object(stack, func_obj, args)
+
+    def _op_load_method(self, frame, arg):
+        stack = frame.stack
+        obj = stack[-1]
+        if isinstance(obj, MorphInstance) and arg != "__class__" and arg != "punya" and arg not in obj.properties:
+            method, def_cls = self._lookup_method_cached(frame, obj.klass, arg)
+            if method:
+                # [metode, kelas_pemilik, ini]: CALL_METHOD memakai 'ini' sebagai argumen pertama
+                stack[-1] = method
+                stack.append(def_cls)
+                stack.append(obj)
+                return
+        # Bukan metode instance: nilai atribut biasa (sama seperti LOAD_ATTR), tanpa 'ini'
+        self._op_load_attr(frame, arg)
+        stack.append(None)
+        stack.append(UNBOUND)
+
+    def _op_call_method(self, frame, arg):
+        stack = frame.stack
+        base = len(stack) - arg - 3
+        method = stack[base]
+        def_cls = stack[base + 1]
+        instance = stack[base + 2]
+        if instance is UNBOUND:
+            args = stack[base + 3:]
+            del stack[base:]
+            self._call_object(stack, method, args)
+        else:
+            # 'ini' sudah berada tepat sebelum argumen, jadi cukup satu irisan
+            args = stack[base + 2:]
+            del stack[base:]
+            self.call_function_internal(
+                method, args,
+                context_globals=def_cls.globals if def_cls else instance.klass.globals,
+                defining_class=def_cls
+            )
 
-                self.stack.append(mod)
-                # Don't return here, continue to next opcode
+    def _call_object(self, stack: List[Any], func_obj: Any, args: List[Any]):
+        """Panggil objek apa pun dengan args; hasil builtin/instance langsung di-push ke stack."""
+        if isinstance(func_obj, SuperBoundMethod):
+            # Untuk panggilan `induk`, `ini` (instance) harus disisipkan secara manual
+            # sama seperti BoundMethod biasa.
+            self.call_function_internal(
+                func_obj.method,
+                [func_obj.instance, *args], # 'ini'
+                context_globals=func_obj.defining_class.globals if func_obj.defining_class else func_obj.instance.klass.superclass.globals,
+                defining_class=func_obj.defining_class
+            )
+        elif isinstance(func_obj, BoundMethod):
+            # Use class globals for method execution
+            self.call_function_internal(
+                func_obj.method, [func_obj.instance, *args], # 'ini'
+                context_globals=func_obj.defining_class.globals if func_obj.defining_class else func_obj.instance.klass.globals,
+                defining_class=func_obj.defining_class
+            )
 
+        elif isinstance(func_obj, MorphClass):
+            instance = MorphInstance(klass=func_obj)
+            init_method, def_cls = self._lookup_method(func_obj, 'inisiasi')
+            if init_method:
+                # Use class globals for constructor execution
+                self.call_function_internal(
+                    init_method, [instance, *args], is_init=True,
+                    context_globals=def_cls.globals,
+                    defining_class=def_cls
+                )
+            else:
+                stack.append(instance)
+
+        elif isinstance(func_obj, (CodeObject, MorphFunction)):
+            code_to_run = func_obj.code if isinstance(func_obj, MorphFunction) else func_obj
+            if code_to_run.is_generator:
+                # Create a new frame but don't execute it. Wrap it in a generator object.
+                new_frame = Frame(code=code_to_run, globals=self.globals)
+                for name, val in zip(code_to_run.arg_names, args):
+                    new_frame.set_local(name, val)
+                gen_obj = new_frame.generator = MorphGenerator(frame=new_frame, status="suspended")
+                stack.append(gen_obj)
             else:
-                # Jika bukan internal, gunakan load_module (untuk file .fox)
-                try:
-                    module_obj = self.load_module(module_path)
-                    self.stack.append(module_obj)
-                except Exception as e:
-                    # Rethrow sebagai error VM jika perlu, atau biarkan handler tangkap
-                    raise ImportError(f"Gagal memuat modul '{module_path}': {e}")
-
-        elif opcode == Op.IMPORT_NATIVE:
-            # FFI: Meminjam library Python asli
-            module_name = instr[1]
-
-            # --- Backend Injection (Ascension Architecture) ---
-            if module_name == "_backend":
-                class PythonBackend:
-                    # File I/O
-                    def fs_buka(self, path, mode): return open(path, mode)
-                    def fs_baca(self, handle, size):
-                        return handle.read() if (size is None or size < 0) else handle.read(size)
-                    def fs_tulis(self, handle, content):
-                        if isinstance(content, list): handle.write(bytes(content))
-                        else: handle.write(content)
-                    def fs_tutup(self, handle): handle.close()
-                    def fs_ada(self, path):
-                        import os; return os.path.exists(path)
-                    def fs_hapus(self, path):
-                        import os; os.remove(path)
-                    def fs_mkdir(self, path):
-                        import os; os.makedirs(path, exist_ok=True)
-                    def fs_listdir(self, path):
-                        import os; return os.listdir(path)
-                    def fs_cwd(self):
-                        import os; return os.getcwd()
-
-                    # System
-                    def sys_waktu(self): import time; return time.time()
-                    def sys_tidur(self, d): import time; time.sleep(d)
-                    def sys_keluar(self, c): import sys; sys.exit(c)
-                    def sys_platform(self): import sys; return sys.platform
-
-                    # Network
-                    def net_konek(self, host, port):
-                        import socket
-                        try:
-                            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                            s.connect((host, port))
-                            return s
-                        except Exception as e:
-                            # print(f"Net Error: {e}")
-                            return None
-
-                    def net_kirim(self, sock, data):
-                        try:
-                            if isinstance(data, str): data = data.encode('utf-8')
-                            sock.sendall(data)
-                            return True # Sukses
-                        except Exception:
-                            return False # Gagal
-
-                    def net_terima(self, sock, size):
-                        try:
-                            sz = size if (size is not None and size > 0) else 4096
-                            data = sock.recv(sz)
-                            return data # Bytes
-                        except Exception:
-                            return None
-
-                    def net_tutup(self, sock):
-                        try:
-                            sock.close()
-                        except: pass
-
-                    # Converters (Helper)
-                    def conv_len(self, o): return len(o)
-                    def conv_str(self, o):
-                        from ivm.stdlib.core import builtins_str
-                        return builtins_str(o)
-
-                    # Bytes Manipulation
-                    def sys_bytes_dari_list(self, lst):
-                        """Convert list of integers to bytes object"""
-                        if not isinstance(lst, list):
-                             raise TypeError(f"sys_bytes_dari_list expects list, got {type(lst)}")
-                        try:
-                            return bytes(lst)
-                        except Exception as e:
-                            # Re-raise to debug
-                            raise ValueError(f"sys_bytes_dari_list failed: {e}. Data sample: {lst[:10] if lst else 'empty'}")
-
-                    def sys_bytes_ke_list(self, data):
-                        """Convert bytes object to list of integers"""
-                        if not isinstance(data, (bytes, bytearray)): return []
-                        return list(data)
-
-                    def sys_bytes_decode(self, data, encoding):
-                        """Decode bytes to string"""
-                        if not isinstance(data, (bytes, bytearray)): return None
-                        try:
-                            # Convert encoding arg from Morph string to python string if needed
-                            enc = encoding if isinstance(encoding, str) else "utf-8"
-                            return data.decode(enc)
-                        except Exception:
-                            return None
-
-                    def sys_list_append(self, lst, item):
-                        """Append item to list"""
-                        if isinstance(lst, list):
-                            lst.append(item)
-                        return None
-
-                    def sys_list_pop(self, lst, index):
-                        """Pop item from list"""
-                        if not isinstance(lst, list): return None
-                        try:
-                            idx = index if index is not None else -1
-                            return lst.pop(idx)
-                        except (IndexError, TypeError):
-                            return None
-
-                    def sys_to_float(self, x): return float(x)
-                    def sys_to_int(self, x): return int(x)
-                    def sys_chr(self, x): return chr(x)
-                    def sys_ord(self, x): return ord(x)
-                    def sys_str_join(self, lst, sep):
-                        if not isinstance(lst, list): return ""
-                        return str(sep).join([str(x) for x in lst])
-
-                self.stack.append(PythonBackend())
-                return # Selesai, jangan lanjut ke importlib
-
-            import importlib
+                self.call_function_internal(func_obj, args)
+
+        elif callable(func_obj):
             try:
-                mod = importlib.import_module(module_name)
-                self.stack.append(mod)
-            except ImportError as e:
-                raise ImportError(f"Gagal meminjam modul Python '{module_name}': {e}")
+                stack.append(func_obj(*args))
+            except TypeError as e:
+                raise TypeError(f"Error calling builtin '{func_obj}': {e}")
+
+        else:
+            raise TypeError(f"Cannot call object of type {type(func_obj)}")
+
+    def _op_ret(self, frame, arg):
+        stack = frame.stack
+        val = None
+        if stack: val = stack.pop()
+        self._return_from_frame(val)
+
+    # === Exception Handling ===
+    def _op_push_try(self, frame, arg):
+        handler_pc = arg
+        if frame.exception_handlers is None: frame.exception_handlers = []
+        frame.exception_handlers.append(handler_pc)
+
+    def _op_pop_try(self, frame, arg):
+        if frame.exception_handlers:
+            frame.exception_handlers.pop()
+
+    def _op_throw(self, frame, arg):
+        err_val = frame.stack.pop()
+        self._handle_exception(err_val)
+
+    # === Modules ===
+    def _op_import(self, frame, arg):
+        stack = frame.stack
+        module_path = arg
+        # Jika ini modul internal Python, load langsung (lewat registry modul native)
+        if module_path in INTERNAL_PY_MODULES:
+            stack.append(self._resolve_native(module_path))
 
-        elif opcode == Op.LEN:
-            obj = self.stack.pop()
+        else:
+            # Jika bukan internal, gunakan load_module (untuk file .fox)
             try:
-                self.stack.append(len(obj))
-            except TypeError:
-                self.stack.append(0)
-
-        elif opcode == Op.TYPE:
-            obj = self.stack.pop()
-            from ivm.stdlib.core import builtins_tipe
-            self.stack.append(builtins_tipe(obj))
-
-        elif opcode == Op.STR:
-            obj = self.stack.pop()
-            # Gunakan builtins_str dari stdlib/core untuk konsistensi
-            from ivm.stdlib.core import builtins_str
-            self.stack.append(builtins_str(obj))
-
-        # === String Intrinsics (Native Performance) ===
-        elif opcode == Op.STR_LOWER:
-            obj = self.stack.pop()
-            if hasattr(obj, 'lower'):
-                self.stack.append(obj.lower())
-            else:
-                self.stack.append(str(obj).lower())
+                module_obj = self.load_module(module_path)
+                stack.append(module_obj)
+            except LemparanMorph:
+                # Error Morph tanpa handler di modul: diteruskan ke handler pengimpor apa adanya
+                raise
+            except Exception as e:
+                # Rethrow sebagai error VM jika perlu, atau biarkan handler tangkap
+                raise ImportError(f"Gagal memuat modul '{module_path}': {e}")
+
+    def _op_import_native(self, frame, arg):
+        # FFI: Meminjam library Python asli
+        stack = frame.stack
+        module_name = arg
 
-        elif opcode == Op.STR_UPPER:
-            obj = self.stack.pop()
-            if hasattr(obj, 'upper'):
-                self.stack.append(obj.upper())
-            else:
-                self.stack.append(str(obj).upper())
-
-        elif opcode == Op.STR_FIND:
-            # Stack: [haystack, needle] (needle on top) -> find needle in haystack
-            needle = self.stack.pop()
-            haystack = self.stack.pop()
-
-            # Handle native objects or stringify
-            h_str = str(haystack) if not isinstance(haystack, str) else haystack
-            n_str = str(needle) if not isinstance(needle, str) else needle
-
-            self.stack.append(h_str.find(n_str))
-
-        elif opcode == Op.STR_REPLACE:
-            # Stack: [haystack, old, new]
-            new_val = self.stack.pop()
-            old_val = self.stack.pop()
-            haystack = self.stack.pop()
-
-            h_str = str(haystack) if not isinstance(haystack, str) else haystack
-            o_str = str(old_val) if not isinstance(old_val, str) else old_val
-            n_str = str(new_val) if not isinstance(new_val, str) else new_val
-
-            self.stack.append(h_str.replace(o_str, n_str))
-
-        # === System Ops (Foxys) ===
-        elif opcode == Op.SYS_TIME:
-            import time
-            self.stack.append(time.time())
-
-        elif opcode == Op.SYS_SLEEP:
-            import time
-            duration = self.stack.pop()
-            time.sleep(float(duration))
-            self.stack.append(None) # Return nil
-
-        elif opcode == Op.SYS_PLATFORM:
-            import sys
-            self.stack.append(sys.platform)
-
-        # === Network Ops (Foxys) ===
-        elif opcode == Op.NET_SOCKET_NEW:
-            import socket
-            # Stack: [type, family] (optional logic or fixed?)
-            # Simplified: No args on stack? Or pop checks?
-            # Opcode doesn't specify args count in instruction usually for intrinsics?
-            # Intrinsics calls push args. So check implementation.
-            # If we map _intrinsik_socket(family, type), we pop 2.
-            # Default to AF_INET, SOCK_STREAM if nil?
-
-            # Since intrinsics are mapped 1-to-1:
-            # Op.NET_SOCKET_NEW expects 2 args: family, type
-            sock_type = self.stack.pop()
-            sock_family = self.stack.pop()
-
-            # Map simplified inputs or pass through if int
-            s_family = sock_family if isinstance(sock_family, int) else socket.AF_INET
-            s_type = sock_type if isinstance(sock_type, int) else socket.SOCK_STREAM
-
-            sock = socket.socket(s_family, s_type)
-            self.stack.append(sock)
-
-        elif opcode == Op.NET_CONNECT:
-            # Stack: [socket, host, port]
-            port = self.stack.pop()
-            host = self.stack.pop()
-            sock = self.stack.pop()
-            sock.connect((host, port))
-            self.stack.append(None)
-
-        elif opcode == Op.NET_SEND:
-            # Stack: [socket, data]
-            data = self.stack.pop()
-            sock = self.stack.pop()
-            if isinstance(data, str): data = data.encode('utf-8')
-            sock.sendall(data)
-            self.stack.append(None)
-
-        elif opcode == Op.NET_RECV:
-            # Stack: [socket, bufsize]
-            bufsize = self.stack.pop()
-            sock = self.stack.pop()
-            b_size = bufsize if isinstance(bufsize, int) else 4096
-            data = sock.recv(b_size)
-            # Return raw bytes? Or string?
-            # "FoxVM written in Morph" -> Maybe bytes is better?
-            # Existing Foxys logic converts to string.
-            # Let's keep it raw bytes, let wrapper handle decoding if needed.
-            # Or decode utf-8 for convenience?
-            # Pure Morph philosophy: Bytes is data. Text is data + encoding.
-            # VM returns bytes.
-            self.stack.append(data)
-
-        elif opcode == Op.NET_CLOSE:
-            sock = self.stack.pop()
-            sock.close()
-            self.stack.append(None)
-
-        # === File I/O Ops (Berkas) ===
-        elif opcode == Op.IO_OPEN:
-            # Stack: [path, mode]
-            mode = self.stack.pop()
-            path = self.stack.pop()
-            # Security check? For now direct open.
-            f = open(path, mode)
-            self.stack.append(f)
-
-        elif opcode == Op.IO_READ:
-            # Stack: [file_handle, size] (size can be nil/-1 for all)
-            size = self.stack.pop()
-            f = self.stack.pop()
-            if size is None or size == -1:
-                data = f.read()
+        try:
+            stack.append(self._resolve_native(module_name))
+        except ImportError as e:
+            raise ImportError(f"Gagal meminjam modul Python '{module_name}': {e}")
+
+    def _resolve_native(self, module_name: str) -> Any:
+        """
+        Registry modul native per VM: "_backend" (PythonBackend) dan modul Python
+        diresolusi sekali lalu di-cache di self.native_modules. Dengan hot_reload=True,
+        modul internal (INTERNAL_PY_MODULES) dan backend dimuat ulang setiap IMPORT,
+        seperti perilaku lama, untuk pengembangan stdlib Python.
+        """
+        mod = self.native_modules.get(module_name)
+        if mod is not None and not self.hot_reload:
+            return mod
+
+        if module_name == "_backend":
+            if self.hot_reload:
+                from ivm.stdlib import backend
+                importlib.reload(backend)
+                mod = backend.PythonBackend()
             else:
-                data = f.read(size)
-            self.stack.append(data)
-
-        elif opcode == Op.IO_WRITE:
-            # Stack: [file_handle, content]
-            content = self.stack.pop()
-            f = self.stack.pop()
-            f.write(content)
-            self.stack.append(None)
-
-        elif opcode == Op.IO_CLOSE:
-            f = self.stack.pop()
-            f.close()
-            self.stack.append(None)
-
-        elif opcode == Op.IO_EXISTS:
-            import os
-            path = self.stack.pop()
-            self.stack.append(os.path.exists(path))
-
-        elif opcode == Op.IO_DELETE:
-            import os
-            path = self.stack.pop()
-            os.remove(path)
-            self.stack.append(None)
-
-        elif opcode == Op.IO_LIST:
-            import os
-            path = self.stack.pop()
-            self.stack.append(os.listdir(path))
-
-        elif opcode == Op.IO_MKDIR:
-            import os
-            path = self.stack.pop()
-            try:
-                os.makedirs(path, exist_ok=True)
-                self.stack.append(True)
-            except OSError:
-                self.stack.append(False)
+                mod = PythonBackend()
+        elif self.hot_reload and module_name in INTERNAL_PY_MODULES and module_name in sys.modules:
+            mod = importlib.reload(sys.modules[module_name])
+        else:
+            mod = importlib.import_module(module_name)
 
-        # === IO ===
-        elif opcode == Op.PRINT:
-            count = instr[1]; args = [self.stack.pop() for _ in range(count)]; print(*reversed(args))
+        self.native_modules[module_name] = mod
+        return mod
 
-        elif opcode == Op.PRINT_RAW:
-            val = self.stack.pop()
-            print(val, end="", flush=True)
+    def _op_len(self, frame, arg):
+        stack = frame.stack
+        obj = stack.pop()
+        try:
+            stack.append(len(obj))
+        except TypeError:
+            stack.append(0)
+
+    def _op_type(self, frame, arg):
+        stack = frame.stack
+        obj = stack.pop()
+        from ivm.stdlib.core import builtins_tipe
+        stack.append(builtins_tipe(obj))
+
+    def _op_str(self, frame, arg):
+        stack = frame.stack
+        obj = stack.pop()
+        # Gunakan builtins_str dari stdlib/core untuk konsistensi
+        stack.append(builtins_str(obj))
+
+    def _op_build_string(self, frame, arg):
+        n, konversi, mentah = arg
+        stack = frame.stack
+        bagian = stack[-n:]
+        del stack[-n:]
+        for i in konversi:
+            b = bagian[i]
+            if type(b) is not str: bagian[i] = str(b)
+        for i in mentah:
+            if type(bagian[i]) is not str: break
+        else:
+            stack.append("".join(bagian))
+            return
+        # Ada operand '+' yang bukan teks: ulangi rantai '+' apa adanya agar hasil/error-nya sama
+        hasil = bagian[0]
+        for i in range(1, n): hasil = hasil + bagian[i]
+        stack.append(hasil)
+
+    # === String Intrinsics (Native Performance) ===
+    def _op_str_lower(self, frame, arg):
+        stack = frame.stack
+        obj = stack.pop()
+        if hasattr(obj, 'lower'):
+            stack.append(obj.lower())
+        else:
+            stack.append(str(obj).lower())
 
-        elif opcode == Op.HALT:
-            self.running = False
+    def _op_str_upper(self, frame, arg):
+        stack = frame.stack
+        obj = stack.pop()
+        if hasattr(obj, 'upper'):
+            stack.append(obj.upper())
+        else:
+            stack.append(str(obj).upper())
+
+    def _op_str_find(self, frame, arg):
+        # Stack: [haystack, needle] (needle on top) -> find needle in haystack
+        stack = frame.stack
+        needle = stack.pop()
+        haystack = stack.pop()
+
+        # Handle native objects or stringify
+        h_str = str(haystack) if not isinstance(haystack, str) else haystack
+        n_str = str(needle) if not isinstance(needle, str) else needle
+
+        stack.append(h_str.find(n_str))
+
+    def _op_str_replace(self, frame, arg):
+        # Stack: [haystack, old, new]
+        stack = frame.stack
+        new_val = stack.pop()
+        old_val = stack.pop()
+        haystack = stack.pop()
+
+        h_str = str(haystack) if not isinstance(haystack, str) else haystack
+        o_str = str(old_val) if not isinstance(old_val, str) else old_val
+        n_str = str(new_val) if not isinstance(new_val, str) else new_val
+
+        stack.append(h_str.replace(o_str, n_str))
+
+    # === System Ops (Foxys) ===
+    def _op_sys_time(self, frame, arg):
+        import time
+        frame.stack.append(time.time())
+
+    def _op_sys_sleep(self, frame, arg):
+        stack = frame.stack
+        import time
+        duration = stack.pop()
+        time.sleep(float(duration))
+        stack.append(None) # Return nil
+
+    def _op_sys_platform(self, frame, arg):
+        import sys
+        frame.stack.append(sys.platform)
+
+    # === Network Ops (Foxys) ===
+    def _op_net_socket_new(self, frame, arg):
+        stack = frame.stack
+        import socket
+        # Stack: [type, family] (optional logic or fixed?)
+        # Simplified: No args on stack? Or pop checks?
+        # Opcode doesn't specify args count in instruction usually for intrinsics?
+        # Intrinsics calls push args. So check implementation.
+        # If we map _intrinsik_socket(family, type), we pop 2.
+        # Default to AF_INET, SOCK_STREAM if nil?
+
+        # Since intrinsics are mapped 1-to-1:
+        # Op.NET_SOCKET_NEW expects 2 args: family, type
+        sock_type = stack.pop()
+        sock_family = stack.pop()
+
+        # Map simplified inputs or pass through if int
+        s_family = sock_family if isinstance(sock_family, int) else socket.AF_INET
+        s_type = sock_type if isinstance(sock_type, int) else socket.SOCK_STREAM
+
+        sock = socket.socket(s_family, s_type)
+        stack.append(sock)
+
+    def _op_net_connect(self, frame, arg):
+        # Stack: [socket, host, port]
+        stack = frame.stack
+        port = stack.pop()
+        host = stack.pop()
+        sock = stack.pop()
+        sock.connect((host, port))
+        stack.append(None)
+
+    def _op_net_send(self, frame, arg):
+        # Stack: [socket, data]
+        stack = frame.stack
+        data = stack.pop()
+        sock = stack.pop()
+        if isinstance(data, str): data = data.encode('utf-8')
+        sock.sendall(data)
+        stack.append(None)
+
+    def _op_net_recv(self, frame, arg):
+        # Stack: [socket, bufsize]
+        stack = frame.stack
+        bufsize = stack.pop()
+        sock = stack.pop()
+        b_size = bufsize if isinstance(bufsize, int) else 4096
+        data = sock.recv(b_size)
+        # Return raw bytes? Or string?
+        # "FoxVM written in Morph" -> Maybe bytes is better?
+        # Existing Foxys logic converts to string.
+        # Let's keep it raw bytes, let wrapper handle decoding if needed.
+        # Or decode utf-8 for convenience?
+        # Pure Morph philosophy: Bytes is data. Text is data + encoding.
+        # VM returns bytes.
+        stack.append(data)
+
+    def _op_net_close(self, frame, arg):
+        stack = frame.stack
+        sock = stack.pop()
+        sock.close()
+        stack.append(None)
+
+    # === File I/O Ops (Berkas) ===
+    def _op_io_open(self, frame, arg):
+        # Stack: [path, mode]
+        stack = frame.stack
+        mode = stack.pop()
+        path = stack.pop()
+        # Security check? For now direct open.
+        f = open(path, mode)
+        stack.append(f)
+
+    def _op_io_read(self, frame, arg):
+        # Stack: [file_handle, size] (size can be nil/-1 for all)
+        stack = frame.stack
+        size = stack.pop()
+        f = stack.pop()
+        if size is None or size == -1:
+            data = f.read()
+        else:
+            data = f.read(size)
+        stack.append(data)
+
+    def _op_io_write(self, frame, arg):
+        # Stack: [file_handle, content]
+        stack = frame.stack
+        content = stack.pop()
+        f = stack.pop()
+        f.write(content)
+        stack.append(None)
+
+    def _op_io_close(self, frame, arg):
+        stack = frame.stack
+        f = stack.pop()
+        f.close()
+        stack.append(None)
+
+    def _op_io_exists(self, frame, arg):
+        stack = frame.stack
+        import os
+        path = stack.pop()
+        stack.append(os.path.exists(path))
 
-        elif opcode == Op.YIELD:
-            # Pop value to yield
-            val = self.stack.pop()
+    def _op_io_delete(self, frame, arg):
+        stack = frame.stack
+        import os
+        path = stack.pop()
+        os.remove(path)
+        stack.append(None)
 
-            # Current frame is the generator frame
-            gen_frame = self.call_stack.pop()
+    def _op_io_list(self, frame, arg):
+        stack = frame.stack
+        import os
+        path = stack.pop()
+        stack.append(os.listdir(path))
 
-            # Wrap in MorphGenerator
-            gen_obj = MorphGenerator(frame=gen_frame, status="suspended")
+    def _op_io_mkdir(self, frame, arg):
+        stack = frame.stack
+        import os
+        path = stack.pop()
+        try:
+            os.makedirs(path, exist_ok=True)
+            stack.append(True)
+        except OSError:
+            stack.append(False)
 
-            # We need to return (val, gen_obj) to the caller.
-            # The caller frame is now at self.call_stack[-1].
-            # We push a Variant "Momen(nilai, kelanjutan)"
+    # === IO ===
+    def _op_print(self, frame, arg):
+        count = arg; args = [frame.stack.pop() for _ in range(count)]; print(*reversed(args))
 
-            moment = MorphVariant("Momen", [val, gen_obj])
+    def _op_print_raw(self, frame, arg):
+        val = frame.stack.pop()
+        print(val, end="", flush=True)
 
-            if self.call_stack:
-                self.current_frame.stack.append(moment)
-                # Restore globals of caller
-                self.globals = self.current_frame.globals
-            else:
-                # Yielded from main?
-                print(f"Yielded: {val}")
-                self.running = False
+    def _op_halt(self, frame, arg):
+        self.running = False
 
-        elif opcode == Op.RESUME:
-            # Pop Generator
-            gen_obj = self.stack.pop()
-            if not isinstance(gen_obj, MorphGenerator):
-                raise TypeError("RESUME butuh Generator")
+    def _op_yield(self, frame, arg):
+        # Pop value to yield
+        val = frame.stack.pop()
 
-            if gen_obj.status != "suspended":
-                raise RuntimeError("Generator tidak bisa di-resume (mungkin sudah selesai)")
+        # Current frame is the generator frame; ditangguhkan di tempat, objek generatornya tetap
+        gen_frame = self.call_stack.pop()
+        gen_obj = gen_frame.generator
+        if gen_obj is None:
+            # Fungsi generator yang dijalankan langsung (mis. metode): generator dibuat sekali di yield pertama
+            gen_obj = gen_frame.generator = MorphGenerator(frame=gen_frame)
+        gen_obj.status = "suspended"
 
-            # Push Generator Frame back to stack
-            self.call_stack.append(gen_obj.frame)
-            self.globals = gen_obj.frame.globals
+        if self.call_stack:
+            caller = self.current_frame
+            if gen_obj.iter_exit is not None:
+                # Konsumen FOR_ITER: nilai langsung, tanpa Momen
+                caller.stack.append(val)
+            else:
+                # We push a Variant "Momen(nilai, kelanjutan)"
+                caller.stack.append(MorphVariant("Momen", [val, gen_obj]))
+            # Restore globals of caller
+            self.globals = caller.globals
+        else:
+            # Yielded from main?
+            print(f"Yielded: {val}")
+            self.running = False
 
-            # Push 'nil' (or resumption value) to Generator's stack
-            # (Result of 'bekukan' expression inside generator)
-            gen_obj.frame.stack.append(None)
+    def _resume_generator(self, gen_obj: MorphGenerator, iter_exit: Optional[int]):
+        if gen_obj.status != "suspended":
+            raise RuntimeError("Generator tidak bisa di-resume (mungkin sudah selesai)")
+        gen_obj.status = "running"
+        gen_obj.iter_exit = iter_exit
+
+        # Push Generator Frame back to stack
+        self.call_stack.append(gen_obj.frame)
+        self.globals = gen_obj.frame.globals
+
+        # Push 'nil' (or resumption value) to Generator's stack
+        # (Result of 'bekukan' expression inside generator)
+        gen_obj.frame.stack.append(None)
+
+    def _op_resume(self, frame, arg):
+        # Pop Generator
+        gen_obj = frame.stack.pop()
+        if not isinstance(gen_obj, MorphGenerator):
+            raise TypeError("RESUME butuh Generator")
+        if gen_obj.status == "closed":
+            # Generator sudah selesai: lanjut() menghasilkan nil
+            frame.stack.append(None)
+            return
+        self._resume_generator(gen_obj, None)
+
+    def _op_get_iter(self, frame, arg):
+        obj = frame.stack.pop()
+        if isinstance(obj, MorphGenerator):
+            frame.stack.append(obj)
+        elif isinstance(obj, (list, tuple, dict, str, bytes, bytearray, range)):
+            frame.stack.append(iter(obj))
+        else:
+            raise TypeError(f"'selama ... dari' butuh daftar, kamus, teks, bytes, rentang atau generator, bukan {type(obj).__name__}")
+
+    def _op_for_iter(self, frame, arg):
+        gen_obj = frame.stack[-1]
+        if not isinstance(gen_obj, MorphGenerator):
+            val = next(gen_obj, UNBOUND)
+            if val is UNBOUND:
+                frame.stack.pop()
+                frame.pc = arg
+            else:
+                frame.stack.append(val)
+            return
+        if gen_obj.status == "closed":
+            frame.stack.pop()
+            frame.pc = arg
+            return
+        self._resume_generator(gen_obj, arg)
 
     def call_function_internal(self, func_obj: Union[CodeObject, MorphFunction], args: List[Any], is_init: bool = False, context_globals: Dict[str, Any] = None, defining_class: MorphClass = None):
-        from ivm.core.structs import Cell
-
         if isinstance(func_obj, MorphFunction):
             code = func_obj.code
             new_globals = func_obj.globals
@@ -974,55 +1612,68 @@ class StandardVM:
             new_globals = context_globals if context_globals is not None else self.globals
             closure = None
 
-        new_frame = Frame(code=code, globals=new_globals, is_init_call=is_init, defining_class=defining_class)
+        expected_argc, slot_tail, cell_args = code.call_info()
 
         # Initialize Cells
-        # 1. Create new cells for cell_vars (locals captured by children)
-        if code.cell_vars:
+        cells = None
+        if code.cell_vars or code.free_vars:
+            cells = {}
+            # 1. Create new cells for cell_vars (locals captured by children)
             for name in code.cell_vars:
-                new_frame.cells[name] = Cell()
-
-        # 2. Map free_vars (captured from parent) to closure cells
-        if code.free_vars:
-            if not closure:
-                 # This might happen if function expects closure but got none (e.g. compiled as script)
-                 # Or if called directly as CodeObject.
-                 # Should be error?
-                 pass
-            else:
-                if len(closure) != len(code.free_vars):
-                    raise RuntimeError(f"Closure mismatch: expected {len(code.free_vars)} cells, got {len(closure)}")
-                for name, cell in zip(code.free_vars, closure):
-                    new_frame.cells[name] = cell
+                cells[name] = Cell()
+
+            # 2. Map free_vars (captured from parent) to closure cells
+            if code.free_vars:
+                if not closure:
+                     # This might happen if function expects closure but got none (e.g. compiled as script)
+                     # Or if called directly as CodeObject.
+                     # Should be error?
+                     pass
+                else:
+                    if len(closure) != len(code.free_vars):
+                        raise RuntimeError(f"Closure mismatch: expected {len(code.free_vars)} cells, got {len(closure)}")
+                    for name, cell in zip(code.free_vars, closure):
+                        cells[name] = cell
 
         # Periksa jumlah argumen, izinkan argumen yang lebih sedikit (diisi dengan None/nil)
-        expected_argc = len(code.arg_names)
         actual_argc = len(args)
         if actual_argc > expected_argc:
             raise TypeError(
                 f"Panggilan fungsi '{code.name}' salah: "
                 f"mengharapkan paling banyak {expected_argc} argumen, tetapi mendapat {actual_argc}."
             )
-
-        # Isi argumen yang diberikan
-        for i in range(actual_argc):
-            name = code.arg_names[i]
-            val = args[i]
-            # Jika variabel ini adalah cell variable, simpan di cell
-            if name in new_frame.cells:
-                new_frame.cells[name].value = val
-            else:
-                new_frame.locals[name] = val
-
-        # Isi sisa argumen yang tidak diberikan dengan None (nil)
         if actual_argc < expected_argc:
-            for i in range(actual_argc, expected_argc):
-                name = code.arg_names[i]
-                if name in new_frame.cells:
-                    new_frame.cells[name].value = None
-                else:
-                    new_frame.locals[name] = None
+            args = [*args, *([None] * (expected_argc - actual_argc))]
 
+        if code.local_names:
+            # Kode hasil Compiler: argumen ke-i langsung jadi slot i, slot lain UNBOUND
+            fast = [*args, *slot_tail]
+            f_locals = None
+        else:
+            fast = []
+            f_locals = dict(zip(code.arg_names, args))
+
+        # Argumen yang ditangkap closure disimpan di cell, bukan di slot/locals
+        for i, name in cell_args:
+            if cells is not None and name in cells:
+                cells[name].value = args[i]
+                if f_locals is None: fast[i] = UNBOUND
+                else: del f_locals[name]
+
+        pool = code.frame_pool
+        if pool and self.pool_frames:
+            new_frame = pool.pop()
+            new_frame.globals = new_globals
+            new_frame.locals = f_locals
+            new_frame.is_init_call = is_init
+            new_frame.defining_class = defining_class
+            new_frame.cells = cells
+            new_frame.fast = fast
+        else:
+            new_frame = Frame(
+                code=code, globals=new_globals, locals=f_locals, is_init_call=is_init,
+                defining_class=defining_class, cells=cells, fast=fast
+            )
         self.call_stack.append(new_frame)
         self.globals = new_globals
 
@@ -1092,56 +1743,54 @@ class StandardVM:
         code_obj = None
 
         if file_path_str.endswith('.mvm'):
-            with open(file_path_str, 'rb') as f:
-                binary_data = f.read()
-            # Cek Magic Bytes "VZOEL FOXS"
-            if binary_data[:10] != b"VZOEL FOXS":
-                raise ValueError(f"File .mvm tidak valid (Magic Header mismatch): {file_path_str}")
-
-            # Skip Header (16 bytes)
-            # Magic(10) + Ver(1) + Flags(1) + TS(4) = 16
-            payload = binary_data[16:]
-
-            # Deserialisasi Payload
-            # Kita butuh parser biner sederhana di sini
-            from ivm.core.deserializer import deserialize_code_object
-            code_obj = deserialize_code_object(payload, filename=file_path_str)
+            # Header (16 bytes): Magic(10) + Ver(1) + Flags(1) + TS(4); versi menentukan layout payload.
+            # Image di-mmap, fungsi bersarang baru di-decode saat pertama dipanggil
+            from ivm.core.deserializer import muat_mvm
+            try:
+                code_obj = muat_mvm(file_path_str)
+            except ValueError as e:
+                raise ValueError(f"{e}: {file_path_str}") from e
 
         else:
             # .fox source file
-            with open(file_path_str, 'r', encoding='utf-8') as f:
-                source = f.read()
-
             # 3. Compile (Lazy Imports untuk hindari circular dependency)
             from transisi.lx import Leksikal
             from transisi.crusher import Pengurai
             from ivm.compiler import Compiler
 
-            lexer = Leksikal(source, nama_file=file_path_str)
-            tokens, err = lexer.buat_token()
-            if err: raise SyntaxError(f"Lexer Error di {module_path}: {err}")
-
-            parser = Pengurai(tokens)
-            ast = parser.urai()
-            if not ast:
-                err_msg = "\n".join([f"{e[1]}" for e in parser.daftar_kesalahan])
-                raise SyntaxError(f"Parser Error di {module_path}: {err_msg}")
-
-            compiler = Compiler()
-            code_obj = compiler.compile(ast, filename=file_path_str)
+            def kompilasi(source: str) -> CodeObject:
+                lexer = Leksikal(source, nama_file=file_path_str)
+                tokens, err = lexer.buat_token()
+                if err: raise SyntaxError(f"Lexer Error di {module_path}: {err}")
+
+                parser = Pengurai(tokens)
+                ast = parser.urai()
+                if not ast:
+                    err_msg = "\n".join([f"{e[1]}" for e in parser.daftar_kesalahan])
+                    raise SyntaxError(f"Parser Error di {module_path}: {err_msg}")
+
+                compiler = Compiler()
+                code = compiler.compile(ast, filename=file_path_str)
+                if self.optimize:
+                    from ivm.optimizer import Optimizer
+                    code = Optimizer(self.optimize).optimize(code)
+                return code
+
+            if self.bytecode_cache:
+                from ivm.core.bytecode_cache import kompilasi_dengan_cache
+                code_obj = kompilasi_dengan_cache(file_path_str, kompilasi, self.optimize)
+            else:
+                with open(file_path_str, 'r', encoding='utf-8') as f:
+                    code_obj = kompilasi(f.read())
 
         # 4. Execute Isolated
         # Simpan globals saat ini
         saved_globals = self.globals
         # Simpan exception handlers dari frame pemanggil
-        saved_handlers = list(self.current_frame.exception_handlers) if self.call_stack else []
+        saved_handlers = list(self.current_frame.exception_handlers or ()) if self.call_stack else []
 
-        # Buat env baru untuk modul, tapi sertakan builtins
-        module_globals = {}
-        module_globals.update(CORE_BUILTINS)
-        module_globals.update(FILE_IO_BUILTINS)
-        module_globals.update(SYSTEM_BUILTINS)
-        module_globals.update(FOX_BUILTINS)
+        # Buat env baru untuk modul; builtins dibaca dari lapisan bersama, tidak disalin
+        module_globals = buat_globals_modul()
 
         # Inject argumen_sistem dari VM context
         if "argumen_sistem" in self.globals:
@@ -1165,40 +1814,15 @@ class StandardVM:
             frame = Frame(code=code_obj, globals=module_globals)
             self.call_stack.append(frame)
 
-            # Jalankan sampai frame ini selesai
-            # Masalah: run() adalah loop utama. Jika kita panggil run() lagi, itu rekursif.
-            # VM single threaded. Kita harus re-enter loop?
-            # Jika load_module dipanggil dari dalam execute (nested), kita harus hati-hati.
-            # execute -> load_module -> ...
-            # Kita bisa gunakan call_function_internal, lalu biarkan loop execute utama melanjutkan.
-            # TAPI, opcode IMPORT mengharapkan hasil SEGERA di stack.
-            # Jadi kita harus eksekusi synchronous sampai selesai DI SINI.
-
-            # Sub-loop eksekusi
-            start_depth = len(self.call_stack)
-            while len(self.call_stack) >= start_depth and self.running:
-                if self.instruction_count >= self.max_instructions:
-                    raise RuntimeError("Instruction limit exceeded")
-
-                curr = self.current_frame
-                if curr.pc >= len(curr.code.instructions):
-                    self._return_from_frame(None)
-                    continue
-
-                instr = curr.code.instructions[curr.pc]
-                curr.pc += 1
-
-                try:
-                    self.execute(instr)
-                except Exception as e:
-                    # Tangani error modul
-                    err = {
-                        "pesan": str(e), "jenis": "ErrorModul",
-                        "file": file_path_str
-                    }
-                    self._handle_exception(err)
-
-                self.instruction_count += 1
+            # Jalankan synchronous sampai frame modul selesai (IMPORT butuh hasilnya
+            # SEGERA di stack), lewat inti eksekusi yang sama dengan run()
+            def error_modul(e: Exception):
+                if isinstance(e, LemparanMorph): raise e
+                self._handle_exception(MorphError({
+                    "pesan": pesan_error(e), "jenis": "ErrorModul",
+                    "file": file_path_str
+                }))
+            self._execute_until(len(self.call_stack) - 1, error_modul)
 
         finally:
             # 5. Restore & Return
@@ -1219,62 +1843,104 @@ class StandardVM:
     def _handle_exception(self, error_obj):
         """
         Mencari handler di stack frame saat ini, atau unwinding stack sampai ketemu.
-        Jika error_obj bukan dict (dan bukan instance ObjekError), bungkus jadi dict standar.
-        Menambahkan stack trace (jejak) ke objek error.
+        Handler dicari di exception_handlers frame (PUSH_TRY, bytecode self-hosted)
+        lalu di exception_table CodeObject (hasil Compiler, tanpa opcode try).
+        Jika error_obj bukan dict (dan bukan instance ObjekError), bungkus jadi MorphError.
+        Menambahkan stack trace (jejak) ke objek error; untuk MorphError formatnya ditunda.
         """
         # Standarisasi Error Object
         if not isinstance(error_obj, dict) and not hasattr(error_obj, 'pesan'):
-             error_obj = {
+             error_obj = MorphError({
                 "pesan": str(error_obj),
                 "baris": 0,
                 "kolom": 0,
                 "jenis": "ErrorManual"
-            }
-
-        # Tambahkan Stack Trace
-        trace = []
-        for f in self.call_stack:
-            trace.append(f"{f.code.name} at PC {f.pc}")
-
-        if isinstance(error_obj, dict):
-            error_obj['jejak'] = trace
+            })
+
+        # Tambahkan Stack Trace (snapshot frame + pc; teks dibuat saat dibutuhkan)
+        call_stack = self.call_stack
+        frames = tuple(call_stack)
+        pcs = list(map(_frame_pc, frames))
+        if isinstance(error_obj, MorphError):
+            error_obj.tunda_jejak(frames, pcs)
+        elif isinstance(error_obj, dict):
+            error_obj['jejak'] = format_jejak(frames, pcs)
         elif hasattr(error_obj, 'jejak'): # ObjekError class
-            error_obj.jejak = trace
+            error_obj.jejak = format_jejak(frames, pcs)
 
         # DEBUG: Print status for diagnostics
         # print(f"[VM DEBUG] Exception: {error_obj.get('pesan')} | Stack: {[f.code.name for f in self.call_stack]}")
 
-        while self.call_stack:
-            frame = self.current_frame
+        self._unwind(error_obj)
+
+    def _unwind(self, error_obj):
+        """
+        Lompat ke handler terdekat untuk error_obj, membuang frame tanpa handler. Frame di
+        bawah _batas_unwind milik pemanggil eksekusi bersarang: sebelum menyentuhnya
+        error dilempar sebagai LemparanMorph.
+        """
+        call_stack = self.call_stack
+        batas = self._batas_unwind
+        while call_stack:
+            if len(call_stack) <= batas:
+                raise LemparanMorph(error_obj)
+            frame = call_stack[-1]
             if frame.exception_handlers:
                 # Handler found in current frame
                 handler_pc = frame.exception_handlers.pop()
                 frame.stack.append(error_obj)
                 frame.pc = handler_pc
                 return
+            table = frame.code.exception_table
+            if table:
+                # frame.pc sudah melewati instruksi yang gagal (atau CALL yang sedang berjalan)
+                fault_pc = frame.pc - 1
+                for start, end, handler_pc, depth in table:
+                    if start <= fault_pc < end:
+                        del frame.stack[depth:]
+                        frame.stack.append(error_obj)
+                        frame.pc = handler_pc
+                        return
+            # No handler in current frame, pop frame (unwind)
+            if len(call_stack) > 1:
+                if frame.generator is not None: frame.generator.status = "closed"
+                call_stack.pop()
             else:
-                # No handler in current frame, pop frame (unwind)
-                if len(self.call_stack) > 1:
-                    self.call_stack.pop()
-                else:
-                    # Stack habis, panic
-                    raise RuntimeError(f"Unhandled Panic (Global): {error_obj}")
+                # Stack habis, panic
+                raise RuntimeError(f"Unhandled Panic (Global): {error_obj}")
 
         # Should not be reached if stack check works
         raise RuntimeError(f"Unhandled Panic: {error_obj}")
 
+    def _has_handler(self, depth: int) -> bool:
+        """
+        True jika _handle_exception akan menemukan handler di frame call_stack[depth:]
+        (PUSH_TRY atau exception_table), tanpa mengubah apa pun. Dipakai policy eksekusi
+        bersarang yang tidak boleh unwinding melewati frame milik pemanggil Python-nya.
+        """
+        for frame in reversed(self.call_stack[depth:]):
+            if frame.exception_handlers:
+                return True
+            fault_pc = frame.pc - 1
+            for start, end, _, _ in frame.code.exception_table:
+                if start <= fault_pc < end:
+                    return True
+        return False
+
     def call_function_sync(self, func_obj: CodeObject, args: List[Any]) -> Any:
+        """
+        Panggil fungsi Morph dari kode Python (callback builtin fox_*) dan tunggu hasilnya.
+        Exception dari fungsi diteruskan ke pemanggil Python apa adanya (`lemparkan`
+        tanpa handler di dalam fungsi sebagai LemparanMorph); frame panggilan yang
+        gagal dibuang dulu agar call_stack kembali seperti semula.
+        """
+        depth = len(self.call_stack)
+        saved_globals = self.globals
         self.call_function_internal(func_obj, args)
-        start_depth = len(self.call_stack)
-        while len(self.call_stack) >= start_depth and self.running:
-             if self.instruction_count >= self.max_instructions:
-                raise RuntimeError(f"Instruction limit exceeded")
-             frame = self.current_frame
-             if frame.pc >= len(frame.code.instructions):
-                self._return_from_frame(None)
-                continue
-             instr = frame.code.instructions[frame.pc]
-             frame.pc += 1
-             self.execute(instr)
-             self.instruction_count += 1
+        try:
+            self._execute_until(depth, _teruskan_error)
+        except Exception:
+            del self.call_stack[depth:]
+            self.globals = saved_globals
+            raise
         return self.stack.pop()
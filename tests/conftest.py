@@ -0,0 +1,58 @@
+# tests/conftest.py
+"""
+Fixture bersama untuk tes IVM: kompilasi sumber .fox dengan ivm/compiler.py lalu
+jalankan di StandardVM, keluaran `tulis` ditangkap sebagai teks.
+"""
+import contextlib
+import io
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from transisi.lx import Leksikal
+from transisi.crusher import Pengurai
+from ivm.compiler import Compiler
+from ivm.optimizer import Optimizer
+from ivm.vms.standard_vm import StandardVM
+
+def kompilasi(source: str, nama_file: str = "<tes>", optimasi: int = 0):
+    tokens, errors = Leksikal(source, nama_file=nama_file).buat_token()
+    assert not errors, f"Lexer Errors: {errors}"
+    parser = Pengurai(tokens)
+    ast = parser.urai()
+    assert ast, f"Parser Errors: {parser.daftar_kesalahan}"
+    code = Compiler().compile(ast, filename=nama_file, is_main_script=False)
+    return Optimizer(optimasi).optimize(code)
+
+def jalankan(source: str, nama_file: str = "<tes>", optimasi: int = 0, globals_tambahan: dict = None, **opsi_vm) -> str:
+    """
+    Jalankan program seperti ivm/main.py (termasuk `utama` jika ada) dan kembalikan stdout.
+    Error yang tidak tertangkap diteruskan sebagai exception Python.
+    """
+    code = kompilasi(source, nama_file, optimasi)
+    opsi_vm.setdefault("bytecode_cache", False)
+    vm = StandardVM(optimize=optimasi, **opsi_vm)
+    vm.load(code)
+    vm.globals.update(globals_tambahan or {})
+    keluaran = io.StringIO()
+    with contextlib.redirect_stdout(keluaran):
+        vm.run()
+        if "utama" in vm.globals:
+            vm.call_function_internal(vm.globals["utama"], [])
+            vm.run()
+    return keluaran.getvalue()
+
+@pytest.fixture
+def kompilasi_morph():
+    """kompilasi(source, nama_file="<tes>", optimasi=0) -> CodeObject"""
+    return kompilasi
+
+@pytest.fixture
+def jalankan_morph():
+    """jalankan(source, nama_file="<tes>", optimasi=0, globals_tambahan=None, **opsi_vm) -> stdout"""
+    return jalankan
@@ -0,0 +1,48 @@
+# tests/test_batas_instruksi.py
+"""
+max_instructions: _run_fast hanya mengecek batas di lompatan mundur, panggilan dan
+pergantian frame, tapi loop tak berujung tetap berhenti dan instruction_count tetap tepat.
+"""
+import pytest
+
+from ivm.vms.standard_vm import StandardVM
+
+MODE = pytest.mark.parametrize("fast_loop", [True, False])
+
+@MODE
+@pytest.mark.parametrize("badan", ["ubah i = i + 1", "f()"])
+def test_loop_tak_berujung_berhenti(kompilasi_morph, fast_loop, badan):
+    code = kompilasi_morph(f"""
+fungsi f() maka
+    kembalikan 1
+akhir
+biar i = 0
+selama benar maka
+    {badan}
+akhir
+""")
+    vm = StandardVM(max_instructions=5_000, fast_loop=fast_loop, bytecode_cache=False)
+    vm.load(code)
+    with pytest.raises(RuntimeError, match="Instruction limit exceeded"):
+        vm.run()
+    # Paling lambat satu iterasi loop (beberapa instruksi) setelah batas
+    assert 5_000 <= vm.instruction_count <= 5_020
+
+def test_hitungan_sama_dengan_loop_legacy(kompilasi_morph):
+    code = kompilasi_morph("""
+fungsi f(n) maka
+    biar i = 0
+    selama i < n maka
+        ubah i = i + 1
+    akhir
+    kembalikan i
+akhir
+f(50)
+""")
+    hitungan = []
+    for fast_loop in (True, False):
+        vm = StandardVM(fast_loop=fast_loop, superinstructions=False, bytecode_cache=False)
+        vm.load(code)
+        vm.run()
+        hitungan.append(vm.instruction_count)
+    assert hitungan[0] == hitungan[1] > 50 * 5
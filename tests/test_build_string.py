@@ -0,0 +1,63 @@
+# tests/test_build_string.py
+"""
+BUILD_STRING: interpolasi dan rantai '+' teks dievaluasi kiri ke kanan, literal yang
+bersebelahan dilipat, dan operand '+' yang bukan teks tetap memakai semantik '+'
+(hasil dan pesan error-nya sama dengan rantai ADD).
+"""
+import pytest
+
+from ivm.core.opcodes import Op
+
+LEVEL = pytest.mark.parametrize("optimasi", [0, 2])
+
+URUTAN = """
+biar jejak = ""
+fungsi catat(nama) maka
+    ubah jejak = jejak + nama
+    kembalikan nama
+akhir
+"""
+
+@LEVEL
+def test_interpolasi_kiri_ke_kanan(jalankan_morph, optimasi):
+    keluaran = jalankan_morph(URUTAN + """
+biar a = "a"
+biar b = "b"
+biar c = "c"
+biar hasil = "<{catat(a)}|{catat(b)}|{catat(c)}>"
+tulis(hasil)
+tulis(jejak)
+""", optimasi=optimasi)
+    assert keluaran.splitlines() == ["<a|b|c>", "abc"]
+
+@LEVEL
+def test_rantai_plus_kiri_ke_kanan(jalankan_morph, optimasi):
+    keluaran = jalankan_morph(URUTAN + """
+fungsi f() maka
+    kembalikan "[" + catat("x") + "-" + catat("y") + "-" + catat("z") + "]"
+akhir
+tulis(f())
+tulis(jejak)
+""", optimasi=optimasi)
+    assert keluaran.splitlines() == ["[x-y-z]", "xyz"]
+
+def test_rantai_jadi_satu_build_string(kompilasi_morph):
+    code = kompilasi_morph('biar a = "x"\nbiar s = "<" + a + "|" + "{a}" + ">"\n')
+    ops = [ins[0] for ins in code.instructions]
+    assert ops.count(Op.BUILD_STRING) == 1
+    assert Op.ADD not in ops and Op.STR not in ops
+
+def test_interpolasi_mengonversi_bukan_teks(jalankan_morph):
+    keluaran = jalankan_morph('biar n = 3\ntulis("n={n} benar={n > 1} daftar={[1, 2]}")\n')
+    assert keluaran.splitlines() == ["n=3 benar=True daftar=[1, 2]"]
+
+def test_operand_mentah_bukan_teks_tetap_error_seperti_plus(jalankan_morph):
+    keluaran = jalankan_morph("""
+biar n = 5
+coba
+    tulis("nilai: " + n + "!")
+tangkap e
+    tulis(e["pesan"])
+akhir
+""")
+    assert keluaran.splitlines() == ['can only concatenate str (not "int") to str']
@@ -0,0 +1,112 @@
+# tests/test_bytecode_cache.py
+"""
+Cache bytecode __foxcache__ (ivm/core/bytecode_cache.py): hit, miss, invalidasi lewat
+hash isi sumber atau tag compiler, entri terpisah per level -O, dan entri rusak.
+"""
+import os
+
+import pytest
+
+from ivm.core import bytecode_cache
+from ivm.core.bytecode_cache import kompilasi_dengan_cache, path_cache
+
+PROGRAM = 'tulis("halo")\n'
+LAMA = 1_000_000_000  # mtime jauh di masa lalu: jalur cepat mtime+ukuran boleh dipakai
+
+class Penghitung:
+    """Pembungkus kompilasi yang mencatat berapa kali compiler benar-benar dipanggil."""
+    def __init__(self, kompilasi, optimasi=0):
+        self.kompilasi = kompilasi
+        self.optimasi = optimasi
+        self.jumlah = 0
+
+    def __call__(self, source):
+        self.jumlah += 1
+        return self.kompilasi(source, optimasi=self.optimasi)
+
+@pytest.fixture
+def sumber(tmp_path):
+    path = tmp_path / "prog.fox"
+    path.write_text(PROGRAM, encoding="utf-8")
+    os.utime(path, ns=(LAMA, LAMA))
+    return path
+
+def tulis_ulang(path, teks):
+    path.write_text(teks, encoding="utf-8")
+    os.utime(path, ns=(LAMA + 10**9, LAMA + 10**9))
+
+def test_miss_lalu_hit(sumber, kompilasi_morph):
+    kompilasi = Penghitung(kompilasi_morph)
+    pertama = kompilasi_dengan_cache(str(sumber), kompilasi)
+    assert kompilasi.jumlah == 1
+    assert os.path.isfile(path_cache(str(sumber)))
+    assert os.path.dirname(path_cache(str(sumber))) == str(sumber.parent / "__foxcache__")
+
+    kedua = kompilasi_dengan_cache(str(sumber), kompilasi)
+    assert kompilasi.jumlah == 1
+    assert kedua.instructions == pertama.instructions
+
+def test_isi_berubah_memicu_kompilasi_ulang(sumber, kompilasi_morph, jalankan_morph):
+    kompilasi = Penghitung(kompilasi_morph)
+    kompilasi_dengan_cache(str(sumber), kompilasi)
+    tulis_ulang(sumber, 'tulis("dunia")\n')
+    code = kompilasi_dengan_cache(str(sumber), kompilasi)
+    assert kompilasi.jumlah == 2
+    assert ("dunia",) in [ins[1:] for ins in code.instructions]
+
+def test_mtime_berubah_isi_sama_tetap_hit(sumber, kompilasi_morph):
+    kompilasi = Penghitung(kompilasi_morph)
+    kompilasi_dengan_cache(str(sumber), kompilasi)
+    tulis_ulang(sumber, PROGRAM)
+    kompilasi_dengan_cache(str(sumber), kompilasi)
+    assert kompilasi.jumlah == 1
+    # Header disegarkan: pemakaian berikutnya lewat jalur cepat, tetap tanpa kompilasi
+    kompilasi_dengan_cache(str(sumber), kompilasi)
+    assert kompilasi.jumlah == 1
+
+def test_sumber_baru_diubah_selalu_dicek_lewat_hash(tmp_path, kompilasi_morph):
+    # mtime "panas" tidak dicatat: perubahan dengan ukuran dan mtime sama tetap terdeteksi
+    path = tmp_path / "panas.fox"
+    path.write_text(PROGRAM, encoding="utf-8")
+    st = os.stat(path)
+    kompilasi = Penghitung(kompilasi_morph)
+    kompilasi_dengan_cache(str(path), kompilasi)
+    path.write_text(PROGRAM.replace("halo", "hola"), encoding="utf-8")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    kompilasi_dengan_cache(str(path), kompilasi)
+    assert kompilasi.jumlah == 2
+
+def test_tag_compiler_berbeda_memicu_kompilasi_ulang(sumber, kompilasi_morph, monkeypatch):
+    kompilasi = Penghitung(kompilasi_morph)
+    kompilasi_dengan_cache(str(sumber), kompilasi)
+    monkeypatch.setattr(bytecode_cache, "_tag_compiler", {0: b"\x01" * 32})
+    kompilasi_dengan_cache(str(sumber), kompilasi)
+    assert kompilasi.jumlah == 2
+    kompilasi_dengan_cache(str(sumber), kompilasi)
+    assert kompilasi.jumlah == 2
+
+def test_entri_terpisah_per_level_optimasi(sumber, kompilasi_morph):
+    o0 = Penghitung(kompilasi_morph, 0)
+    o2 = Penghitung(kompilasi_morph, 2)
+    kompilasi_dengan_cache(str(sumber), o0, 0)
+    kompilasi_dengan_cache(str(sumber), o2, 2)
+    assert path_cache(str(sumber), 2).endswith("prog.fox.opt-2.mvm")
+    assert os.path.isfile(path_cache(str(sumber), 0)) and os.path.isfile(path_cache(str(sumber), 2))
+    kompilasi_dengan_cache(str(sumber), o0, 0)
+    kompilasi_dengan_cache(str(sumber), o2, 2)
+    assert (o0.jumlah, o2.jumlah) == (1, 1)
+    assert bytecode_cache.tag_compiler(0) != bytecode_cache.tag_compiler(2)
+
+def test_entri_rusak_dianggap_miss(sumber, kompilasi_morph):
+    kompilasi = Penghitung(kompilasi_morph)
+    kompilasi_dengan_cache(str(sumber), kompilasi)
+    entri = path_cache(str(sumber))
+    with open(entri, "rb") as f:
+        data = f.read()
+    with open(entri, "wb") as f:
+        f.write(data[:len(data) - 5])
+    code = kompilasi_dengan_cache(str(sumber), kompilasi)
+    assert kompilasi.jumlah == 2
+    assert code.instructions
+    kompilasi_dengan_cache(str(sumber), kompilasi)
+    assert kompilasi.jumlah == 2
@@ -0,0 +1,48 @@
+# tests/test_decoder.py
+"""
+ivm/core/decoder.py: instruksi CodeObject di-decode sekali jadi array('B') opcode dan list
+operand, varian hybrid bootstrap/self-hosted diselesaikan saat decode, dan cache di
+CodeObject.decoded() diperbarui saat list instruksi diganti.
+"""
+from array import array
+
+from ivm.core.decoder import decode_instruction, decode_instructions
+from ivm.core.opcodes import Op, DecodedOp
+from ivm.core.structs import CodeObject
+from ivm.vms.standard_vm import StandardVM
+
+def test_array_paralel_per_pc():
+    ops, args = decode_instructions([(Op.PUSH_CONST, 5), (Op.POP,), (Op.LOAD_ATTR, "x"), (Op.BUILD_FUNCTION, 1, 2)])
+    assert isinstance(ops, array) and ops.typecode == 'B'
+    assert list(ops) == [Op.PUSH_CONST, Op.POP, Op.LOAD_ATTR, Op.BUILD_FUNCTION]
+    assert args == [5, None, "x", (1, 2)]
+
+def test_varian_hybrid_diselesaikan_saat_decode():
+    assert decode_instruction((Op.IS_INSTANCE, "Titik")) == (DecodedOp.IS_INSTANCE_NAMED, "Titik")
+    assert decode_instruction((Op.IS_INSTANCE, None)) == (Op.IS_INSTANCE, None)
+    assert decode_instruction((Op.IS_VARIANT, "Ada")) == (DecodedOp.IS_VARIANT_NAMED, "Ada")
+    assert decode_instruction((Op.BUILD_VARIANT, "Ada", 1)) == (DecodedOp.BUILD_VARIANT_NAMED, ("Ada", 1))
+    assert decode_instruction((Op.BUILD_VARIANT, 1)) == (Op.BUILD_VARIANT, 1)
+
+def test_opcode_tidak_dikenal():
+    assert decode_instruction((300,)) == (DecodedOp.UNKNOWN, None)
+    assert decode_instruction(("PUSH_CONST", 1)) == (DecodedOp.UNKNOWN, None)
+
+def test_cache_decoded_mengikuti_instruksi():
+    code = CodeObject(name="f", instructions=[(Op.PUSH_CONST, 1), (Op.RET,)])
+    ops, args = code.decoded()
+    assert code.decoded()[0] is ops
+    code.instructions.append((Op.HALT,))
+    assert len(code.decoded()[0]) == 3
+    code.instructions = [(Op.PUSH_CONST, 2), (Op.RET,)]
+    assert code.decoded()[1] == [2, None]
+
+def test_vm_menjalankan_instruksi_yang_diganti():
+    code = CodeObject(name="<main>", instructions=[(Op.PUSH_CONST, 1), (Op.STORE_VAR, "x"), (Op.HALT,)])
+    vm = StandardVM(bytecode_cache=False)
+    vm.load(code)
+    vm.run()
+    code.instructions = [(Op.PUSH_CONST, 2), (Op.PUSH_CONST, 3), (Op.ADD,), (Op.STORE_VAR, "x"), (Op.HALT,)]
+    vm.load(code)
+    vm.run()
+    assert vm.globals["x"] == 5
@@ -0,0 +1,56 @@
+# tests/test_dispatch.py
+"""
+Tabel dispatch StandardVM: satu handler per nilai opcode (Op dan DecodedOp), opcode
+tak dikenal jadi no-op, dan execute() pada tuple instruksi mentah berperilaku sama.
+"""
+import pytest
+
+from ivm.core.decoder import decode_instruction
+from ivm.core.opcodes import Op, DecodedOp
+from ivm.vms.standard_vm import StandardVM, DISPATCH_TABLE_SIZE
+
+def test_setiap_opcode_punya_handler():
+    vm = StandardVM(bytecode_cache=False)
+    assert len(vm._dispatch) == DISPATCH_TABLE_SIZE
+    for op in list(Op) + list(DecodedOp):
+        assert vm._dispatch[op.value] == getattr(vm, f"_op_{op.name.lower()}")
+        assert op is DecodedOp.UNKNOWN or vm._dispatch[op.value] != vm._op_unknown
+
+@pytest.mark.parametrize("instr", [
+    (250, "abaikan"),
+    (DecodedOp.LOAD_FAST_FAST.value, "abaikan"),
+    (DecodedOp.ADD_INT.value,),
+    (-1,),
+], ids=["di_luar_tabel", "superinstruksi", "spesialisasi", "negatif"])
+@pytest.mark.parametrize("fast_loop", [True, False])
+def test_opcode_tak_dikenal_jadi_no_op(instr, fast_loop):
+    # Nilai DecodedOp internal di bytecode mentah tidak boleh sampai ke handler internalnya
+    vm = StandardVM(bytecode_cache=False, fast_loop=fast_loop)
+    vm.load([(Op.PUSH_CONST, 1), instr, (Op.PUSH_CONST, 2), (Op.ADD,), (Op.RET,)])
+    vm.run()
+    assert vm.instruction_count == 5
+    assert not vm.running
+    assert decode_instruction(instr) == (DecodedOp.UNKNOWN.value, None)
+
+def test_execute_instruksi_mentah():
+    vm = StandardVM(bytecode_cache=False)
+    vm.load([])
+    for instr in [(Op.PUSH_CONST, 7), (Op.PUSH_CONST, 5), (Op.SUB,), (Op.PUSH_CONST, "x"), (Op.BUILD_LIST, 2)]:
+        vm.execute(instr)
+    assert vm.stack == [[2, "x"]]
+
+def test_opcode_akhir_tabel(jalankan_morph):
+    # CALL, RET, LOAD_ATTR dan opcode bitwise dulu berada di ujung rantai if/elif
+    keluaran = jalankan_morph("""
+kelas Kotak maka
+    fungsi inisiasi(isi) maka
+        ubah ini.isi = isi
+    akhir
+akhir
+fungsi buka(k) maka
+    kembalikan k.isi
+akhir
+tulis(buka(Kotak(3)) << 2)
+tulis(~5 ^ 1)
+""")
+    assert keluaran.splitlines() == ["12", "-5"]
@@ -0,0 +1,211 @@
+# tests/test_eksepsi.py
+"""
+Tabel eksepsi (coba/tangkap/akhirnya dikompilasi jadi exception_table, bukan PUSH_TRY):
+unwinding lintas frame, handler bersarang, akhirnya, kedalaman stack iterator loop, dan
+teks error yang terlihat pengguna.
+"""
+import pytest
+
+from ivm.core.opcodes import Op
+from ivm.core.structs import MorphError, pesan_error
+
+LEVEL = pytest.mark.parametrize("optimasi", [0, 2])
+
+def semua_instruksi(code):
+    for ins in code.instructions:
+        yield ins
+        for operand in ins[1:]:
+            if hasattr(operand, "instructions"):
+                yield from semua_instruksi(operand)
+
+def test_coba_dikompilasi_jadi_exception_table(kompilasi_morph):
+    code = kompilasi_morph("""
+coba
+    tulis(1)
+tangkap e
+    tulis(2)
+akhir
+""")
+    assert len(code.exception_table) == 1
+    awal, akhir_, handler, kedalaman = code.exception_table[0]
+    assert awal < akhir_ <= handler and kedalaman == 0
+    assert not any(ins[0] in (Op.PUSH_TRY, Op.POP_TRY) for ins in semua_instruksi(code))
+
+@LEVEL
+def test_error_dari_frame_dalam_ditangkap_frame_luar(jalankan_morph, optimasi):
+    keluaran = jalankan_morph("""
+fungsi c() maka
+    lemparkan "dalam"
+akhir
+fungsi b() maka
+    c()
+    tulis("tidak sampai")
+akhir
+fungsi a() maka
+    coba
+        b()
+        tulis("tidak sampai")
+    tangkap e
+        tulis(e["pesan"])
+        tulis(e["jenis"])
+    akhir
+    kembalikan "a selesai"
+akhir
+tulis(a())
+tulis(a())
+""", optimasi=optimasi)
+    assert keluaran.splitlines() == ["dalam", "ErrorManual", "a selesai"] * 2
+
+def test_jejak_mencatat_semua_frame(jalankan_morph):
+    keluaran = jalankan_morph("""
+fungsi c() maka
+    lemparkan "x"
+akhir
+fungsi b() maka
+    c()
+akhir
+coba
+    b()
+tangkap e
+    selama baris dari e["jejak"] maka
+        tulis(baris)
+    akhir
+akhir
+""")
+    nama = [baris.split(" at PC ")[0] for baris in keluaran.splitlines()]
+    assert nama == ["<module>", "b", "c"]
+
+@LEVEL
+def test_handler_terdalam_menang_lalu_lempar_ulang(jalankan_morph, optimasi):
+    keluaran = jalankan_morph("""
+fungsi dalam() maka
+    coba
+        lemparkan "satu"
+    tangkap e
+        tulis("dalam " + e["pesan"])
+        lemparkan "dua"
+    akhir
+akhir
+fungsi luar() maka
+    coba
+        dalam()
+    tangkap e
+        tulis("luar " + e["pesan"])
+    akhir
+akhir
+luar()
+""", optimasi=optimasi)
+    assert keluaran.splitlines() == ["dalam satu", "luar dua"]
+
+@LEVEL
+def test_akhirnya_berjalan_di_kedua_jalur(jalankan_morph, optimasi):
+    keluaran = jalankan_morph("""
+fungsi f(gagal) maka
+    coba
+        jika gagal maka
+            lemparkan "x"
+        akhir
+        tulis("ok")
+    tangkap e
+        tulis("tangkap")
+    akhirnya
+        tulis("akhirnya")
+    akhir
+akhir
+f(salah)
+f(benar)
+""", optimasi=optimasi)
+    assert keluaran.splitlines() == ["ok", "akhirnya", "tangkap", "akhirnya"]
+
+@LEVEL
+def test_unwinding_menjaga_iterator_loop_pemanggil(jalankan_morph, optimasi):
+    # Handler di badan loop: stack dipotong ke kedalaman iterator, bukan ke nol
+    keluaran = jalankan_morph("""
+fungsi cek(x) maka
+    jika x % 2 == 0 maka
+        lemparkan "genap"
+    akhir
+    kembalikan x
+akhir
+fungsi f() maka
+    selama i dari [1, 2, 3] maka
+        selama x dari [i * 10, i * 10 + 1] maka
+            coba
+                tulis(cek(x))
+            tangkap e
+                tulis(e["pesan"])
+            akhir
+        akhir
+    akhir
+akhir
+f()
+""", optimasi=optimasi)
+    assert keluaran.splitlines() == [
+        "genap", "11", "genap", "21", "genap", "31"]
+
+@pytest.mark.parametrize("fast_loop", [True, False])
+def test_superinstruksi_tidak_melewati_batas_coba(jalankan_morph, kompilasi_morph, fast_loop):
+    # STORE_FAST a; LOAD_FAST z berdampingan tepat di awal rentang coba
+    source = """
+fungsi f() maka
+    biar a = 1
+    coba
+        biar c = z
+    tangkap e
+        tulis("tertangkap")
+    akhir
+    biar z = 2
+akhir
+f()
+"""
+    keluaran = jalankan_morph(source, superinstructions=True, fast_loop=fast_loop)
+    assert keluaran.splitlines() == ["tertangkap"]
+
+    code = next(ins[1] for ins in kompilasi_morph(source).instructions if hasattr(ins[1], "instructions"))
+    ops, _ = code.fused()
+    (awal, akhir_, handler, _), = code.exception_table
+    assert ops[awal - 1] == Op.STORE_FAST
+
+def test_error_sistem_ditangkap(jalankan_morph):
+    keluaran = jalankan_morph("""
+fungsi bagi(a, b) maka
+    kembalikan a / b
+akhir
+coba
+    bagi(1, 0)
+tangkap e
+    tulis(e["jenis"])
+akhir
+""")
+    assert keluaran.splitlines() == ["ErrorSistem"]
+
+def test_teks_error_menyebut_dict(jalankan_morph):
+    # MorphError tetap tampil sebagai 'dict' di pesan TypeError Python
+    keluaran = jalankan_morph("""
+coba
+    lemparkan "a"
+tangkap e
+    coba
+        tulis("x" + e)
+    tangkap e2
+        tulis(e2["pesan"])
+    akhir
+akhir
+""")
+    assert keluaran.splitlines() == ['can only concatenate str (not "dict") to str']
+
+def test_morph_error_tidak_menyamar_sebagai_dict():
+    assert MorphError.__name__ == "MorphError"
+    try:
+        "x" + MorphError({"pesan": "a"})
+    except TypeError as e:
+        assert pesan_error(e) == 'can only concatenate str (not "dict") to str'
+
+def test_error_tanpa_handler(jalankan_morph):
+    with pytest.raises(RuntimeError, match="Unhandled Panic"):
+        jalankan_morph("""
+fungsi f() maka
+    lemparkan "lepas"
+akhir
+f()
+""")
@@ -0,0 +1,115 @@
+# tests/test_frame_pool.py
+"""
+Frame pooling (StandardVM(pool_frames=True)): Frame fungsi yang selesai di-reset lalu
+disimpan di CodeObject.frame_pool dan dipakai ulang panggilan berikutnya. Frame di pool
+tidak menahan objek panggilan lama; frame generator dan frame modul tidak didaur ulang.
+"""
+import contextlib
+import io
+
+import pytest
+
+from ivm.core.opcodes import Op
+from ivm.core.structs import CodeObject
+from ivm.vms.standard_vm import StandardVM, FRAME_POOL_MAX
+
+PROGRAM = """
+fungsi fib(n) maka
+    jika n < 2 maka
+        kembalikan n
+    akhir
+    kembalikan fib(n - 1) + fib(n - 2)
+akhir
+fungsi pembuat(x) maka
+    biar daftar = [x, x]
+    fungsi ambil() maka
+        kembalikan daftar
+    akhir
+    kembalikan ambil
+akhir
+fungsi gen(n) maka
+    biar i = 0
+    selama i < n maka
+        bekukan(i)
+        ubah i = i + 1
+    akhir
+akhir
+fungsi gagal(x) maka
+    lemparkan "gagal " + x
+akhir
+tulis(fib(12))
+biar a = pembuat("a")
+biar b = pembuat("b")
+tulis(a())
+tulis(b())
+selama v dari gen(3) maka
+    tulis(v)
+akhir
+coba
+    gagal("x")
+tangkap e
+    tulis(e["pesan"])
+akhir
+tulis(fib(5))
+"""
+
+HARAPAN = ["144", "['a', 'a']", "['b', 'b']", "0", "1", "2", "gagal x", "5"]
+
+def jalankan_vm(kompilasi, pool_frames):
+    vm = StandardVM(pool_frames=pool_frames, bytecode_cache=False)
+    vm.load(kompilasi(PROGRAM))
+    keluaran = io.StringIO()
+    with contextlib.redirect_stdout(keluaran):
+        vm.run()
+    return vm, keluaran.getvalue().splitlines()
+
+@pytest.mark.parametrize("pool_frames", [True, False])
+def test_keluaran_sama_dengan_dan_tanpa_pool(kompilasi_morph, pool_frames):
+    _, keluaran = jalankan_vm(kompilasi_morph, pool_frames)
+    assert keluaran == HARAPAN
+
+def test_frame_dipakai_ulang_dan_dibatasi(kompilasi_morph):
+    vm, _ = jalankan_vm(kompilasi_morph, True)
+    pool = vm.globals["fib"].code.frame_pool
+    # Rekursi fib(12) sedalam 12 frame; sesudahnya semua kembali ke pool
+    assert 1 <= len(pool) <= FRAME_POOL_MAX
+    assert len(set(map(id, pool))) == len(pool)
+    frame = pool[-1]
+    vm.load(kompilasi_morph("tulis(fib(1))\n"))
+    with contextlib.redirect_stdout(io.StringIO()):
+        vm.run()
+    assert pool[-1] is frame
+
+def test_frame_di_pool_tidak_menahan_referensi(kompilasi_morph):
+    vm, _ = jalankan_vm(kompilasi_morph, True)
+    for nama in ("fib", "pembuat"):
+        for frame in vm.globals[nama].code.frame_pool:
+            assert frame.pc == 0 and frame.stack == []
+            assert frame.globals is None and frame.fast is None
+            assert frame.cells is None and frame.locals is None
+
+def test_frame_generator_dan_tanpa_pool_tidak_didaur_ulang(kompilasi_morph):
+    vm, _ = jalankan_vm(kompilasi_morph, True)
+    assert vm.globals["gen"].code.frame_pool == []
+    vm, _ = jalankan_vm(kompilasi_morph, False)
+    assert vm.globals["fib"].code.frame_pool == []
+
+@pytest.mark.parametrize("fast_loop", [True, False])
+def test_frame_yield_tanpa_flag_generator_tidak_didaur_ulang(fast_loop):
+    # Bytecode buatan tangan: YIELD di kode ber-slot tanpa is_generator membuat
+    # MorphGenerator saat yield pertama; frame-nya tetap milik generator itu
+    f = CodeObject(name="f", arg_names=["x"], local_names=("x",), instructions=[
+        (Op.LOAD_FAST, 0), (Op.YIELD,), (Op.POP,), (Op.LOAD_FAST, 0), (Op.RET,)])
+    vm = StandardVM(pool_frames=True, fast_loop=fast_loop, bytecode_cache=False)
+    vm.globals["f"] = f
+    vm.load([(Op.LOAD_VAR, "f"), (Op.PUSH_CONST, 1), (Op.CALL, 1), (Op.STORE_VAR, "m"), (Op.RET,)])
+    vm.run()
+    lama = vm.globals["m"].args[1]
+    vm.globals["g"] = lama
+    vm.load([(Op.LOAD_VAR, "g"), (Op.RESUME,), (Op.STORE_VAR, "r"),
+             (Op.LOAD_VAR, "f"), (Op.PUSH_CONST, 5), (Op.CALL, 1), (Op.STORE_VAR, "n"), (Op.RET,)])
+    vm.run()
+    assert vm.globals["r"] == 1 and lama.status == "closed"
+    nilai, baru = vm.globals["n"].args
+    assert nilai == 5 and baru is not lama and baru.frame is not lama.frame
+    assert f.frame_pool == []
@@ -0,0 +1,103 @@
+# tests/test_generator.py
+"""
+Generator di StandardVM: `selama v dari g` (FOR_ITER) melanjutkan frame generator di
+tempat, protokol lama `lanjut(g)` -> Momen tetap jalan, dan error dari dalam generator
+sampai ke `coba` pemanggil.
+"""
+import pytest
+
+HITUNG = """
+fungsi hitung(n) maka
+    biar i = 0
+    selama i < n maka
+        bekukan(i)
+        ubah i = i + 1
+    akhir
+akhir
+"""
+
+@pytest.mark.parametrize("optimasi", [0, 2])
+def test_selama_dari_generator(jalankan_morph, optimasi):
+    keluaran = jalankan_morph(HITUNG + """
+biar total = 0
+selama v dari hitung(5) maka
+    tulis(v)
+    ubah total = total + v
+akhir
+tulis(total)
+""", optimasi=optimasi)
+    assert keluaran.splitlines() == ["0", "1", "2", "3", "4", "10"]
+
+def test_generator_kosong(jalankan_morph):
+    keluaran = jalankan_morph(HITUNG + """
+selama v dari hitung(0) maka
+    tulis(v)
+akhir
+tulis("selesai")
+""")
+    assert keluaran.splitlines() == ["selesai"]
+
+def test_berhenti_lalu_lanjutkan_generator_yang_sama(jalankan_morph):
+    keluaran = jalankan_morph(HITUNG + """
+biar g = hitung(5)
+selama v dari g maka
+    jika v == 2 maka
+        berhenti
+    akhir
+    tulis(v)
+akhir
+selama v dari g maka
+    tulis("sisa")
+    tulis(v)
+akhir
+""")
+    assert keluaran.splitlines() == ["0", "1", "sisa", "3", "sisa", "4"]
+
+def test_generator_bersarang(jalankan_morph):
+    keluaran = jalankan_morph(HITUNG + """
+fungsi kuadrat(n) maka
+    selama v dari hitung(n) maka
+        bekukan(v * v)
+    akhir
+akhir
+selama v dari kuadrat(4) maka
+    tulis(v)
+akhir
+""")
+    assert keluaran.splitlines() == ["0", "1", "4", "9"]
+
+def test_protokol_lanjut_momen(jalankan_morph):
+    keluaran = jalankan_morph(HITUNG + """
+biar g = hitung(3)
+biar jalan = benar
+selama jalan maka
+    jodohkan lanjut(g) dengan
+    | Momen(v, k) maka
+        tulis(v)
+    | _ maka
+        ubah jalan = salah
+    akhir
+akhir
+tulis("habis")
+""")
+    assert keluaran.splitlines() == ["0", "1", "2", "habis"]
+
+def test_error_di_generator_ditangkap_pemanggil(jalankan_morph):
+    keluaran = jalankan_morph("""
+fungsi rusak() maka
+    bekukan(1)
+    lemparkan "rusak"
+akhir
+fungsi f() maka
+    coba
+        selama v dari rusak() maka
+            tulis(v)
+        akhir
+    tangkap e
+        tulis("tangkap " + e["pesan"])
+    akhir
+    tulis("lanjut")
+akhir
+f()
+""")
+    assert keluaran.splitlines() == ["1", "tangkap rusak", "lanjut"]
@@ -0,0 +1,113 @@
+# tests/test_inline_cache.py
+"""
+Inline cache per situs LOAD_ATTR/LOAD_METHOD (CodeObject.inline_cache): situs mengingat
+kelas yang sudah dilihat beserta metode hasil resolusinya, gugur saat metode kelas
+berubah (MorphClass.epoch), dan situs megamorfik tetap memberi hasil yang benar.
+"""
+import contextlib
+import io
+
+from ivm.core.structs import MorphClass
+from ivm.vms.standard_vm import StandardVM, INLINE_CACHE_MAX_CLASSES
+
+HEWAN = """
+kelas Hewan maka
+    fungsi suara() maka
+        kembalikan "..."
+    akhir
+    fungsi bicara() maka
+        kembalikan ini.suara()
+    akhir
+akhir
+kelas Kucing warisi Hewan maka
+    fungsi suara() maka
+        kembalikan "meong"
+    akhir
+akhir
+kelas Anjing warisi Hewan maka
+akhir
+fungsi panggil(h) maka
+    kembalikan h.bicara()
+akhir
+"""
+
+def jalankan_vm(kompilasi, source):
+    vm = StandardVM(bytecode_cache=False)
+    vm.load(kompilasi(source))
+    keluaran = io.StringIO()
+    with contextlib.redirect_stdout(keluaran):
+        vm.run()
+    return vm, keluaran.getvalue()
+
+def lanjutkan(vm, kompilasi, source):
+    """Jalankan program lain di VM yang sama (globals dipertahankan)."""
+    vm.load(kompilasi(source))
+    keluaran = io.StringIO()
+    with contextlib.redirect_stdout(keluaran):
+        vm.run()
+    return keluaran.getvalue()
+
+def test_situs_polimorfik_mengingat_kelas_pemilik_metode(kompilasi_morph):
+    vm, keluaran = jalankan_vm(kompilasi_morph, HEWAN + """
+selama h dari [Kucing(), Anjing(), Kucing()] maka
+    tulis(panggil(h))
+akhir
+""")
+    assert keluaran.splitlines() == ["meong", "...", "meong"]
+    hewan, kucing, anjing = (vm.globals[n] for n in ("Hewan", "Kucing", "Anjing"))
+    entri = [e for e in vm.globals["panggil"].code.inline_cache.values() if e[1] == "bicara"]
+    assert len(entri) == 1
+    dilihat = [(k, pemilik) for k, _, pemilik in entri[0][2]]
+    assert dilihat == [(kucing, hewan), (anjing, hewan)]
+
+def test_perubahan_metode_membatalkan_cache(kompilasi_morph):
+    vm, keluaran = jalankan_vm(kompilasi_morph, HEWAN + "biar k = Kucing()\ntulis(panggil(k))\n")
+    assert keluaran.splitlines() == ["meong"]
+    kucing = vm.globals["Kucing"]
+    sebelum = MorphClass.epoch
+    kucing.methods["suara"] = vm.globals["Anjing"].method_table()["suara"][0]
+    assert MorphClass.epoch > sebelum
+    assert lanjutkan(vm, kompilasi_morph, "tulis(panggil(k))\n").splitlines() == ["..."]
+
+def test_situs_megamorfik_tetap_benar(kompilasi_morph):
+    kelas = "".join(f"""
+kelas K{i} maka
+    fungsi nilai() maka
+        kembalikan {i}
+    akhir
+akhir
+""" for i in range(INLINE_CACHE_MAX_CLASSES + 3))
+    daftar = ", ".join(f"K{i}()" for i in range(INLINE_CACHE_MAX_CLASSES + 3))
+    vm, keluaran = jalankan_vm(kompilasi_morph, kelas + f"""
+fungsi ambil(o) maka
+    kembalikan o.nilai()
+akhir
+biar total = 0
+selama putaran dari [1, 2] maka
+    selama o dari [{daftar}] maka
+        ubah total = total + ambil(o)
+    akhir
+akhir
+tulis(total)
+""")
+    n = INLINE_CACHE_MAX_CLASSES + 3
+    assert keluaran.splitlines() == [str(n * (n - 1))]
+    (entri,) = vm.globals["ambil"].code.inline_cache.values()
+    assert len(entri[2]) == INLINE_CACHE_MAX_CLASSES
+
+def test_properti_instance_menang_atas_metode(jalankan_morph):
+    keluaran = jalankan_morph("""
+kelas A maka
+    fungsi f() maka
+        kembalikan "metode"
+    akhir
+akhir
+fungsi ambil(o) maka
+    kembalikan o.f
+akhir
+biar a = A()
+tulis(ambil(a) == nil)
+ubah a.f = "properti"
+tulis(ambil(a))
+""")
+    assert keluaran.splitlines() == ["False", "properti"]
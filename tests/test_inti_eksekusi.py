@@ -0,0 +1,153 @@
+# tests/test_inti_eksekusi.py
+"""
+Inti eksekusi bersama (StandardVM._execute_until): run, load_module dan
+call_function_sync menjalankan frame bersarang lewat loop yang sama, mengikuti mode VM
+(fast_loop, legacy, profiler), dengan instruction_count dan call_stack yang konsisten.
+"""
+import pytest
+
+from ivm.core.profiler import OpcodeProfiler
+from ivm.vm_context import get_current_vm
+from ivm.vms.standard_vm import StandardVM
+
+MODUL = """
+biar nilai = 41
+fungsi tambah_satu(x) maka
+    kembalikan x + 1
+akhir
+"""
+
+MODE = [
+    pytest.param({"fast_loop": True}, id="fast"),
+    pytest.param({"fast_loop": False}, id="legacy"),
+    pytest.param({"profiler": OpcodeProfiler()}, id="profiler"),
+]
+
+@pytest.fixture
+def pemanggil():
+    """Builtin Python yang memanggil balik fungsi Morph lewat call_function_sync."""
+    catatan = []
+    def panggil(fungsi, *args):
+        vm = get_current_vm()
+        kedalaman = len(vm.call_stack)
+        globals_awal = vm.globals
+        try:
+            return vm.call_function_sync(fungsi, list(args))
+        except Exception as e:
+            catatan.append(type(e).__name__)
+            raise
+        finally:
+            catatan.append(len(vm.call_stack) == kedalaman and vm.globals is globals_awal)
+    panggil.catatan = catatan
+    return panggil
+
+@pytest.mark.parametrize("opsi", MODE)
+def test_call_function_sync_mengembalikan_nilai(jalankan_morph, pemanggil, opsi):
+    keluaran = jalankan_morph("""
+fungsi kali(a, b) maka
+    kembalikan a * b
+akhir
+fungsi luar(x) maka
+    kembalikan PANGGIL(kali, x, x) + 1
+akhir
+tulis(PANGGIL(kali, 6, 7))
+tulis(PANGGIL(luar, 3))
+""", globals_tambahan={"PANGGIL": pemanggil}, **opsi)
+    assert keluaran.splitlines() == ["42", "10"]
+    assert pemanggil.catatan == [True, True, True]
+
+@pytest.mark.parametrize("opsi", MODE)
+def test_call_function_sync_meneruskan_error(jalankan_morph, pemanggil, opsi):
+    keluaran = jalankan_morph("""
+fungsi bagi(a, b) maka
+    biar sisa = [1, 2, 3]
+    kembalikan a / b
+akhir
+coba
+    PANGGIL(bagi, 1, 0)
+tangkap e
+    tulis("tertangkap")
+akhir
+tulis(PANGGIL(bagi, 6, 3))
+""", globals_tambahan={"PANGGIL": pemanggil}, **opsi)
+    assert keluaran.splitlines() == ["tertangkap", "2.0"]
+    # Exception Python diteruskan apa adanya, frame yang gagal sudah dibuang
+    assert pemanggil.catatan == ["ZeroDivisionError", True, True]
+
+@pytest.mark.parametrize("opsi", MODE)
+def test_lemparkan_tidak_unwinding_melewati_pemanggil_python(jalankan_morph, pemanggil, opsi):
+    keluaran = jalankan_morph("""
+fungsi gagal(x) maka
+    lemparkan "gagal " + x
+akhir
+fungsi luar() maka
+    coba
+        PANGGIL(gagal, "a")
+        tulis("tidak tercapai")
+    tangkap e
+        tulis(e["pesan"])
+    akhir
+akhir
+luar()
+""", globals_tambahan={"PANGGIL": pemanggil}, **opsi)
+    assert keluaran.splitlines() == ["gagal a"]
+    assert pemanggil.catatan == ["LemparanMorph", True]
+
+@pytest.mark.parametrize("opsi", MODE)
+@pytest.mark.parametrize("isi, harapan", [
+    ('lemparkan "rusak di modul"\n', ["ErrorManual", "rusak di modul"]),
+    ("biar a = 1 / 0\n", ["ErrorModul", "division by zero"]),
+], ids=["lemparkan", "error_python"])
+def test_error_modul_ditangkap_pengimpor(jalankan_morph, tmp_path, opsi, isi, harapan):
+    modul = tmp_path / "rusak.fox"
+    modul.write_text("biar a = 1\n" + isi, encoding="utf-8")
+    keluaran = jalankan_morph(f"""
+coba
+    ambil_semua "{modul.as_posix()}" sebagai R
+    tulis("tidak tercapai")
+tangkap e
+    tulis(e["jenis"])
+    tulis(e["pesan"])
+akhir
+tulis("setelah")
+""", **opsi)
+    assert keluaran.splitlines() == harapan + ["setelah"]
+
+@pytest.mark.parametrize("opsi", MODE)
+def test_load_module_lewat_inti_yang_sama(jalankan_morph, tmp_path, opsi):
+    modul = tmp_path / "modul.fox"
+    modul.write_text(MODUL, encoding="utf-8")
+    keluaran = jalankan_morph(f"""
+ambil_semua "{modul.as_posix()}" sebagai M
+ambil_semua "{modul.as_posix()}" sebagai M2
+tulis(M.tambah_satu(M.nilai))
+tulis(M2.nilai)
+""", **opsi)
+    assert keluaran.splitlines() == ["42", "41"]
+
+def test_error_di_modul_menjadi_error_modul(jalankan_morph, tmp_path):
+    modul = tmp_path / "rusak.fox"
+    modul.write_text("biar a = 1 / 0\n", encoding="utf-8")
+    with pytest.raises(RuntimeError, match="ErrorModul") as info:
+        jalankan_morph(f'ambil_semua "{modul.as_posix()}" sebagai R\n')
+    assert "division by zero" in str(info.value)
+
+def test_instruction_count_berlanjut_di_modul(kompilasi_morph, tmp_path):
+    modul = tmp_path / "modul.fox"
+    modul.write_text(MODUL, encoding="utf-8")
+    sumber = f'ambil_semua "{modul.as_posix()}" sebagai M\nbiar x = M.nilai\n'
+
+    def hitung(max_instructions=50_000_000):
+        vm = StandardVM(bytecode_cache=False, max_instructions=max_instructions)
+        vm.load(kompilasi_morph(sumber))
+        vm.run()
+        return vm.instruction_count
+
+    total = hitung()
+    utama = len(kompilasi_morph(sumber).instructions)
+    # Instruksi modul ikut terhitung di penghitung yang sama dengan program utama
+    assert total > utama
+    # ...sehingga batas instruksi juga berlaku di dalam modul (program utama tanpa
+    # lompatan sendiri tidak pernah melewati `utama` instruksi)
+    with pytest.raises(RuntimeError, match="Instruction limit exceeded"):
+        hitung(max_instructions=utama + 1)
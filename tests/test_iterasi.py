@@ -0,0 +1,154 @@
+# tests/test_iterasi.py
+"""
+`selama x dari ...` (GET_ITER/FOR_ITER) atas daftar, teks, kamus, bytes dan rentang,
+termasuk badan loop yang memakai jodohkan, coba, berhenti dan lanjutkan. Setiap program
+dijalankan pada -O0 dan -O2.
+"""
+import pytest
+
+LEVEL = pytest.mark.parametrize("optimasi", [0, 2])
+
+@LEVEL
+@pytest.mark.parametrize("sumber, harapan", [
+    ('[10, 20, 30]', ["10", "20", "30"]),
+    ('"abc"', ["a", "b", "c"]),
+    ('{"kunci": 1}', ["kunci"]),
+    ('rentang(3)', ["0", "1", "2"]),
+    ('rentang(10, 0, -4)', ["10", "6", "2"]),
+    ('[]', []),
+    ('""', []),
+])
+def test_sumber_iterasi(jalankan_morph, optimasi, sumber, harapan):
+    keluaran = jalankan_morph(f"""
+selama x dari {sumber} maka
+    tulis(x)
+akhir
+tulis("selesai")
+""", optimasi=optimasi)
+    assert keluaran.splitlines() == harapan + ["selesai"]
+
+@LEVEL
+def test_sumber_di_fungsi_dan_loop_bersarang(jalankan_morph, optimasi):
+    keluaran = jalankan_morph("""
+fungsi pasangan(a, b) maka
+    biar hasil = ""
+    selama x dari a maka
+        selama y dari b maka
+            ubah hasil = hasil + x + y + " "
+        akhir
+    akhir
+    kembalikan hasil
+akhir
+tulis(pasangan(["a", "b"], "xy"))
+""", optimasi=optimasi)
+    assert keluaran.splitlines() == ["ax ay bx by "]
+
+@LEVEL
+def test_berhenti_dan_lanjutkan(jalankan_morph, optimasi):
+    keluaran = jalankan_morph("""
+fungsi f() maka
+    selama i dari rentang(10) maka
+        jika i % 2 == 0 maka
+            lanjutkan
+        akhir
+        jika i > 6 maka
+            berhenti
+        akhir
+        tulis(i)
+    akhir
+    tulis("keluar")
+akhir
+f()
+selama c dari "abcd" maka
+    jika c == "c" maka
+        berhenti
+    akhir
+    tulis(c)
+akhir
+""", optimasi=optimasi)
+    assert keluaran.splitlines() == ["1", "3", "5", "keluar", "a", "b"]
+
+@LEVEL
+def test_berhenti_dari_loop_dalam_tidak_mengganggu_loop_luar(jalankan_morph, optimasi):
+    keluaran = jalankan_morph("""
+selama x dari [1, 2] maka
+    selama y dari [10, 20, 30] maka
+        jika y == 20 maka
+            berhenti
+        akhir
+        tulis(x * y)
+    akhir
+akhir
+""", optimasi=optimasi)
+    assert keluaran.splitlines() == ["10", "20"]
+
+@LEVEL
+def test_coba_di_badan_loop(jalankan_morph, optimasi):
+    keluaran = jalankan_morph("""
+fungsi f(daftar) maka
+    selama x dari daftar maka
+        coba
+            tulis(10 / x)
+        tangkap e
+            tulis("gagal")
+            lanjutkan
+        akhir
+        tulis("ok")
+    akhir
+akhir
+f([2, 0, 5])
+""", optimasi=optimasi)
+    assert keluaran.splitlines() == ["5.0", "ok", "gagal", "2.0", "ok"]
+
+@LEVEL
+def test_error_dari_loop_ditangkap_di_luar(jalankan_morph, optimasi):
+    keluaran = jalankan_morph("""
+fungsi f() maka
+    coba
+        selama x dari [1, 2, 3] maka
+            jika x == 2 maka
+                lemparkan "stop"
+            akhir
+            tulis(x)
+        akhir
+    tangkap e
+        tulis("tangkap " + e["pesan"])
+    akhir
+    selama x dari [7, 8] maka
+        tulis(x)
+    akhir
+akhir
+f()
+""", optimasi=optimasi)
+    assert keluaran.splitlines() == ["1", "tangkap stop", "7", "8"]
+
+@LEVEL
+def test_jodohkan_di_badan_loop(jalankan_morph, optimasi):
+    keluaran = jalankan_morph("""
+selama x dari [1, 2, 3, 4] maka
+    jodohkan x dengan
+    | 1 maka
+        tulis("satu")
+    | 3 maka
+        lanjutkan
+    | 4 maka
+        berhenti
+    | n maka
+        tulis(n * 100)
+    akhir
+    tulis("-")
+akhir
+""", optimasi=optimasi)
+    assert keluaran.splitlines() == ["satu", "-", "200", "-"]
+
+def test_sumber_tidak_bisa_diiterasi(jalankan_morph):
+    keluaran = jalankan_morph("""
+coba
+    selama x dari 5 maka
+        tulis(x)
+    akhir
+tangkap e
+    tulis("tangkap")
+akhir
+""")
+    assert keluaran.splitlines() == ["tangkap"]
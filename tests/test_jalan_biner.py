@@ -0,0 +1,115 @@
+# tests/test_jalan_biner.py
+"""
+jalan_biner (_jalan_biner_internal): error di dalam kode biner ditangani `coba` milik
+kode biner itu sendiri; hanya error tanpa handler di frame biner yang sampai ke `coba`
+pemanggil, dan handler frame pemanggil tidak ikut berubah.
+"""
+import pytest
+
+from ivm.core.opcodes import Op
+from ivm.core.structs import CodeObject
+from ivm.core.serializer import serialize_mvm
+
+PEMANGGIL = """
+fungsi jalankan(data) maka
+    coba
+        _jalan_biner_internal(data, [])
+        tulis("luar selesai")
+    tangkap e
+        tulis("ditangkap luar")
+    akhir
+akhir
+jalankan(DATA)
+tulis("setelah")
+"""
+
+def test_coba_di_kode_biner_menangkap_errornya_sendiri(kompilasi_morph, jalankan_morph):
+    biner = kompilasi_morph("""
+biar hasil = "awal"
+coba
+    ubah hasil = tidak_ada()
+tangkap e
+    ubah hasil = "ditangkap dalam"
+akhir
+tulis(hasil)
+""")
+    keluaran = jalankan_morph(PEMANGGIL, globals_tambahan={"DATA": serialize_mvm(biner)})
+    assert keluaran.splitlines() == ["ditangkap dalam", "luar selesai", "setelah"]
+
+def test_coba_push_try_di_kode_biner(jalankan_morph):
+    # Bentuk bytecode self-hosted (greenfield): handler lewat PUSH_TRY/POP_TRY
+    biner = CodeObject(name="<biner>", instructions=[
+        (Op.PUSH_TRY, 5),
+        (Op.LOAD_VAR, "tidak_ada"),
+        (Op.CALL, 0),
+        (Op.POP_TRY,),
+        (Op.JMP, 8),
+        (Op.POP,),
+        (Op.PUSH_CONST, "ditangkap dalam"),
+        (Op.PRINT, 1),
+        (Op.PUSH_CONST, None),
+        (Op.RET,),
+    ])
+    keluaran = jalankan_morph(PEMANGGIL, globals_tambahan={"DATA": serialize_mvm(biner)})
+    assert keluaran.splitlines() == ["ditangkap dalam", "luar selesai", "setelah"]
+
+def test_error_tanpa_handler_sampai_ke_pemanggil(kompilasi_morph, jalankan_morph):
+    biner = kompilasi_morph("""
+fungsi dalam() maka
+    kembali tidak_ada()
+akhir
+tulis("mulai")
+dalam()
+tulis("tidak tercapai")
+""")
+    keluaran = jalankan_morph(PEMANGGIL, globals_tambahan={"DATA": serialize_mvm(biner)})
+    assert keluaran.splitlines() == ["mulai", "ditangkap luar", "setelah"]
+
+def test_biner_bersarang_dalam_coba_pemanggil(kompilasi_morph, jalankan_morph):
+    # Error kedua setelah biner yang menangani errornya sendiri tetap ditangkap pemanggil
+    biner = kompilasi_morph("""
+coba
+    tidak_ada()
+tangkap e
+    tulis("dalam")
+akhir
+""")
+    keluaran = jalankan_morph("""
+fungsi jalankan(data) maka
+    coba
+        _jalan_biner_internal(data, [])
+        tidak_ada_juga()
+    tangkap e
+        tulis("luar")
+    akhir
+akhir
+jalankan(DATA)
+""", globals_tambahan={"DATA": serialize_mvm(biner)})
+    assert keluaran.splitlines() == ["dalam", "luar"]
+
+@pytest.mark.parametrize("fast_loop", [True, False])
+def test_lemparkan_tanpa_handler_sampai_ke_pemanggil_dengan_nilainya(kompilasi_morph, jalankan_morph, fast_loop):
+    # THROW tidak boleh unwinding melewati frame biner ke frame pemanggil jalan_biner
+    biner = kompilasi_morph("""
+fungsi dalam() maka
+    lemparkan "boom"
+akhir
+tulis("mulai")
+dalam()
+tulis("tidak tercapai")
+""")
+    keluaran = jalankan_morph("""
+fungsi jalankan(data) maka
+    coba
+        _jalan_biner_internal(data, [])
+        tulis("luar selesai")
+    tangkap e
+        tulis("ditangkap luar")
+        tulis(e["pesan"])
+        tulis(e["jenis"])
+    akhir
+akhir
+jalankan(DATA)
+tulis("setelah")
+""", globals_tambahan={"DATA": serialize_mvm(biner)}, fast_loop=fast_loop)
+    assert keluaran.splitlines() == ["mulai", "ditangkap luar", "boom", "ErrorManual", "setelah"]
@@ -0,0 +1,113 @@
+# tests/test_jodohkan.py
+"""
+jodohkan: subjek di-pop di setiap jalur kasus yang cocok, sehingga badan kasus berjalan
+pada kedalaman stack dasar. Di dalam `selama ... dari` iterator loop harus tetap berada
+di puncak stack untuk FOR_ITER berikutnya dan untuk handler `coba` (iter_depth).
+"""
+import pytest
+
+TIPE = "tipe Bentuk = Titik | Lingkaran(r) | Kotak(p, l)\n"
+
+@pytest.mark.parametrize("optimasi", [0, 2])
+def test_wildcard_di_loop_modul(jalankan_morph, optimasi):
+    keluaran = jalankan_morph("""
+selama x dari [1, 2, 3] maka
+    jodohkan x dengan
+    | 1 maka
+        tulis("satu")
+    | _ maka
+        tulis("lain")
+    akhir
+akhir
+tulis("selesai")
+""", optimasi=optimasi)
+    assert keluaran.splitlines() == ["satu", "lain", "lain", "selesai"]
+
+@pytest.mark.parametrize("optimasi", [0, 2])
+def test_ikatan_variabel_di_loop_fungsi(jalankan_morph, optimasi):
+    keluaran = jalankan_morph("""
+fungsi f(daftar) maka
+    biar total = 0
+    selama x dari daftar maka
+        jodohkan x dengan
+        | 0 maka
+            tulis("nol")
+        | y maka
+            ubah total = total + y
+        akhir
+    akhir
+    kembalikan total
+akhir
+tulis(f([0, 4, 5, 0, 6]))
+""", optimasi=optimasi)
+    assert keluaran.splitlines() == ["nol", "nol", "15"]
+
+def test_varian_dengan_dan_tanpa_ikatan_di_loop(jalankan_morph):
+    keluaran = jalankan_morph(TIPE + """
+fungsi luas(daftar) maka
+    selama b dari daftar maka
+        jodohkan b dengan
+        | Titik maka
+            tulis("titik")
+        | Lingkaran(r) maka
+            tulis(r * r * 3)
+        | Kotak(p, l) maka
+            tulis(p * l)
+        akhir
+    akhir
+akhir
+luas([Titik(), Kotak(2, 3), Lingkaran(1), Titik()])
+""")
+    assert keluaran.splitlines() == ["titik", "6", "3", "titik"]
+
+def test_berhenti_dan_lanjutkan_dari_badan_kasus(jalankan_morph):
+    keluaran = jalankan_morph("""
+fungsi f() maka
+    selama x dari [1, 2, 3, 4, 5] maka
+        jodohkan x dengan
+        | 2 maka
+            lanjutkan
+        | 4 maka
+            berhenti
+        | y maka
+            tulis(y)
+        akhir
+    akhir
+    tulis("keluar")
+akhir
+f()
+""")
+    assert keluaran.splitlines() == ["1", "3", "keluar"]
+
+def test_coba_di_badan_kasus_dalam_loop(jalankan_morph):
+    keluaran = jalankan_morph("""
+fungsi f() maka
+    selama x dari [1, 2, 3] maka
+        jodohkan x dengan
+        | _ maka
+            coba
+                jika x == 2 maka
+                    lemparkan "dua"
+                akhir
+                tulis(x)
+            tangkap e
+                tulis("tangkap " + e["pesan"])
+            akhir
+        akhir
+    akhir
+akhir
+f()
+""")
+    assert keluaran.splitlines() == ["1", "tangkap dua", "3"]
+
+def test_tanpa_kasus_cocok(jalankan_morph):
+    keluaran = jalankan_morph("""
+selama x dari ["a", "b"] maka
+    jodohkan x dengan
+    | "b" maka
+        tulis("b")
+    akhir
+akhir
+tulis("selesai")
+""")
+    assert keluaran.splitlines() == ["b", "selesai"]
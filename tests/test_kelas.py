@@ -0,0 +1,95 @@
+# tests/test_kelas.py
+"""
+MorphClass.epoch: hanya naik saat methods/superclass kelas yang sudah jadi berubah,
+bukan saat kelas baru dibuat; method_table dan inline cache mengikuti perubahannya.
+"""
+from ivm.core.structs import MorphClass
+
+def test_membuat_kelas_tidak_menaikkan_epoch():
+    sebelum = MorphClass.epoch
+    dasar = MorphClass(name="Dasar", methods={"a": 1})
+    MorphClass(name="Turunan", methods={"b": 2}, superclass=dasar)
+    assert MorphClass.epoch == sebelum
+
+def test_perubahan_setelah_dibuat_menaikkan_epoch():
+    dasar = MorphClass(name="Dasar", methods={"a": 1})
+    turunan = MorphClass(name="Turunan", methods={"b": 2}, superclass=dasar)
+    assert turunan.method_table() == {"a": (1, dasar), "b": (2, turunan)}
+
+    sebelum = MorphClass.epoch
+    dasar.methods["a"] = 10
+    assert MorphClass.epoch > sebelum
+    assert turunan.method_table()["a"] == (10, dasar)
+
+    sebelum = MorphClass.epoch
+    turunan.superclass = None
+    assert MorphClass.epoch > sebelum
+    assert turunan.method_table() == {"b": (2, turunan)}
+
+    sebelum = MorphClass.epoch
+    turunan.methods = {"c": 3}
+    assert MorphClass.epoch > sebelum
+    assert turunan.method_table() == {"c": (3, turunan)}
+
+def test_definisi_kelas_di_program_tidak_menaikkan_epoch(jalankan_morph):
+    program = """
+kelas Hewan maka
+    fungsi suara() maka
+        kembalikan "..."
+    akhir
+    fungsi bicara() maka
+        kembalikan ini.suara()
+    akhir
+akhir
+kelas Kucing warisi Hewan maka
+    fungsi suara() maka
+        kembalikan "meong"
+    akhir
+akhir
+biar daftar = [Hewan(), Kucing(), Hewan()]
+selama h dari daftar maka
+    tulis(h.bicara())
+akhir
+"""
+    sebelum = MorphClass.epoch
+    keluaran = jalankan_morph(program)
+    assert keluaran.splitlines() == ["...", "meong", "..."]
+    assert MorphClass.epoch == sebelum
+
+def test_tabel_metode_rantai_warisan_dalam(jalankan_morph):
+    # method_table datar: metode dari kakek, override di tengah, dan induk.* ke kelas pemilik
+    keluaran = jalankan_morph("""
+kelas A maka
+    fungsi nama() maka
+        kembalikan "A"
+    akhir
+    fungsi salam() maka
+        kembalikan "halo " + ini.nama()
+    akhir
+akhir
+kelas B warisi A maka
+    fungsi nama() maka
+        kembalikan "B<" + induk.nama() + ">"
+    akhir
+akhir
+kelas C warisi B maka
+akhir
+kelas D warisi C maka
+    fungsi nama() maka
+        kembalikan "D<" + induk.nama() + ">"
+    akhir
+akhir
+selama o dari [A(), B(), C(), D()] maka
+    tulis(o.salam())
+akhir
+""")
+    assert keluaran.splitlines() == ["halo A", "halo B<A>", "halo B<A>", "halo D<B<A>>"]
+
+def test_tabel_turunan_mengikuti_perubahan_kelas_dasar():
+    dasar = MorphClass(name="Dasar", methods={"a": 1, "b": 2})
+    tengah = MorphClass(name="Tengah", methods={"b": 20}, superclass=dasar)
+    bawah = MorphClass(name="Bawah", methods={}, superclass=tengah)
+    assert bawah.method_table() == {"a": (1, dasar), "b": (20, tengah)}
+    dasar.methods["c"] = 3
+    del tengah.methods["b"]
+    assert bawah.method_table() == {"a": (1, dasar), "b": (2, dasar), "c": (3, dasar)}
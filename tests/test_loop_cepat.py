@@ -0,0 +1,112 @@
+# tests/test_loop_cepat.py
+"""
+_run_fast (state frame di variabel lokal) harus berperilaku sama dengan loop lama
+(fast_loop=False): keluaran, error dan jumlah instruksi, termasuk di sekitar
+pergantian frame (CALL/RET/YIELD/RESUME/unwinding).
+"""
+import contextlib
+import io
+
+import pytest
+
+from ivm.vms.standard_vm import StandardVM
+
+PROGRAM = {
+    "rekursi": """
+fungsi fib(n) maka
+    jika n < 2 maka
+        kembalikan n
+    akhir
+    kembalikan fib(n - 1) + fib(n - 2)
+akhir
+tulis(fib(15))
+""",
+    "closure_dan_kelas": """
+fungsi pembuat(awal) maka
+    biar n = awal
+    fungsi tambah() maka
+        ubah n = n + 1
+        kembalikan n
+    akhir
+    kembalikan tambah
+akhir
+kelas Hitung maka
+    fungsi inisiasi(f) maka
+        ubah ini.f = f
+    akhir
+    fungsi dua_kali() maka
+        ini.f()
+        kembalikan ini.f()
+    akhir
+akhir
+biar h = Hitung(pembuat(10))
+tulis(h.dua_kali())
+tulis(h.dua_kali())
+""",
+    "generator": """
+fungsi angka(n) maka
+    biar i = 0
+    selama i < n maka
+        bekukan(i * i)
+        ubah i = i + 1
+    akhir
+akhir
+biar total = 0
+selama x dari angka(6) maka
+    ubah total = total + x
+akhir
+tulis(total)
+""",
+    "unwinding": """
+fungsi dalam(x) maka
+    jika x == 3 maka
+        lemparkan "tiga"
+    akhir
+    kembalikan x
+akhir
+selama i dari [1, 2, 3, 4] maka
+    coba
+        tulis(dalam(i))
+    tangkap e
+        tulis(e["pesan"])
+    akhir
+akhir
+""",
+}
+
+HARAPAN = {
+    "rekursi": "610\n",
+    "closure_dan_kelas": "12\n14\n",
+    "generator": "55\n",
+    "unwinding": "1\n2\ntiga\n4\n",
+}
+
+def jalankan(code, fast_loop):
+    vm = StandardVM(fast_loop=fast_loop, bytecode_cache=False)
+    vm.load(code)
+    keluaran = io.StringIO()
+    with contextlib.redirect_stdout(keluaran):
+        vm.run()
+    return keluaran.getvalue(), vm.instruction_count
+
+@pytest.mark.parametrize("nama", sorted(PROGRAM))
+def test_sama_dengan_loop_lama(kompilasi_morph, nama):
+    code = kompilasi_morph(PROGRAM[nama])
+    cepat = jalankan(code, True)
+    lama = jalankan(code, False)
+    assert cepat == lama
+    assert cepat[0] == HARAPAN[nama]
+
+def test_error_tak_tertangkap_sama(kompilasi_morph):
+    code = kompilasi_morph("""
+fungsi f(x) maka
+    kembalikan x + nil
+akhir
+f(1)
+""")
+    pesan = []
+    for fast_loop in (True, False):
+        with pytest.raises(RuntimeError) as info:
+            jalankan(code, fast_loop)
+        pesan.append(str(info.value))
+    assert pesan[0] == pesan[1]
@@ -0,0 +1,60 @@
+# tests/test_modul_native.py
+"""
+Registry modul native per VM (StandardVM._resolve_native): modul Python internal dan
+"_backend" diresolusi sekali per VM lalu dipakai ulang di setiap IMPORT/IMPORT_NATIVE;
+hanya hot_reload=True yang memuat ulang modul setiap kali.
+"""
+import importlib
+
+import pytest
+
+from ivm.core.opcodes import Op
+from ivm.vms.standard_vm import StandardVM, INTERNAL_PY_MODULES
+
+def impor_dua_kali(vm, op, nama):
+    vm.load([(op, nama), (Op.STORE_VAR, "a"), (op, nama), (Op.STORE_VAR, "b"), (Op.HALT,)])
+    vm.run()
+    return vm.globals["a"], vm.globals["b"]
+
+@pytest.fixture
+def hitung_reload(monkeypatch):
+    dimuat_ulang = []
+    asli = importlib.reload
+    def reload(modul):
+        dimuat_ulang.append(modul.__name__)
+        return asli(modul)
+    monkeypatch.setattr(importlib, "reload", reload)
+    return dimuat_ulang
+
+@pytest.mark.parametrize("nama", INTERNAL_PY_MODULES)
+def test_modul_internal_tidak_dimuat_ulang(hitung_reload, nama):
+    vm = StandardVM(bytecode_cache=False)
+    a, b = impor_dua_kali(vm, Op.IMPORT, nama)
+    assert a is b and a.__name__ == nama
+    assert hitung_reload == []
+
+def test_backend_satu_per_vm(hitung_reload):
+    a, b = impor_dua_kali(StandardVM(bytecode_cache=False), Op.IMPORT_NATIVE, "_backend")
+    c, _ = impor_dua_kali(StandardVM(bytecode_cache=False), Op.IMPORT_NATIVE, "_backend")
+    assert a is b and a is not c
+    assert hitung_reload == []
+
+def test_modul_python_biasa_di_cache(hitung_reload):
+    vm = StandardVM(bytecode_cache=False)
+    a, b = impor_dua_kali(vm, Op.IMPORT_NATIVE, "math")
+    assert a is b and vm.native_modules["math"] is a
+
+def test_hot_reload_memuat_ulang_setiap_impor(hitung_reload):
+    nama = INTERNAL_PY_MODULES[0]
+    vm = StandardVM(bytecode_cache=False, hot_reload=True)
+    impor_dua_kali(vm, Op.IMPORT, nama)
+    assert hitung_reload.count(nama) >= 1
+    a, b = impor_dua_kali(vm, Op.IMPORT_NATIVE, "_backend")
+    assert a is not b
+
+def test_modul_tidak_ada():
+    vm = StandardVM(bytecode_cache=False)
+    vm.load([(Op.IMPORT_NATIVE, "modul_yang_tidak_ada"), (Op.HALT,)])
+    with pytest.raises(RuntimeError, match="Gagal meminjam modul Python 'modul_yang_tidak_ada'"):
+        vm.run()
+    assert "modul_yang_tidak_ada" not in vm.native_modules
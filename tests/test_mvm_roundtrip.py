@@ -0,0 +1,138 @@
+# tests/test_mvm_roundtrip.py
+"""
+Round-trip format .mvm v2 (ivm/core/serializer.py <-> ivm/core/deserializer.py).
+
+Setiap file .fox di bawah greenfield/ dikompilasi dengan ivm/compiler.py, diserialisasi,
+dibaca kembali (lazy dan tidak), lalu dibandingkan field demi field dengan CodeObject
+asli, rekursif ke CodeObject fungsi bersarang. File yang memang belum bisa di-lex/di-parse
+oleh bootstrap dicatat di TIDAK_TERURAI; file lain yang gagal membuat tes gagal.
+"""
+import glob
+import mmap
+import os
+import struct
+
+import pytest
+
+from transisi.lx import Leksikal
+from transisi.crusher import Pengurai
+from ivm.compiler import Compiler
+from ivm.core.structs import CodeObject
+from ivm.core.serializer import serialize_mvm
+from ivm.core import deserializer
+from ivm.core.deserializer import deserialize_mvm, muat_mvm
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FIELD = ("name", "filename", "is_generator", "arg_names", "local_names", "free_vars",
+         "cell_vars", "exception_table", "line_table", "instructions")
+
+# Sintaks self-hosted yang belum dikenal Leksikal/Pengurai bootstrap.
+TIDAK_TERURAI = {
+    "greenfield/cotc/compiler/kompiler.fox",
+    "greenfield/cotc/nursery_native.fox",
+    "greenfield/cotc/pairing/alokasi/arena.fox",
+    "greenfield/cotc/pairing/alokasi/buffer_ganda.fox",
+    "greenfield/cotc/pairing/alokasi/lemari.fox",
+    "greenfield/cotc/pairing/alokasi/penunjuk.fox",
+    "greenfield/examples/daemon.fox",
+}
+
+SEMUA = sorted(
+    os.path.relpath(path, ROOT).replace(os.sep, "/")
+    for path in glob.glob(os.path.join(ROOT, "greenfield", "**", "*.fox"), recursive=True)
+)
+
+def urai(path: str):
+    with open(os.path.join(ROOT, path), "r", encoding="utf-8") as f:
+        source = f.read()
+    tokens, errors = Leksikal(source, nama_file=path).buat_token()
+    if errors:
+        return None
+    try:
+        return Pengurai(tokens).urai() or None
+    except Exception:
+        return None
+
+def bandingkan(asli: CodeObject, hasil: CodeObject, jalur: str):
+    """Daftar perbedaan (teks) antara dua CodeObject, rekursif ke konstanta CodeObject."""
+    beda = []
+    for nama in FIELD[:-1]:
+        if getattr(asli, nama) != getattr(hasil, nama):
+            beda.append(f"{jalur}.{nama}")
+    if len(asli.instructions) != len(hasil.instructions):
+        return beda + [f"{jalur}.instructions (panjang)"]
+    for pc, (a, b) in enumerate(zip(asli.instructions, hasil.instructions)):
+        if len(a) != len(b) or a[0] != b[0]:
+            beda.append(f"{jalur}@{pc}")
+            continue
+        for x, y in zip(a[1:], b[1:]):
+            if isinstance(x, CodeObject) and isinstance(y, CodeObject):
+                beda.extend(bandingkan(x, y, f"{jalur}/{x.name}"))
+            elif type(x) is not type(y) or x != y:
+                beda.append(f"{jalur}@{pc}")
+    return beda
+
+@pytest.mark.parametrize("lazy", [True, False], ids=["lazy", "penuh"])
+def test_image_terpotong_ditolak_saat_dimuat(kompilasi_morph, lazy):
+    image = serialize_mvm(kompilasi_morph("fungsi f(x) maka\n    kembalikan x + 1\nakhir\ntulis(f(1))\n"))
+    for potong in (1, 5, len(image) // 2):
+        with pytest.raises((ValueError, IndexError, struct.error)):
+            deserialize_mvm(image[:len(image) - potong], lazy=lazy)
+
+def test_daftar_tidak_terurai_masih_akurat():
+    assert TIDAK_TERURAI <= set(SEMUA)
+    assert {path for path in SEMUA if urai(path) is None} == TIDAK_TERURAI
+
+@pytest.mark.parametrize("lazy", [True, False], ids=["lazy", "penuh"])
+@pytest.mark.parametrize("path", [p for p in SEMUA if p not in TIDAK_TERURAI])
+def test_round_trip(path, lazy):
+    ast = urai(path)
+    assert ast is not None, f"{path} gagal di-lex/di-parse"
+    code = Compiler().compile(ast, filename=path)
+    hasil = deserialize_mvm(serialize_mvm(code), filename=path, lazy=lazy)
+    assert bandingkan(code, hasil, code.name) == []
+
+@pytest.fixture
+def mmap_dibuka(monkeypatch):
+    """Daftar mmap yang dibuka muat_mvm selama tes."""
+    dibuka = []
+    class PetaTercatat(mmap.mmap):
+        def __init__(self, *args, **kwargs):
+            dibuka.append(self)
+    monkeypatch.setattr(deserializer.mmap, "mmap", PetaTercatat)
+    return dibuka
+
+def semua_kode(code):
+    yield code
+    for ins in code.instructions:
+        for operand in ins[1:]:
+            if isinstance(operand, CodeObject):
+                yield from semua_kode(operand)
+
+def test_mmap_ditutup_setelah_semua_fungsi_di_decode(tmp_path, kompilasi_morph, mmap_dibuka):
+    path = tmp_path / "modul.mvm"
+    path.write_bytes(serialize_mvm(kompilasi_morph("""
+fungsi a() maka
+    fungsi b() maka
+        kembalikan 1
+    akhir
+    kembalikan b
+akhir
+fungsi c() maka
+    kembalikan 2
+akhir
+""")))
+    code = muat_mvm(str(path))
+    (peta,) = mmap_dibuka
+    assert not peta.closed
+    kode = list(semua_kode(code))
+    assert [k.name for k in kode[1:]] == ["a", "b", "c"]
+    assert peta.closed
+
+def test_mmap_langsung_ditutup_tanpa_lazy(tmp_path, kompilasi_morph, mmap_dibuka):
+    path = tmp_path / "modul.mvm"
+    path.write_bytes(serialize_mvm(kompilasi_morph("fungsi f() maka\n    kembalikan 1\nakhir\n")))
+    code = muat_mvm(str(path), lazy=False)
+    assert mmap_dibuka[0].closed
+    assert [k.name for k in semua_kode(code)][1:] == ["f"]
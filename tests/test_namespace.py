@@ -0,0 +1,94 @@
+# tests/test_namespace.py
+"""
+ModuleGlobals: [], get() dan `in` melihat dict modul lalu lapisan builtins bersama, dan
+hasilnya tidak bergantung pada pembacaan sebelumnya.
+"""
+import copy
+
+import pytest
+
+from ivm.core.structs import ModuleGlobals
+from ivm.stdlib.namespace import BUILTINS, buat_globals_modul
+
+def test_builtin_terlihat_konsisten_sebelum_dan_sesudah_dibaca():
+    g = buat_globals_modul()
+    sebelum = ("tulis" in g, g.get("tulis"), len(g), list(g))
+    assert g["tulis"] is BUILTINS["tulis"]
+    sesudah = ("tulis" in g, g.get("tulis"), len(g), list(g))
+    assert sebelum == sesudah == (True, BUILTINS["tulis"], 0, [])
+
+def test_nama_tidak_ada():
+    g = buat_globals_modul()
+    assert "tidak_ada" not in g
+    assert g.get("tidak_ada") is None
+    assert g.get("tidak_ada", 5) == 5
+    with pytest.raises(KeyError):
+        g["tidak_ada"]
+
+def test_shadow_builtin_hanya_di_modul_itu():
+    a, b = buat_globals_modul(), buat_globals_modul()
+    a["tulis"] = "milik a"
+    assert a["tulis"] == a.get("tulis") == "milik a"
+    assert b["tulis"] is BUILTINS["tulis"]
+    assert list(a) == ["tulis"] and list(b) == []
+    del a["tulis"]
+    assert a["tulis"] is BUILTINS["tulis"]
+
+def test_baca_builtin_tidak_lewat_missing(monkeypatch, jalankan_morph):
+    def gagal(self, key):
+        raise AssertionError(f"__missing__ dipanggil untuk {key!r}")
+    monkeypatch.setattr(ModuleGlobals, "__missing__", gagal)
+    g = buat_globals_modul()
+    assert g.get("tulis") is BUILTINS["tulis"]
+    keluaran = jalankan_morph("""
+fungsi f() maka
+    kembalikan panjang("abc")
+akhir
+tulis(f())
+""")
+    assert keluaran.splitlines() == ["3"]
+
+def test_deepcopy_berbagi_lapisan_builtins():
+    g = buat_globals_modul()
+    g["x"] = [1, 2]
+    salinan = copy.deepcopy(g)
+    assert salinan.builtins is g.builtins
+    assert salinan["x"] == [1, 2] and salinan["x"] is not g["x"]
+    assert "panjang" in salinan
+
+def test_program_memakai_dan_men_shadow_builtin(jalankan_morph):
+    keluaran = jalankan_morph("""
+tulis(panjang("abc"))
+fungsi panjang(x) maka
+    kembalikan 99
+akhir
+tulis(panjang("abc"))
+""")
+    assert keluaran.splitlines() == ["3", "99"]
+
+@pytest.mark.parametrize("fast_loop", [True, False])
+def test_situs_load_var_melihat_global_dan_builtin_yang_diikat_ulang(jalankan_morph, fast_loop):
+    # Situs LOAD_VAR yang sama di baca() dieksekusi sebelum dan sesudah tiap pengikatan ulang
+    keluaran = jalankan_morph("""
+biar x = 1
+fungsi baca() maka
+    kembalikan panjang("abc") + x
+akhir
+tulis(baca())
+ubah x = 10
+tulis(baca())
+fungsi panjang(s) maka
+    kembalikan 100
+akhir
+tulis(baca())
+""", fast_loop=fast_loop)
+    assert keluaran.splitlines() == ["4", "13", "110"]
+
+def test_global_tidak_ada_tetap_error(jalankan_morph):
+    with pytest.raises(RuntimeError, match="Global 'tidak_ada' not found"):
+        jalankan_morph("""
+fungsi f() maka
+    kembalikan tidak_ada
+akhir
+f()
+""", fast_loop=False)
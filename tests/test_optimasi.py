@@ -0,0 +1,132 @@
+# tests/test_optimasi.py
+"""
+ivm/optimizer.py: program harus menghasilkan keluaran yang sama pada -O0 dan -O2.
+Program kecil dijalankan langsung di StandardVM; contoh greenfield dijalankan lewat
+`ivm.main --verifikasi-optimasi` (tanpa __foxcache__) yang membandingkan stdout,
+stderr dan kode keluar kedua level.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+from ivm.optimizer import LEVEL_MAKS
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROGRAM = {
+    "konstanta_dan_kode_mati": """
+biar skala = 60 * 60
+biar debug = salah
+jika debug maka
+    tulis("tidak pernah")
+akhir
+jika tidak (skala > 100) maka
+    tulis("salah")
+lain
+    tulis(skala - (2 * 4 + 1))
+akhir
+""",
+    "loop_berhenti_lanjutkan": """
+fungsi hitung(n) maka
+    biar total = 0
+    biar i = 0
+    selama benar maka
+        jika i >= n maka
+            berhenti
+        akhir
+        ubah i = i + 1
+        jika i % 3 == 0 maka
+            lanjutkan
+        akhir
+        ubah total = total + i
+    akhir
+    kembalikan total
+akhir
+tulis(hitung(100))
+""",
+    "selama_dari_jodohkan_coba": """
+fungsi f(daftar) maka
+    biar hasil = ""
+    selama x dari daftar maka
+        jodohkan x dengan
+        | 0 maka
+            lanjutkan
+        | 9 maka
+            berhenti
+        | n maka
+            coba
+                ubah hasil = hasil + "{10 / n} "
+            tangkap e
+                ubah hasil = hasil + "? "
+            akhir
+        akhir
+    akhir
+    kembalikan hasil
+akhir
+tulis(f([1, 0, 2, 4, 9, 5]))
+""",
+    "closure_generator_kelas": """
+fungsi pembuat(k) maka
+    fungsi kali(x) maka
+        kembalikan x * k
+    akhir
+    kembalikan kali
+akhir
+fungsi deret(n) maka
+    biar i = 0
+    selama i < n maka
+        bekukan(i)
+        ubah i = i + 1
+    akhir
+akhir
+kelas Titik maka
+    fungsi inisiasi(x) maka
+        ubah ini.x = x
+    akhir
+    fungsi geser(d) maka
+        kembalikan Titik(ini.x + d)
+    akhir
+akhir
+biar tiga = pembuat(3)
+selama v dari deret(4) maka
+    tulis(tiga(v))
+akhir
+tulis(Titik(1).geser(2).geser(3).x)
+""",
+    "error_dari_fungsi_ditangkap": """
+fungsi f(x) maka
+    biar y = x * 2
+    kembalikan y / 0
+akhir
+coba
+    f(1)
+tangkap e
+    tulis(e["jenis"])
+akhir
+""",
+}
+
+@pytest.mark.parametrize("nama", sorted(PROGRAM))
+def test_keluaran_sama_di_setiap_level(jalankan_morph, nama):
+    keluaran = [jalankan_morph(PROGRAM[nama], optimasi=level) for level in range(LEVEL_MAKS + 1)]
+    assert keluaran[0]
+    assert all(k == keluaran[0] for k in keluaran[1:])
+
+CONTOH = [
+    "kucing", "repro_jodohkan_scope", "tes_kompleks", "test_base64", "test_bitwise",
+    "test_hashable", "test_json", "test_pattern_matching", "test_struktur_lanjut",
+    "uji_aritmatika", "uji_closure_fix", "uji_closure_self",
+    "uji_eksepsi", "uji_logika", "uji_map_fungsi",
+]
+
+@pytest.mark.parametrize("nama", CONTOH)
+def test_verifikasi_optimasi_contoh_greenfield(nama):
+    hasil = subprocess.run(
+        [sys.executable, "-m", "ivm.main", "--no-cache", "--verifikasi-optimasi", "-O", str(LEVEL_MAKS),
+         os.path.join("greenfield", "examples", nama + ".fox")],
+        cwd=ROOT, stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=120,
+    )
+    assert f"OK: hasil -O0 dan -O{LEVEL_MAKS} identik" in hasil.stderr, hasil.stderr
+    assert hasil.returncode == 0 and hasil.stdout
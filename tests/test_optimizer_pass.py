@@ -0,0 +1,107 @@
+# tests/test_optimizer_pass.py
+"""
+Pass ivm/optimizer.py pada bytecode buatan tangan: lipat konstanta, cabang konstan dan
+blok mati, threading lompatan, propagasi konstanta per level, pemetaan ulang
+exception_table/line_table, serta kode PUSH_TRY yang dibiarkan apa adanya.
+"""
+import pytest
+
+from ivm.core.opcodes import Op
+from ivm.core.structs import CodeObject
+from ivm.optimizer import Optimizer, LEVEL_MAKS
+
+def kode(instructions, **opsi):
+    return CodeObject(name="f", instructions=list(instructions), **opsi)
+
+def optimasi(instructions, level=LEVEL_MAKS, **opsi):
+    return Optimizer(level).optimize(kode(instructions, **opsi))
+
+def test_lipat_konstanta():
+    hasil = optimasi([
+        (Op.PUSH_CONST, 2), (Op.PUSH_CONST, 3), (Op.MUL,),
+        (Op.PUSH_CONST, 1), (Op.ADD,), (Op.RET,),
+    ])
+    assert hasil.instructions == [(Op.PUSH_CONST, 7), (Op.RET,)]
+
+@pytest.mark.parametrize("instructions", [
+    [(Op.PUSH_CONST, 1), (Op.PUSH_CONST, 0), (Op.DIV,), (Op.RET,)],
+    [(Op.PUSH_CONST, "x"), (Op.PUSH_CONST, 10**6), (Op.MUL,), (Op.RET,)],
+], ids=["bagi_nol", "hasil_terlalu_besar"])
+def test_lipatan_yang_ditunda_ke_runtime(instructions):
+    assert optimasi(instructions).instructions == instructions
+
+def test_cabang_konstan_membuang_blok_mati():
+    hasil = optimasi([
+        (Op.PUSH_CONST, False), (Op.JMP_IF_FALSE, 4),
+        (Op.PUSH_CONST, "mati"), (Op.RET,),
+        (Op.PUSH_CONST, "hidup"), (Op.RET,),
+    ])
+    assert hasil.instructions == [(Op.PUSH_CONST, "hidup"), (Op.RET,)]
+
+def test_threading_rantai_lompatan():
+    hasil = optimasi([
+        (Op.LOAD_VAR, "x"), (Op.JMP_IF_FALSE, 5),
+        (Op.LOAD_VAR, "y"), (Op.POP,), (Op.JMP, 7),
+        (Op.JMP, 6),
+        (Op.JMP, 7),
+        (Op.LOAD_VAR, "z"), (Op.RET,),
+    ])
+    assert (Op.JMP, 6) not in hasil.instructions
+    tujuan = [ins[1] for ins in hasil.instructions if ins[0] in (Op.JMP, Op.JMP_IF_FALSE)]
+    assert all(hasil.instructions[t] == (Op.LOAD_VAR, "z") for t in tujuan)
+
+def test_propagasi_konstanta_hanya_di_level_2():
+    instructions = [
+        (Op.PUSH_CONST, 5), (Op.STORE_FAST, 0),
+        (Op.LOAD_VAR, "c"), (Op.JMP_IF_FALSE, 5), (Op.LOAD_VAR, "d"),
+        (Op.LOAD_FAST, 0), (Op.PUSH_CONST, 1), (Op.ADD,), (Op.RET,),
+    ]
+    level1 = optimasi(instructions, level=1, local_names=("a",))
+    assert (Op.LOAD_FAST, 0) in level1.instructions
+    level2 = optimasi(instructions, level=2, local_names=("a",))
+    assert (Op.LOAD_FAST, 0) not in level2.instructions
+    assert (Op.STORE_FAST, 0) not in level2.instructions
+    assert (Op.PUSH_CONST, 6) in level2.instructions
+
+def test_level_0_dan_level_tidak_valid():
+    masukan = kode([(Op.PUSH_CONST, 1), (Op.PUSH_CONST, 2), (Op.ADD,), (Op.RET,)])
+    assert Optimizer(0).optimize(masukan) is masukan
+    with pytest.raises(ValueError, match="Level optimasi tidak valid"):
+        Optimizer(LEVEL_MAKS + 1)
+
+def test_tabel_eksepsi_dan_baris_dipetakan_ulang():
+    masukan = kode([
+        (Op.PUSH_CONST, 1), (Op.PUSH_CONST, 2), (Op.ADD,), (Op.POP,),   # 0-3: hilang seluruhnya
+        (Op.LOAD_VAR, "f"), (Op.CALL, 0), (Op.POP,), (Op.JMP, 10),       # 4-7: dilindungi
+        (Op.POP,), (Op.LOAD_VAR, "g"),                                   # 8-9: handler
+        (Op.PUSH_CONST, None), (Op.RET,),                                # 10
+    ], exception_table=((4, 8, 8, 0),), line_table=((0, 1), (4, 2), (8, 3), (10, 4)))
+    hasil = Optimizer().optimize(masukan)
+    ((awal, akhir_, handler, kedalaman),) = hasil.exception_table
+    assert hasil.instructions[awal:akhir_][:2] == [(Op.LOAD_VAR, "f"), (Op.CALL, 0)]
+    assert hasil.instructions[handler:handler + 2] == [(Op.POP,), (Op.LOAD_VAR, "g")]
+    assert kedalaman == 0
+    assert hasil.baris(awal) == 2 and hasil.baris(handler) == 3
+    assert hasil.baris(len(hasil.instructions) - 1) == 4
+    # Masukan tidak diubah
+    assert masukan.exception_table == ((4, 8, 8, 0),) and len(masukan.instructions) == 12
+
+def test_kode_push_try_tidak_disentuh_tapi_fungsi_bersarang_dioptimasi():
+    dalam = kode([(Op.PUSH_CONST, 2), (Op.PUSH_CONST, 3), (Op.ADD,), (Op.RET,)])
+    instructions = [
+        (Op.PUSH_TRY, 5), (Op.PUSH_CONST, 1), (Op.PUSH_CONST, 1), (Op.ADD,), (Op.POP_TRY,),
+        (Op.PUSH_CONST, dalam), (Op.RET,),
+    ]
+    hasil = optimasi(instructions)
+    assert hasil.instructions[:5] == instructions[:5]
+    assert hasil.instructions[5][1].instructions == [(Op.PUSH_CONST, 5), (Op.RET,)]
+
+def test_metadata_dipertahankan_dan_memo_per_masukan():
+    dalam = kode([(Op.PUSH_CONST, 1), (Op.RET,)], arg_names=["x"], local_names=("x",),
+                 free_vars=("k",), is_generator=True, filename="m.fox")
+    optimizer = Optimizer()
+    a = optimizer.optimize(kode([(Op.PUSH_CONST, dalam), (Op.PUSH_CONST, dalam), (Op.RET,)]))
+    pertama, kedua = a.instructions[0][1], a.instructions[1][1]
+    assert pertama is kedua and pertama is not dalam
+    assert (pertama.arg_names, pertama.local_names, pertama.free_vars) == (["x"], ("x",), ("k",))
+    assert pertama.is_generator and pertama.filename == "m.fox"
@@ -0,0 +1,93 @@
+# tests/test_panggilan.py
+"""
+Jalur CALL/CALL_METHOD: argumen diiris langsung dari stack pemanggil ke slot frame baru
+(template CodeObject.call_info), tanpa membalik urutan atau menyisipkan 'ini', dan
+CALL_METHOD tidak membuat BoundMethod untuk metode instance.
+"""
+import pytest
+
+from ivm.core.opcodes import Op
+
+@pytest.mark.parametrize("fast_loop", [True, False])
+def test_urutan_argumen(jalankan_morph, fast_loop):
+    keluaran = jalankan_morph("""
+fungsi gabung(a, b, c, d, e) maka
+    kembalikan a + b + c + d + e
+akhir
+kelas Alat maka
+    fungsi inisiasi(awal, akhir_) maka
+        ubah ini.awal = awal
+        ubah ini.akhir_ = akhir_
+    akhir
+    fungsi bungkus(x, y) maka
+        kembalikan ini.awal + x + y + ini.akhir_
+    akhir
+akhir
+tulis(gabung("a", "b", "c", "d", "e"))
+biar alat = Alat("[", "]")
+tulis(alat.bungkus("x", "y"))
+biar metode = alat.bungkus
+tulis(metode("p", "q"))
+tulis(rentang(2, 8, 2))
+""", fast_loop=fast_loop)
+    assert keluaran.splitlines() == ["abcde", "[xy]", "[pq]", "range(2, 8, 2)"]
+
+def test_argumen_kurang_diisi_nil(jalankan_morph):
+    keluaran = jalankan_morph("""
+fungsi f(a, b, c) maka
+    kembalikan [a, b, c]
+akhir
+tulis(f(1))
+""")
+    assert keluaran.splitlines() == ["[1, None, None]"]
+
+def test_argumen_yang_ditangkap_closure(jalankan_morph):
+    # Argumen di cell_vars disimpan di Cell, bukan di slot
+    keluaran = jalankan_morph("""
+fungsi pencacah(mulai, langkah) maka
+    fungsi lanjut() maka
+        ubah mulai = mulai + langkah
+        kembalikan mulai
+    akhir
+    kembalikan lanjut
+akhir
+biar c = pencacah(10, 5)
+c()
+tulis(c())
+tulis(pencacah(0, 1)())
+""")
+    assert keluaran.splitlines() == ["20", "1"]
+
+def test_properti_berisi_fungsi_lewat_call_method(kompilasi_morph, jalankan_morph):
+    source = """
+fungsi dua_kali(x) maka
+    kembalikan x * 2
+akhir
+kelas Wadah maka
+    fungsi inisiasi(f) maka
+        ubah ini.f = f
+    akhir
+akhir
+biar w = Wadah(dua_kali)
+tulis(w.f(21))
+"""
+    ops = [ins[0] for ins in kompilasi_morph(source).instructions]
+    assert Op.CALL_METHOD in ops
+    assert jalankan_morph(source).splitlines() == ["42"]
+
+def test_call_info_template(kompilasi_morph):
+    code = kompilasi_morph("""
+fungsi f(a, b) maka
+    biar c = a
+    fungsi g() maka
+        kembalikan b
+    akhir
+    kembalikan g
+akhir
+""")
+    f = next(ins[1] for ins in code.instructions if len(ins) > 1 and hasattr(ins[1], "call_info"))
+    argc, ekor, arg_cell = f.call_info()
+    assert argc == 2
+    assert len(ekor) == len(f.local_names) - 2
+    assert arg_cell == ((1, "b"),)
+    assert f.call_info() is f.call_info()
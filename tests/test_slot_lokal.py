@@ -0,0 +1,81 @@
+# tests/test_slot_lokal.py
+"""
+Lokal fungsi ber-slot: Compiler memberi setiap lokal indeks slot tetap (argumen di slot
+awal) dan memakai LOAD_FAST/STORE_FAST, bukan LOAD_LOCAL/STORE_LOCAL berbasis nama.
+Variabel yang ditangkap closure tetap lewat cell; slot yang belum diisi dibaca dari globals.
+"""
+from ivm.core.opcodes import Op
+from ivm.core.structs import UNBOUND, CodeObject, Frame
+
+def fungsi(code, nama):
+    for ins in code.instructions:
+        for operand in ins[1:]:
+            if isinstance(operand, CodeObject):
+                if operand.name == nama: return operand
+                try: return fungsi(operand, nama)
+                except KeyError: pass
+    raise KeyError(nama)
+
+def test_lokal_fungsi_memakai_slot(kompilasi_morph):
+    code = fungsi(kompilasi_morph("""
+fungsi f(a, b) maka
+    biar c = a + b
+    kembalikan c * a
+akhir
+"""), "f")
+    assert code.local_names[:2] == ("a", "b") and "c" in code.local_names
+    ops = {ins[0] for ins in code.instructions}
+    assert Op.LOAD_FAST in ops and Op.STORE_FAST in ops
+    assert not ops & {Op.LOAD_LOCAL, Op.STORE_LOCAL}
+
+def test_variabel_closure_tetap_lewat_cell(kompilasi_morph, jalankan_morph):
+    source = """
+fungsi luar(n) maka
+    biar k = 2
+    fungsi dalam(x) maka
+        kembalikan x * k + n
+    akhir
+    kembalikan dalam
+akhir
+tulis(luar(1)(5))
+"""
+    code = fungsi(kompilasi_morph(source), "luar")
+    assert set(code.cell_vars) >= {"k", "n"}
+    assert jalankan_morph(source).splitlines() == ["11"]
+
+def test_slot_belum_diisi_dibaca_dari_globals(jalankan_morph):
+    keluaran = jalankan_morph("""
+biar x = "global"
+fungsi f(pakai_lokal) maka
+    jika pakai_lokal maka
+        biar x = "lokal"
+    akhir
+    kembalikan x
+akhir
+tulis(f(salah))
+tulis(f(benar))
+""")
+    assert keluaran.splitlines() == ["global", "lokal"]
+
+def test_rekursi_punya_slot_sendiri(jalankan_morph):
+    keluaran = jalankan_morph("""
+fungsi jumlah(n) maka
+    jika n == 0 maka
+        kembalikan 0
+    akhir
+    biar sisa = jumlah(n - 1)
+    kembalikan n + sisa
+akhir
+tulis(jumlah(50))
+""")
+    assert keluaran.splitlines() == ["1275"]
+
+def test_get_set_local_frame():
+    code = CodeObject(name="f", instructions=[], arg_names=["a"], local_names=("a", "b"))
+    frame = Frame(code=code, globals={})
+    assert frame.fast == [UNBOUND, UNBOUND] and frame.locals is None
+    frame.set_local("b", 3)
+    frame.set_local("lain", 4)
+    assert frame.fast == [UNBOUND, 3]
+    assert frame.get_local("a", "kosong") == "kosong"
+    assert frame.get_local("b") == 3 and frame.get_local("lain") == 4
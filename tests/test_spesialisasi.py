@@ -0,0 +1,121 @@
+# tests/test_spesialisasi.py
+"""
+Spesialisasi ADD/SUB/MUL (ivm/core/specializer.py): situs yang melihat operand bertipe
+sama ditulis ulang jadi ADD_INT dan kawan-kawan, lalu dideoptimasi kembali ke opcode
+generik saat tipe operand berubah. Hasil dan pesan error harus sama dengan specialize=False.
+"""
+import contextlib
+import io
+
+import pytest
+
+from ivm.core.opcodes import Op, DecodedOp
+from ivm.core.specializer import SPESIALISASI_MAX_DEOPT
+from ivm.vms.standard_vm import StandardVM
+
+OPERASI = """
+fungsi tambah(a, b) maka
+    kembalikan a + b
+akhir
+fungsi kurang(a, b) maka
+    kembalikan a - b
+akhir
+fungsi kali(a, b) maka
+    kembalikan a * b
+akhir
+"""
+
+def jalankan_vm(kompilasi, source, **opsi_vm):
+    code = kompilasi(source)
+    vm = StandardVM(bytecode_cache=False, **opsi_vm)
+    vm.load(code)
+    keluaran = io.StringIO()
+    with contextlib.redirect_stdout(keluaran):
+        vm.run()
+    return vm, keluaran.getvalue()
+
+def fungsi(vm, nama):
+    return vm.globals[nama].code
+
+def situs(code, generik):
+    """Indeks situs opcode generik di instruksi fungsi (array specialized() sejajar dengan ini)."""
+    return [pc for pc, ins in enumerate(code.instructions) if ins[0] == generik]
+
+CAMPUR = OPERASI + """
+selama i dari rentang(20) maka
+    tambah(i, 1)
+    kurang(i, 1)
+    kali(i, 2)
+akhir
+tulis(tambah(1.5, 2))
+tulis(tambah(2, 1.5))
+tulis(tambah("a", "b"))
+tulis(tambah([1], [2]))
+tulis(kurang(10, 2.5))
+tulis(kali("ab", 3))
+tulis(kali(3, 2))
+tulis(tambah(4, 5))
+"""
+
+@pytest.mark.parametrize("specialize", [True, False])
+def test_hasil_campuran_tipe(kompilasi_morph, specialize):
+    _, keluaran = jalankan_vm(kompilasi_morph, CAMPUR, specialize=specialize)
+    assert keluaran.splitlines() == ["3.5", "3.5", "ab", "[1, 2]", "7.5", "ababab", "6", "9"]
+
+def test_deopt_saat_tipe_berubah(kompilasi_morph):
+    vm, _ = jalankan_vm(kompilasi_morph, CAMPUR)
+    stats = vm.specialization_stats
+    for spes in (DecodedOp.ADD_INT, DecodedOp.SUB_INT, DecodedOp.MUL_INT):
+        assert stats.spesialisasi[spes.value] >= 1
+        assert stats.deopt[spes.value] >= 1
+
+def test_situs_kembali_spesialis_setelah_deopt(kompilasi_morph):
+    vm, keluaran = jalankan_vm(kompilasi_morph, OPERASI + """
+selama i dari rentang(5) maka
+    tambah(i, 1)
+akhir
+tambah(0.5, 0.5)
+selama i dari rentang(5) maka
+    tambah(i, 1)
+akhir
+tulis(tambah(2, 3))
+""")
+    assert keluaran.splitlines() == ["5"]
+    code = fungsi(vm, "tambah")
+    [site] = situs(code, Op.ADD)
+    ops, _ = code.specialized()
+    assert ops[site] == DecodedOp.ADD_INT.value
+    assert code.deopt_count[site] == 1
+
+def test_situs_tetap_generik_setelah_batas_deopt(kompilasi_morph):
+    vm, keluaran = jalankan_vm(kompilasi_morph, OPERASI + f"""
+selama i dari rentang({SPESIALISASI_MAX_DEOPT * 2 + 2}) maka
+    tambah(i, 1)
+    tambah(0.5, 0.5)
+akhir
+selama i dari rentang(10) maka
+    tambah(i, 1)
+akhir
+tulis(tambah(1, 1))
+""")
+    assert keluaran.splitlines() == ["2"]
+    code = fungsi(vm, "tambah")
+    [site] = situs(code, Op.ADD)
+    ops, _ = code.specialized()
+    assert code.deopt_count[site] == SPESIALISASI_MAX_DEOPT
+    assert ops[site] == Op.ADD.value
+
+def test_error_tipe_sama_dengan_generik(kompilasi_morph):
+    program = OPERASI + """
+selama i dari rentang(10) maka
+    tambah(i, 1)
+akhir
+coba
+    tambah(1, "x")
+tangkap e
+    tulis(e["pesan"])
+akhir
+"""
+    hasil = [jalankan_vm(kompilasi_morph, program, specialize=s)[1] for s in (True, False)]
+    assert hasil[0] == hasil[1]
+    assert hasil[0].splitlines() == ["unsupported operand type(s) for +: 'int' and 'str'"]
@@ -0,0 +1,65 @@
+# tests/test_struktur_runtime.py
+"""
+Struktur runtime ber-__slots__ (Frame, Cell, MorphInstance, BoundMethod, MorphVariant):
+tanpa __dict__ per objek, container Frame yang jarang dipakai baru dialokasikan saat
+dibutuhkan, dan salinan (deepcopy) tetap utuh.
+"""
+import copy
+
+import pytest
+
+from ivm.core.structs import (Cell, CodeObject, Frame, MorphClass, MorphInstance,
+                              BoundMethod, MorphVariant)
+
+KODE = CodeObject(name="f", instructions=[], arg_names=["a"], local_names=("a",))
+
+@pytest.mark.parametrize("obj", [
+    Cell(1),
+    Frame(code=KODE, globals={}),
+    MorphInstance(klass=MorphClass(name="K", methods={})),
+    BoundMethod(instance=None, method=KODE),
+    MorphVariant(name="Ada", args=[1]),
+], ids=lambda obj: type(obj).__name__)
+def test_tanpa_dict_per_objek(obj):
+    assert not hasattr(obj, "__dict__")
+    with pytest.raises(AttributeError):
+        obj.atribut_baru = 1
+
+def test_container_frame_dialokasikan_saat_dibutuhkan():
+    frame = Frame(code=KODE, globals={})
+    assert frame.stack == [] and frame.fast is not None
+    assert frame.locals is None and frame.exception_handlers is None
+    assert frame.snapshots is None and frame.cells is None
+    # Kode tanpa slot (LOAD_LOCAL berbasis nama) tetap mendapat dict locals
+    frame = Frame(code=CodeObject(name="g", instructions=[]), globals={})
+    assert frame.locals == {} and frame.fast == []
+
+def test_deepcopy_instance_dan_varian():
+    klass = MorphClass(name="K", methods={})
+    inst = MorphInstance(klass=klass, properties={"isi": [1, 2]})
+    varian = MorphVariant(name="Ada", args=[inst])
+    salinan = copy.deepcopy(varian)
+    assert salinan.name == "Ada"
+    assert salinan.args[0].properties == {"isi": [1, 2]}
+    assert salinan.args[0] is not inst
+
+def test_program_dengan_instance_dan_varian(jalankan_morph):
+    keluaran = jalankan_morph("""
+tipe Hasil = Sukses(nilai) | Gagal(pesan)
+kelas Wadah maka
+    fungsi inisiasi(isi) maka
+        ubah ini.isi = isi
+    akhir
+akhir
+fungsi periksa(h) maka
+    jodohkan h dengan
+    | Sukses(n) maka
+        kembalikan n.isi
+    | Gagal(p) maka
+        kembalikan p
+    akhir
+akhir
+tulis(periksa(Sukses(Wadah(7))))
+tulis(periksa(Gagal("x")))
+""")
+    assert keluaran.splitlines() == ["7", "x"]
@@ -0,0 +1,123 @@
+# tests/test_superinstruksi.py
+"""
+Superinstruksi (decoder.fuse_superinstructions): program yang sama harus memberi keluaran
+dan error yang sama dengan superinstructions=True dan False, termasuk error dari bagian
+kedua superinstruksi (pc, jejak, handler coba).
+"""
+from array import array
+
+import pytest
+
+from ivm.core.decoder import fuse_superinstructions
+from ivm.core.opcodes import Op, DecodedOp
+
+MODE = pytest.mark.parametrize("fast_loop", [True, False])
+
+def bandingkan(jalankan, source, **opsi_vm):
+    hasil = []
+    for fused in (False, True):
+        try:
+            hasil.append(jalankan(source, superinstructions=fused, **opsi_vm))
+        except RuntimeError as e:
+            hasil.append(f"error: {e}")
+    assert hasil[0] == hasil[1]
+    return hasil[1]
+
+def fungsi(code, nama):
+    for ins in code.instructions:
+        for operand in ins[1:]:
+            if getattr(operand, "name", None) == nama:
+                return operand
+    raise KeyError(nama)
+
+@MODE
+def test_keluaran_sama(jalankan_morph, fast_loop):
+    keluaran = bandingkan(jalankan_morph, """
+kelas Titik maka
+    fungsi inisiasi(x, y) maka
+        ubah ini.x = x
+        ubah ini.y = y
+    akhir
+    fungsi jumlah() maka
+        kembalikan ini.x + ini.y
+    akhir
+akhir
+fungsi hitung(n) maka
+    biar i = 0
+    biar total = 0
+    selama i < n maka
+        biar p = Titik(i, total)
+        ubah total = total + p.jumlah() + p.x
+        ubah i = i + 1
+    akhir
+    kembalikan total
+akhir
+tulis(hitung(20))
+""", fast_loop=fast_loop)
+    assert keluaran == "2097110\n"
+
+def test_urutan_benar_digabung(kompilasi_morph):
+    code = fungsi(kompilasi_morph("""
+fungsi f(a, b) maka
+    biar c = a + b
+    tulis(c)
+    ubah c = c + 1
+    kembalikan c
+akhir
+"""), "f")
+    ops, _ = code.fused()
+    assert DecodedOp.LOAD_FAST_FAST.value in ops
+    assert DecodedOp.INC_FAST.value in ops
+
+@MODE
+def test_error_bagian_kedua_sama_dengan_tanpa_fusi(jalankan_morph, fast_loop):
+    # LOAD_FAST_FAST / STORE_FAST_LOAD_FAST gagal di LOAD_FAST kedua, INC_FAST di ADD
+    keluaran = bandingkan(jalankan_morph, """
+fungsi dua() maka
+    biar a = 1
+    biar c = a + z
+    biar z = 2
+akhir
+fungsi simpan() maka
+    biar a = 1
+    biar c = z
+    biar z = 2
+akhir
+fungsi tambah() maka
+    biar i = "x"
+    tulis(i)
+    ubah i = i + 1
+akhir
+selama f dari [dua, simpan, tambah] maka
+    coba
+        f()
+    tangkap e
+        tulis(e["pesan"])
+        tulis(e["jejak"])
+    akhir
+akhir
+""", fast_loop=fast_loop)
+    assert keluaran.count("not found") == 2
+    assert "can only concatenate str" in keluaran
+
+def test_error_tak_tertangkap_sama(jalankan_morph):
+    keluaran = bandingkan(jalankan_morph, """
+fungsi f() maka
+    biar a = 1
+    biar c = a + z
+    biar z = 2
+akhir
+f()
+""")
+    assert "Variable 'z' not found" in keluaran
+
+def test_tidak_digabung_melewati_target_lompatan():
+    load, store = Op.LOAD_FAST.value, Op.STORE_FAST.value
+    ops = array('B', [load, load, store, load, Op.JMP.value])
+    args = [0, 1, 0, 1, 1]
+    fops, _ = fuse_superinstructions(ops, args)
+    # pc 1 target JMP: LOAD_FAST di pc 0 tidak boleh menelannya, STORE_FAST_LOAD_FAST di pc 2 boleh
+    assert fops[0] == load
+    assert fops[2] == DecodedOp.STORE_FAST_LOAD_FAST.value
+    fops, _ = fuse_superinstructions(ops, args, batas=(3,))
+    assert fops[2] == store
@@ -0,0 +1,50 @@
+"""
+Benchmark cache bytecode __foxcache__ (ivm/core/bytecode_cache.py).
+
+Program yang sama dijalankan lewat CLI (`python -m ivm.main`) sebagai proses baru:
+  - "kompilasi" : --no-cache, setiap modul di-lex, di-parse dan dikompilasi ulang.
+  - "cache"     : modul dimuat dari __foxcache__ (cache diisi dulu oleh satu run pemanasan).
+
+Yang dilaporkan: waktu dinding terbaik per mode; keluaran kedua mode harus sama.
+Default-nya greenfield/morph.fox, yang mengimpor lexer, parser dan compiler greenfield.
+
+Penggunaan:
+    python tools/bench_cache.py [--file greenfield/morph.fox] [--ulang N]
+"""
+import sys
+import os
+import argparse
+import subprocess
+import time
+
+# Add repo root to path
+sys.path.append(os.getcwd())
+
+def jalankan(file: str, opsi: list):
+    mulai = time.perf_counter()
+    hasil = subprocess.run([sys.executable, "-m", "ivm.main", *opsi, file], capture_output=True, text=True)
+    return time.perf_counter() - mulai, hasil.stdout
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cache bytecode __foxcache__")
+    parser.add_argument("--file", default="greenfield/morph.fox", help="File .fox yang dijalankan.")
+    parser.add_argument("--ulang", type=int, default=5, help="Jumlah pengulangan per mode (diambil yang tercepat).")
+    args = parser.parse_args()
+
+    jalankan(args.file, []) # Pemanasan: isi __foxcache__
+    hasil = {}
+    for nama, opsi in (("kompilasi", ["--no-cache"]), ("cache", [])):
+        hasil[nama] = min(jalankan(args.file, opsi) for _ in range(args.ulang))
+
+    if hasil["kompilasi"][1] != hasil["cache"][1]:
+        print("PERINGATAN: keluaran kedua mode berbeda!")
+
+    print(f"{'Mode':<10} {'waktu (s)':>10}")
+    print("-" * 21)
+    for nama, (durasi, _) in hasil.items():
+        print(f"{nama:<10} {durasi:>10.4f}")
+    print("-" * 21)
+    print(f"Percepatan: {hasil['kompilasi'][0] / hasil['cache'][0]:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Micro-benchmark biaya dispatch per opcode di StandardVM.
+
+Membandingkan dua mekanisme dispatch untuk setiap Op:
+  - "rantai": rantai if/elif `opcode == Op.X` dengan urutan yang sama seperti
+    StandardVM.execute sebelum tabel dispatch (dibangkitkan ulang di sini).
+  - "tabel" : indeks list handler per opcode, seperti loop StandardVM saat ini.
+
+Kedua mekanisme memanggil handler kosong yang sama, sehingga angka yang
+dilaporkan murni biaya menemukan handler, bukan biaya kerja opcode-nya.
+
+Penggunaan:
+    python tools/bench_dispatch.py [--ulang N] [--op NAMA ...]
+"""
+import sys
+import os
+import argparse
+import timeit
+
+# Add repo root to path
+sys.path.append(os.getcwd())
+
+from ivm.core.opcodes import Op
+from ivm.vms.standard_vm import StandardVM
+
+# Urutan cabang pada rantai if/elif lama di StandardVM.execute
+URUTAN_RANTAI_LAMA = [
+    "PUSH_CONST", "POP", "DUP", "ADD", "SUB", "MUL", "DIV", "MOD", "EQ", "NEQ",
+    "GT", "LT", "GTE", "LTE", "NOT", "AND", "OR", "BIT_AND", "BIT_OR", "BIT_XOR",
+    "BIT_NOT", "LSHIFT", "RSHIFT", "LOAD_REG", "MOVE_REG", "ADD_REG",
+    "PUSH_FROM_REG", "POP_TO_REG", "LOAD_VAR", "STORE_VAR", "LOAD_LOCAL",
+    "STORE_LOCAL", "BUILD_LIST", "BUILD_DICT", "LOAD_INDEX", "STORE_INDEX",
+    "SLICE", "UNPACK_SEQUENCE", "CHECK_LEN", "CHECK_LEN_MIN", "SNAPSHOT",
+    "RESTORE", "DISCARD_SNAPSHOT", "JMP", "JMP_IF_FALSE", "JMP_IF_TRUE",
+    "BUILD_CLASS", "LOAD_ATTR", "STORE_ATTR", "LOAD_SUPER_METHOD", "IS_INSTANCE",
+    "IS_VARIANT", "UNPACK_VARIANT", "BUILD_VARIANT", "LOAD_DEREF", "STORE_DEREF",
+    "LOAD_CLOSURE", "BUILD_FUNCTION", "MAKE_FUNCTION", "CALL", "RET", "PUSH_TRY",
+    "POP_TRY", "THROW", "IMPORT", "IMPORT_NATIVE", "LEN", "TYPE", "STR",
+    "STR_LOWER", "STR_UPPER", "STR_FIND", "STR_REPLACE", "SYS_TIME", "SYS_SLEEP",
+    "SYS_PLATFORM", "NET_SOCKET_NEW", "NET_CONNECT", "NET_SEND", "NET_RECV",
+    "NET_CLOSE", "IO_OPEN", "IO_READ", "IO_WRITE", "IO_CLOSE", "IO_EXISTS",
+    "IO_DELETE", "IO_LIST", "IO_MKDIR", "PRINT", "PRINT_RAW", "HALT", "YIELD",
+    "RESUME",
+]
+
+class _VMHandlerKosong(StandardVM):
+    """StandardVM yang semua handler-nya no-op, agar yang terukur hanya dispatch."""
+    def _build_dispatch_table(self):
+        return [self._op_unknown] * len(super()._build_dispatch_table())
+
+def _buat_eksekutor_rantai(vm: StandardVM):
+    """Membangkitkan fungsi execute bergaya rantai if/elif lama untuk VM ini."""
+    baris = ["def execute_rantai(instr):", "    opcode = instr[0]"]
+    for i, nama in enumerate(URUTAN_RANTAI_LAMA):
+        kata = "if" if i == 0 else "elif"
+        baris.append(f"    {kata} opcode == Op.{nama}: handler(frame, instr)")
+    namespace = {"Op": Op, "handler": vm._op_unknown, "frame": vm.current_frame}
+    exec("\n".join(baris), namespace)
+    return namespace["execute_rantai"]
+
+def ukur(ulang: int, hanya: list = None):
+    vm = _VMHandlerKosong()
+    vm.load([])
+    execute_rantai = _buat_eksekutor_rantai(vm)
+    frame = vm.current_frame
+    dispatch = vm._dispatch
+    execute_tabel = lambda instr: dispatch[instr[0]](frame, None)
+
+    nama_ops = hanya if hanya else URUTAN_RANTAI_LAMA
+    hasil = []
+    for nama in nama_ops:
+        instr = (Op[nama], None)
+        t_rantai = min(timeit.repeat(lambda: execute_rantai(instr), number=ulang, repeat=3))
+        t_tabel = min(timeit.repeat(lambda: execute_tabel(instr), number=ulang, repeat=3))
+        hasil.append((nama, t_rantai / ulang * 1e9, t_tabel / ulang * 1e9))
+    return hasil
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dispatch opcode StandardVM")
+    parser.add_argument("--ulang", type=int, default=200_000, help="Jumlah eksekusi per opcode.")
+    parser.add_argument("--op", nargs="*", help="Hanya ukur opcode tertentu (nama Op).")
+    args = parser.parse_args()
+
+    hasil = ukur(args.ulang, args.op)
+
+    print(f"{'Opcode':<20} {'rantai (ns)':>12} {'tabel (ns)':>12} {'rasio':>8}")
+    print("-" * 56)
+    for nama, ns_rantai, ns_tabel in hasil:
+        print(f"{nama:<20} {ns_rantai:>12.1f} {ns_tabel:>12.1f} {ns_rantai / ns_tabel:>7.2f}x")
+
+    rata_rantai = sum(h[1] for h in hasil) / len(hasil)
+    rata_tabel = sum(h[2] for h in hasil) / len(hasil)
+    print("-" * 56)
+    print(f"{'rata-rata':<20} {rata_rantai:>12.1f} {rata_tabel:>12.1f} {rata_rantai / rata_tabel:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Benchmark pooling Frame di StandardVM.
+
+Menjalankan bytecode yang sama dua kali:
+  - "tanpa pool": StandardVM(pool_frames=False), setiap panggilan membuat Frame baru.
+  - "dengan pool": StandardVM(pool_frames=True), Frame yang selesai dipakai ulang
+                   lewat CodeObject.frame_pool.
+
+Yang dilaporkan: waktu terbaik, jumlah objek Frame yang benar-benar dialokasikan
+(dihitung pada putaran terpisah dengan membungkus konstruktor Frame di
+ivm.vms.standard_vm), dan puncak memori (tracemalloc).
+
+Penggunaan:
+    python tools/bench_frame_pool.py [--file program.fox] [--ulang N]
+"""
+import sys
+import os
+import argparse
+import io
+import time
+import contextlib
+import tracemalloc
+
+# Add repo root to path
+sys.path.append(os.getcwd())
+
+from transisi.lx import Leksikal
+from transisi.crusher import Pengurai
+from ivm.compiler import Compiler
+from ivm.core.structs import CodeObject
+from ivm.vms import standard_vm
+from ivm.vms.standard_vm import StandardVM
+
+# Beban bawaan: banyak panggilan fungsi dan metode pendek
+PROGRAM_BAWAAN = """
+kelas Penghitung maka
+    fungsi inisiasi() maka
+        ubah ini.n = 0
+    akhir
+
+    fungsi tambah(k) maka
+        ubah ini.n = ini.n + k
+        kembali ini
+    akhir
+akhir
+
+fungsi fib(n) maka
+    jika n < 2 maka
+        kembali n
+    akhir
+    kembali fib(n - 1) + fib(n - 2)
+akhir
+
+fungsi tambah_satu(x) maka
+    kembali x + 1
+akhir
+
+biar p = Penghitung()
+biar i = 0
+selama i < 20000 maka
+    p.tambah(tambah_satu(i))
+    ubah i = i + 1
+akhir
+tulis(p.n)
+tulis(fib(18))
+"""
+
+def kompilasi(source: str, nama_file: str):
+    tokens, errors = Leksikal(source, nama_file=nama_file).buat_token()
+    if errors:
+        raise SystemExit(f"Lexer Errors: {errors}")
+    parser = Pengurai(tokens)
+    ast = parser.urai()
+    if not ast:
+        raise SystemExit(f"Parser Errors: {parser.daftar_kesalahan}")
+    return Compiler().compile(ast, filename=nama_file, is_main_script=False)
+
+def _kosongkan_pool(nilai):
+    """Kosongkan frame_pool semua CodeObject (termasuk yang bersarang) agar tiap putaran adil."""
+    if isinstance(nilai, CodeObject):
+        nilai.frame_pool.clear()
+        for instr in nilai.instructions:
+            _kosongkan_pool(instr)
+    elif isinstance(nilai, (list, tuple)):
+        for isi in nilai:
+            _kosongkan_pool(isi)
+    elif isinstance(nilai, dict):
+        for isi in nilai.values():
+            _kosongkan_pool(isi)
+
+def jalankan(code_obj, pool: bool, ukur_alokasi: bool):
+    _kosongkan_pool(code_obj)
+    vm = StandardVM(pool_frames=pool)
+    vm.load(code_obj)
+    keluaran = io.StringIO()
+    frame_asli = standard_vm.Frame
+    jumlah_frame = 0
+    if ukur_alokasi:
+        def frame_terhitung(*args, **kwargs):
+            nonlocal jumlah_frame
+            jumlah_frame += 1
+            return frame_asli(*args, **kwargs)
+        standard_vm.Frame = frame_terhitung
+        tracemalloc.start()
+    mulai = time.perf_counter()
+    with contextlib.redirect_stdout(keluaran):
+        vm.run()
+        if "utama" in vm.globals:
+            vm.call_function_internal(vm.globals["utama"], [])
+            vm.run()
+    durasi = time.perf_counter() - mulai
+    puncak = 0
+    if ukur_alokasi:
+        _, puncak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        standard_vm.Frame = frame_asli
+    return durasi, jumlah_frame, puncak, keluaran.getvalue()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pooling Frame StandardVM")
+    parser.add_argument("--file", help="Program .fox yang dijalankan (default: beban bawaan).")
+    parser.add_argument("--ulang", type=int, default=3, help="Jumlah pengulangan per mode (diambil yang tercepat).")
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, "r", encoding="utf-8") as f:
+            source = f.read()
+        nama_file = args.file
+    else:
+        source = PROGRAM_BAWAAN
+        nama_file = "<bench_frame_pool>"
+
+    code_obj = kompilasi(source, nama_file)
+
+    hasil = {}
+    for nama, pool in (("tanpa pool", False), ("dengan pool", True)):
+        terbaik = None
+        for _ in range(args.ulang):
+            durasi, _, _, keluaran = jalankan(code_obj, pool, ukur_alokasi=False)
+            if terbaik is None or durasi < terbaik[0]:
+                terbaik = (durasi, keluaran)
+        # Alokasi diukur pada putaran terpisah karena penghitung + tracemalloc memperlambat eksekusi
+        _, jumlah_frame, puncak, _ = jalankan(code_obj, pool, ukur_alokasi=True)
+        hasil[nama] = terbaik + (jumlah_frame, puncak)
+
+    if hasil["tanpa pool"][1] != hasil["dengan pool"][1]:
+        print("PERINGATAN: keluaran kedua mode berbeda!")
+
+    print(f"{'Mode':<12} {'waktu (s)':>10} {'Frame baru':>11} {'puncak (KiB)':>13}")
+    print("-" * 49)
+    for nama, (durasi, _, jumlah_frame, puncak) in hasil.items():
+        print(f"{nama:<12} {durasi:>10.3f} {jumlah_frame:>11} {puncak / 1024:>13.1f}")
+    print("-" * 49)
+    print(f"Percepatan: {hasil['tanpa pool'][0] / hasil['dengan pool'][0]:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark konsumsi generator di StandardVM.
+
+Generator yang sama dikonsumsi dengan dua cara:
+  - "momen" : protokol lama, `lanjut(g)` mengembalikan Momen(nilai, g) yang harus
+              dibongkar lewat `jodohkan`, satu varian baru per nilai.
+  - "dari"  : `selama v dari g maka ... akhir` (FOR_ITER), frame generator
+              ditangguhkan dan dilanjutkan di tempat, nilai langsung ke loop.
+
+Yang dilaporkan: waktu terbaik per mode; keluaran kedua mode harus sama.
+
+Penggunaan:
+    python tools/bench_generator.py [--jumlah N] [--ulang N]
+"""
+import sys
+import os
+import argparse
+import io
+import time
+import contextlib
+
+# Add repo root to path
+sys.path.append(os.getcwd())
+
+from transisi.lx import Leksikal
+from transisi.crusher import Pengurai
+from ivm.compiler import Compiler
+from ivm.vms.standard_vm import StandardVM
+
+GENERATOR = """
+fungsi hitung(n) maka
+    biar i = 0
+    selama i < n maka
+        bekukan(i)
+        ubah i = i + 1
+    akhir
+akhir
+"""
+
+PROGRAM_MOMEN = GENERATOR + """
+biar g = hitung(JUMLAH)
+biar total = 0
+biar jalan = benar
+selama jalan maka
+    jodohkan lanjut(g) dengan
+    | Momen(v, k) maka
+        ubah total = total + v
+    | _ maka
+        ubah jalan = salah
+    akhir
+akhir
+tulis(total)
+"""
+
+PROGRAM_DARI = GENERATOR + """
+biar total = 0
+selama v dari hitung(JUMLAH) maka
+    ubah total = total + v
+akhir
+tulis(total)
+"""
+
+def kompilasi(source: str, nama_file: str):
+    tokens, errors = Leksikal(source, nama_file=nama_file).buat_token()
+    if errors:
+        raise SystemExit(f"Lexer Errors: {errors}")
+    parser = Pengurai(tokens)
+    ast = parser.urai()
+    if not ast:
+        raise SystemExit(f"Parser Errors: {parser.daftar_kesalahan}")
+    return Compiler().compile(ast, filename=nama_file)
+
+def jalankan(code_obj):
+    vm = StandardVM()
+    vm.load(code_obj)
+    keluaran = io.StringIO()
+    mulai = time.perf_counter()
+    with contextlib.redirect_stdout(keluaran):
+        vm.run()
+    return time.perf_counter() - mulai, keluaran.getvalue()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark konsumsi generator StandardVM")
+    parser.add_argument("--jumlah", type=int, default=100_000, help="Jumlah nilai yang dihasilkan generator.")
+    parser.add_argument("--ulang", type=int, default=5, help="Jumlah pengulangan per mode (diambil yang tercepat).")
+    args = parser.parse_args()
+
+    hasil = {}
+    for nama, sumber in (("momen", PROGRAM_MOMEN), ("dari", PROGRAM_DARI)):
+        code_obj = kompilasi(sumber.replace("JUMLAH", str(args.jumlah)), f"<bench_generator_{nama}>")
+        hasil[nama] = min(jalankan(code_obj) for _ in range(args.ulang))
+
+    if hasil["momen"][1] != hasil["dari"][1]:
+        print("PERINGATAN: keluaran kedua mode berbeda!")
+
+    print(f"{'Mode':<6} {'waktu (s)':>10}")
+    print("-" * 17)
+    for nama, (durasi, _) in hasil.items():
+        print(f"{nama:<6} {durasi:>10.4f}")
+    print("-" * 17)
+    print(f"Percepatan: {hasil['momen'][0] / hasil['dari'][0]:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark biaya impor modul native di StandardVM.
+
+Dua skenario, masing-masing dijalankan dengan registry modul native (default,
+modul diresolusi sekali per VM) dan dengan StandardVM(hot_reload=True) yang
+meniru perilaku lama (modul internal di-reload dan PythonBackend dibuat ulang
+setiap IMPORT):
+  - "startup" : VM baru per putaran yang memuat stdlib bergaya COTC
+                (core.fox, bytes.fox, teks.fox, koleksi.fox).
+  - "fungsi"  : fungsi yang melakukan `pinjam` di badannya dipanggil berulang kali.
+
+Penggunaan:
+    python tools/bench_impor.py [--panggilan N] [--ulang N]
+"""
+import sys
+import os
+import argparse
+import io
+import time
+import contextlib
+
+# Add repo root to path
+sys.path.append(os.getcwd())
+
+from transisi.lx import Leksikal
+from transisi.crusher import Pengurai
+from ivm.compiler import Compiler
+from ivm.vms.standard_vm import StandardVM
+
+PROGRAM_STARTUP = """
+ambil_semua "greenfield/cotc/stdlib/core.fox" sebagai Inti
+ambil_semua "greenfield/cotc/bytes.fox" sebagai Bytes
+ambil_semua "transisi/stdlib/wajib/teks.fox" sebagai Teks
+ambil_semua "transisi/stdlib/wajib/koleksi.fox" sebagai Koleksi
+tulis(Inti.panjang([1, 2, 3]))
+"""
+
+PROGRAM_FUNGSI = """
+fungsi ukur(x) maka
+    pinjam "_backend" sebagai mesin
+    pinjam "transisi.stdlib.wajib._teks_internal" sebagai internal
+    kembali mesin.conv_len(x)
+akhir
+
+biar i = 0
+biar total = 0
+selama i < PANGGILAN maka
+    ubah total = total + ukur("abc")
+    ubah i = i + 1
+akhir
+tulis(total)
+"""
+
+def kompilasi(source: str, nama_file: str):
+    tokens, errors = Leksikal(source, nama_file=nama_file).buat_token()
+    if errors:
+        raise SystemExit(f"Lexer Errors: {errors}")
+    parser = Pengurai(tokens)
+    ast = parser.urai()
+    if not ast:
+        raise SystemExit(f"Parser Errors: {parser.daftar_kesalahan}")
+    return Compiler().compile(ast, filename=nama_file)
+
+def jalankan(code_obj, hot_reload: bool):
+    vm = StandardVM(hot_reload=hot_reload)
+    vm.load(code_obj)
+    keluaran = io.StringIO()
+    mulai = time.perf_counter()
+    with contextlib.redirect_stdout(keluaran):
+        vm.run()
+    return time.perf_counter() - mulai, keluaran.getvalue()
+
+def terbaik(code_obj, hot_reload: bool, ulang: int):
+    return min(jalankan(code_obj, hot_reload) for _ in range(ulang))
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark impor modul native StandardVM")
+    parser.add_argument("--panggilan", type=int, default=1_000, help="Jumlah panggilan fungsi pengimpor (mode reload ~3ms per panggilan).")
+    parser.add_argument("--ulang", type=int, default=5, help="Jumlah pengulangan per mode (diambil yang tercepat).")
+    args = parser.parse_args()
+
+    skenario = [
+        ("startup", kompilasi(PROGRAM_STARTUP, "<bench_impor_startup>")),
+        ("fungsi", kompilasi(PROGRAM_FUNGSI.replace("PANGGILAN", str(args.panggilan)), "<bench_impor_fungsi>")),
+    ]
+
+    print(f"{'Skenario':<10} {'reload (s)':>11} {'cache (s)':>10} {'percepatan':>11}")
+    print("-" * 45)
+    for nama, code_obj in skenario:
+        t_reload, out_reload = terbaik(code_obj, True, args.ulang)
+        t_cache, out_cache = terbaik(code_obj, False, args.ulang)
+        if out_reload != out_cache:
+            print(f"PERINGATAN: keluaran skenario '{nama}' berbeda!")
+        print(f"{nama:<10} {t_reload:>11.4f} {t_cache:>10.4f} {t_reload / t_cache:>10.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark iterasi koleksi di StandardVM.
+
+Daftar yang sama dijumlahkan dengan dua cara, di dalam fungsi (slot lokal):
+  - "indeks" : gaya lama, `selama i < panjang(d)` dengan variabel indeks manual,
+               LOAD_INDEX dan penambahan indeks per iterasi.
+  - "dari"   : `selama v dari d maka ... akhir` (GET_ITER/FOR_ITER), satu next()
+               iterator Python per iterasi.
+Ditambah loop terhitung `selama i dari rentang(N)` dibandingkan dengan penghitung manual.
+
+Yang dilaporkan: waktu terbaik per mode; keluaran kedua mode harus sama.
+
+Penggunaan:
+    python tools/bench_iterasi.py [--jumlah N] [--ulang N]
+"""
+import sys
+import os
+import argparse
+import io
+import time
+import contextlib
+
+# Add repo root to path
+sys.path.append(os.getcwd())
+
+from transisi.lx import Leksikal
+from transisi.crusher import Pengurai
+from ivm.compiler import Compiler
+from ivm.vms.standard_vm import StandardVM
+
+PROGRAM_INDEKS = """
+fungsi jumlah(d) maka
+    biar t = 0
+    biar i = 0
+    biar n = panjang(d)
+    selama i < n maka
+        ubah t = t + d[i]
+        ubah i = i + 1
+    akhir
+    kembali t
+akhir
+fungsi hitung(n) maka
+    biar c = 0
+    biar i = 0
+    selama i < n maka
+        ubah c = c + i
+        ubah i = i + 1
+    akhir
+    kembali c
+akhir
+biar d = []
+biar i = 0
+selama i < JUMLAH maka
+    _tambah_builtin(d, i)
+    ubah i = i + 1
+akhir
+tulis(jumlah(d), hitung(JUMLAH))
+"""
+
+PROGRAM_DARI = """
+fungsi jumlah(d) maka
+    biar t = 0
+    selama v dari d maka
+        ubah t = t + v
+    akhir
+    kembali t
+akhir
+fungsi hitung(n) maka
+    biar c = 0
+    selama i dari rentang(n) maka
+        ubah c = c + i
+    akhir
+    kembali c
+akhir
+biar d = []
+biar i = 0
+selama i < JUMLAH maka
+    _tambah_builtin(d, i)
+    ubah i = i + 1
+akhir
+tulis(jumlah(d), hitung(JUMLAH))
+"""
+
+def kompilasi(source: str, nama_file: str):
+    tokens, errors = Leksikal(source, nama_file=nama_file).buat_token()
+    if errors:
+        raise SystemExit(f"Lexer Errors: {errors}")
+    parser = Pengurai(tokens)
+    ast = parser.urai()
+    if not ast:
+        raise SystemExit(f"Parser Errors: {parser.daftar_kesalahan}")
+    return Compiler().compile(ast, filename=nama_file)
+
+def jalankan(code_obj):
+    vm = StandardVM()
+    vm.load(code_obj)
+    keluaran = io.StringIO()
+    mulai = time.perf_counter()
+    with contextlib.redirect_stdout(keluaran):
+        vm.run()
+    return time.perf_counter() - mulai, keluaran.getvalue()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark iterasi koleksi StandardVM")
+    parser.add_argument("--jumlah", type=int, default=100_000, help="Panjang daftar dan jumlah putaran loop terhitung.")
+    parser.add_argument("--ulang", type=int, default=5, help="Jumlah pengulangan per mode (diambil yang tercepat).")
+    args = parser.parse_args()
+
+    hasil = {}
+    for nama, sumber in (("indeks", PROGRAM_INDEKS), ("dari", PROGRAM_DARI)):
+        code_obj = kompilasi(sumber.replace("JUMLAH", str(args.jumlah)), f"<bench_iterasi_{nama}>")
+        hasil[nama] = min(jalankan(code_obj) for _ in range(args.ulang))
+
+    if hasil["indeks"][1] != hasil["dari"][1]:
+        print("PERINGATAN: keluaran kedua mode berbeda!")
+
+    print(f"{'Mode':<6} {'waktu (s)':>10}")
+    print("-" * 17)
+    for nama, (durasi, _) in hasil.items():
+        print(f"{nama:<6} {durasi:>10.4f}")
+    print("-" * 17)
+    print(f"Percepatan: {hasil['indeks'][0] / hasil['dari'][0]:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark throughput loop eksekusi StandardVM.
+
+Mengompilasi satu program .fox sekali, lalu menjalankan bytecode yang sama
+dengan dua loop:
+  - "lama"  : StandardVM(fast_loop=False), satu instruksi per iterasi via execute.
+  - "cepat" : StandardVM(fast_loop=True), state frame di variabel lokal + opcode
+              panas di-inline (_run_fast).
+
+Penggunaan:
+    python tools/bench_loop.py [--file program.fox] [--ulang N]
+"""
+import sys
+import os
+import argparse
+import io
+import time
+import contextlib
+
+# Add repo root to path
+sys.path.append(os.getcwd())
+
+from transisi.lx import Leksikal
+from transisi.crusher import Pengurai
+from ivm.compiler import Compiler
+from ivm.vms.standard_vm import StandardVM
+
+# Beban bawaan: loop hitung, panggilan fungsi, akses atribut, indeks daftar
+PROGRAM_BAWAAN = """
+kelas Titik maka
+    fungsi inisiasi(x, y) maka
+        ubah ini.x = x
+        ubah ini.y = y
+    akhir
+
+    fungsi jumlah() maka
+        kembali ini.x + ini.y
+    akhir
+akhir
+
+fungsi kuadrat(n) maka
+    kembali n * n
+akhir
+
+biar data = [1, 2, 3, 4, 5, 6, 7, 8]
+biar total = 0
+biar i = 0
+selama i < 20000 maka
+    biar t = Titik(i, 1)
+    ubah total = total + t.jumlah() + kuadrat(data[i % 8])
+    jika total == 0 maka
+        tulis("tidak mungkin")
+    akhir
+    ubah i = i + 1
+akhir
+tulis(total)
+"""
+
+def kompilasi(source: str, nama_file: str):
+    tokens, errors = Leksikal(source, nama_file=nama_file).buat_token()
+    if errors:
+        raise SystemExit(f"Lexer Errors: {errors}")
+    parser = Pengurai(tokens)
+    ast = parser.urai()
+    if not ast:
+        raise SystemExit(f"Parser Errors: {parser.daftar_kesalahan}")
+    return Compiler().compile(ast, filename=nama_file, is_main_script=False)
+
+def jalankan(code_obj, fast_loop: bool):
+    vm = StandardVM(fast_loop=fast_loop)
+    vm.load(code_obj)
+    keluaran = io.StringIO()
+    mulai = time.perf_counter()
+    with contextlib.redirect_stdout(keluaran):
+        vm.run()
+        if "utama" in vm.globals:
+            vm.call_function_internal(vm.globals["utama"], [])
+            vm.run()
+    durasi = time.perf_counter() - mulai
+    return durasi, vm.instruction_count, keluaran.getvalue()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark loop eksekusi StandardVM")
+    parser.add_argument("--file", help="Program .fox yang dijalankan (default: beban bawaan).")
+    parser.add_argument("--ulang", type=int, default=3, help="Jumlah pengulangan per mode (diambil yang tercepat).")
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, "r", encoding="utf-8") as f:
+            source = f.read()
+        nama_file = args.file
+    else:
+        source = PROGRAM_BAWAAN
+        nama_file = "<bench_loop>"
+
+    code_obj = kompilasi(source, nama_file)
+
+    hasil = {}
+    for nama, fast in (("lama", False), ("cepat", True)):
+        terbaik = None
+        for _ in range(args.ulang):
+            durasi, jumlah, keluaran = jalankan(code_obj, fast)
+            if terbaik is None or durasi < terbaik[0]:
+                terbaik = (durasi, jumlah, keluaran)
+        hasil[nama] = terbaik
+
+    if hasil["lama"][2] != hasil["cepat"][2] or hasil["lama"][1] != hasil["cepat"][1]:
+        print("PERINGATAN: keluaran/jumlah instruksi kedua loop berbeda!")
+
+    print(f"{'Loop':<8} {'waktu (s)':>10} {'instruksi':>12} {'juta instr/s':>13}")
+    print("-" * 46)
+    for nama, (durasi, jumlah, _) in hasil.items():
+        print(f"{nama:<8} {durasi:>10.3f} {jumlah:>12} {jumlah / durasi / 1e6:>13.2f}")
+    print("-" * 46)
+    print(f"Percepatan: {hasil['lama'][0] / hasil['cepat'][0]:.2f}x")
+
+if __name__ == "__main__":
+    main()
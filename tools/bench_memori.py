@@ -0,0 +1,140 @@
+"""
+Benchmark memori objek runtime IVM (bytes per objek, diukur dengan tracemalloc).
+
+Membandingkan struct di ivm/core/structs.py saat ini (slots + container lazy)
+dengan bentuk lama (@dataclass biasa dengan __dict__ dan list/dict yang selalu
+dialokasikan per frame), yang didefinisikan ulang di sini sebagai pembanding.
+
+Selain itu mengukur puncak memori saat menjalankan rekursi dalam dan
+pattern matching varian di StandardVM.
+
+Penggunaan:
+    python tools/bench_memori.py [--jumlah N] [--kedalaman D]
+"""
+import sys
+import os
+import argparse
+import io
+import contextlib
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import List, Any, Dict, Optional
+
+# Add repo root to path
+sys.path.append(os.getcwd())
+
+from ivm.core.structs import CodeObject, Frame, Cell, MorphClass, MorphInstance, BoundMethod, MorphVariant
+
+# --- Bentuk lama (sebelum slots/lazy), hanya untuk pembanding ---
+@dataclass
+class _CellLama:
+    value: Any = None
+
+@dataclass
+class _FrameLama:
+    code: CodeObject
+    globals: Dict[str, Any]
+    pc: int = 0
+    locals: Dict[str, Any] = field(default_factory=dict)
+    stack: List[Any] = field(default_factory=list)
+    is_init_call: bool = False
+    exception_handlers: List[int] = field(default_factory=list)
+    snapshots: List[int] = field(default_factory=list)
+    defining_class: Optional[Any] = None
+    cells: Dict[str, Any] = field(default_factory=dict)
+
+@dataclass
+class _InstanceLama:
+    klass: Any
+    properties: Dict[str, Any] = field(default_factory=dict)
+
+@dataclass
+class _BoundMethodLama:
+    instance: Any
+    method: Any
+    defining_class: Optional[Any] = None
+
+@dataclass
+class _VariantLama:
+    name: str
+    args: List[Any] = field(default_factory=list)
+
+def bytes_per_objek(pabrik, jumlah: int) -> float:
+    tracemalloc.start()
+    awal, _ = tracemalloc.get_traced_memory()
+    objek = [pabrik(i) for i in range(jumlah)]
+    akhir, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Kurangi biaya list penampung itu sendiri
+    return (akhir - awal - sys.getsizeof(objek)) / jumlah
+
+def bandingkan_objek(jumlah: int):
+    code = CodeObject(name="f", instructions=[], arg_names=["a", "b"], local_names=("a", "b", "c"))
+    klass = MorphClass(name="Titik", methods={})
+    g = {}
+    skenario = [
+        ("Frame", lambda i: _FrameLama(code=code, globals=g), lambda i: Frame(code=code, globals=g)),
+        ("Cell", lambda i: _CellLama(i), lambda i: Cell(i)),
+        ("MorphInstance", lambda i: _InstanceLama(klass, {"x": i}), lambda i: MorphInstance(klass, {"x": i})),
+        ("BoundMethod", lambda i: _BoundMethodLama(i, code, klass), lambda i: BoundMethod(i, code, klass)),
+        ("MorphVariant", lambda i: _VariantLama("Ada", [i]), lambda i: MorphVariant("Ada", [i])),
+    ]
+    return [(nama, bytes_per_objek(lama, jumlah), bytes_per_objek(baru, jumlah)) for nama, lama, baru in skenario]
+
+PROGRAM_REKURSI = """
+tipe Opsi = Ada(nilai) | Kosong
+
+fungsi turun(n) maka
+    jika n == 0 maka
+        kembali Kosong
+    akhir
+    biar hasil = turun(n - 1)
+    jodohkan hasil dengan
+    | Ada(v) maka
+        kembali Ada(v + 1)
+    | _ maka
+        kembali Ada(1)
+    akhir
+akhir
+
+tulis(turun(KEDALAMAN))
+"""
+
+def puncak_rekursi(kedalaman: int):
+    from transisi.lx import Leksikal
+    from transisi.crusher import Pengurai
+    from ivm.compiler import Compiler
+    from ivm.vms.standard_vm import StandardVM
+
+    source = PROGRAM_REKURSI.replace("KEDALAMAN", str(kedalaman))
+    tokens, _ = Leksikal(source, nama_file="<bench_memori>").buat_token()
+    ast = Pengurai(tokens).urai()
+    code_obj = Compiler().compile(ast, filename="<bench_memori>")
+
+    vm = StandardVM()
+    vm.load(code_obj)
+    keluaran = io.StringIO()
+    tracemalloc.start()
+    with contextlib.redirect_stdout(keluaran):
+        vm.run()
+    _, puncak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return puncak, keluaran.getvalue().strip()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark memori objek runtime IVM")
+    parser.add_argument("--jumlah", type=int, default=20_000, help="Jumlah objek per skenario.")
+    parser.add_argument("--kedalaman", type=int, default=2_000, help="Kedalaman rekursi program uji.")
+    args = parser.parse_args()
+
+    print(f"{'Objek':<15} {'lama (B)':>10} {'baru (B)':>10} {'hemat':>8}")
+    print("-" * 46)
+    for nama, lama, baru in bandingkan_objek(args.jumlah):
+        print(f"{nama:<15} {lama:>10.1f} {baru:>10.1f} {(1 - baru / lama) * 100:>7.1f}%")
+
+    puncak, hasil = puncak_rekursi(args.kedalaman)
+    print("-" * 46)
+    print(f"Rekursi + jodohkan (kedalaman {args.kedalaman}): puncak {puncak / 1024:.1f} KiB, hasil {hasil}")
+
+if __name__ == "__main__":
+    main()
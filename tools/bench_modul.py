@@ -0,0 +1,103 @@
+"""
+Benchmark pemuatan modul .fox di StandardVM (globals modul dua tingkat).
+
+Memuat modul-modul compiler greenfield (impor yang sama dengan greenfield/morph.fox)
+dalam dua mode:
+  - "salin"  : meniru perilaku lama, setiap modul menyalin seluruh builtins
+               ke dict globals-nya sendiri.
+  - "bersama": default, modul hanya menyimpan nama miliknya sendiri dan membaca
+               builtins dari lapisan bersama (ivm/stdlib/namespace.py).
+
+Yang dilaporkan: waktu terbaik, jumlah modul, total entri di dict globals modul,
+dan puncak memori (tracemalloc).
+
+Penggunaan:
+    python tools/bench_modul.py [--ulang N]
+"""
+import sys
+import os
+import argparse
+import io
+import time
+import contextlib
+import tracemalloc
+
+# Add repo root to path
+sys.path.append(os.getcwd())
+
+from transisi.lx import Leksikal
+from transisi.crusher import Pengurai
+from ivm.compiler import Compiler
+from ivm.core.structs import ModuleGlobals
+from ivm.vms import standard_vm
+from ivm.vms.standard_vm import StandardVM
+from ivm.stdlib.namespace import BUILTINS, buat_globals_modul
+
+PROGRAM_IMPOR = """
+ambil_semua "greenfield/lx_morph.fox" sebagai LX
+ambil_semua "greenfield/crusher.fox" sebagai CR
+ambil_semua "greenfield/kompiler/utama.fox" sebagai KC
+ambil_semua "greenfield/handler.fox" sebagai Handler
+dari "greenfield/cotc/io/berkas.fox" ambil_sebagian baca, baca_bytes, Sukses, Gagal
+dari "greenfield/cotc/sys/syscalls.fox" ambil_sebagian sys_buka_file, sys_tulis_file, sys_tutup_file
+dari "greenfield/cotc/stdlib/core.fox" ambil_sebagian teks, panjang, argumen_sistem, tambah
+dari "greenfield/cotc/stdlib/teks.fox" ambil_sebagian iris
+"""
+
+def kompilasi(source: str, nama_file: str):
+    tokens, errors = Leksikal(source, nama_file=nama_file).buat_token()
+    if errors:
+        raise SystemExit(f"Lexer Errors: {errors}")
+    parser = Pengurai(tokens)
+    ast = parser.urai()
+    if not ast:
+        raise SystemExit(f"Parser Errors: {parser.daftar_kesalahan}")
+    return Compiler().compile(ast, filename=nama_file)
+
+def _globals_salinan():
+    """Bentuk lama: semua builtins disalin ke dict modul."""
+    return ModuleGlobals(BUILTINS, BUILTINS)
+
+def jalankan(code_obj, salin: bool, ukur_memori: bool):
+    standard_vm.buat_globals_modul = _globals_salinan if salin else buat_globals_modul
+    try:
+        if ukur_memori:
+            tracemalloc.start()
+        vm = StandardVM()
+        vm.load(code_obj)
+        mulai = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            vm.run()
+        durasi = time.perf_counter() - mulai
+        puncak = 0
+        if ukur_memori:
+            _, puncak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    finally:
+        standard_vm.buat_globals_modul = buat_globals_modul
+    entri = sum(len(g) for g in vm.loaded_modules.values())
+    return durasi, len(vm.loaded_modules), entri, puncak
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pemuatan modul StandardVM")
+    parser.add_argument("--ulang", type=int, default=5, help="Jumlah pengulangan per mode (diambil yang tercepat).")
+    args = parser.parse_args()
+
+    code_obj = kompilasi(PROGRAM_IMPOR, "<bench_modul>")
+
+    hasil = {}
+    for nama, salin in (("salin", True), ("bersama", False)):
+        durasi = min(jalankan(code_obj, salin, ukur_memori=False)[0] for _ in range(args.ulang))
+        # Memori diukur pada putaran terpisah karena tracemalloc memperlambat eksekusi
+        _, modul, entri, puncak = jalankan(code_obj, salin, ukur_memori=True)
+        hasil[nama] = (durasi, modul, entri, puncak)
+
+    print(f"{'Mode':<8} {'waktu (s)':>10} {'modul':>6} {'entri globals':>14} {'puncak (KiB)':>13}")
+    print("-" * 55)
+    for nama, (durasi, modul, entri, puncak) in hasil.items():
+        print(f"{nama:<8} {durasi:>10.4f} {modul:>6} {entri:>14} {puncak / 1024:>13.1f}")
+    print("-" * 55)
+    print(f"Percepatan: {hasil['salin'][0] / hasil['bersama'][0]:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark pemuatan image .mvm v2 (ivm/core/deserializer.py).
+
+Semua file .fox di bawah --dir (default: greenfield, compiler self-hosted lengkap)
+dikompilasi dan ditulis sebagai image .mvm ke direktori sementara, lalu dimuat dengan:
+  - "salin"  : read() seluruh file, potong header (binary_data[16:]), decode semua
+               CodeObject sekaligus (cara lama), lalu telusuri semua CodeObject.
+  - "mmap"   : muat_mvm: mmap + memoryview tanpa salinan, fungsi bersarang lazy.
+  - "mmap+semua" : seperti "mmap", lalu telusuri semua CodeObject sehingga semua
+               instruksi bersarang di-decode (batas atas: program yang memanggil setiap
+               fungsi); penelusurannya sama dengan "salin", jadi keduanya sebanding.
+
+Yang dilaporkan: waktu terbaik memuat seluruh image per mode.
+
+Penggunaan:
+    python tools/bench_muat_mvm.py [--dir greenfield] [--ulang N]
+"""
+import sys
+import os
+import argparse
+import glob
+import tempfile
+import time
+
+# Add repo root to path
+sys.path.append(os.getcwd())
+
+from transisi.lx import Leksikal
+from transisi.crusher import Pengurai
+from ivm.compiler import Compiler
+from ivm.core.structs import CodeObject
+from ivm.core.serializer import serialize_mvm
+from ivm.core.deserializer import deserialize_code_object, muat_mvm
+
+def kompilasi(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        source = f.read()
+    tokens, errors = Leksikal(source, nama_file=path).buat_token()
+    if errors:
+        return None
+    try:
+        ast = Pengurai(tokens).urai()
+    except Exception:
+        return None
+    return Compiler().compile(ast, filename=path) if ast else None
+
+def muat_salin(path: str):
+    with open(path, "rb") as f:
+        binary_data = f.read()
+    return deserialize_code_object(binary_data[16:], filename=path, version=binary_data[10])
+
+def decode_semua(code: CodeObject):
+    for instr in code.instructions:
+        for operand in instr[1:]:
+            if isinstance(operand, CodeObject):
+                decode_semua(operand)
+
+def ukur(paths, muat, ulang: int):
+    terbaik = None
+    for _ in range(ulang):
+        mulai = time.perf_counter()
+        for path in paths:
+            muat(path)
+        durasi = time.perf_counter() - mulai
+        terbaik = durasi if terbaik is None else min(terbaik, durasi)
+    return terbaik
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pemuatan image .mvm")
+    parser.add_argument("--dir", default="greenfield", help="Direktori sumber .fox.")
+    parser.add_argument("--ulang", type=int, default=5, help="Jumlah pengulangan per mode (diambil yang tercepat).")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths, ukuran = [], 0
+        for i, sumber in enumerate(sorted(glob.glob(os.path.join(args.dir, "**", "*.fox"), recursive=True))):
+            code = kompilasi(sumber)
+            if code is None:
+                continue
+            image = serialize_mvm(code)
+            path = os.path.join(tmp, f"{i}.mvm")
+            with open(path, "wb") as f:
+                f.write(image)
+            paths.append(path)
+            ukuran += len(image)
+
+        hasil = {
+            "salin": ukur(paths, lambda p: decode_semua(muat_salin(p)), args.ulang),
+            "mmap": ukur(paths, muat_mvm, args.ulang),
+            "mmap+semua": ukur(paths, lambda p: decode_semua(muat_mvm(p)), args.ulang),
+        }
+
+    print(f"{len(paths)} image, {ukuran} byte")
+    print(f"{'Mode':<11} {'waktu (s)':>10}")
+    print("-" * 22)
+    for nama, durasi in hasil.items():
+        print(f"{nama:<11} {durasi:>10.4f}")
+    print("-" * 22)
+    print(f"Percepatan mmap: {hasil['salin'] / hasil['mmap']:.2f}x")
+
+if __name__ == "__main__":
+    main()
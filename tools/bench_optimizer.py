@@ -0,0 +1,175 @@
+"""
+Benchmark ivm/optimizer.py.
+
+Dua bagian:
+  - statis : setiap file .fox di bawah --dir dikompilasi, dioptimasi, lalu dihitung
+             jumlah instruksi dan lompatan (rekursif ke CodeObject bersarang) serta
+             ukuran image .mvm v2 sebelum/sesudah. Hasil optimasi juga diverifikasi
+             round-trip lewat serializer/deserializer.
+  - runtime: program contoh (konstanta, flag debug lokal, loop `selama benar` dengan
+             `berhenti`) dijalankan pada setiap level -O; keluaran harus sama.
+
+Yang dilaporkan: total instruksi/lompatan/ukuran, waktu terbaik per mode dan percepatan.
+Keluar dengan kode 1 jika round-trip atau keluaran runtime berbeda.
+
+Penggunaan:
+    python tools/bench_optimizer.py [--dir greenfield] [--jumlah N] [--ulang N]
+"""
+import sys
+import os
+import argparse
+import contextlib
+import glob
+import io
+import time
+
+# Add repo root to path
+sys.path.append(os.getcwd())
+
+from transisi.lx import Leksikal
+from transisi.crusher import Pengurai
+from ivm.compiler import Compiler
+from ivm.optimizer import Optimizer, LEVEL_MAKS
+from ivm.core.structs import CodeObject
+from ivm.core.serializer import serialize_mvm
+from ivm.core.deserializer import deserialize_mvm
+from ivm.vms.standard_vm import StandardVM
+
+_JUMPS = ("JMP", "JMP_IF_FALSE", "JMP_IF_TRUE", "FOR_ITER")
+
+PROGRAM = """
+fungsi hitung(n) maka
+    biar debug = salah
+    biar skala = 60 * 60
+    biar total = 0
+    biar i = 0
+    selama benar maka
+        jika i >= n maka
+            berhenti
+        akhir
+        jika debug maka
+            tulis(i)
+        akhir
+        jika tidak (i % 3 == 0) maka
+            ubah total = total + i * skala
+        lain
+            ubah total = total - (2 * 4 + 1)
+        akhir
+        ubah i = i + 1
+    akhir
+    kembalikan total
+akhir
+tulis(hitung(JUMLAH))
+"""
+
+def kompilasi(source: str, nama_file: str):
+    tokens, errors = Leksikal(source, nama_file=nama_file).buat_token()
+    if errors:
+        return None
+    try:
+        ast = Pengurai(tokens).urai()
+    except Exception:
+        return None
+    if not ast:
+        return None
+    return Compiler().compile(ast, filename=nama_file)
+
+def hitung(code: CodeObject):
+    """(jumlah instruksi, jumlah lompatan), rekursif ke CodeObject bersarang."""
+    instr, lompat = 0, 0
+    for ins in code.instructions:
+        instr += 1
+        if ins[0].name in _JUMPS:
+            lompat += 1
+        for operand in ins[1:]:
+            if isinstance(operand, CodeObject):
+                a, b = hitung(operand)
+                instr += a
+                lompat += b
+    return instr, lompat
+
+def sama(a: CodeObject, b: CodeObject) -> bool:
+    if (a.name, a.exception_table, a.line_table, a.local_names) != (b.name, b.exception_table, b.line_table, b.local_names):
+        return False
+    if len(a.instructions) != len(b.instructions):
+        return False
+    for x, y in zip(a.instructions, b.instructions):
+        if len(x) != len(y) or x[0] != y[0]:
+            return False
+        for p, q in zip(x[1:], y[1:]):
+            if isinstance(p, CodeObject):
+                if not (isinstance(q, CodeObject) and sama(p, q)):
+                    return False
+            elif type(p) is not type(q) or p != q:
+                return False
+    return True
+
+def statis(direktori: str) -> bool:
+    total = {"instr": [0, 0], "lompat": [0, 0], "ukuran": [0, 0]}
+    jumlah, rusak = 0, []
+    optimizer = Optimizer()
+    for path in sorted(glob.glob(os.path.join(direktori, "**", "*.fox"), recursive=True)):
+        with open(path, "r", encoding="utf-8") as f:
+            code = kompilasi(f.read(), path)
+        if code is None:
+            continue
+        hasil = optimizer.optimize(code)
+        for i, c in enumerate((code, hasil)):
+            instr, lompat = hitung(c)
+            total["instr"][i] += instr
+            total["lompat"][i] += lompat
+            total["ukuran"][i] += len(serialize_mvm(c))
+        if not sama(hasil, deserialize_mvm(serialize_mvm(hasil), filename=path, lazy=False)):
+            rusak.append(path)
+        jumlah += 1
+
+    print(f"Statis: {jumlah} file di {direktori}")
+    print(f"{'':<12} {'sebelum':>10} {'sesudah':>10} {'selisih':>9}")
+    print("-" * 44)
+    for nama, (sebelum, sesudah) in total.items():
+        print(f"{nama:<12} {sebelum:>10} {sesudah:>10} {(sesudah - sebelum) / max(sebelum, 1):>9.1%}")
+    for path in rusak:
+        print(f"ROUND-TRIP BEDA: {path}")
+    return not rusak
+
+def jalankan(code_obj):
+    vm = StandardVM(bytecode_cache=False)
+    vm.load(code_obj)
+    keluaran = io.StringIO()
+    mulai = time.perf_counter()
+    with contextlib.redirect_stdout(keluaran):
+        vm.run()
+    return time.perf_counter() - mulai, keluaran.getvalue()
+
+def runtime(jumlah: int, ulang: int) -> bool:
+    code = kompilasi(PROGRAM.replace("JUMLAH", str(jumlah)), "<bench_optimizer>")
+    hasil = {}
+    for level in range(LEVEL_MAKS + 1):
+        c = Optimizer(level).optimize(code)
+        hasil[f"-O{level}"] = (hitung(c)[0],) + min(jalankan(c) for _ in range(ulang))
+
+    print(f"\nRuntime ({jumlah} iterasi)")
+    print(f"{'Mode':<5} {'instr':>6} {'waktu (s)':>10}")
+    print("-" * 23)
+    for nama, (instr, durasi, _) in hasil.items():
+        print(f"{nama:<5} {instr:>6} {durasi:>10.4f}")
+    print("-" * 23)
+    print(f"Percepatan -O{LEVEL_MAKS}: {hasil['-O0'][1] / hasil[f'-O{LEVEL_MAKS}'][1]:.2f}x")
+    if len({keluaran for _, _, keluaran in hasil.values()}) != 1:
+        print("PERINGATAN: keluaran antar level berbeda!")
+        return False
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark optimizer bytecode IVM")
+    parser.add_argument("--dir", default="greenfield", help="Direktori sumber .fox untuk statistik statis.")
+    parser.add_argument("--jumlah", type=int, default=200_000, help="Jumlah iterasi program runtime.")
+    parser.add_argument("--ulang", type=int, default=5, help="Jumlah pengulangan per mode (diambil yang tercepat).")
+    args = parser.parse_args()
+
+    ok = statis(args.dir)
+    ok &= runtime(args.jumlah, args.ulang)
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
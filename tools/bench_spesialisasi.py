@@ -0,0 +1,92 @@
+"""
+Benchmark spesialisasi tipe opcode aritmatika di StandardVM.
+
+Kernel numerik (polinomial Horner int, deret float, dan penggabungan teks) dijalankan
+dengan StandardVM(specialize=False) (ADD/SUB/MUL generik lewat tabel dispatch) dan
+StandardVM(specialize=True) (situs ditulis ulang jadi ADD_INT/ADD_FLOAT/ADD_STR/...).
+Setelah tabel waktu, statistik spesialisasi (situs, deopt) dicetak.
+
+Penggunaan:
+    python tools/bench_spesialisasi.py [--jumlah N] [--ulang N]
+"""
+import sys
+import os
+import argparse
+import io
+import time
+import contextlib
+
+# Add repo root to path
+sys.path.append(os.getcwd())
+
+from transisi.lx import Leksikal
+from transisi.crusher import Pengurai
+from ivm.compiler import Compiler
+from ivm.vms.standard_vm import StandardVM
+
+PROGRAM = """
+fungsi horner(x) maka
+    kembali ((3 * x + 2) * x - 7) * x + 11
+akhir
+fungsi kernel(n) maka
+    biar total = 0
+    biar f = 0.5
+    biar s = ""
+    selama i dari rentang(n) maka
+        ubah total = total + horner(i) - i * i
+        ubah f = f * 1.5 - f + 0.25
+        jika i < 64 maka
+            ubah s = "x" + s
+        akhir
+    akhir
+    kembali [total, f, s]
+akhir
+tulis(kernel(JUMLAH))
+"""
+
+def kompilasi(source: str, nama_file: str):
+    tokens, errors = Leksikal(source, nama_file=nama_file).buat_token()
+    if errors:
+        raise SystemExit(f"Lexer Errors: {errors}")
+    parser = Pengurai(tokens)
+    ast = parser.urai()
+    if not ast:
+        raise SystemExit(f"Parser Errors: {parser.daftar_kesalahan}")
+    return Compiler().compile(ast, filename=nama_file)
+
+def jalankan(sumber: str, specialize: bool):
+    # Kompilasi ulang per putaran: situs yang sudah dispesialisasi tersimpan di CodeObject
+    code_obj = kompilasi(sumber, "<bench_spesialisasi>")
+    vm = StandardVM(specialize=specialize)
+    vm.load(code_obj)
+    keluaran = io.StringIO()
+    mulai = time.perf_counter()
+    with contextlib.redirect_stdout(keluaran):
+        vm.run()
+    return time.perf_counter() - mulai, keluaran.getvalue(), vm
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark spesialisasi tipe StandardVM")
+    parser.add_argument("--jumlah", type=int, default=100_000, help="Jumlah putaran kernel numerik.")
+    parser.add_argument("--ulang", type=int, default=5, help="Jumlah pengulangan per mode (diambil yang tercepat).")
+    args = parser.parse_args()
+
+    sumber = PROGRAM.replace("JUMLAH", str(args.jumlah))
+    hasil = {}
+    for nama, specialize in (("generik", False), ("spesial", True)):
+        hasil[nama] = min((jalankan(sumber, specialize) for _ in range(args.ulang)), key=lambda h: h[0])
+
+    if hasil["generik"][1] != hasil["spesial"][1]:
+        print("PERINGATAN: keluaran kedua mode berbeda!")
+
+    print(f"{'Mode':<8} {'waktu (s)':>10}")
+    print("-" * 19)
+    for nama, (durasi, _, _) in hasil.items():
+        print(f"{nama:<8} {durasi:>10.4f}")
+    print("-" * 19)
+    print(f"Percepatan: {hasil['generik'][0] / hasil['spesial'][0]:.2f}x")
+    print()
+    print(hasil["spesial"][2].specialization_stats.laporan())
+
+if __name__ == "__main__":
+    main()
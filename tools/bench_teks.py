@@ -0,0 +1,97 @@
+"""
+Benchmark pembangunan teks (interpolasi dan rantai '+') di StandardVM.
+
+Program yang sama dikompilasi dua kali:
+  - "rantai" : lowering lama, setiap interpolasi/rantai '+' jadi STR + ADD berpasangan
+               (N-1 teks sementara per ekspresi).
+  - "build"  : default, rantai teks jadi satu BUILD_STRING n.
+
+Penggunaan:
+    python tools/bench_teks.py [--jumlah N] [--ulang N]
+"""
+import sys
+import os
+import argparse
+import io
+import time
+import contextlib
+
+# Add repo root to path
+sys.path.append(os.getcwd())
+
+from transisi.lx import Leksikal
+from transisi.crusher import Pengurai
+from ivm.compiler import Compiler
+from ivm.vms.standard_vm import StandardVM
+
+PROGRAM = """
+fungsi log(tingkat, modul, pesan, baris) maka
+    kembali "[{tingkat}] {modul}:{baris} - {pesan} (kode={baris * 7})"
+akhir
+fungsi emit(op, reg, nilai) maka
+    kembali "    " + op + " " + reg + ", " + nilai + "\\n"
+akhir
+fungsi kerja(n) maka
+    biar total = 0
+    selama i dari rentang(n) maka
+        ubah total = total + panjang(log("INFO", "kompiler", "selesai", i))
+        ubah total = total + panjang(emit("mov", "r1", "42"))
+    akhir
+    kembali total
+akhir
+tulis(kerja(JUMLAH))
+"""
+
+def kompilasi(source: str, nama_file: str):
+    tokens, errors = Leksikal(source, nama_file=nama_file).buat_token()
+    if errors:
+        raise SystemExit(f"Lexer Errors: {errors}")
+    parser = Pengurai(tokens)
+    ast = parser.urai()
+    if not ast:
+        raise SystemExit(f"Parser Errors: {parser.daftar_kesalahan}")
+    return Compiler().compile(ast, filename=nama_file)
+
+def kompilasi_mode(source: str, nama_file: str, rantai: bool):
+    """rantai=True: matikan lowering BUILD_STRING (juga di compiler fungsi bersarang) selama kompilasi."""
+    asli = Compiler._bagian_rantai_teks
+    if rantai:
+        Compiler._bagian_rantai_teks = lambda self, node: None
+    try:
+        return kompilasi(source, nama_file)
+    finally:
+        Compiler._bagian_rantai_teks = asli
+
+def jalankan(code_obj):
+    vm = StandardVM()
+    vm.load(code_obj)
+    keluaran = io.StringIO()
+    mulai = time.perf_counter()
+    with contextlib.redirect_stdout(keluaran):
+        vm.run()
+    return time.perf_counter() - mulai, keluaran.getvalue()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pembangunan teks StandardVM")
+    parser.add_argument("--jumlah", type=int, default=100_000, help="Jumlah putaran pembangunan teks.")
+    parser.add_argument("--ulang", type=int, default=5, help="Jumlah pengulangan per mode (diambil yang tercepat).")
+    args = parser.parse_args()
+
+    sumber = PROGRAM.replace("JUMLAH", str(args.jumlah))
+    hasil = {}
+    for nama, rantai in (("rantai", True), ("build", False)):
+        code_obj = kompilasi_mode(sumber, f"<bench_teks_{nama}>", rantai)
+        hasil[nama] = min(jalankan(code_obj) for _ in range(args.ulang))
+
+    if hasil["rantai"][1] != hasil["build"][1]:
+        print("PERINGATAN: keluaran kedua mode berbeda!")
+
+    print(f"{'Mode':<6} {'waktu (s)':>10}")
+    print("-" * 17)
+    for nama, (durasi, _) in hasil.items():
+        print(f"{nama:<6} {durasi:>10.4f}")
+    print("-" * 17)
+    print(f"Percepatan: {hasil['rantai'][0] / hasil['build'][0]:.2f}x")
+
+if __name__ == "__main__":
+    main()
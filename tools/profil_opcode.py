@@ -0,0 +1,86 @@
+"""
+Profil frekuensi opcode (tunggal, pasangan, triple) program .fox di StandardVM,
+dasar pemilihan superinstruksi di ivm/core/decoder.py (SUPERINSTRUCTIONS).
+
+Program dijalankan sekali dengan OpcodeProfiler (bytecode asli), lalu waktu dan
+jumlah dispatch dibandingkan antara StandardVM(superinstructions=False) dan
+StandardVM(superinstructions=True).
+
+Penggunaan:
+    python tools/profil_opcode.py [--file program.fox] [--top N] [--ulang N] [-- argumen skrip...]
+"""
+import sys
+import os
+import argparse
+import io
+import time
+import contextlib
+
+# Add repo root to path
+sys.path.append(os.getcwd())
+
+from ivm.core.profiler import OpcodeProfiler
+from ivm.vms.standard_vm import StandardVM
+
+# Pakai ulang beban bawaan dan kompilasi dari bench_loop
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from bench_loop import PROGRAM_BAWAAN, kompilasi
+
+def jalankan(code_obj, script_args, **opsi_vm):
+    vm = StandardVM(script_args=script_args, **opsi_vm)
+    vm.load(code_obj)
+    keluaran = io.StringIO()
+    mulai = time.perf_counter()
+    with contextlib.redirect_stdout(keluaran):
+        vm.run()
+        if "utama" in vm.globals:
+            vm.call_function_internal(vm.globals["utama"], [])
+            vm.run()
+    durasi = time.perf_counter() - mulai
+    return durasi, vm.instruction_count, keluaran.getvalue()
+
+def main():
+    parser = argparse.ArgumentParser(description="Profil pasangan/triple opcode StandardVM")
+    parser.add_argument("--file", help="Program .fox yang diprofil (default: beban bawaan bench_loop).")
+    parser.add_argument("--top", type=int, default=20, help="Jumlah entri teratas per tabel.")
+    parser.add_argument("--ulang", type=int, default=3, help="Pengulangan per mode untuk perbandingan waktu.")
+    parser.add_argument("script_args", nargs=argparse.REMAINDER, help="Argumen untuk program (setelah --).")
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, "r", encoding="utf-8") as f:
+            source = f.read()
+        nama_file = args.file
+    else:
+        source = PROGRAM_BAWAAN
+        nama_file = "<profil_opcode>"
+    script_args = [a for a in args.script_args if a != "--"]
+    code_obj = kompilasi(source, nama_file)
+
+    profiler = OpcodeProfiler()
+    jalankan(code_obj, [nama_file] + script_args, profiler=profiler)
+    print(profiler.laporan(args.top))
+
+    hasil = {}
+    for nama, fused in (("asli", False), ("superinstruksi", True)):
+        terbaik = None
+        for _ in range(args.ulang):
+            durasi, jumlah, keluaran = jalankan(code_obj, [nama_file] + script_args, superinstructions=fused)
+            if terbaik is None or durasi < terbaik[0]:
+                terbaik = (durasi, jumlah, keluaran)
+        hasil[nama] = terbaik
+
+    if hasil["asli"][2] != hasil["superinstruksi"][2]:
+        print("PERINGATAN: keluaran dengan dan tanpa superinstruksi berbeda!")
+
+    print()
+    print(f"{'Mode':<16} {'waktu (s)':>10} {'dispatch':>12}")
+    print("-" * 40)
+    for nama, (durasi, jumlah, _) in hasil.items():
+        print(f"{nama:<16} {durasi:>10.3f} {jumlah:>12}")
+    print("-" * 40)
+    print(f"Dispatch berkurang {(1 - hasil['superinstruksi'][1] / hasil['asli'][1]) * 100:.1f}%, "
+          f"percepatan {hasil['asli'][0] / hasil['superinstruksi'][0]:.2f}x")
+
+if __name__ == "__main__":
+    main()
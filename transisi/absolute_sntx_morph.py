@@ -251,6 +251,15 @@ class Selama(St):
         self.kondisi = kondisi
         self.badan = badan
 
+class SelamaDari(St):
+    """Mewakili perulangan `selama nama dari sumber maka ... akhir` atas nilai-nilai generator."""
+    def __init__(self, token: Token, nama: Token, sumber: Xprs, badan: Bagian, lokasi: Optional[Any] = None):
+        super().__init__(lokasi)
+        self.token = token  # Token dari kata kunci 'selama'
+        self.nama = nama    # Token NAMA variabel penampung tiap nilai
+        self.sumber = sumber
+        self.badan = badan
+
 # --- Node untuk Deklarasi Tipe Varian ---
 
 class Varian(MRPH):
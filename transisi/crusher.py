@@ -291,6 +291,8 @@ class Pengurai:
 
     def _pernyataan_selama(self):
         token_selama = self._sebelumnya()
+        if self._periksa(TipeToken.NAMA) and self._periksa_berikutnya(TipeToken.DARI):
+            return self._pernyataan_selama_dari(token_selama)
         kondisi = self._ekspresi()
         self._konsumsi(TipeToken.MAKA, "Dibutuhkan 'maka' setelah kondisi 'selama'.")
         self._cocok(TipeToken.AKHIR_BARIS)
@@ -298,6 +300,16 @@ class Pengurai:
         self._konsumsi(TipeToken.AKHIR, "Dibutuhkan 'akhir' untuk menutup loop 'selama'.")
         return ast.Selama(token_selama, kondisi, ast.Bagian(badan))
 
+    def _pernyataan_selama_dari(self, token_selama):
+        nama = self._maju()
+        self._maju() # 'dari'
+        sumber = self._ekspresi()
+        self._konsumsi(TipeToken.MAKA, "Dibutuhkan 'maka' setelah sumber 'selama ... dari'.")
+        self._cocok(TipeToken.AKHIR_BARIS)
+        badan = self._blok_pernyataan_hingga(TipeToken.AKHIR)
+        self._konsumsi(TipeToken.AKHIR, "Dibutuhkan 'akhir' untuk menutup loop 'selama'.")
+        return ast.SelamaDari(token_selama, nama, sumber, ast.Bagian(badan))
+
     def _pernyataan_berhenti(self):
         token = self._sebelumnya()
         self._konsumsi_akhir_baris("Dibutuhkan baris baru setelah 'berhenti'.")